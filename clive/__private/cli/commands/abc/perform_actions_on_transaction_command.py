@@ -19,6 +19,7 @@ from clive.__private.cli.exceptions import (
     CLITransactionNotSignedMissingKeysError,
     CLITransactionNotSignedMissingSignOptionError,
     CLITransactionToExchangeError,
+    CLITransactionTooLargeError,
     CLITransactionUnknownAccountError,
 )
 from clive.__private.cli.print_cli import print_cli, print_json
@@ -30,6 +31,11 @@ from clive.__private.core.ensure_transaction import ensure_transaction
 from clive.__private.core.error_handlers.abc.error_notificator import CannotNotifyError
 from clive.__private.core.formatters.humanize import humanize_validation_result
 from clive.__private.core.keys.key_manager import MultipleKeysFoundError
+from clive.__private.core.transaction_sizing import (
+    OperationTooLargeError,
+    calculate_max_transaction_size,
+    split_transaction,
+)
 from clive.__private.settings import safe_settings
 from clive.__private.validators.exchange_operations_validator import ExchangeOperationsValidatorCli
 from clive.__private.validators.path_validator import PathValidator
@@ -166,6 +172,7 @@ class PerformActionsOnTransactionCommand(WorldBasedCommand, ForceableCLICommand,
         await self._validate_unknown_accounts()
         await self._validate_operations_to_exchange()
         await self._validate_keys_availability()
+        await self._validate_transaction_size()
         await super().validate_inside_context_manager()
 
     async def _hook_after_fetching_data(self) -> None:
@@ -286,6 +293,26 @@ class PerformActionsOnTransactionCommand(WorldBasedCommand, ForceableCLICommand,
             except MultipleKeysFoundError:
                 raise CLIMultipleKeysAutoSignError from None
 
+    async def _validate_transaction_size(self) -> None:
+        signatures_amount = max(len(self.transaction.signatures), len(self.sign_with), 1)
+        # no extra call to the node is made just for sizing, block size limit is considered only when already known
+        max_size = calculate_max_transaction_size(self.world.node.cached.dynamic_global_properties_or_none)
+        try:
+            split = split_transaction(
+                self.transaction.operations_models, max_size=max_size, signatures_amount=signatures_amount
+            )
+        except OperationTooLargeError as error:
+            raise CLIPrettyError(str(error), errno.E2BIG) from None
+
+        if split.is_split and self.world.node.cached.is_online_with_basic_info_available:
+            split = split_transaction(
+                self.transaction.operations_models,
+                max_size=max_size,
+                signatures_amount=signatures_amount,
+                rc_cost_estimator=await self.world.node.cached.rc_cost_estimator,
+            )
+            raise CLITransactionTooLargeError(split)
+
     def _get_transaction_created_message(self) -> str:
         return "created"
 
@@ -3,10 +3,13 @@ from __future__ import annotations
 import errno
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.table import Table
 
 from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
 from clive.__private.cli.exceptions import CLIPrettyError, CLIPrivateKeyInvalidFormatError
-from clive.__private.cli.print_cli import print_cli
+from clive.__private.cli.print_cli import print_cli, print_warning
 from clive.__private.core.formatters.humanize import humanize_validation_result
 from clive.__private.core.keys import (
     PrivateKey,
@@ -14,8 +17,12 @@ from clive.__private.core.keys import (
     PrivateKeyInvalidFormatError,
     PublicKeyAliased,
 )
+from clive.__private.core.keys.bulk import KeysImportResult, calculate_key_pairs, deduplicate_key_pairs
 from clive.__private.validators.public_key_alias_validator import PublicKeyAliasValidator
 
+if TYPE_CHECKING:
+    from clive.__private.core.keys.bulk import KeyPair, KeysDeduplication
+
 
 @dataclass(kw_only=True)
 class AddKey(WorldBasedCommand):
@@ -63,6 +70,85 @@ class AddKey(WorldBasedCommand):
         print_cli("Key imported.")
 
 
+@dataclass(kw_only=True)
+class AddKeysFromFile(WorldBasedCommand):
+    """Import many keys listed in a file, each line is `<private key> [alias]`, lines starting with `#` are skipped."""
+
+    path: Path
+
+    async def _run(self) -> None:
+        key_pairs = await calculate_key_pairs(self._read_private_keys())
+        deduplication = deduplicate_key_pairs(self.profile.keys, key_pairs)
+
+        print_cli(f"Importing {len(deduplication.new)} of {len(key_pairs)} key(s)...")
+        self.profile.keys.add_to_import(*[key_pair.private_key for key_pair in deduplication.new])
+        result = await self.profile.keys.import_pending_to_beekeeper_in_bulk(self._import_keys)
+        self.profile.keys.clear_to_import()
+
+        print_cli(self._create_summary_table(deduplication, result))
+        if not result.is_complete:
+            raise CLIPrettyError(f"Failed to import {len(result.failed)} key(s).", errno.EIO)
+        if deduplication.alias_conflicts:
+            print_warning("Some keys were skipped because their aliases are already in use, give them other aliases.")
+        print_cli("Keys imported.")
+
+    def _read_private_keys(self) -> list[PrivateKey]:
+        try:
+            lines = self.path.read_text().splitlines()
+        except OSError as error:
+            raise CLIPrettyError(f"Can't read keys from `{self.path}`: {error}", errno.EIO) from None
+
+        alias_validator = PublicKeyAliasValidator(self.profile.keys)
+        private_keys: list[PrivateKey] = []
+        for line_number, line in enumerate(lines, start=1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+
+            value, *alias = stripped.split(maxsplit=1)
+            try:
+                private_key = PrivateKey(value=value)
+            except PrivateKeyInvalidFormatError:
+                raise CLIPrettyError(
+                    f"Invalid private key format in line {line_number} of `{self.path}`.", errno.EINVAL
+                ) from None
+
+            if alias:
+                alias_result = alias_validator.validate(alias[0])
+                if not alias_result.is_valid:
+                    raise CLIPrettyError(
+                        f"Invalid alias in line {line_number} of `{self.path}`: "
+                        f"{humanize_validation_result(alias_result)}",
+                        errno.EINVAL,
+                    )
+                private_key = private_key.with_alias(alias[0])
+            private_keys.append(private_key)
+        return private_keys
+
+    async def _import_keys(self, keys_to_import: list[PrivateKeyAliased]) -> KeysImportResult:
+        if not keys_to_import:
+            return KeysImportResult()
+        return (await self.world.commands.import_keys(keys_to_import=keys_to_import)).result_or_raise
+
+    def _create_summary_table(self, deduplication: KeysDeduplication, result: KeysImportResult) -> Table:
+        def add_rows(key_pairs: list[KeyPair], status: str) -> None:
+            for key_pair in key_pairs:
+                table.add_row(key_pair.alias, key_pair.public_key.value, status)
+
+        table = Table(title="Imported keys")
+        table.add_column("Alias")
+        table.add_column("Public key")
+        table.add_column("Status")
+        for public_key in result.imported:
+            table.add_row(public_key.alias, public_key.value, "imported")
+        add_rows(deduplication.already_known, "skipped, already known")
+        add_rows(deduplication.alias_conflicts, "skipped, alias in use")
+        failed = [key_pair for key_pair in deduplication.new if key_pair.alias in result.failed]
+        for key_pair in failed:
+            table.add_row(key_pair.alias, key_pair.public_key.value, f"failed: {result.failed[key_pair.alias]}")
+        return table
+
+
 @dataclass(kw_only=True)
 class RemoveKey(WorldBasedCommand):
     alias: str
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import errno
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
 
 from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
 from clive.__private.cli.exceptions import CLIPrettyError
+from clive.__private.cli.print_cli import print_cli
+from clive.__private.core.accounts.accounts import InvalidAccountNameError
+from clive.__private.core.accounts.exceptions import AccountsUpdateError
+from clive.__private.core.accounts.known_accounts_file import (
+    KnownAccountsFileError,
+    dump_known_account_names,
+    load_known_account_names,
+    resolve_known_accounts_file_format,
+)
 from clive.__private.core.formatters.humanize import humanize_validation_result
+from clive.__private.validators.path_validator import PathValidator
 from clive.__private.validators.set_known_account_validator import SetKnownAccountValidator
 
 
@@ -53,3 +65,100 @@ class EnableKnownAccounts(WorldBasedCommand):
 class DisableKnownAccounts(WorldBasedCommand):
     async def _run(self) -> None:
         self.profile.disable_known_accounts()
+
+
+@dataclass(kw_only=True)
+class ImportKnownAccounts(WorldBasedCommand):
+    file: str | Path
+
+    FIND_ACCOUNTS_LIMIT: ClassVar[int] = 1000
+    """Maximum number of accounts the node looks up in a single `find_accounts` call."""
+
+    _account_names: list[str] = field(init=False, default_factory=list)
+    _account_names_to_add: list[str] = field(init=False, default_factory=list)
+
+    @property
+    def file_path(self) -> Path:
+        return Path(self.file)
+
+    async def validate(self) -> None:
+        self._validate_file_argument()
+        await super().validate()
+
+    async def validate_inside_context_manager(self) -> None:
+        self._load_account_names()
+        self._validate_known_accounts()
+        await self._validate_accounts_exist_in_node()
+        await super().validate_inside_context_manager()
+
+    def _validate_file_argument(self) -> None:
+        result = PathValidator(mode="is_file").validate(str(self.file))
+        if not result.is_valid:
+            raise CLIPrettyError(
+                f"Can't import known accounts from file: {humanize_validation_result(result)}", errno.EINVAL
+            )
+
+    def _load_account_names(self) -> None:
+        try:
+            self._account_names = load_known_account_names(self.file_path)
+        except KnownAccountsFileError as error:
+            raise CLIPrettyError(str(error), errno.EINVAL) from error
+        self._account_names_to_add = [
+            name for name in dict.fromkeys(self._account_names) if not self.profile.accounts.is_account_known(name)
+        ]
+
+    def _validate_known_accounts(self) -> None:
+        validator = SetKnownAccountValidator(self.profile)
+        for account_name in self._account_names_to_add:
+            result = validator.validate(account_name)
+            if not result.is_valid:
+                raise CLIPrettyError(
+                    f"Can't import account `{account_name}`: {humanize_validation_result(result)}", errno.EINVAL
+                )
+
+    async def _validate_accounts_exist_in_node(self) -> None:
+        """Check existence of all imported accounts with a single node call per `FIND_ACCOUNTS_LIMIT` accounts."""
+        missing: list[str] = []
+        for start in range(0, len(self._account_names_to_add), self.FIND_ACCOUNTS_LIMIT):
+            chunk = self._account_names_to_add[start : start + self.FIND_ACCOUNTS_LIMIT]
+            response = await self.world.node.api.database_api.find_accounts(accounts=chunk)
+            found = {account.name for account in response.accounts}
+            missing.extend(account_name for account_name in chunk if account_name not in found)
+
+        if missing:
+            raise CLIPrettyError(
+                f"Can't import known accounts, accounts {', '.join(f'`{name}`' for name in missing)}"
+                f" don't exist on node `{self.world.node.http_endpoint}`.",
+                errno.EINVAL,
+            )
+
+    async def _run(self) -> None:
+        try:
+            added = self.profile.accounts.import_known_accounts(self._account_names_to_add)
+        except (AccountsUpdateError, InvalidAccountNameError) as error:
+            raise CLIPrettyError(str(error), errno.EINVAL) from error
+
+        print_cli(
+            f"Imported {len(added)} known account(s) from {self.file_path},"
+            f" {len(self._account_names) - len(added)} skipped as already known or duplicated."
+        )
+
+
+@dataclass(kw_only=True)
+class ExportKnownAccounts(WorldBasedCommand):
+    file: str | Path
+
+    @property
+    def file_path(self) -> Path:
+        return Path(self.file)
+
+    async def validate(self) -> None:
+        try:
+            resolve_known_accounts_file_format(self.file_path)
+        except KnownAccountsFileError as error:
+            raise CLIPrettyError(str(error), errno.EINVAL) from error
+        await super().validate()
+
+    async def _run(self) -> None:
+        dump_known_account_names(self.file_path, self.profile.accounts.known.names)
+        print_cli(f"Exported {len(self.profile.accounts.known)} known account(s) to {self.file_path}.")
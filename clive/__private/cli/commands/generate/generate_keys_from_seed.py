@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from clive.__private.cli.commands.abc.external_cli_command import ExternalCLICommand
+from clive.__private.cli.print_cli import print_cli
+from clive.__private.core.keys.bulk import KeyDerivationRequest, derive_key_pairs
+
+if TYPE_CHECKING:
+    from clive.__private.core.types import AuthorityLevel
+
+
+@dataclass(kw_only=True)
+class GenerateKeysFromSeed(ExternalCLICommand):
+    account_names: list[str]
+    roles: list[AuthorityLevel]
+    alias_template: str
+    only_private_key: bool
+    only_public_key: bool
+
+    def validate_all_mutually_exclusive_options(self) -> None:
+        self._validate_mutually_exclusive(only_private_key=self.only_private_key, only_public_key=self.only_public_key)
+        return super().validate_all_mutually_exclusive_options()
+
+    async def _run(self) -> None:
+        seed = self.read_interactive("Enter seed (like as secret phrase)") if self.is_interactive else self.read_piped()
+
+        requests = [
+            KeyDerivationRequest(account_name=account_name, role=role, alias_template=self.alias_template)
+            for account_name in dict.fromkeys(self.account_names)
+            for role in dict.fromkeys(self.roles)
+        ]
+        for key_pair in await derive_key_pairs(seed, requests):
+            if self.only_public_key:
+                print_cli(f"{key_pair.public_key.value} {key_pair.alias}")
+            elif self.only_private_key:
+                print_cli(f"{key_pair.private_key.value} {key_pair.alias}")
+            else:
+                print_cli(f"{key_pair.private_key.value} {key_pair.public_key.value} {key_pair.alias}")
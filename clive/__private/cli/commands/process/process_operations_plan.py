@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import errno
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from clive.__private.cli.commands.abc.operation_command import OperationCommand
+from clive.__private.cli.exceptions import (
+    CLIPrettyError,
+    RcDelegationBelowMinimumError,
+    RcDelegationInsufficientRcError,
+)
+from clive.__private.cli.print_cli import print_info
+from clive.__private.core import iwax
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
+from clive.__private.core.operations_planner import (
+    CurrentState,
+    InvalidTargetStateError,
+    OperationsPlan,
+    TargetState,
+    plan_operations,
+)
+from clive.__private.core.wax_operation_wrapper import WaxRcDelegationWrapper
+from clive.__private.models.schemas import CustomJsonOperation
+
+if TYPE_CHECKING:
+    from clive.__private.cli.types import ComposeTransaction
+    from clive.__private.core.commands.command_wrappers import CommandWithResultWrapper
+    from clive.__private.core.commands.data_retrieval.account_votes_data import AccountVotesData
+    from clive.__private.core.commands.data_retrieval.rc_data import RcData
+
+
+@dataclass(kw_only=True)
+class ProcessOperationsPlan(OperationCommand):
+    account_name: str
+    target_file: str
+    _target: TargetState = field(init=False)
+    _rc_data: RcData = field(init=False)
+    _plan: OperationsPlan = field(init=False)
+
+    async def fetch_data(self) -> None:
+        await super().fetch_data()
+        try:
+            self._target = TargetState.load(Path(self.target_file))
+        except InvalidTargetStateError as error:
+            raise CLIPrettyError(str(error), errno.EINVAL) from None
+
+        self._rc_data, votes_data = await self._retrieve_current_state()
+        current = CurrentState(
+            rc_delegations={str(d.to): int(d.delegated_rc) for d in self._rc_data.outgoing_delegations},
+            witness_votes=frozenset(votes_data.witness_votes or ()),
+            proposal_votes=frozenset(votes_data.proposal_votes or ()),
+            gdpo=self._rc_data.gdpo,
+        )
+        self._plan = plan_operations(account_name=self.account_name, target=self._target, current=current)
+        if self._plan.is_empty:
+            raise CLIPrettyError("Current state already matches the target state, nothing to process.", errno.EEXIST)
+
+    async def validate_inside_context_manager(self) -> None:
+        self._validate_rc_delegations()
+        await super().validate_inside_context_manager()
+
+    async def _run(self) -> None:
+        print_info(
+            f"Target state is reached with {self._plan.operations_amount} operation(s)"
+            f" instead of {self._plan.changes_amount} processed one by one."
+        )
+        await super()._run()
+
+    async def _retrieve_current_state(self) -> tuple[RcData, AccountVotesData]:
+        """Retrieve RC delegations and votes in a single batch, no matter how many targets there are."""
+        snapshot_round = SnapshotRound(self.world.node)
+        rc_data_result, votes_data_result = await snapshot_round.run(
+            self.world.commands.retrieve_rc_data(account_name=self.account_name, snapshot_round=snapshot_round),
+            self.world.commands.retrieve_account_votes_data(
+                account_name=self.account_name,
+                include_witness_votes=self._target.witness_votes is not None,
+                include_proposal_votes=self._target.proposal_votes is not None,
+                snapshot_round=snapshot_round,
+            ),
+        )
+        return self._ensure_result(rc_data_result), self._ensure_result(votes_data_result)
+
+    @staticmethod
+    def _ensure_result[T](result: CommandWithResultWrapper[T] | BaseException) -> T:
+        if isinstance(result, BaseException):
+            raise result
+        return result.result_or_raise
+
+    def _validate_rc_delegations(self) -> None:
+        rc_data = self._rc_data
+        for change in self._plan.rc_delegations:
+            if change.max_rc and change.max_rc < rc_data.min_rc_delegation:
+                raise RcDelegationBelowMinimumError(
+                    iwax.calculate_vests_to_hp(change.max_rc, rc_data.gdpo),
+                    iwax.vests(change.max_rc),
+                    iwax.calculate_vests_to_hp(rc_data.min_rc_delegation, rc_data.gdpo),
+                    iwax.vests(rc_data.min_rc_delegation),
+                )
+
+        # changes freeing RC are applied first, so only the total increase has to fit in the current mana
+        delta_total = self._plan.rc_delegations_delta
+        if delta_total > rc_data.current_mana:
+            max_delegable = max(rc_data.current_mana, 0)
+            raise RcDelegationInsufficientRcError(
+                iwax.calculate_vests_to_hp(delta_total, rc_data.gdpo),
+                iwax.vests(delta_total),
+                iwax.calculate_vests_to_hp(max_delegable, rc_data.gdpo),
+                iwax.vests(max_delegable),
+            )
+
+    async def _create_operations(self) -> ComposeTransaction:
+        for change in self._plan.rc_delegations:
+            wrapper = WaxRcDelegationWrapper.create_delegations(
+                from_account=self.account_name, delegatees=change.delegatees, max_rc=change.max_rc
+            )
+            yield wrapper.to_schemas(self.world.wax_interface, CustomJsonOperation)
+        for witness_vote in self._plan.witness_votes:
+            yield witness_vote
+        for proposal_vote in self._plan.proposal_votes:
+            yield proposal_vote
@@ -12,7 +12,9 @@ from rich.text import Text
 from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
 from clive.__private.cli.print_cli import print_cli
 from clive.__private.cli.styling import colorize_content_not_available
+from clive.__private.cli.table_pagination_info import add_cursor_pagination_info_to_table_if_needed
 from clive.__private.core import iwax
+from clive.__private.core.constants.data_retrieval import VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
 from clive.__private.core.formatters.humanize import (
     align_to_dot,
     humanize_asset,
@@ -36,10 +38,16 @@ if TYPE_CHECKING:
 @dataclass(kw_only=True)
 class ShowHivePower(WorldBasedCommand):
     account_name: str
+    delegations_page_size: int = VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
+    delegations_page_no: int = 0
     _hp_data: HivePowerData = field(init=False)
 
     async def _run(self) -> None:
-        wrapper = await self.world.commands.retrieve_hp_data(account_name=self.account_name)
+        wrapper = await self.world.commands.retrieve_hp_data(
+            account_name=self.account_name,
+            delegations_page_no=self.delegations_page_no,
+            delegations_page_size=self.delegations_page_size,
+        )
         self._hp_data = wrapper.result_or_raise
 
         general_info = self.__general_info()
@@ -141,6 +149,8 @@ class ShowHivePower(WorldBasedCommand):
 
     def __delegations(self) -> RenderableType:
         if len(self._hp_data.delegations) == 0:
+            if self.delegations_page_no > 0:
+                return colorize_content_not_available("There are no delegations on this page")
             return colorize_content_not_available("There are no delegations set")
 
         delegations_title = "Current delegations"
@@ -148,12 +158,18 @@ class ShowHivePower(WorldBasedCommand):
         delegations_table.add_column(Text("Delegatee", justify="center"), style="cyan", no_wrap=True)
         delegations_table.add_column(Text("Shares", justify="center"), style="green", no_wrap=True)
 
-        for delegation in self._hp_data.delegations:
-            delegation_hp_raw = iwax.calculate_vests_to_hp(delegation.vesting_shares, self._hp_data.gdpo)
+        delegations_hp = iwax.calculate_vests_to_hp_many(
+            (delegation.vesting_shares for delegation in self._hp_data.delegations), self._hp_data.gdpo
+        )
+        for delegation, delegation_hp_raw in zip(self._hp_data.delegations, delegations_hp, strict=True):
             delegation_hp = humanize_hive_power(delegation_hp_raw)
             delegation_vests = humanize_asset(delegation.vesting_shares)
             hp_aligned, vests_aligned = align_to_dot(delegation_hp, delegation_vests, center_to=delegations_title)
 
             delegations_table.add_row(delegation.delegatee, hp_aligned)
             delegations_table.add_row("", vests_aligned, end_section=True)
+
+        add_cursor_pagination_info_to_table_if_needed(
+            delegations_table, self.delegations_page_no, has_next_page=self._hp_data.has_more_delegations
+        )
         return delegations_table
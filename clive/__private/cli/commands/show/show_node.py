@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
+from typing import Final
+
+from rich.table import Table
 
 from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
 from clive.__private.cli.print_cli import print_cli
 
+CONNECTION_STATS_PROBE_REQUESTS: Final[int] = 3
+
 
 @dataclass(kw_only=True)
 class ShowNode(WorldBasedCommand):
+    connection_stats: bool = False
+
     async def _run(self) -> None:
         print_cli(str(self.profile.node_address))
+        if self.connection_stats:
+            await self._show_connection_stats()
+
+    async def _show_connection_stats(self) -> None:
+        node = self.world.node
+        latencies = []
+        for _ in range(CONNECTION_STATS_PROBE_REQUESTS):
+            start = time.perf_counter()
+            await node.api.database_api.get_dynamic_global_properties()
+            latencies.append(time.perf_counter() - start)
+
+        metrics = node.connection_pool_metrics
+        table = Table(title="Connection statistics", show_header=False)
+        table.add_row("requests", f"{metrics.requests}")
+        table.add_row("new connections", f"{metrics.new_connections}")
+        table.add_row("reused connections", f"{metrics.reused_connections} ({metrics.reuse_ratio:.0%})")
+        table.add_row("average time of connecting (TCP + TLS handshake)", f"{metrics.average_connect_secs:.3f}s")
+        table.add_row("DNS resolutions / cache hits", f"{metrics.dns_resolutions} / {metrics.dns_cache_hits}")
+        table.add_row("latency of the first request", f"{latencies[0]:.3f}s")
+        table.add_row("average latency of next requests", f"{sum(latencies[1:]) / len(latencies[1:]):.3f}s")
+        print_cli(table)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import errno
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
+from clive.__private.cli.exceptions import CLIPrettyError
+from clive.__private.cli.print_cli import print_cli
+from clive.__private.core.formatters.humanize import humanize_validation_result
+from clive.__private.core.signature_verification import SignatureVerificationResult
+from clive.__private.validators.path_validator import PathValidator
+
+if TYPE_CHECKING:
+    from clive.__private.core.commands.verify_transaction_signatures import TransactionFileVerification
+
+
+@dataclass(kw_only=True)
+class ShowTransactionSignatures(WorldBasedCommand):
+    from_path: str | Path
+
+    async def validate(self) -> None:
+        result = PathValidator(mode="is_file_or_directory").validate(str(self.from_path))
+        if not result.is_valid:
+            raise CLIPrettyError(
+                f"Can't load transactions from path: {humanize_validation_result(result)}", errno.EINVAL
+            )
+        await super().validate()
+
+    async def _run(self) -> None:
+        wrapper = await self.world.commands.verify_transaction_files_signatures(paths=[Path(self.from_path)])
+        verifications = wrapper.result_or_raise
+        if not verifications:
+            print_cli(f"No transaction files found in `{self.from_path}`.")
+            return
+
+        for file_path, verification in verifications.items():
+            self._print_verification(file_path, verification)
+
+    def _print_verification(self, file_path: Path, verification: TransactionFileVerification) -> None:
+        if not isinstance(verification, SignatureVerificationResult):
+            print_cli(f"{file_path}: {verification.reason}")
+            return
+
+        status = "signatures are valid" if verification.is_valid else "signatures are NOT valid"
+        table = Table(title=f"{file_path}: {status}")
+        table.add_column("required authority")
+        table.add_column("weight / threshold", justify="right")
+        table.add_column("missing keys")
+        for check in verification.checks:
+            table.add_row(
+                f"{check.name} ({'satisfied' if check.is_satisfied else 'not satisfied'})",
+                f"{check.weight} / {check.weight_threshold}",
+                "\n".join(check.missing_keys),
+            )
+        print_cli(table)
+
+        if verification.redundant_signatures:
+            redundant = "\n".join(verification.redundant_signatures)
+            print_cli(f"Redundant signatures (node would reject the transaction with them):\n{redundant}")
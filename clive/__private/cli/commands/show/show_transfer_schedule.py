@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Final
 
 from rich.columns import Columns
@@ -12,6 +12,7 @@ from rich.text import Text
 
 from clive.__private.cli.commands.abc.world_based_command import WorldBasedCommand
 from clive.__private.cli.print_cli import print_cli, print_content_not_available
+from clive.__private.core.constants.data_retrieval import DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT
 from clive.__private.core.formatters.humanize import humanize_datetime
 from clive.__private.core.shorthand_timedelta import timedelta_to_shorthand_timedelta
 
@@ -19,12 +20,32 @@ if TYPE_CHECKING:
     from clive.__private.core.commands.data_retrieval.find_scheduled_transfers import AccountScheduledTransferData
 
 ERROR_LACK_OF_FUNDS_MESSAGE_RAW: Final[str] = "Possible lack of funds."
-DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT: Final[int] = 10
 
 
 @dataclass(kw_only=True)
 class ShowTransferSchedule(WorldBasedCommand):
     account_name: str
+    upcoming: int | None = None
+    until: datetime | timedelta | None = None
+    page_no: int = 0
+
+    @property
+    def until_ensure(self) -> datetime | None:
+        assert not isinstance(self.until, timedelta), "until should be resolved to datetime at this point"
+        return self.until
+
+    @property
+    def upcoming_amount(self) -> int | None:
+        """Without `until`, number of upcoming transfers falls back to the default, so the horizon is bounded."""
+        if self.upcoming is None and self.until is None:
+            return DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT
+        return self.upcoming
+
+    async def fetch_data(self) -> None:
+        await super().fetch_data()
+        if isinstance(self.until, timedelta):
+            gdpo = await self.world.node.api.database_api.get_dynamic_global_properties()
+            self.until = gdpo.time.replace(tzinfo=UTC) + self.until
 
     async def _run(self) -> None:
         account_scheduled_transfers_data = (
@@ -39,7 +60,9 @@ class ShowTransferSchedule(WorldBasedCommand):
         table_upcoming = self.__create_table_upcoming(account_scheduled_transfers_data)
 
         table_definitions_group = Group(table_definitions, Padding(""))
-        table_upcoming_group = Group(table_upcoming, Padding(""))
+        table_upcoming_group = Group(
+            table_upcoming, self.__create_first_lack_of_funds_note(account_scheduled_transfers_data), Padding("")
+        )
 
         show_transfer_schedule = Columns([table_definitions_group, table_upcoming_group])
         print_cli(show_transfer_schedule)
@@ -79,12 +102,7 @@ class ShowTransferSchedule(WorldBasedCommand):
 
     def __create_table_upcoming(self, account_scheduled_transfers_data: AccountScheduledTransferData) -> Table:
         """Create table with upcoming scheduled transfers."""
-        table_upcoming = Table(
-            title=(
-                f"Next {DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT}"
-                f" upcoming recurrent transfers for `{self.account_name}` account"
-            )
-        )
+        table_upcoming = Table(title=self.__create_table_upcoming_title())
 
         amount_column_name = "Amount"
         possible_amount_column_name = "Possible balance after operation"
@@ -96,9 +114,12 @@ class ShowTransferSchedule(WorldBasedCommand):
         table_upcoming.add_column("Next", justify="center", style="green", no_wrap=True)
         table_upcoming.add_column("Frequency", justify="center", style="green", no_wrap=True)
 
+        upcoming_amount = self.upcoming_amount
         upcoming_future_scheduled_transfers = (
             account_scheduled_transfers_data.get_next_upcoming_future_scheduled_transfers(
-                next_upcoming=DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT
+                next_upcoming=upcoming_amount,
+                until=self.until_ensure,
+                offset=self.page_no * upcoming_amount if upcoming_amount is not None else 0,
             )
         )
         amount_aligned = upcoming_future_scheduled_transfers.get_amount_aligned_to_dot(center_to=amount_column_name)
@@ -122,3 +143,27 @@ class ShowTransferSchedule(WorldBasedCommand):
                 timedelta_to_shorthand_timedelta(timedelta(hours=future_scheduled_transfer.recurrence)),
             )
         return table_upcoming
+
+    def __create_table_upcoming_title(self) -> str:
+        upcoming_amount = self.upcoming_amount
+        until = self.until_ensure
+        what = "Upcoming" if upcoming_amount is None else f"Next {upcoming_amount} upcoming"
+        title = f"{what} recurrent transfers for `{self.account_name}` account"
+        if until is not None:
+            title += f" until {humanize_datetime(until)}"
+        if self.page_no and upcoming_amount is not None:
+            title += f" (page {self.page_no})"
+        return title
+
+    def __create_first_lack_of_funds_note(self, account_scheduled_transfers_data: AccountScheduledTransferData) -> Text:
+        """Warn about the first execution that could fail, also when it's beyond the displayed page."""
+        first_lack_of_funds = account_scheduled_transfers_data.get_projection().find_first_lack_of_funds(
+            until=self.until_ensure
+        )
+        if first_lack_of_funds is None:
+            return Text("")
+        return Text(
+            f"{ERROR_LACK_OF_FUNDS_MESSAGE_RAW} First transfer that could fail: `{first_lack_of_funds.to}`"
+            f" (pair id {first_lack_of_funds.pair_id}) at {humanize_datetime(first_lack_of_funds.trigger_date)}.",
+            style="red",
+        )
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from decimal import Decimal
 
     from clive.__private.core.keys.keys import PublicKey
+    from clive.__private.core.types import AuthorityLevel
     from clive.__private.models.asset import Asset
 
 
@@ -167,6 +168,15 @@ def transaction_expiration_parser(raw: str) -> timedelta:
     return shorthand_timedelta_to_timedelta(raw)
 
 
+def authority_level(raw: str) -> AuthorityLevel:
+    from clive.__private.core.constants.authority import AUTHORITY_LEVELS  # noqa: PLC0415
+
+    for level in AUTHORITY_LEVELS:
+        if raw == level:
+            return level
+    raise typer.BadParameter(f"`{raw}` is not a valid role. Only {list(AUTHORITY_LEVELS)} are allowed.")
+
+
 def public_key(raw: str) -> PublicKey:
     from clive.__private.core.keys.keys import PublicKey, PublicKeyInvalidFormatError  # noqa: PLC0415
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path  # noqa: TC003
+
 import typer
 
 from clive.__private.cli.clive_typer import CliveTyper
@@ -24,15 +26,33 @@ _alias_argument = typer.Argument(
 )
 
 
+_from_file_option = typer.Option(
+    None,
+    "--from-file",
+    help=(
+        "Import many keys at once from a file, each line is `<private key> [alias]` (lines starting with # are"
+        " skipped). Keys already known are skipped. Can't be used with key and alias."
+    ),
+)
+
+
 @key.command(name="add")
 async def add_key(
     key: str | None = _key_argument,
     key_option: str | None = argument_related_options.key,
     alias: str | None = _alias_argument,
     alias_option: str | None = argument_related_options.alias,
+    from_file: Path | None = _from_file_option,
 ) -> None:
     """Import a key into the Beekeeper, and make it ready to use for Clive."""
-    from clive.__private.cli.commands.configure.key import AddKey  # noqa: PLC0415
+    from clive.__private.cli.commands.configure.key import AddKey, AddKeysFromFile  # noqa: PLC0415
+    from clive.__private.cli.exceptions import CLIMutuallyExclusiveOptionsError  # noqa: PLC0415
+
+    if from_file is not None:
+        if any(value is not None for value in (key, key_option, alias, alias_option)):
+            raise CLIMutuallyExclusiveOptionsError("from-file", "key", "alias")
+        await AddKeysFromFile(path=from_file).run()
+        return
 
     await AddKey(
         key_or_path=EnsureSingleValue("key").of(key, key_option),
@@ -45,6 +45,33 @@ async def remove_known_account(
     await RemoveKnownAccount(account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option)).run()
 
 
+_file_option = typer.Option(
+    ...,
+    "--file",
+    help="The file with account names (format is determined by file extension - .csv or .json).",
+)
+
+
+@known_account.command(name="import")
+async def import_known_accounts(
+    file: str = _file_option,
+) -> None:
+    """Add all accounts listed in a file to the list of known accounts (already known ones are skipped)."""
+    from clive.__private.cli.commands.configure.known_account import ImportKnownAccounts  # noqa: PLC0415
+
+    await ImportKnownAccounts(file=file).run()
+
+
+@known_account.command(name="export")
+async def export_known_accounts(
+    file: str = modified_param(_file_option, help="The file to save account names to (.csv or .json)."),
+) -> None:
+    """Save the list of known accounts to a file."""
+    from clive.__private.cli.commands.configure.known_account import ExportKnownAccounts  # noqa: PLC0415
+
+    await ExportKnownAccounts(file=file).run()
+
+
 @known_account.command(name="enable")
 async def enable_known_accounts(
     ctx: typer.Context,  # noqa: ARG001
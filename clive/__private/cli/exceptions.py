@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
     from clive.__private.core.keys import PublicKeyAliased
     from clive.__private.core.profile import InvalidTransactionExpirationError, Profile
+    from clive.__private.core.transaction_sizing import TransactionSplit
     from clive.__private.models.asset import Asset
 
 
@@ -371,6 +372,30 @@ class CLITransactionToExchangeError(CLIPrettyError):
         self.message = message
 
 
+class CLITransactionTooLargeError(CLIPrettyError):
+    """
+    Raise when operations don't fit in a single transaction.
+
+    Args:
+        split: The fewest transactions the operations could be split into.
+    """
+
+    def __init__(self, split: TransactionSplit) -> None:
+        self.split = split
+
+        parts = "\n".join(
+            f"  {index}. operations {part.operations.start + 1}-{part.operations.stop} ({part.size} bytes"
+            + (f", ~{part.rc_cost} RC)" if part.rc_cost is not None else ")")
+            for index, part in enumerate(split.parts, start=1)
+        )
+        message = (
+            f"Cannot perform transaction, it exceeds the maximum size of {split.max_size} bytes.\n"
+            f"Operations fit in at least {len(split.parts)} transactions, which have to be performed in order:\n"
+            f"{parts}"
+        )
+        super().__init__(message, errno.E2BIG)
+
+
 class CLIMutuallyExclusiveOptionsError(CLIPrettyError):
     """
     Raise when cli command is invoked with mutually exclusive options.
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import cast
+
 import typer
 
 from clive.__private.cli.clive_typer import CliveTyper
@@ -9,7 +11,8 @@ from clive.__private.cli.common.parameters.argument_related_options import (
 )
 from clive.__private.cli.common.parameters.ensure_single_value import EnsureSingleValue
 from clive.__private.cli.common.parameters.styling import stylized_help
-from clive.__private.cli.common.parsers import account_name
+from clive.__private.cli.common.parsers import account_name, authority_level
+from clive.__private.core.constants.authority import AUTHORITY_LEVELS, DEFAULT_DERIVED_KEY_ALIAS_TEMPLATE
 from clive.__private.core.types import AuthorityLevel
 
 generate = CliveTyper(name="generate", help="Commands for generating things (e.g. keys).")
@@ -58,6 +61,48 @@ async def generate_key_from_seed(  # noqa: PLR0913
     ).run()
 
 
+@generate.command(name="keys-from-seed")
+async def generate_keys_from_seed(
+    account_names: list[str] = typer.Option(
+        ...,
+        "--account-name",
+        parser=account_name,
+        help="Account for which keys are derived. Option can be added multiple times.",
+    ),
+    roles: list[str] = typer.Option(
+        list(AUTHORITY_LEVELS),
+        "--role",
+        parser=authority_level,
+        help="Role for which keys are derived. Option can be added multiple times.",
+    ),
+    alias_template: str = typer.Option(
+        DEFAULT_DERIVED_KEY_ALIAS_TEMPLATE,
+        help="Alias printed next to each key, `{account_name}` and `{role}` placeholders are replaced.",
+    ),
+    only_private_key: bool = typer.Option(  # noqa: FBT001
+        default=False, help="Whether to display only the private key instead of key pair."
+    ),
+    only_public_key: bool = typer.Option(  # noqa: FBT001
+        default=False, help="Whether to display only the public key instead of key pair."
+    ),
+) -> None:
+    """
+    Derive many private keys at once, for each combination of given account names and roles.
+
+    Works like `clive generate key-from-seed`, but keys are derived in parallel and each is printed in a single line
+    followed by its alias. Output of `--only-private-key` can be imported with `clive configure key add --from-file`.
+    """
+    from clive.__private.cli.commands.generate.generate_keys_from_seed import GenerateKeysFromSeed  # noqa: PLC0415
+
+    await GenerateKeysFromSeed(
+        account_names=account_names,
+        roles=cast("list[AuthorityLevel]", roles),  # validated by the parser
+        alias_template=alias_template,
+        only_private_key=only_private_key,
+        only_public_key=only_public_key,
+    ).run()
+
+
 @generate.command(name="public-key")
 async def generate_public_key() -> None:
     """Display the public key that corresponds to the private key provided at stdin."""
@@ -137,6 +137,37 @@ async def process_transaction(  # noqa: PLR0913
     ).run()
 
 
+@process.command(name="target-state")
+async def process_target_state(  # noqa: PLR0913
+    account_name: str = options.account_name,
+    from_file: str = typer.Option(
+        ...,
+        help=(
+            "JSON file with the target state, with optional sections: `rc_delegations` (delegatee and amount),"
+            " `witness_votes` (witness names) and `proposal_votes` (proposal ids)."
+            " Delegations and votes not listed in a given section are removed."
+        ),
+    ),
+    sign_with: list[str] = options.sign_with,
+    autosign: bool | None = options.autosign,  # noqa: FBT001
+    broadcast: bool | None = options.broadcast,  # noqa: FBT001
+    save_file: str | None = options.save_file,
+    force: bool = options.force,  # noqa: FBT001
+) -> None:
+    """Reach the target state of RC delegations, witness and proposal votes with as few operations as possible."""
+    from clive.__private.cli.commands.process.process_operations_plan import ProcessOperationsPlan  # noqa: PLC0415
+
+    await ProcessOperationsPlan(
+        account_name=account_name,
+        target_file=from_file,
+        sign_with=sign_with,
+        broadcast=broadcast,
+        save_file=save_file,
+        autosign=autosign,
+        force=force,
+    ).run()
+
+
 @process.command(name="update-memo-key")
 async def process_update_memo_key(  # noqa: PLR0913
     account_name: str = options.account_name,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, cast
+
 import typer
 
 from clive.__private.cli.clive_typer import CliveTyper
@@ -10,15 +12,20 @@ from clive.__private.cli.common.parameters.ensure_single_value import (
 )
 from clive.__private.cli.common.parameters.modified_param import modified_param
 from clive.__private.cli.common.parameters.styling import stylized_help
-from clive.__private.cli.common.parsers import account_name
+from clive.__private.cli.common.parsers import account_name, hive_datetime
 from clive.__private.cli.show.pending import pending
 from clive.__private.core.constants.data_retrieval import (
+    DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT,
     ORDER_DIRECTION_DEFAULT,
     PROPOSAL_ORDER_DEFAULT,
     PROPOSAL_STATUS_DEFAULT,
+    VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT,
 )
 from clive.__private.core.types import OrderDirections, ProposalOrders, ProposalStatuses  # noqa: TC001
 
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
 show = CliveTyper(name="show", help="Show various data.")
 
 show.add_typer(pending)
@@ -68,11 +75,19 @@ async def show_balances(
 
 
 @show.command(name="node")
-async def show_node() -> None:
+async def show_node(
+    connection_stats: bool = typer.Option(  # noqa: FBT001
+        default=False,
+        help=(
+            "Whether to send a few requests to the node and show statistics of connections made to it"
+            " (new and reused connections, time of establishing them, DNS cache hits)."
+        ),
+    ),
+) -> None:
     """Show address of the currently selected node."""
     from clive.__private.cli.commands.show.show_node import ShowNode  # noqa: PLC0415
 
-    await ShowNode().run()
+    await ShowNode(connection_stats=connection_stats).run()
 
 
 _transaction_id_argument = typer.Argument(
@@ -93,6 +108,24 @@ async def show_transaction_status(
     ).run()
 
 
+@show.command(name="transaction-signatures")
+async def show_transaction_signatures(
+    from_path: str = typer.Option(
+        ...,
+        help=(
+            "The file to load the transaction from or a directory with transaction files (.json or .bin)."
+            " Transactions from the directory are verified in parallel."
+        ),
+    ),
+) -> None:
+    """Verify locally, without broadcasting, whether signatures satisfy authorities required by the transaction."""
+    from clive.__private.cli.commands.show.show_transaction_signatures import (  # noqa: PLC0415
+        ShowTransactionSignatures,
+    )
+
+    await ShowTransactionSignatures(from_path=from_path).run()
+
+
 @show.command(name="proxy")
 async def show_proxy(
     account_name: str = arguments.account_name,
@@ -267,15 +300,34 @@ async def show_chain() -> None:
     await ShowChain().run()
 
 
+delegations_page_size = modified_param(
+    options.page_size,
+    param_decls=("--delegations-page-size",),
+    default=VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT,
+    help="The number of delegations presented on a single page.",
+)
+delegations_page_no = modified_param(
+    options.page_no,
+    param_decls=("--delegations-page",),
+    help="Page number of the delegations list, considering the given page size.",
+)
+
+
 @show.command(name="hive-power")
 async def show_hive_power(
     account_name: str = arguments.account_name,
     account_name_option: str | None = argument_related_options.account_name,
+    delegations_page_size: int = delegations_page_size,
+    delegations_page_no: int = delegations_page_no,
 ) -> None:
     """Show info about hive power related to account including delegations and withdraw routes."""
     from clive.__private.cli.commands.show.show_hive_power import ShowHivePower  # noqa: PLC0415
 
-    await ShowHivePower(account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option)).run()
+    await ShowHivePower(
+        account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option),
+        delegations_page_size=delegations_page_size,
+        delegations_page_no=delegations_page_no,
+    ).run()
 
 
 @show.command(name="resource-credits")
@@ -304,15 +356,45 @@ async def show_new_account_token(
     await ShowNewAccountToken(account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option)).run()
 
 
+transfer_schedule_page_no = modified_param(
+    options.page_no, help="Page number of upcoming recurrent transfers, considering the --upcoming value as page size."
+)
+
+
 @show.command(name="transfer-schedule")
 async def show_transfer_schedule(
     account_name: str = arguments.account_name,
     account_name_option: str | None = argument_related_options.account_name,
+    upcoming: int | None = typer.Option(
+        None,
+        "--upcoming",
+        min=1,
+        help=stylized_help(
+            "The number of upcoming recurrent transfers to show.",
+            default=f"{DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT} or all until --until if given",
+        ),
+        show_default=False,
+    ),
+    until: str = typer.Option(  # actually datetime | timedelta | None, but Typer doesn't support Union types
+        None,
+        "--until",
+        parser=hive_datetime,
+        help=(
+            "Show upcoming recurrent transfers triggered not later than this date."
+            " Formats: absolute (2025-12-31, 2025-12-31T14:30:00) or relative (+30d, +2w)."
+        ),
+    ),
+    page_no: int = transfer_schedule_page_no,
 ) -> None:
     """Fetch from blockchain information about recurrent transfers of selected account."""
     from clive.__private.cli.commands.show.show_transfer_schedule import ShowTransferSchedule  # noqa: PLC0415
 
-    await ShowTransferSchedule(account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option)).run()
+    await ShowTransferSchedule(
+        account_name=EnsureSingleAccountNameValue().of(account_name, account_name_option),
+        upcoming=upcoming,
+        until=cast("datetime | timedelta | None", until),
+        page_no=page_no,
+    ).run()
 
 
 @show.command(name="account")
@@ -25,10 +25,31 @@ def add_pagination_info_to_table_if_needed(table: Table, page_no: int, page_size
         return
 
     last_page_no = math.ceil(all_entries / page_size) - 1  # -1 as pages are 0-indexed
+    _set_pagination_info(table, has_previous_page=page_no > 0, has_next_page=page_no < last_page_no)
 
-    if page_no == 0:
+
+def add_cursor_pagination_info_to_table_if_needed(table: Table, page_no: int, *, has_next_page: bool) -> None:
+    """
+    Add information about current displayed page of table, when the total number of entries is unknown.
+
+    Args:
+        table: The table to which the pagination info will be added.
+        page_no: The current page number (0-indexed).
+        has_next_page: Whether there are entries on the next page.
+    """
+    assert page_no >= 0, "Page number must be greater or equal to 0."
+    assert table.caption is None, "The table's caption should be None before setting a new one to avoid overwriting."
+
+    if page_no == 0 and not has_next_page:
+        return
+
+    _set_pagination_info(table, has_previous_page=page_no > 0, has_next_page=has_next_page)
+
+
+def _set_pagination_info(table: Table, *, has_previous_page: bool, has_next_page: bool) -> None:
+    if not has_previous_page:
         page_info = "There are more on the next page(s)."
-    elif page_no >= last_page_no:
+    elif not has_next_page:
         page_info = "There are more on the previous page(s)."
     else:
         page_info = "There are more on the next/previous page(s)."
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 
 class CustomThreadPoolExecutor(ThreadPoolExecutor):
@@ -10,3 +12,36 @@ class CustomThreadPoolExecutor(ThreadPoolExecutor):
 
 
 thread_pool = CustomThreadPoolExecutor(max_workers=4, thread_name_prefix="clive_thread_pool")
+
+
+def calculate_cpu_thread_pool_size(configured_workers: int = 0) -> int:
+    """
+    Calculate the number of CPU thread pool workers.
+
+    Args:
+        configured_workers: Number of workers from settings, 0 means it should be determined from the number of CPUs.
+
+    Returns:
+        The configured number of workers or one less than the number of CPUs (leaving one for the event loop).
+    """
+    if configured_workers > 0:
+        return configured_workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+@cache
+def get_cpu_thread_pool() -> CustomThreadPoolExecutor:
+    """
+    Get the thread pool dedicated to CPU-bound work (e.g. heavy wax calls), separate from the general `thread_pool`.
+
+    It's created on first use, with size determined by the settings and the number of CPUs.
+
+    Returns:
+        The CPU thread pool.
+    """
+    from clive.__private.settings import safe_settings  # noqa: PLC0415
+
+    return CustomThreadPoolExecutor(
+        max_workers=calculate_cpu_thread_pool_size(safe_settings.wax.cpu_workers),
+        thread_name_prefix="clive_cpu_thread_pool",
+    )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import contextlib
+import bisect
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
 
 from clive.__private.core.accounts.accounts import Account, KnownAccount, WatchedAccount
 from clive.__private.core.accounts.exceptions import AccountAlreadyExistsError, AccountNotFoundError
@@ -10,20 +11,36 @@ from clive.__private.core.accounts.exceptions import AccountAlreadyExistsError,
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+_get_name = attrgetter("name")
+
 
 class AccountContainerBase[AccountT: Account](ABC):
     """
     A container-like object, that controls set of accounts.
 
+    Accounts are indexed by name, and an index sorted by name is maintained on every change, so lookups don't scan
+    and iteration doesn't sort. The sorted index is replaced (not modified in place) on change, so iteration is
+    not affected by changes made meanwhile.
+
     Args:
         accounts: Initial accounts to add to the container.
     """
 
+    BULK_INSERT_THRESHOLD: ClassVar[int] = 32
+    """Above that number of accounts added at once, the sorted index is rebuilt instead of inserting one by one."""
+
     def __init__(self, accounts: Iterable[AccountT] | None = None) -> None:
-        self._accounts: set[AccountT] = set() if accounts is None else set(accounts)
+        self._accounts: dict[str, AccountT] = {}
+        self._sorted_accounts: list[AccountT] = []
+        self._revision = 0
+
+        if accounts is not None:
+            for account in accounts:
+                self._accounts.setdefault(account.name, account)
+            self._rebuild_sorted_index()
 
     def __iter__(self) -> Iterator[AccountT]:
-        return iter(self._sorted_accounts())
+        return iter(self._sorted_accounts)
 
     def __len__(self) -> int:
         return len(self._accounts)
@@ -31,9 +48,25 @@ class AccountContainerBase[AccountT: Account](ABC):
     def __bool__(self) -> bool:
         return bool(self._accounts)
 
+    def __contains__(self, account: object) -> bool:
+        if not isinstance(account, str | Account):
+            return False
+        return Account.ensure_account_name(account) in self._accounts
+
     @property
     def content(self) -> list[AccountT]:
-        return self._sorted_accounts()
+        """Get a new list of accounts sorted by name."""
+        return list(self._sorted_accounts)
+
+    @property
+    def names(self) -> list[str]:
+        """Get a new list of account names sorted alphabetically."""
+        return [account.name for account in self._sorted_accounts]
+
+    @property
+    def change_marker(self) -> int:
+        """A value that changes whenever accounts are added to or removed from the container."""
+        return self._revision
 
     @abstractmethod
     def add(self, to_add: str | AccountT) -> None:
@@ -41,14 +74,15 @@ class AccountContainerBase[AccountT: Account](ABC):
 
     def clear(self) -> None:
         self._accounts.clear()
+        self._sorted_accounts = []
+        self._revision += 1
 
     def get(self, to_get: str | Account) -> AccountT:
         searched_account_name = Account.ensure_account_name(to_get)
-        for account in self._accounts:
-            if account.name == searched_account_name:
-                return account
-
-        raise AccountNotFoundError(searched_account_name)
+        account = self._accounts.get(searched_account_name)
+        if account is None:
+            raise AccountNotFoundError(searched_account_name)
+        return account
 
     def remove(self, *to_remove: str | Account) -> None:
         """
@@ -59,32 +93,55 @@ class AccountContainerBase[AccountT: Account](ABC):
         Args:
             *to_remove: Accounts to remove.
         """
-
-        def remove_single_account(account: str | Account) -> None:
-            with contextlib.suppress(AccountNotFoundError):
-                account_obj = self.get(account)
-                self._accounts.remove(account_obj)
-
-        for acc in to_remove:
-            remove_single_account(acc)
-
-    def _sorted_accounts(self) -> list[AccountT]:
-        """Get accounts sorted by name."""
-        return sorted(self._accounts, key=lambda account: account.name)
+        removed = [
+            account
+            for account in (self._accounts.pop(Account.ensure_account_name(acc), None) for acc in to_remove)
+            if account is not None
+        ]
+        if not removed:
+            return
+
+        if len(removed) > self.BULK_INSERT_THRESHOLD:
+            self._rebuild_sorted_index()
+        else:
+            sorted_accounts = list(self._sorted_accounts)
+            for account in removed:
+                del sorted_accounts[bisect.bisect_left(sorted_accounts, account.name, key=_get_name)]
+            self._sorted_accounts = sorted_accounts
+        self._revision += 1
 
     def _add(self, *to_add: str | Account, account_type: type[AccountT]) -> None:
-        def add_single_account(account: str | Account) -> None:
-            new_account = (
-                account if isinstance(account, account_type) else account_type(Account.ensure_account_name(account))
-            )
-
-            if new_account in self._accounts:
-                raise AccountAlreadyExistsError(new_account.name, type(self).__name__)
-
-            self._accounts.add(new_account)
-
-        for acc in to_add:
-            add_single_account(acc)
+        added: list[AccountT] = []
+        try:
+            for account in to_add:
+                new_account = (
+                    account if isinstance(account, account_type) else account_type(Account.ensure_account_name(account))
+                )
+
+                if new_account.name in self._accounts:
+                    raise AccountAlreadyExistsError(new_account.name, type(self).__name__)
+
+                self._accounts[new_account.name] = new_account
+                added.append(new_account)
+        finally:
+            # accounts added before the failing one are kept
+            self._insert_into_sorted_index(added)
+
+    def _insert_into_sorted_index(self, accounts: list[AccountT]) -> None:
+        if not accounts:
+            return
+
+        if len(accounts) > self.BULK_INSERT_THRESHOLD:
+            self._rebuild_sorted_index()
+        else:
+            sorted_accounts = list(self._sorted_accounts)
+            for account in accounts:
+                bisect.insort(sorted_accounts, account, key=_get_name)
+            self._sorted_accounts = sorted_accounts
+        self._revision += 1
+
+    def _rebuild_sorted_index(self) -> None:
+        self._sorted_accounts = sorted(self._accounts.values(), key=_get_name)
 
 
 class WatchedAccountContainer(AccountContainerBase[WatchedAccount]):
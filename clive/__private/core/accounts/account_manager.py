@@ -10,7 +10,6 @@ from clive.__private.core.accounts.account_container import (
 from clive.__private.core.accounts.accounts import Account, KnownAccount, TrackedAccount, WatchedAccount, WorkingAccount
 from clive.__private.core.accounts.exceptions import (
     AccountAlreadyExistsError,
-    AccountNotFoundError,
     NoWorkingAccountError,
     TryingToAddBadAccountError,
 )
@@ -53,6 +52,7 @@ class AccountManager:
         known_accounts: Iterable[str | Account] | None = None,
     ) -> None:
         self._working_account: WorkingAccount | None = None
+        self._revision = 0
         self._watched_accounts = WatchedAccountContainer()
         self._known_accounts = KnownAccountContainer()
 
@@ -96,13 +96,32 @@ class AccountManager:
     @property
     def tracked(self) -> list[TrackedAccount]:
         """Get a new list of tracked accounts (watched and working) sorted by name with working account always first."""
-        accounts: set[WatchedAccount | WorkingAccount] = set(self._watched_accounts.content)
-        if self.has_working_account:
-            accounts.add(self.working)
-        return sorted(
-            accounts,
-            key=lambda account: (not isinstance(account, WorkingAccount), account.name),
+        working_account = self.working_or_none
+        if working_account is None:
+            return [*self._watched_accounts]
+        # watched accounts are already kept sorted, so there is no need to sort them again
+        watched_accounts = [account for account in self._watched_accounts if account.name != working_account.name]
+        return [working_account, *watched_accounts]
+
+    @property
+    def change_marker(self) -> object:
+        """
+        A cheap to compute value that changes whenever the persisted state of accounts changes.
+
+        Alarms of tracked accounts are updated in place by the alarms refresh, so their state is a part of the marker.
+        """
+        alarms = tuple(
+            (
+                account.name,
+                tuple(
+                    (alarm.get_name(), alarm.is_harmless, alarm.identifier)
+                    for alarm in account._alarms.all_alarms
+                    if alarm.has_identifier
+                ),
+            )
+            for account in self.tracked
         )
+        return (self._revision, self._watched_accounts.change_marker, self._known_accounts.change_marker, alarms)
 
     @property
     def has_working_account(self) -> bool:
@@ -144,16 +163,13 @@ class AccountManager:
         return self.working.name == account_name
 
     def is_account_watched(self, account: str | Account) -> bool:
-        account_name = Account.ensure_account_name(account)
-        return account_name in [watched_account.name for watched_account in self.watched]
+        return account in self.watched
 
     def is_account_known(self, account: str | Account) -> bool:
-        account_name = Account.ensure_account_name(account)
-        return account_name in [known_account.name for known_account in self.known]
+        return account in self.known
 
     def is_account_tracked(self, account: str | Account) -> bool:
-        account_name = Account.ensure_account_name(account)
-        return account_name in [tracked_account.name for tracked_account in self.tracked]
+        return self.is_account_working(account) or self.is_account_watched(account)
 
     @classmethod
     def get_bad_accounts(cls) -> list[str]:
@@ -183,9 +199,11 @@ class AccountManager:
         self._working_account = (
             value if isinstance(value, WorkingAccount) else WorkingAccount(Account.ensure_account_name(value))
         )
+        self._revision += 1
 
     def unset_working_account(self) -> None:
         self._working_account = None
+        self._revision += 1
 
     def switch_working_account(self, new_working_account: str | Account | None = None) -> None:
         """
@@ -285,12 +303,9 @@ class AccountManager:
         Raises:
             AccountNotFoundError: If given account wasn't found.
         """
-        searched_account_name = Account.ensure_account_name(value)
-        for account in self.tracked:
-            if account.name == searched_account_name:
-                return account
-
-        raise AccountNotFoundError(searched_account_name)
+        if self.is_account_working(value):
+            return self.working
+        return self.watched.get(value)
 
     def _move_working_account_to_watched(self) -> None:
         """
@@ -351,3 +366,21 @@ class AccountManager:
             The known account with the given name.
         """
         return self.known.get(account_to_get)
+
+    def import_known_accounts(self, account_names: Iterable[str]) -> list[str]:
+        """
+        Add many accounts to the known accounts list at once, skipping the ones that are already known.
+
+        Args:
+            account_names: Names of accounts that should be considered as known.
+
+        Raises:
+            InvalidAccountNameError: If any of the account names is invalid. No account is added then.
+
+        Returns:
+            Names of the accounts that were actually added, in the given order.
+        """
+        to_add = [name for name in dict.fromkeys(account_names) if not self.is_account_known(name)]
+        known_accounts = [KnownAccount(name) for name in to_add]  # validates all names before adding any
+        self.known.add(*known_accounts)
+        return to_add
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import TYPE_CHECKING, Final, Literal, get_args
+
+from clive.__private.core.accounts.exceptions import AccountsUpdateError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+type KnownAccountsFileFormat = Literal["csv", "json"]
+
+KNOWN_ACCOUNTS_FILE_FORMATS: Final[tuple[KnownAccountsFileFormat, ...]] = get_args(KnownAccountsFileFormat.__value__)
+CSV_NAME_COLUMN: Final[str] = "name"
+
+
+class KnownAccountsFileError(AccountsUpdateError):
+    """
+    Raised when file with known accounts can't be read or has unsupported format.
+
+    Args:
+        path: Path of the file.
+        reason: Why the file couldn't be processed.
+    """
+
+    def __init__(self, path: Path, reason: str) -> None:
+        super().__init__(f"Can't process known accounts file {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+
+def resolve_known_accounts_file_format(path: Path) -> KnownAccountsFileFormat:
+    """
+    Determine the format of the known accounts file by its extension.
+
+    Args:
+        path: Path of the file.
+
+    Raises:
+        KnownAccountsFileError: If the extension doesn't match any supported format.
+
+    Returns:
+        The format of the file.
+    """
+    suffix = path.suffix.lower().removeprefix(".")
+    for file_format in KNOWN_ACCOUNTS_FILE_FORMATS:
+        if suffix == file_format:
+            return file_format
+    raise KnownAccountsFileError(path, f"unsupported extension, expected one of: {KNOWN_ACCOUNTS_FILE_FORMATS}.")
+
+
+def load_known_account_names(path: Path) -> list[str]:
+    """
+    Load account names from a CSV or JSON file.
+
+    CSV file should have account names in the first column, optionally with the `name` header.
+    JSON file should contain a list of account names or a list of objects with the `name` key.
+
+    Args:
+        path: Path of the file.
+
+    Raises:
+        KnownAccountsFileError: If the file can't be read or has invalid content.
+
+    Returns:
+        Account names in the order they appear in the file.
+    """
+    file_format = resolve_known_accounts_file_format(path)
+    try:
+        content = path.read_text()
+    except OSError as error:
+        raise KnownAccountsFileError(path, str(error)) from error
+
+    if file_format == "json":
+        return _parse_json(path, content)
+    return _parse_csv(content)
+
+
+def dump_known_account_names(path: Path, account_names: Iterable[str]) -> None:
+    """
+    Write account names to a CSV (with the `name` header) or JSON (list of names) file.
+
+    Args:
+        path: Path of the file.
+        account_names: Account names to write.
+    """
+    if resolve_known_accounts_file_format(path) == "json":
+        path.write_text(json.dumps(list(account_names), indent=4))
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([CSV_NAME_COLUMN])
+    writer.writerows([name] for name in account_names)
+    path.write_text(buffer.getvalue())
+
+
+def _parse_json(path: Path, content: str) -> list[str]:
+    try:
+        parsed = json.loads(content)
+    except json.JSONDecodeError as error:
+        raise KnownAccountsFileError(path, f"invalid JSON: {error}") from error
+
+    if not isinstance(parsed, list):
+        raise KnownAccountsFileError(path, "expected a list of account names.")
+
+    names: list[str] = []
+    for item in parsed:
+        name = item.get(CSV_NAME_COLUMN) if isinstance(item, dict) else item
+        if not isinstance(name, str):
+            raise KnownAccountsFileError(path, f"expected account name, got: {item!r}.")
+        names.append(name)
+    return names
+
+
+def _parse_csv(content: str) -> list[str]:
+    rows = (row for row in csv.reader(io.StringIO(content)) if row and row[0].strip())
+    names = [row[0].strip() for row in rows]
+    if names and names[0] == CSV_NAME_COLUMN:
+        return names[1:]
+    return names
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final
+import time
+from typing import TYPE_CHECKING, ClassVar, Final
 
 import beekeepy as bk
 
@@ -8,6 +9,8 @@ from clive.__private.settings import safe_settings
 from clive.exceptions import CliveError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from beekeepy import AsyncBeekeeper, AsyncSession, AsyncUnlockedWallet
     from beekeepy.settings import InterfaceSettings
 
@@ -21,12 +24,102 @@ class WalletsNotAvailableError(CliveError):
         super().__init__(self.MESSAGE)
 
 
+class WalletStateWatcher:
+    """
+    Decides when the lock state of wallets has to be checked in the beekeeper.
+
+    Instead of asking beekeeper about unlocked wallets on every refresh, the session unlock timeout is tracked
+    locally, so the moment of the lock can be predicted. Beekeeper is polled only near that deadline, after user
+    actions that could change the state (`request_poll`) and rarely otherwise (e.g. to notice a lock done by
+    another client of the same session).
+
+    Args:
+        clock: Source of monotonic time, in seconds.
+    """
+
+    SAFETY_POLL_INTERVAL_SECS: ClassVar[float] = 15.0
+    """Maximum time between polls, no matter the predicted deadline."""
+
+    DEADLINE_MARGIN_SECS: ClassVar[float] = 1.0
+    """How long before the predicted lock moment polling starts, covers the inaccuracy of the prediction."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._is_unlocked: bool | None = None
+        self._lock_deadline: float | None = None
+        self._last_poll_at = 0.0
+        self._is_poll_requested = False
+
+    @property
+    def is_unlocked(self) -> bool | None:
+        """Wallets state observed during the last poll, None if not polled yet."""
+        return self._is_unlocked
+
+    @property
+    def lock_deadline(self) -> float | None:
+        """Predicted moment of the lock (in the clock time), None when unknown or wallets are locked."""
+        return self._lock_deadline
+
+    @property
+    def is_poll_due(self) -> bool:
+        if self._is_poll_requested or self._is_unlocked is None:
+            return True
+
+        now = self._clock()
+        if now - self._last_poll_at >= self.SAFETY_POLL_INTERVAL_SECS:
+            return True
+        if not self._is_unlocked:
+            return False
+        return self._lock_deadline is None or now >= self._lock_deadline - self.DEADLINE_MARGIN_SECS
+
+    def request_poll(self) -> None:
+        """Check the state during the next refresh, e.g. after a user action that could change it."""
+        self._is_poll_requested = True
+
+    def notify_timeout_set(self, seconds: float) -> None:
+        self._lock_deadline = self._clock() + seconds
+
+    async def observe(self, session: AsyncSession, *, is_unlocked: bool) -> None:
+        """
+        Record the state polled from the beekeeper.
+
+        When wallets are unlocked and the lock deadline is unknown or has already passed (timeout could be
+        extended), it's fetched from the session.
+
+        Args:
+            session: The beekeeper session the state was polled from.
+            is_unlocked: Whether wallets are unlocked in the session.
+        """
+        self._last_poll_at = self._clock()
+        self._is_poll_requested = False
+        self._is_unlocked = is_unlocked
+
+        if not is_unlocked:
+            self._lock_deadline = None
+            return
+
+        if self._lock_deadline is None or self._last_poll_at >= self._lock_deadline:
+            await self._refresh_lock_deadline(session)
+
+    def reset(self) -> None:
+        self._is_unlocked = None
+        self._lock_deadline = None
+        self._is_poll_requested = False
+
+    async def _refresh_lock_deadline(self, session: AsyncSession) -> None:
+        info = await session.get_info()
+        # use time reported by beekeeper to not depend on the difference between local and beekeeper clocks
+        remaining_secs = (info.timeout_time - info.now).total_seconds()
+        self._lock_deadline = self._clock() + max(remaining_secs, 0.0)
+
+
 class BeekeeperManager:
     def __init__(self) -> None:
         self._settings = self._setup_beekeepy_settings()
         self._beekeeper: AsyncBeekeeper | None = None
         self._session: AsyncSession | None = None
         self._wallets: WalletContainer | None = None
+        self._wallet_state_watcher = WalletStateWatcher()
 
     async def setup(self) -> None:
         self._beekeeper = await self._setup()
@@ -38,6 +131,7 @@ class BeekeeperManager:
         self._beekeeper = None
         self._session = None
         self.clear_wallets()
+        self._wallet_state_watcher.reset()
 
     def __bool__(self) -> bool:
         return bool(self._wallets)
@@ -71,6 +165,10 @@ class BeekeeperManager:
         assert self._session is not None, message
         return self._session
 
+    @property
+    def wallet_state_watcher(self) -> WalletStateWatcher:
+        return self._wallet_state_watcher
+
     @property
     def user_wallet(self) -> AsyncUnlockedWallet:
         return self._content.user_wallet
@@ -99,9 +197,11 @@ class BeekeeperManager:
         assert_wallet_exists(wallets.encryption_wallet.name)
 
         self._wallets = wallets
+        self._wallet_state_watcher.request_poll()
 
     def clear_wallets(self) -> None:
         self._wallets = None
+        self._wallet_state_watcher.request_poll()
 
     def _setup_beekeepy_settings(self) -> InterfaceSettings:
         return safe_settings.beekeeper.settings_factory()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+_MISSING: Final[object] = object()
+
+type ChangeMarkers = Mapping[str, object]
+
+
+class ChangeJournal:
+    """
+    Records which sections of an object changed since it was last persisted.
+
+    Each section is described by a change marker - a cheap to compute value that differs whenever the content of that
+    section changes. Markers are compared against the ones captured during the last persist, so no serialization is
+    needed to tell whether anything changed. Encoded fragments of sections are cached together with the marker they
+    were created from, so clean sections are reused as-is when some other section has to be persisted.
+    """
+
+    def __init__(self) -> None:
+        self._persisted_markers: dict[str, object] | None = None
+        self._fragments: dict[str, tuple[object, bytes]] = {}
+
+    @property
+    def is_persisted(self) -> bool:
+        """Determine if the object was persisted at least once."""
+        return self._persisted_markers is not None
+
+    def get_dirty_sections(self, markers: ChangeMarkers) -> list[str]:
+        """
+        Get sections that changed since the last persist.
+
+        Args:
+            markers: Current change markers of all sections.
+
+        Returns:
+            Names of the sections whose markers differ from the persisted ones. All sections if never persisted.
+        """
+        if self._persisted_markers is None:
+            return list(markers)
+
+        persisted = self._persisted_markers
+        return [section for section, marker in markers.items() if persisted.get(section, _MISSING) != marker]
+
+    def has_changes(self, markers: ChangeMarkers) -> bool:
+        return bool(self.get_dirty_sections(markers))
+
+    def get_fragment(self, section: str, marker: object, encode: Callable[[], bytes]) -> bytes:
+        """
+        Get the encoded fragment of a section, encoding it only if the section changed since the last encoding.
+
+        Args:
+            section: Name of the section.
+            marker: Current change marker of the section.
+            encode: Callable producing the encoded fragment, called only when the cached one is outdated.
+
+        Returns:
+            The encoded fragment of the section.
+        """
+        cached = self._fragments.get(section)
+        if cached is not None and cached[0] == marker:
+            return cached[1]
+
+        fragment = encode()
+        self._fragments[section] = (marker, fragment)
+        return fragment
+
+    def mark_persisted(self, markers: ChangeMarkers) -> None:
+        """
+        Mark given state of sections as persisted.
+
+        Markers should be captured before encoding, so changes made during the persist are not lost.
+
+        Args:
+            markers: Change markers of all sections at the moment the persisted state was captured.
+        """
+        self._persisted_markers = dict(markers)
+
+    def forget_persisted(self) -> None:
+        """Forget the persisted state, so all sections are considered dirty."""
+        self._persisted_markers = None
+        self._fragments.clear()
@@ -62,10 +62,10 @@ class Command(ABC):
         asyncio.gather(*[command.execute() for command in commands])
 
     def _log_execution_info(self) -> None:
-        logger.debug(f"Executing command: {self.__class__.__name__}")
+        logger.debug("Executing command: {}", self.__class__.__name__)
 
     def _log_execution_skipped(self) -> None:
-        logger.debug(f"Skipping execution of command: {self.__class__.__name__}")
+        logger.debug("Skipping execution of command: {}", self.__class__.__name__)
 
     def _log_execution_error(self, error: Exception) -> None:
-        logger.debug(f"Error occurred during {self.__class__.__name__} command execution. Error:\n{error!s}")
+        logger.debug("Error occurred during {} command execution. Error:\n{!s}", self.__class__.__name__, error)
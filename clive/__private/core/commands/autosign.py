@@ -9,10 +9,10 @@ from clive.__private.core.commands.abc.command_with_result import CommandWithRes
 from clive.__private.core.commands.prefetch_transaction_authorities import PrefetchTransactionAuthorities
 from clive.__private.core.constants.data_retrieval import ALREADY_SIGNED_MODE_DEFAULT
 from clive.__private.core.iwax import (
-    calculate_sig_digest,
-    collect_signing_keys,
+    calculate_sig_digest_async,
+    collect_signing_keys_async,
     convert_schemas_account_to_python_authorities,
-    minimize_required_signatures,
+    minimize_required_signatures_async,
 )
 from clive.__private.core.keys.key_manager import KeyManager, KeyNotFoundError, MultipleKeysFoundError
 from clive.__private.logger import logger
@@ -91,7 +91,7 @@ class AutoSign(CommandInUnlocked, CommandWithResult[Transaction]):
         except MultipleKeysFoundError:
             raise TooManyKeysAutoSignError(self) from None
 
-        sig_digest = calculate_sig_digest(self.transaction, self.chain_id)
+        sig_digest = await calculate_sig_digest_async(self.transaction, self.chain_id)
         result = await self.unlocked_wallet.sign_digest(sig_digest=sig_digest, key=key.value)
         self._set_transaction_signature(result)
 
@@ -110,7 +110,7 @@ class AutoSign(CommandInUnlocked, CommandWithResult[Transaction]):
         def retrieve_authorities(account_names: list[str]) -> dict[str, wax.python_authorities]:
             return {name: authorities_map[name] for name in account_names if name in authorities_map}
 
-        approving_keys = collect_signing_keys(self.transaction, retrieve_authorities)
+        approving_keys = await collect_signing_keys_async(self.transaction, retrieve_authorities)
         logger.debug(f"AutoSign: approving keys: {approving_keys}")
 
         profile_public_keys = [key.value for key in self.keys]
@@ -125,7 +125,7 @@ class AutoSign(CommandInUnlocked, CommandWithResult[Transaction]):
         # In "multisign" mode the transaction already holds signatures from other parties;
         # minimize_required_signatures considers them (by recovering public keys from the sigs)
         # and returns only the subset of matching_keys that is still needed.
-        minimal_keys = minimize_required_signatures(
+        minimal_keys = await minimize_required_signatures_async(
             self.transaction,
             self.chain_id,
             matching_keys,
@@ -135,7 +135,7 @@ class AutoSign(CommandInUnlocked, CommandWithResult[Transaction]):
         logger.debug(f"AutoSign: minimal keys after minimization: {minimal_keys}")
 
         # Sign only with the minimal set
-        sig_digest = calculate_sig_digest(self.transaction, self.chain_id)
+        sig_digest = await calculate_sig_digest_async(self.transaction, self.chain_id)
         existing_sig_set = set(existing_signatures)
         new_signatures = []
         for key in minimal_keys:
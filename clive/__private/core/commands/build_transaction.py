@@ -44,7 +44,7 @@ class BuildTransaction(CommandWithResult[Transaction]):
             if self._has_custom_operations(transaction):
                 self._validate_non_custom_operations(transaction)
             else:
-                iwax.validate_transaction(transaction)
+                await iwax.validate_transaction_async(transaction)
         except WaxOperationFailedError as error:
             raise TransactionWaxValidationError(self, transaction, str(error)) from error
 
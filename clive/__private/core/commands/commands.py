@@ -9,6 +9,7 @@ from clive.__private.core.constants.data_retrieval import (
     ORDER_DIRECTION_DEFAULT,
     PROPOSAL_ORDER_DEFAULT,
     PROPOSAL_STATUS_DEFAULT,
+    VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT,
     WITNESSES_SEARCH_BY_PATTERN_LIMIT_DEFAULT,
     WITNESSES_SEARCH_MODE_DEFAULT,
 )
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
     from clive.__private.core.app_state import LockSource
     from clive.__private.core.commands.abc.command import Command
     from clive.__private.core.commands.create_profile_wallets import CreateProfileWalletsResult
+    from clive.__private.core.commands.data_retrieval.account_votes_data import AccountVotesData
     from clive.__private.core.commands.data_retrieval.chain_data import ChainData
     from clive.__private.core.commands.data_retrieval.convert_data import ConvertData
     from clive.__private.core.commands.data_retrieval.escrow_data import EscrowData
@@ -44,14 +46,17 @@ if TYPE_CHECKING:
     from clive.__private.core.commands.data_retrieval.proposals_data import ProposalsData
     from clive.__private.core.commands.data_retrieval.rc_data import RcData
     from clive.__private.core.commands.data_retrieval.savings_data import SavingsData
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
     from clive.__private.core.commands.data_retrieval.witnesses_data import WitnessesData
     from clive.__private.core.commands.get_wallet_names import WalletStatus
     from clive.__private.core.commands.unlock import UnlockWalletStatus
+    from clive.__private.core.commands.verify_transaction_signatures import TransactionFileVerification
     from clive.__private.core.ensure_transaction import TransactionConvertibleType
     from clive.__private.core.error_handlers.abc.error_handler_context_manager import (
         AnyErrorHandlerContextManager,
     )
     from clive.__private.core.keys import PrivateKeyAliased, PublicKey, PublicKeyAliased
+    from clive.__private.core.keys.bulk import KeysImportResult
     from clive.__private.core.keys.key_manager import KeyManager
     from clive.__private.core.profile import Profile
     from clive.__private.core.types import (
@@ -131,6 +136,7 @@ class Commands[WorldT: World]:
                 password=password,
                 unlock_time=unlock_time,
                 permanent_unlock=permanent_unlock,
+                wallet_state_watcher=self._world.beekeeper_manager.wallet_state_watcher,
             )
         )
 
@@ -274,6 +280,7 @@ class Commands[WorldT: World]:
                 profile_name=profile_to_unlock,
                 time=time,
                 permanent=permanent,
+                wallet_state_watcher=self._world.beekeeper_manager.wallet_state_watcher,
             )
         )
 
@@ -368,7 +375,12 @@ class Commands[WorldT: World]:
         from clive.__private.core.commands.set_timeout import SetTimeout  # noqa: PLC0415
 
         return await self.__surround_with_exception_handlers(
-            SetTimeout(session=self._world.beekeeper_manager.session, time=time, permanent=permanent)
+            SetTimeout(
+                session=self._world.beekeeper_manager.session,
+                time=time,
+                permanent=permanent,
+                wallet_state_watcher=self._world.beekeeper_manager.wallet_state_watcher,
+            )
         )
 
     async def perform_actions_on_transaction(  # noqa: PLR0913
@@ -513,6 +525,29 @@ class Commands[WorldT: World]:
 
         return await self.__surround_with_exception_handlers(LoadTransaction(file_path=path))
 
+    async def verify_transaction_files_signatures(
+        self, *, paths: Sequence[Path], chain_id: str | None = None
+    ) -> CommandWithResultWrapper[dict[Path, TransactionFileVerification]]:
+        """
+        Verify locally whether signatures of transactions from files satisfy their required authorities.
+
+        Args:
+            paths: Paths of transaction files or directories with them.
+            chain_id: The chain id the transactions were signed for. If not given, the one of the node is used.
+
+        Returns:
+            A wrapper containing the verification result (or loading error) for each of the transaction files.
+        """
+        from clive.__private.core.commands.verify_transaction_signatures import (  # noqa: PLC0415
+            VerifyTransactionFilesSignatures,
+        )
+
+        return await self.__surround_with_exception_handlers(
+            VerifyTransactionFilesSignatures(
+                paths=paths, node=self._world.node, chain_id=chain_id or await self._world.node.chain_id
+            )
+        )
+
     async def broadcast(self, *, transaction: Transaction) -> CommandWrapper:
         from clive.__private.core.commands.broadcast import Broadcast  # noqa: PLC0415
 
@@ -528,6 +563,18 @@ class Commands[WorldT: World]:
             )
         )
 
+    async def import_keys(
+        self, *, keys_to_import: list[PrivateKeyAliased]
+    ) -> CommandWithResultWrapper[KeysImportResult]:
+        from clive.__private.core.commands.import_keys import ImportKeys  # noqa: PLC0415
+
+        return await self.__surround_with_exception_handlers(
+            ImportKeys(
+                unlocked_wallet=self._world.beekeeper_manager.user_wallet,
+                keys_to_import=keys_to_import,
+            )
+        )
+
     async def remove_key(self, *, key_to_remove: PublicKey) -> CommandWrapper:
         from clive.__private.core.commands.remove_key import RemoveKey  # noqa: PLC0415
 
@@ -557,14 +604,29 @@ class Commands[WorldT: World]:
             )
         )
 
-    async def sync_state_with_beekeeper(self, source: LockSource = "unknown") -> CommandWrapper:
+    async def sync_state_with_beekeeper(
+        self, source: LockSource = "unknown", *, only_when_poll_due: bool = False
+    ) -> CommandWrapper:
+        """
+        Switch the application mode according to the state of wallets in the beekeeper.
+
+        Args:
+            source: What triggered the synchronization.
+            only_when_poll_due: Whether to ask beekeeper only when the wallet state watcher says a poll is due
+                (e.g. near the predicted lock moment). Intended for periodic refreshes.
+
+        Returns:
+            A wrapper containing the result of the command.
+        """
         from clive.__private.core.commands.sync_state_with_beekeeper import SyncStateWithBeekeeper  # noqa: PLC0415
 
+        wallet_state_watcher = self._world.beekeeper_manager.wallet_state_watcher if only_when_poll_due else None
         return await self.__surround_with_exception_handlers(
             SyncStateWithBeekeeper(
                 session=self._world.beekeeper_manager.session,
                 app_state=self._world.app_state,
                 source=source,
+                wallet_state_watcher=wallet_state_watcher,
             )
         )
 
@@ -579,13 +641,16 @@ class Commands[WorldT: World]:
         return result
 
     async def update_node_data(
-        self, *, accounts: Iterable[TrackedAccount] | None = None
+        self, *, accounts: Iterable[TrackedAccount] | None = None, snapshot_round: SnapshotRound | None = None
     ) -> CommandWithResultWrapper[DynamicGlobalProperties]:
         from clive.__private.core.commands.data_retrieval.update_node_data import UpdateNodeData  # noqa: PLC0415
 
         result = await self.__surround_with_exception_handlers(
             UpdateNodeData(
-                accounts=list(accounts or []), wax_interface=self._world.wax_interface, node=self._world.node
+                accounts=list(accounts or []),
+                wax_interface=self._world.wax_interface,
+                node=self._world.node,
+                snapshot_round=snapshot_round,
             )
         )
         if result.success:
@@ -599,11 +664,13 @@ class Commands[WorldT: World]:
             UpdateAlarmsData(accounts=list(accounts) if accounts is not None else [], node=self._world.node)
         )
 
-    async def retrieve_savings_data(self, *, account_name: str) -> CommandWithResultWrapper[SavingsData]:
+    async def retrieve_savings_data(
+        self, *, account_name: str, snapshot_round: SnapshotRound | None = None
+    ) -> CommandWithResultWrapper[SavingsData]:
         from clive.__private.core.commands.data_retrieval.savings_data import SavingsDataRetrieval  # noqa: PLC0415
 
         return await self.__surround_with_exception_handlers(
-            SavingsDataRetrieval(node=self._world.node, account_name=account_name)
+            SavingsDataRetrieval(node=self._world.node, account_name=account_name, snapshot_round=snapshot_round)
         )
 
     async def retrieve_convert_data(self, *, account_name: str) -> CommandWithResultWrapper[ConvertData]:
@@ -634,6 +701,7 @@ class Commands[WorldT: World]:
         mode: WitnessesSearchModes = WITNESSES_SEARCH_MODE_DEFAULT,
         witness_name_pattern: str | None = None,
         search_by_pattern_limit: int = WITNESSES_SEARCH_BY_PATTERN_LIMIT_DEFAULT,
+        snapshot_round: SnapshotRound | None = None,
     ) -> CommandWithResultWrapper[WitnessesData]:
         from clive.__private.core.commands.data_retrieval.witnesses_data import WitnessesDataRetrieval  # noqa: PLC0415
 
@@ -644,6 +712,7 @@ class Commands[WorldT: World]:
                 mode=mode,
                 witness_name_pattern=witness_name_pattern,
                 search_by_pattern_limit=search_by_pattern_limit,
+                snapshot_round=snapshot_round,
             )
         )
 
@@ -654,6 +723,7 @@ class Commands[WorldT: World]:
         order: ProposalOrders = PROPOSAL_ORDER_DEFAULT,
         order_direction: OrderDirections = ORDER_DIRECTION_DEFAULT,
         status: ProposalStatuses = PROPOSAL_STATUS_DEFAULT,
+        snapshot_round: SnapshotRound | None = None,
     ) -> CommandWithResultWrapper[ProposalsData]:
         from clive.__private.core.commands.data_retrieval.proposals_data import ProposalsDataRetrieval  # noqa: PLC0415
 
@@ -664,6 +734,7 @@ class Commands[WorldT: World]:
                 order=order,
                 order_direction=order_direction,
                 status=status,
+                snapshot_round=snapshot_round,
             )
         )
 
@@ -671,22 +742,54 @@ class Commands[WorldT: World]:
         self,
         *,
         account_name: str,
+        delegations_page_no: int = 0,
+        delegations_page_size: int = VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT,
+        snapshot_round: SnapshotRound | None = None,
     ) -> CommandWithResultWrapper[HivePowerData]:
         from clive.__private.core.commands.data_retrieval.hive_power_data import HivePowerDataRetrieval  # noqa: PLC0415
 
         return await self.__surround_with_exception_handlers(
-            HivePowerDataRetrieval(node=self._world.node, account_name=account_name)
+            HivePowerDataRetrieval(
+                node=self._world.node,
+                account_name=account_name,
+                delegations_page_no=delegations_page_no,
+                delegations_page_size=delegations_page_size,
+                snapshot_round=snapshot_round,
+            )
         )
 
     async def retrieve_rc_data(
         self,
         *,
         account_name: str,
+        snapshot_round: SnapshotRound | None = None,
     ) -> CommandWithResultWrapper[RcData]:
         from clive.__private.core.commands.data_retrieval.rc_data import RcDataRetrieval  # noqa: PLC0415
 
         return await self.__surround_with_exception_handlers(
-            RcDataRetrieval(node=self._world.node, account_name=account_name)
+            RcDataRetrieval(node=self._world.node, account_name=account_name, snapshot_round=snapshot_round)
+        )
+
+    async def retrieve_account_votes_data(
+        self,
+        *,
+        account_name: str,
+        include_witness_votes: bool = True,
+        include_proposal_votes: bool = True,
+        snapshot_round: SnapshotRound | None = None,
+    ) -> CommandWithResultWrapper[AccountVotesData]:
+        from clive.__private.core.commands.data_retrieval.account_votes_data import (  # noqa: PLC0415
+            AccountVotesDataRetrieval,
+        )
+
+        return await self.__surround_with_exception_handlers(
+            AccountVotesDataRetrieval(
+                node=self._world.node,
+                account_name=account_name,
+                include_witness_votes=include_witness_votes,
+                include_proposal_votes=include_proposal_votes,
+                snapshot_round=snapshot_round,
+            )
         )
 
     async def retrieve_chain_data(self) -> CommandWithResultWrapper[ChainData]:
@@ -720,6 +823,13 @@ class Commands[WorldT: World]:
 
         return await self.__surround_with_exception_handlers(FindAccounts(node=self._world.node, accounts=accounts))
 
+    async def list_account_names(self, *, prefix: str, limit: int) -> CommandWithResultWrapper[list[str]]:
+        from clive.__private.core.commands.list_account_names import ListAccountNames  # noqa: PLC0415
+
+        return await self.__surround_with_exception_handlers(
+            ListAccountNames(node=self._world.node, prefix=prefix, limit=limit)
+        )
+
     async def find_vesting_delegation_expirations(
         self, *, account: str
     ) -> CommandWithResultWrapper[list[VestingDelegationExpirationData]]:
@@ -752,7 +862,7 @@ class Commands[WorldT: World]:
     async def save_profile(self) -> NoOpWrapper | CommandWrapper:
         profile = self._world.profile
         if not profile.should_be_saved:
-            logger.debug("Saving profile skipped... Looks like was explicitly skipped or hash didn't changed.")
+            logger.debug("Saving profile skipped... Looks like was explicitly skipped or nothing has changed.")
             return NoOpWrapper()
 
         from clive.__private.core.commands.save_profile import SaveProfile  # noqa: PLC0415
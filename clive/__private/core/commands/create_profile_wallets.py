@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from beekeepy import AsyncSession, AsyncUnlockedWallet
 
     from clive.__private.core.app_state import AppState
+    from clive.__private.core.beekeeper_manager import WalletStateWatcher
 
 
 @dataclass
@@ -32,6 +33,8 @@ class CreateProfileWallets(CommandWithResult[CreateProfileWalletsResult]):
     unlock_time: timedelta | None = None
     permanent_unlock: bool = True
     """Will take precedence when `unlock_time` is also set."""
+    wallet_state_watcher: WalletStateWatcher | None = None
+    """Will be notified about the set timeout, so it can predict the lock moment."""
 
     async def _execute(self) -> None:
         unlocked_encryption_wallet = await CreateEncryptionWallet(
@@ -47,4 +50,9 @@ class CreateProfileWallets(CommandWithResult[CreateProfileWalletsResult]):
         if self.app_state:
             await self.app_state.unlock(WalletContainer(unlocked_user_wallet, unlocked_encryption_wallet))
 
-        await SetTimeout(session=self.session, time=self.unlock_time, permanent=self.permanent_unlock).execute()
+        await SetTimeout(
+            session=self.session,
+            time=self.unlock_time,
+            permanent=self.permanent_unlock,
+            wallet_state_watcher=self.wallet_state_watcher,
+        ).execute()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
+from clive.__private.core.constants.node import DATABASE_API_SINGLE_QUERY_LIMIT, MAX_NUMBER_OF_WITNESSES_VOTES
+
+if TYPE_CHECKING:
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
+    from clive.__private.models.schemas import ListProposalVotes, ListWitnessVotes
+
+
+@dataclass
+class HarvestedDataRaw:
+    witness_votes: ListWitnessVotes | None = None
+    proposal_votes: ListProposalVotes | None = None
+
+
+@dataclass
+class AccountVotesData:
+    """
+    Witnesses and proposals the account currently votes for.
+
+    Attributes:
+        witness_votes: Names of voted witnesses, None when not retrieved.
+        proposal_votes: Ids of voted proposals which can still be voted, None when not retrieved.
+    """
+
+    witness_votes: set[str] | None
+    proposal_votes: set[int] | None
+
+
+@dataclass(kw_only=True)
+class AccountVotesDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, HarvestedDataRaw, AccountVotesData]):
+    """
+    Retrieve only the votes of the account, without the details of voted witnesses and proposals.
+
+    Attributes:
+        account_name: Name of the voter.
+        include_witness_votes: Whether to retrieve witness votes.
+        include_proposal_votes: Whether to retrieve proposal votes.
+    """
+
+    MAX_SEARCHED_PROPOSAL_VOTES: ClassVar[int] = DATABASE_API_SINGLE_QUERY_LIMIT
+
+    account_name: str
+    include_witness_votes: bool = True
+    include_proposal_votes: bool = True
+
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        if self.include_witness_votes:
+            needs.add_call("database_api", "list_witness_votes", **self.__witness_votes_params)
+        if self.include_proposal_votes:
+            needs.add_call("database_api", "list_proposal_votes", **self.__proposal_votes_params)
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        data = HarvestedDataRaw()
+        if self.include_witness_votes:
+            data.witness_votes = snapshot.get_result(
+                "database_api", "list_witness_votes", **self.__witness_votes_params
+            )
+        if self.include_proposal_votes:
+            data.proposal_votes = snapshot.get_result(
+                "database_api", "list_proposal_votes", **self.__proposal_votes_params
+            )
+        return data
+
+    async def _process_data(self, data: HarvestedDataRaw) -> AccountVotesData:
+        witness_votes: set[str] | None = None
+        if data.witness_votes is not None:
+            witness_votes = {vote.witness for vote in data.witness_votes.votes if vote.account == self.account_name}
+
+        proposal_votes: set[int] | None = None
+        if data.proposal_votes is not None:
+            proposal_votes = {
+                vote.proposal.proposal_id
+                for vote in data.proposal_votes.proposal_votes
+                if vote.voter == self.account_name
+            }
+
+        return AccountVotesData(witness_votes=witness_votes, proposal_votes=proposal_votes)
+
+    @property
+    def __witness_votes_params(self) -> dict[str, Any]:
+        return {
+            "start": (self.account_name, ""),
+            "limit": MAX_NUMBER_OF_WITNESSES_VOTES,
+            "order": "by_account_witness",
+        }
+
+    @property
+    def __proposal_votes_params(self) -> dict[str, Any]:
+        return {
+            "start": [self.account_name],
+            "limit": self.MAX_SEARCHED_PROPOSAL_VOTES,
+            "order": "by_voter_proposal",
+            "order_direction": "ascending",
+            "status": "votable",
+        }
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Final, Literal, cast
+from typing import TYPE_CHECKING, Final, Literal
 
 import beekeepy.exceptions as bke
 
@@ -12,7 +11,9 @@ from clive.__private.core.formatters.humanize import align_to_dot, humanize_asse
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
 
+    from clive.__private.core.transfer_schedule_projection import TransferScheduleProjection
     from clive.__private.models.schemas import Account, FindAccounts, RecurrentTransfer
     from clive.__private.models.schemas import FindRecurrentTransfers as SchemasFindRecurrentTransfers
 from clive.__private.models.asset import Asset
@@ -105,6 +106,11 @@ class FutureScheduledTransfer:
 TypeOfTransfers = ScheduledTransfer | FutureScheduledTransfer
 
 
+def calculate_possible_amount(balance: Asset.LiquidT, amount: Asset.LiquidT) -> Asset.LiquidT:
+    lack_of_funds: Asset.LiquidT = ZERO_HIVE_ASSET if Asset.is_hive(amount) else ZERO_HBD_ASSET
+    return balance - amount if balance > amount else lack_of_funds
+
+
 def _assert_sort_by_members_in_class_members(sort_by: Sequence[str], of_class: type[TypeOfTransfers]) -> None:
     all_members = [field.name for field in fields(of_class)]
     assert all(member in all_members for member in sort_by), (
@@ -152,51 +158,20 @@ class AccountScheduledTransferData:
         )
 
     def calculate_possible_amount(self, balance: Asset.LiquidT, amount: Asset.LiquidT) -> Asset.LiquidT:
-        lack_of_funds: Asset.LiquidT = ZERO_HIVE_ASSET if Asset.is_hive(amount) else ZERO_HBD_ASSET
-        return balance - amount if balance > amount else lack_of_funds
-
-    def get_next_upcoming_future_scheduled_transfers(self, next_upcoming: int) -> AccountFutureScheduledTransferData:
-        future_scheduled_transfers: list[FutureScheduledTransfer] = []
-        # Create all future scheduled transfers
-        for st in self.scheduled_transfers:
-            number_of_calculated_future_scheduled_transfers = min(st.remaining_executions, next_upcoming)
-            future_scheduled_transfers.extend(
-                FutureScheduledTransfer(
-                    amount=st.amount,
-                    from_=st.from_,
-                    memo=st.memo,
-                    pair_id=st.pair_id,
-                    possible_amount=ZERO_HIVE_ASSET.copy() if Asset.is_hive(st.amount) else ZERO_HBD_ASSET.copy(),
-                    recurrence=st.recurrence,
-                    remaining_executions=remains,
-                    to=st.to,
-                    trigger_date=st.trigger_date + timedelta(hours=idx * st.recurrence),
-                )
-                for idx, remains in enumerate(range(number_of_calculated_future_scheduled_transfers))
-            )
+        return calculate_possible_amount(balance, amount)
 
-        # Sort future transfer list, and slice it to next_upcoming value
-        future_scheduled_transfers.sort(key=lambda x: x.trigger_date)
-        upcoming_future_transfers = future_scheduled_transfers[:next_upcoming]
-        upcoming_future_transfers_data = AccountFutureScheduledTransferData(
-            future_scheduled_transfers=upcoming_future_transfers
+    def get_projection(self) -> TransferScheduleProjection:
+        """Get projection of future executions of the scheduled transfers, cached until they or balance change."""
+        from clive.__private.core.transfer_schedule_projection import TransferScheduleProjection  # noqa: PLC0415
+
+        return TransferScheduleProjection.of(
+            self.scheduled_transfers, self.account_hive_balance, self.account_hbd_balance
         )
 
-        # Calculate possible amounts
-        account_hive_balance = self.account_hive_balance
-        account_hbd_balance = self.account_hbd_balance
-        for future_transfer in upcoming_future_transfers_data.future_scheduled_transfers:
-            if Asset.is_hive(future_transfer.amount):
-                account_hive_balance = cast(
-                    "Asset.Hive", self.calculate_possible_amount(account_hive_balance, future_transfer.amount)
-                )
-                future_transfer.possible_amount = account_hive_balance
-            else:
-                account_hbd_balance = cast(
-                    "Asset.Hbd", self.calculate_possible_amount(account_hbd_balance, future_transfer.amount)
-                )
-                future_transfer.possible_amount = account_hbd_balance
-        return upcoming_future_transfers_data
+    def get_next_upcoming_future_scheduled_transfers(
+        self, next_upcoming: int | None, *, until: datetime | None = None, offset: int = 0
+    ) -> AccountFutureScheduledTransferData:
+        return self.get_projection().get_upcoming(next_upcoming, until=until, offset=offset)
 
 
 @dataclass
@@ -1,32 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Final
-
-import beekeepy.exceptions as bke
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from clive.__private.core import iwax
-from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
+from clive.__private.core.constants.data_retrieval import VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
+from clive.__private.core.constants.node import DATABASE_API_SINGLE_QUERY_LIMIT, HIVE_MAX_WITHDRAW_ROUTES
 from clive.__private.core.formatters.humanize import align_to_dot
 from clive.__private.models.asset import Asset
 from clive.__private.models.hp_vests_balance import HpVestsBalance
+from clive.__private.models.schemas import ListVestingDelegations
 
 if TYPE_CHECKING:
     from datetime import datetime
     from decimal import Decimal
 
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.core.node import Node
     from clive.__private.models.schemas import (
         Account,
         DynamicGlobalProperties,
         FindAccounts,
-        FindVestingDelegations,
         ListWithdrawVestingRoutes,
         VestingDelegation,
         WithdrawRoute,
     )
 
-_MAX_WITHDRAW_VESTING_ROUTES_LIMIT: Final[int] = 10
+
+class _DelegationAmountsCache:
+    """
+    Formatted amounts of delegations retained between refreshes, so only new or changed delegations are formatted.
+
+    Amounts are keyed by vesting shares and the vests-to-HP ratio, entries of the previous ratio are dropped once it
+    changes.
+    """
+
+    def __init__(self) -> None:
+        self._ratio: tuple[int, int] | None = None
+        self._amounts: dict[int, tuple[str, str]] = {}
+
+    def get(self, vesting_shares: Asset.Vests, gdpo: DynamicGlobalProperties) -> tuple[str, str]:
+        ratio = (int(gdpo.total_vesting_fund_hive.amount), int(gdpo.total_vesting_shares.amount))
+        if ratio != self._ratio:
+            self._ratio = ratio
+            self._amounts.clear()
+
+        key = int(vesting_shares.amount)
+        amounts = self._amounts.get(key)
+        if amounts is None:
+            balance = HpVestsBalance.create(vesting_shares, gdpo)
+            amounts = (Asset.pretty_amount(balance.hp_balance), Asset.pretty_amount(balance.vests_balance))
+            self._amounts[key] = amounts
+        return amounts
+
+
+_delegation_amounts_cache = _DelegationAmountsCache()
 
 
 @dataclass
@@ -34,7 +63,7 @@ class HarvestedDataRaw:
     gdpo: DynamicGlobalProperties | None = None
     core_account: FindAccounts | None = None
     withdraw_routes: ListWithdrawVestingRoutes | None = None
-    delegations: FindVestingDelegations | None = None
+    delegations: ListVestingDelegations | None = None
 
 
 @dataclass
@@ -54,6 +83,10 @@ class HivePowerData:
     next_vesting_withdrawal: datetime
     withdraw_routes: list[WithdrawRoute]
     delegations: list[VestingDelegation]
+    """Delegations on the requested page only."""
+    delegations_page_no: int
+    has_more_delegations: bool
+    """Whether there are delegations on the next pages."""
     to_withdraw: HpVestsBalance
     withdrawn: HpVestsBalance
     remaining: HpVestsBalance
@@ -70,37 +103,121 @@ class HivePowerData:
         """
         hp_amounts_to_align, vests_amounts_to_align = [], []
         for delegation in self.delegations:
-            hp_vests_amount = HpVestsBalance.create(delegation.vesting_shares, self.gdpo)
-
-            hp_amounts_to_align.append(Asset.pretty_amount(hp_vests_amount.hp_balance))
-            vests_amounts_to_align.append(Asset.pretty_amount(hp_vests_amount.vests_balance))
+            hp_amount, vests_amount = _delegation_amounts_cache.get(delegation.vesting_shares, self.gdpo)
+            hp_amounts_to_align.append(hp_amount)
+            vests_amounts_to_align.append(vests_amount)
 
         return align_to_dot(*hp_amounts_to_align), align_to_dot(*vests_amounts_to_align)
 
 
+async def find_vesting_delegations_page_start(
+    node: Node, account_name: str, *, page_no: int, page_size: int
+) -> str | None:
+    """
+    Walk delegations of the account with a cursor, in the biggest chunks the node allows, up to the requested page.
+
+    Args:
+        node: The node to list the delegations from.
+        account_name: Name of the delegator.
+        page_no: Number of the page, starting from 0.
+        page_size: Number of delegations on a single page.
+
+    Returns:
+        The delegatee the page starts from, None when the page is out of range.
+    """
+    start = ""
+    to_skip = page_no * page_size
+    while to_skip:
+        limit = min(to_skip + 1, DATABASE_API_SINGLE_QUERY_LIMIT)
+        delegations = _filter_own_delegations(
+            await node.api.database_api.list_vesting_delegations(
+                start=(account_name, start), limit=limit, order="by_delegation"
+            ),
+            account_name,
+        )
+        if to_skip < len(delegations):
+            return delegations[to_skip].delegatee
+        if len(delegations) < limit:
+            return None
+
+        # the last one starts the next chunk (start is inclusive), so it's not skipped yet
+        start = delegations[-1].delegatee
+        to_skip -= limit - 1
+    return start
+
+
+def _filter_own_delegations(data: ListVestingDelegations, account_name: str) -> list[VestingDelegation]:
+    # listing goes further to the delegations of next delegators when there is no more delegations of the account
+    return [delegation for delegation in data.delegations if delegation.delegator == account_name]
+
+
 @dataclass(kw_only=True)
-class HivePowerDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, HivePowerData]):
-    node: Node
+class HivePowerDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, HivePowerData]):
+    """
+    Retrieve hive power data of the account, with a single page of its delegations.
+
+    Delegations are listed with a cursor (the delegatee the page starts from), so even accounts with thousands of
+    delegations are retrieved a page at a time.
+
+    Attributes:
+        account_name: Name of the account.
+        delegations_page_no: Number of the page of delegations to retrieve, starting from 0.
+        delegations_page_size: Number of delegations on a single page.
+    """
+
     account_name: str
+    delegations_page_no: int = 0
+    delegations_page_size: int = VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
+    _delegations_start: str | None = field(init=False, default="")
+
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_accounts(self.account_name)
+        needs.add_call("database_api", "list_withdraw_vesting_routes", **self.__withdraw_routes_params)
+        if self._delegations_start is not None:
+            needs.add_call("database_api", "list_vesting_delegations", **self.__delegations_params)
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        return HarvestedDataRaw(
+            snapshot.get_gdpo(),
+            snapshot.get_accounts([self.account_name]),
+            snapshot.get_result("database_api", "list_withdraw_vesting_routes", **self.__withdraw_routes_params),
+            (
+                snapshot.get_result("database_api", "list_vesting_delegations", **self.__delegations_params)
+                if self._delegations_start is not None
+                else ListVestingDelegations(delegations=[])
+            ),
+        )
 
     async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        async with await self.node.batch() as node:
-            return HarvestedDataRaw(
-                await node.api.database_api.get_dynamic_global_properties(),
-                await node.api.database_api.find_accounts(accounts=[self.account_name]),
-                await node.api.database_api.list_withdraw_vesting_routes(
-                    start=(self.account_name, ""), limit=_MAX_WITHDRAW_VESTING_ROUTES_LIMIT, order="by_withdraw_route"
-                ),
-                await node.api.database_api.find_vesting_delegations(account=self.account_name),
-            )
-        raise bke.UnknownDecisionPathError(f"{self.__class__.__name__}:_harvest_data_from_api")
+        self._delegations_start = await find_vesting_delegations_page_start(
+            self.node, self.account_name, page_no=self.delegations_page_no, page_size=self.delegations_page_size
+        )
+        return await super()._harvest_data_from_api()
+
+    @property
+    def __withdraw_routes_params(self) -> dict[str, Any]:
+        return {
+            "start": (self.account_name, ""),
+            "limit": HIVE_MAX_WITHDRAW_ROUTES,
+            "order": "by_withdraw_route",
+        }
+
+    @property
+    def __delegations_params(self) -> dict[str, Any]:
+        assert self._delegations_start is not None, "Page of delegations is out of range"
+        return {
+            "start": (self.account_name, self._delegations_start),
+            "limit": self.delegations_page_size + 1,  # one more to know whether there is a next page
+            "order": "by_delegation",
+        }
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         return SanitizedData(
             gdpo=self._assert_gdpo(data.gdpo),
             core_account=self._assert_core_account(data.core_account),
             withdraw_routes=self._assert_withdraw_routes(data.withdraw_routes),
-            delegations=self._assert_delegations(data.delegations),
+            delegations=_filter_own_delegations(self._assert_delegations(data.delegations), self.account_name),
         )
 
     async def _process_data(self, data: SanitizedData) -> HivePowerData:
@@ -119,7 +236,9 @@ class HivePowerDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedDat
             delegated_balance=HpVestsBalance.create(delegated_shares, data.gdpo),
             next_vesting_withdrawal=data.core_account.next_vesting_withdrawal,
             withdraw_routes=[route for route in data.withdraw_routes if route.from_account == self.account_name],
-            delegations=data.delegations,
+            delegations=data.delegations[: self.delegations_page_size],
+            delegations_page_no=self.delegations_page_no,
+            has_more_delegations=len(data.delegations) > self.delegations_page_size,
             to_withdraw=HpVestsBalance.create(to_withdraw_vests, data.gdpo),
             withdrawn=HpVestsBalance.create(withdrawn_vests, data.gdpo),
             remaining=HpVestsBalance.create(remaining_vests, data.gdpo),
@@ -144,6 +263,6 @@ class HivePowerDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedDat
         assert data is not None, "ListWithdrawVestingRoutes data is missing"
         return data.routes
 
-    def _assert_delegations(self, data: FindVestingDelegations | None) -> list[VestingDelegation]:
-        assert data is not None, "FindVestingDelegations data is missing"
-        return data.delegations
+    def _assert_delegations(self, data: ListVestingDelegations | None) -> ListVestingDelegations:
+        assert data is not None, "ListVestingDelegations data is missing"
+        return data
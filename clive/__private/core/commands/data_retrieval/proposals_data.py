@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import beekeepy.exceptions as bke
-
-from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
 from clive.__private.core.constants.data_retrieval import (
     ORDER_DIRECTION_DEFAULT,
     ORDER_DIRECTIONS,
@@ -21,7 +19,7 @@ from clive.__private.models.asset import Asset
 if TYPE_CHECKING:
     import datetime
 
-    from clive.__private.core.node import Node
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.core.node.async_hived.api.database_api.common import DatabaseApiCommons
     from clive.__private.models.schemas import DynamicGlobalProperties, ListProposals, ListProposalVotes
     from clive.__private.models.schemas import Proposal as SchemasProposal
@@ -69,7 +67,7 @@ class ProposalsData:
 
 
 @dataclass(kw_only=True)
-class ProposalsDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, ProposalsData]):
+class ProposalsDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, ProposalsData]):
     type Orders = ProposalOrders
     type OrderDirections = OrderDirections
     type Statuses = ProposalStatuses
@@ -84,40 +82,50 @@ class ProposalsDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedDat
     DEFAULT_ORDER: ClassVar[Orders] = PROPOSAL_ORDER_DEFAULT
     DEFAULT_ORDER_DIRECTION: ClassVar[OrderDirections] = ORDER_DIRECTION_DEFAULT
 
-    node: Node
     account_name: str
     order: Orders = DEFAULT_ORDER
     order_direction: OrderDirections = DEFAULT_ORDER_DIRECTION
     status: Statuses = DEFAULT_STATUS
 
-    async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        async with await self.node.batch() as node:
-            gdpo = await node.api.database_api.get_dynamic_global_properties()
-            proposal_votes = await node.api.database_api.list_proposal_votes(
-                start=[self.account_name],
-                limit=self.MAX_SEARCHED_PROPOSALS_HARD_LIMIT,
-                order="by_voter_proposal",
-                order_direction=self.order_direction,
-                status=self.status,
-            )
-
-            order: DatabaseApiCommons.SORT_TYPES
-            if self.order == "by_total_votes_with_voted_first":
-                order = "by_total_votes"
-            elif self.order in self.ORDERS:
-                order = self.order
-            else:
-                raise ValueError(f"Unknown order: {self.order}")
-
-            searched_proposals = await node.api.database_api.list_proposals(
-                start=[],
-                limit=self.MAX_SEARCHED_PROPOSALS_HARD_LIMIT,
-                order=order,
-                order_direction=self.order_direction,
-                status=self.status,
-            )
-            return HarvestedDataRaw(gdpo, searched_proposals, proposal_votes)
-        raise bke.UnknownDecisionPathError(f"{self.__class__.__name__}:_harvest_data_from_api")
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_call("database_api", "list_proposal_votes", **self.__proposal_votes_params)
+        needs.add_call("database_api", "list_proposals", **self.__proposals_params)
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        return HarvestedDataRaw(
+            snapshot.get_gdpo(),
+            snapshot.get_result("database_api", "list_proposals", **self.__proposals_params),
+            snapshot.get_result("database_api", "list_proposal_votes", **self.__proposal_votes_params),
+        )
+
+    @property
+    def __proposal_votes_params(self) -> dict[str, Any]:
+        return {
+            "start": [self.account_name],
+            "limit": self.MAX_SEARCHED_PROPOSALS_HARD_LIMIT,
+            "order": "by_voter_proposal",
+            "order_direction": self.order_direction,
+            "status": self.status,
+        }
+
+    @property
+    def __proposals_params(self) -> dict[str, Any]:
+        order: DatabaseApiCommons.SORT_TYPES
+        if self.order == "by_total_votes_with_voted_first":
+            order = "by_total_votes"
+        elif self.order in self.ORDERS:
+            order = self.order
+        else:
+            raise ValueError(f"Unknown order: {self.order}")
+
+        return {
+            "start": [],
+            "limit": self.MAX_SEARCHED_PROPOSALS_HARD_LIMIT,
+            "order": order,
+            "order_direction": self.order_direction,
+            "status": self.status,
+        }
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         return SanitizedData(
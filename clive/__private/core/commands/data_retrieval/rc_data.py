@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from decimal import Decimal
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
-import beekeepy.exceptions as bke
-
-from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
 from clive.__private.core.constants.node import HIVE_RC_DELEGATION_MIN_ACCOUNT_CREATION_FEE_DIVISOR
 from clive.__private.core.constants.precision import HIVE_PERCENT_PRECISION_DOT_PLACES
 from clive.__private.core.decimal_conventer import DecimalConverter
@@ -17,6 +15,7 @@ from clive.__private.core.iwax import (
 )
 
 if TYPE_CHECKING:
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.core.node import Node
     from clive.__private.models.asset import Asset
     from clive.__private.models.schemas import (
@@ -31,12 +30,40 @@ if TYPE_CHECKING:
 _MAX_RC_DIRECT_DELEGATIONS_LIMIT: Final[int] = 1000
 
 
+async def list_next_rc_direct_delegations(
+    node: Node, account_name: str, first_page: list[RcDirectDelegation]
+) -> list[RcDirectDelegation]:
+    """
+    List the rest of RC delegations of the account with a cursor, as long as the previous page was full.
+
+    Args:
+        node: The node to list the delegations from.
+        account_name: Name of the delegator.
+        first_page: Delegations listed from the beginning, with the limit of the node.
+
+    Returns:
+        Delegations of the account following the first page.
+    """
+    next_delegations: list[RcDirectDelegation] = []
+    page = first_page
+    while len(page) == _MAX_RC_DIRECT_DELEGATIONS_LIMIT and str(page[-1].from_) == account_name:
+        response = await node.api.rc_api.list_rc_direct_delegations(
+            start=(account_name, str(page[-1].to)), limit=_MAX_RC_DIRECT_DELEGATIONS_LIMIT
+        )
+        page = response.rc_direct_delegations
+        # start is inclusive, the first one was already listed; listing goes further to the next delegators
+        next_delegations.extend(delegation for delegation in page[1:] if str(delegation.from_) == account_name)
+    return next_delegations
+
+
 @dataclass
 class HarvestedDataRaw:
     gdpo: DynamicGlobalProperties | None = None
     rc_accounts: FindRcAccounts | None = None
     rc_delegations: ListRcDirectDelegations | None = None
     witness_schedule: WitnessSchedule | None = None
+    next_rc_delegations: list[RcDirectDelegation] = field(default_factory=list)
+    """Delegations listed after the first page (which is fetched in the snapshot), when the account has many."""
 
 
 @dataclass
@@ -62,27 +89,40 @@ class RcData:
 
 
 @dataclass(kw_only=True)
-class RcDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, RcData]):
-    node: Node
+class RcDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, RcData]):
     account_name: str
 
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_rc_accounts(self.account_name)
+        needs.add_call("rc_api", "list_rc_direct_delegations", **self.__rc_delegations_params)
+        needs.add_call("database_api", "get_witness_schedule")
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        return HarvestedDataRaw(
+            snapshot.get_gdpo(),
+            snapshot.get_rc_accounts([self.account_name]),
+            snapshot.get_result("rc_api", "list_rc_direct_delegations", **self.__rc_delegations_params),
+            snapshot.get_result("database_api", "get_witness_schedule"),
+        )
+
     async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        async with await self.node.batch() as node:
-            return HarvestedDataRaw(
-                await node.api.database_api.get_dynamic_global_properties(),
-                await node.api.rc_api.find_rc_accounts(accounts=[self.account_name]),
-                await node.api.rc_api.list_rc_direct_delegations(
-                    start=(self.account_name, ""), limit=_MAX_RC_DIRECT_DELEGATIONS_LIMIT
-                ),
-                await node.api.database_api.get_witness_schedule(),
+        data = await super()._harvest_data_from_api()
+        if data.rc_delegations is not None:
+            data.next_rc_delegations = await list_next_rc_direct_delegations(
+                self.node, self.account_name, data.rc_delegations.rc_direct_delegations
             )
-        raise bke.UnknownDecisionPathError(f"{self.__class__.__name__}:_harvest_data_from_api")
+        return data
+
+    @property
+    def __rc_delegations_params(self) -> dict[str, Any]:
+        return {"start": (self.account_name, ""), "limit": _MAX_RC_DIRECT_DELEGATIONS_LIMIT}
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         return SanitizedData(
             gdpo=self._assert_gdpo(data.gdpo),
             rc_account=self._assert_rc_account(data.rc_accounts),
-            outgoing_delegations=self._assert_delegations(data.rc_delegations),
+            outgoing_delegations=[*self._assert_delegations(data.rc_delegations), *data.next_rc_delegations],
             account_creation_fee=self._assert_account_creation_fee(data.witness_schedule),
         )
 
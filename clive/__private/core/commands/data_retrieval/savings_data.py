@@ -3,16 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Final
 
-import beekeepy.exceptions as bke
-
-from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
 from clive.__private.core.formatters.humanize import align_to_dot, humanize_asset
 from clive.exceptions import RequestIdError
 
 if TYPE_CHECKING:
     from datetime import datetime
 
-    from clive.__private.core.node import Node
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.models.asset import Asset
     from clive.__private.models.schemas import (
         Account,
@@ -86,18 +84,20 @@ class SavingsData:
 
 
 @dataclass(kw_only=True)
-class SavingsDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, SavingsData]):
-    node: Node
+class SavingsDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, SavingsData]):
     account_name: str
 
-    async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        async with await self.node.batch() as node:
-            return HarvestedDataRaw(
-                await node.api.database_api.get_dynamic_global_properties(),
-                await node.api.database_api.find_accounts(accounts=[self.account_name]),
-                await node.api.database_api.find_savings_withdrawals(account=self.account_name),
-            )
-        raise bke.UnknownDecisionPathError(f"{self.__class__.__name__}:_harvest_data_from_api")
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_accounts(self.account_name)
+        needs.add_call("database_api", "find_savings_withdrawals", account=self.account_name)
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        return HarvestedDataRaw(
+            snapshot.get_gdpo(),
+            snapshot.get_accounts([self.account_name]),
+            snapshot.get_result("database_api", "find_savings_withdrawals", account=self.account_name),
+        )
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         return SanitizedData(
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.abc.command_data_retrieval_base import HarvestedDataT, SanitizedDataT
+from clive.__private.core.commands.abc.command_with_result import CommandResultT
+from clive.__private.logger import logger
+from clive.__private.models.schemas import FindAccounts, FindRcAccounts
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from clive.__private.core.node import Node
+    from clive.__private.models.schemas import DynamicGlobalProperties
+
+type SnapshotCallKey = tuple[str, str, str]
+"""Api, method and representation of params, identifies calls which can be sent once for many retrievals."""
+
+
+def _create_call_key(api: str, method: str, params: dict[str, Any]) -> SnapshotCallKey:
+    return api, method, repr(sorted(params.items()))
+
+
+@dataclass
+class SnapshotNeeds:
+    """
+    Data needed by many retrievals, merged so each piece of data is requested once.
+
+    Global properties are requested once, accounts (and their RC) of all retrievals are requested with a single call
+    and other calls with the same params are deduplicated.
+    """
+
+    is_gdpo_needed: bool = False
+    account_names: dict[str, None] = field(default_factory=dict)
+    """Ordered set of names of accounts to find."""
+    rc_account_names: dict[str, None] = field(default_factory=dict)
+    """Ordered set of names of accounts to find RC of."""
+    calls: dict[SnapshotCallKey, tuple[str, str, dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def requests_amount(self) -> int:
+        """Number of JSON-RPC requests in the batch fetching the needs."""
+        return int(self.is_gdpo_needed) + bool(self.account_names) + bool(self.rc_account_names) + len(self.calls)
+
+    def add_gdpo(self) -> None:
+        self.is_gdpo_needed = True
+
+    def add_accounts(self, *names: str) -> None:
+        self.account_names.update(dict.fromkeys(names))
+
+    def add_rc_accounts(self, *names: str) -> None:
+        self.rc_account_names.update(dict.fromkeys(names))
+
+    def add_call(self, api: str, method: str, **params: Any) -> None:
+        """
+        Add a call of other API method, the same call of many retrievals is sent once.
+
+        Args:
+            api: Name of the API, e.g. `database_api`.
+            method: Name of the method of the API.
+            **params: Params of the call.
+        """
+        self.calls.setdefault(_create_call_key(api, method, params), (api, method, params))
+
+    async def fetch(self, node: Node) -> NodeSnapshot:
+        """
+        Fetch all the needs in a single batch.
+
+        Errors are delayed until the data is accessed, so a failing call affects only the retrievals which need it.
+
+        Args:
+            node: The node to fetch the data from.
+
+        Returns:
+            The snapshot with fetched data.
+        """
+        snapshot = NodeSnapshot()
+        async with await node.batch(delay_error_on_data_access=True) as batch_node:
+            if self.is_gdpo_needed:
+                snapshot.gdpo = await batch_node.api.database_api.get_dynamic_global_properties()
+            if self.account_names:
+                snapshot.accounts = await batch_node.api.database_api.find_accounts(accounts=list(self.account_names))
+            if self.rc_account_names:
+                snapshot.rc_accounts = await batch_node.api.rc_api.find_rc_accounts(
+                    accounts=list(self.rc_account_names)
+                )
+            for key, (api, method, params) in self.calls.items():
+                snapshot.results[key] = await getattr(getattr(batch_node.api, api), method)(**params)
+        return snapshot
+
+
+@dataclass
+class NodeSnapshot:
+    """Data fetched for many retrievals in a single batch, each takes the part it needs."""
+
+    gdpo: DynamicGlobalProperties | None = None
+    accounts: FindAccounts | None = None
+    rc_accounts: FindRcAccounts | None = None
+    results: dict[SnapshotCallKey, Any] = field(default_factory=dict)
+
+    def get_gdpo(self) -> DynamicGlobalProperties:
+        assert self.gdpo is not None, "DynamicGlobalProperties were not requested"
+        return self.gdpo
+
+    def get_accounts(self, names: Iterable[str]) -> FindAccounts:
+        """Get found accounts of the given names, in their order, like `find_accounts` called only for them does."""
+        names = list(names)
+        if not names:
+            return FindAccounts(accounts=[])
+        assert self.accounts is not None, "Accounts were not requested"
+        try:
+            accounts = {account.name: account for account in self.accounts.accounts}
+        except Exception:  # noqa: BLE001  # error of the call is raised again when the retrieval accesses it
+            return self.accounts
+        return FindAccounts(accounts=[accounts[name] for name in names if name in accounts])
+
+    def get_rc_accounts(self, names: Iterable[str]) -> FindRcAccounts:
+        """Get found RC accounts of the given names, in their order, like `find_rc_accounts` called for them does."""
+        names = list(names)
+        if not names:
+            return FindRcAccounts(rc_accounts=[])
+        assert self.rc_accounts is not None, "RC accounts were not requested"
+        try:
+            rc_accounts = {rc_account.account: rc_account for rc_account in self.rc_accounts.rc_accounts}
+        except Exception:  # noqa: BLE001  # e.g. rc_api not available, retrieval might suppress it on access
+            return self.rc_accounts
+        return FindRcAccounts(rc_accounts=[rc_accounts[name] for name in names if name in rc_accounts])
+
+    def get_result(self, api: str, method: str, **params: Any) -> Any:  # noqa: ANN401
+        key = _create_call_key(api, method, params)
+        assert key in self.results, f"Call of {api}.{method} was not requested"
+        return self.results[key]
+
+
+class SnapshotRound:
+    """
+    A single tick of fetching data of many retrievals, their needs are gathered and fetched in one batch.
+
+    Retrievals join the round when they are about to harvest data, the batch is sent once every participant either
+    joined or finished (e.g. failed before harvesting), so none of them waits forever.
+
+    Args:
+        node: The node to fetch the data from.
+    """
+
+    def __init__(self, node: Node) -> None:
+        self._node = node
+        self._needs = SnapshotNeeds()
+        self._joined = 0
+        self._joined_event = asyncio.Event()
+        self._snapshot: asyncio.Future[NodeSnapshot] = asyncio.get_running_loop().create_future()
+
+    @property
+    def needs(self) -> SnapshotNeeds:
+        return self._needs
+
+    async def join(self, declare_needs: Callable[[SnapshotNeeds], None]) -> NodeSnapshot:
+        """
+        Declare needs of a participant and wait for the snapshot fetched with needs of all the participants.
+
+        Args:
+            declare_needs: Adds needs of the participant.
+
+        Returns:
+            The snapshot shared by all the participants.
+        """
+        declare_needs(self._needs)
+        self._joined += 1
+        self._joined_event.set()
+        return await asyncio.shield(self._snapshot)
+
+    async def run[T](self, *participants: Awaitable[T]) -> list[T | BaseException]:
+        """
+        Run the participants, fetching data they need in a single batch.
+
+        Args:
+            *participants: Awaitables which join this round (e.g. executing retrievals given this round).
+
+        Returns:
+            Results of the participants or exceptions they raised, in order of participants.
+        """
+        tasks = [asyncio.ensure_future(participant) for participant in participants]
+        try:
+            await self._wait_for_needs(tasks)
+            await self._fetch()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _wait_for_needs(self, tasks: list[asyncio.Future[Any]]) -> None:
+        while self._joined + sum(task.done() for task in tasks) < len(tasks):
+            self._joined_event.clear()
+            joined = asyncio.ensure_future(self._joined_event.wait())
+            pending = [task for task in tasks if not task.done()]
+            await asyncio.wait([joined, *pending], return_when=asyncio.FIRST_COMPLETED)
+            joined.cancel()
+
+    async def _fetch(self) -> None:
+        if not self._joined:
+            self._snapshot.cancel()
+            return
+
+        logger.debug(f"Fetching snapshot of {self._joined} retrievals in {self._needs.requests_amount} requests")
+        try:
+            self._snapshot.set_result(await self._needs.fetch(self._node))
+        except Exception as error:  # noqa: BLE001  # passed to each participant, they handle it on their own
+            self._snapshot.set_exception(error)
+
+
+@dataclass(kw_only=True)
+class SnapshotDataRetrieval(CommandDataRetrieval[HarvestedDataT, SanitizedDataT, CommandResultT], ABC):
+    """
+    Data retrieval which declares data it needs, so it can be fetched together with the needs of other retrievals.
+
+    Attributes:
+        node: The node to fetch the data from, when not fetched in the snapshot round.
+        snapshot_round: Round in which the data is fetched together with other retrievals, own batch when None.
+    """
+
+    node: Node
+    snapshot_round: SnapshotRound | None = None
+
+    @abstractmethod
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        """Add data needed by this retrieval, all of them are taken from the snapshot in `_harvest_from_snapshot`."""
+
+    @abstractmethod
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataT:
+        """Take the data needed by this retrieval from the snapshot."""
+
+    async def _harvest_data_from_api(self) -> HarvestedDataT:
+        if self.snapshot_round is not None:
+            snapshot = await self.snapshot_round.join(self.declare_needs)
+        else:
+            needs = SnapshotNeeds()
+            self.declare_needs(needs)
+            snapshot = await needs.fetch(self.node)
+        return self._harvest_from_snapshot(snapshot)
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 import beekeepy.interfaces as bki
 
 from clive.__private.core import iwax
 from clive.__private.core.authority import Authority
-from clive.__private.core.commands.abc.command_data_retrieval import CommandDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
 from clive.__private.core.commands.data_retrieval.update_node_data.clive_authority_data_provider import (
     CliveAuthorityDataProvider,
 )
@@ -34,7 +34,7 @@ from wax.complex_operations.account_update import AccountAuthorityUpdateOperatio
 
 if TYPE_CHECKING:
     from clive.__private.core.accounts.accounts import TrackedAccount
-    from clive.__private.core.node import Node
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.models.schemas import (
         Account,
         FindAccounts,
@@ -49,14 +49,13 @@ if TYPE_CHECKING:
 
 
 @dataclass
-class UpdateNodeData(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, DynamicGlobalProperties]):
-    node: Node
+class UpdateNodeData(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, DynamicGlobalProperties]):
     wax_interface: IHiveChainInterface
     accounts: list[TrackedAccount] = field(default_factory=list)
 
     async def _execute(self) -> None:
         self.__assert_no_duplicate_accounts()
-        if not self.accounts:
+        if not self.accounts and self.snapshot_round is None:
             # We only need to fetch GDPO if no accounts were provided - otherwise it will be fetched in the same (batch)
             # query with other account-related data. Otherwise, if that would happen in a separate call we might get a
             # stale GDPO (for previous block).
@@ -65,28 +64,39 @@ class UpdateNodeData(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, Dynam
 
         await super()._execute()
 
-    async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        non_virtual_operations_filter: Final[int] = 0x3FFFFFFFFFFFF
-        account_names = [acc.name for acc in self.accounts if acc.name]
-        harvested_data: HarvestedDataRaw = HarvestedDataRaw()
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_accounts(*self.__account_names)
+        needs.add_rc_accounts(*self.__account_names)
+        for account in self.accounts:
+            needs.add_call("account_history_api", "get_account_history", **self.__account_history_params(account))
 
-        async with await self.node.batch(delay_error_on_data_access=True) as node:
-            harvested_data.gdpo = await node.api.database_api.get_dynamic_global_properties()
-            harvested_data.core_accounts = await node.api.database_api.find_accounts(accounts=account_names)
-            harvested_data.rc_accounts = await node.api.rc_api.find_rc_accounts(accounts=account_names)
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        harvested_data = HarvestedDataRaw(
+            gdpo=snapshot.get_gdpo(),
+            core_accounts=snapshot.get_accounts(self.__account_names),
+            rc_accounts=snapshot.get_rc_accounts(self.__account_names),
+        )
 
-            account_harvested_data = harvested_data.account_harvested_data
-            for account in self.accounts:
-                account_history = await node.api.account_history_api.get_account_history(
-                    account=account.name,
-                    limit=1,
-                    operation_filter_low=non_virtual_operations_filter,
-                    include_reversible=True,
-                )
+        account_harvested_data = harvested_data.account_harvested_data
+        for account in self.accounts:
+            account_harvested_data[account].account_history = snapshot.get_result(
+                "account_history_api", "get_account_history", **self.__account_history_params(account)
+            )
+        return harvested_data
 
-                account_harvested_data[account].account_history = account_history
+    @property
+    def __account_names(self) -> list[str]:
+        return [acc.name for acc in self.accounts if acc.name]
 
-        return harvested_data
+    def __account_history_params(self, account: TrackedAccount) -> dict[str, Any]:
+        non_virtual_operations_filter: Final[int] = 0x3FFFFFFFFFFFF
+        return {
+            "account": account.name,
+            "limit": 1,
+            "operation_filter_low": non_virtual_operations_filter,
+            "include_reversible": True,
+        }
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         for core_account in self.__assert_core_accounts(data.core_accounts):
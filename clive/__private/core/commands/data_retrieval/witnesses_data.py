@@ -2,13 +2,9 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import beekeepy.exceptions as bke
-
-from clive.__private.core.commands.abc.command_data_retrieval import (
-    CommandDataRetrieval,
-)
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotDataRetrieval
 from clive.__private.core.constants.data_retrieval import (
     WITNESSES_SEARCH_BY_PATTERN_LIMIT_DEFAULT,
     WITNESSES_SEARCH_MODE_DEFAULT,
@@ -24,7 +20,7 @@ from clive.__private.core.types import WitnessesSearchModes
 if TYPE_CHECKING:
     from datetime import datetime
 
-    from clive.__private.core.node import Node
+    from clive.__private.core.commands.data_retrieval.snapshot import NodeSnapshot, SnapshotNeeds
     from clive.__private.models.schemas import DynamicGlobalProperties, ListWitnesses, ListWitnessVotes, Witness
 
 
@@ -74,7 +70,7 @@ class WitnessesData:
 
 
 @dataclass(kw_only=True)
-class WitnessesDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedData, WitnessesData]):
+class WitnessesDataRetrieval(SnapshotDataRetrieval[HarvestedDataRaw, SanitizedData, WitnessesData]):
     type Modes = WitnessesSearchModes
     """
     Available modes for retrieving witnesses data.
@@ -98,7 +94,6 @@ class WitnessesDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedDat
     DEFAULT_SEARCH_BY_PATTERN_LIMIT: ClassVar[int] = WITNESSES_SEARCH_BY_PATTERN_LIMIT_DEFAULT
     DEFAULT_MODE: ClassVar[Modes] = WITNESSES_SEARCH_MODE_DEFAULT
 
-    node: Node
     account_name: str
     mode: Modes = DEFAULT_MODE
     witness_name_pattern: str | None = None
@@ -106,33 +101,48 @@ class WitnessesDataRetrieval(CommandDataRetrieval[HarvestedDataRaw, SanitizedDat
     search_by_pattern_limit: int = DEFAULT_SEARCH_BY_PATTERN_LIMIT
     """Doesn't matter if mode is different than search_by_pattern."""
 
-    async def _harvest_data_from_api(self) -> HarvestedDataRaw:
-        async with await self.node.batch() as node:
-            gdpo = await node.api.database_api.get_dynamic_global_properties()
-
-            witness_votes = await node.api.database_api.list_witness_votes(
-                start=(self.account_name, ""),
-                limit=self.MAX_POSSIBLE_NUMBER_OF_WITNESSES_VOTED_FOR,
-                order="by_account_witness",
-            )
-
-            top_witnesses = await node.api.database_api.list_witnesses(
-                start=(self.MAX_POSSIBLE_NUMBER_OF_VOTES, ""),
-                limit=self.TOP_WITNESSES_HARD_LIMIT,
-                order="by_vote_name",
-            )
+    def declare_needs(self, needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_call("database_api", "list_witness_votes", **self.__witness_votes_params)
+        needs.add_call("database_api", "list_witnesses", **self.__top_witnesses_params)
+        if self.mode == "search_by_pattern":
+            needs.add_call("database_api", "list_witnesses", **self.__witnesses_by_name_params)
+
+    def _harvest_from_snapshot(self, snapshot: NodeSnapshot) -> HarvestedDataRaw:
+        witnesses_by_name: ListWitnesses | None = None
+        if self.mode == "search_by_pattern":
+            witnesses_by_name = snapshot.get_result("database_api", "list_witnesses", **self.__witnesses_by_name_params)
+
+        return HarvestedDataRaw(
+            snapshot.get_gdpo(),
+            snapshot.get_result("database_api", "list_witness_votes", **self.__witness_votes_params),
+            snapshot.get_result("database_api", "list_witnesses", **self.__top_witnesses_params),
+            witnesses_by_name,
+        )
 
-            witnesses_by_name: ListWitnesses | None = None
+    @property
+    def __witness_votes_params(self) -> dict[str, Any]:
+        return {
+            "start": (self.account_name, ""),
+            "limit": self.MAX_POSSIBLE_NUMBER_OF_WITNESSES_VOTED_FOR,
+            "order": "by_account_witness",
+        }
 
-            if self.mode == "search_by_pattern":
-                witnesses_by_name = await node.api.database_api.list_witnesses(
-                    start=self.witness_name_pattern if self.witness_name_pattern is not None else "",
-                    limit=self.search_by_pattern_limit,
-                    order="by_name",
-                )
+    @property
+    def __top_witnesses_params(self) -> dict[str, Any]:
+        return {
+            "start": (self.MAX_POSSIBLE_NUMBER_OF_VOTES, ""),
+            "limit": self.TOP_WITNESSES_HARD_LIMIT,
+            "order": "by_vote_name",
+        }
 
-            return HarvestedDataRaw(gdpo, witness_votes, top_witnesses, witnesses_by_name)
-        raise bke.UnknownDecisionPathError(f"{self.__class__.__name__}:_harvest_data_from_api")
+    @property
+    def __witnesses_by_name_params(self) -> dict[str, Any]:
+        return {
+            "start": self.witness_name_pattern if self.witness_name_pattern is not None else "",
+            "limit": self.search_by_pattern_limit,
+            "order": "by_name",
+        }
 
     async def _sanitize_data(self, data: HarvestedDataRaw) -> SanitizedData:
         in_search_by_pattern_mode = self.mode == "search_by_pattern"
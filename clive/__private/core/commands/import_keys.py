@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+
+import beekeepy.exceptions as bke
+
+from clive.__private.core.commands.abc.command_in_unlocked import CommandInUnlocked
+from clive.__private.core.commands.abc.command_with_result import CommandWithResult
+from clive.__private.core.keys import PrivateKeyAliased, PublicKeyAliased
+from clive.__private.core.keys.bulk import KeysImportResult
+from clive.__private.logger import logger
+
+
+@dataclass(kw_only=True)
+class ImportKeys(CommandInUnlocked, CommandWithResult[KeysImportResult]):
+    """
+    Import many keys into the beekeeper, in chunks imported with a single call each.
+
+    When importing a chunk fails, its keys are imported one by one, so only the faulty keys are reported as failed.
+
+    Attributes:
+        keys_to_import: The keys to import.
+        chunk_size: Number of keys imported with a single beekeeper call.
+        max_concurrency: Maximum number of chunks being imported at the same time.
+    """
+
+    keys_to_import: list[PrivateKeyAliased]
+    chunk_size: int = 64
+    max_concurrency: int = 4
+    _semaphore: asyncio.Semaphore = field(init=False)
+
+    async def _execute(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._result = KeysImportResult()
+        chunks = itertools.batched(self.keys_to_import, self.chunk_size)
+        await asyncio.gather(*(self.__import_chunk(list(chunk)) for chunk in chunks))
+
+    async def __import_chunk(self, chunk: list[PrivateKeyAliased]) -> None:
+        async with self._semaphore:
+            try:
+                public_keys = await self.unlocked_wallet.import_keys(private_keys=[key.value for key in chunk])
+            except bke.BeekeepyError as error:
+                logger.debug(f"Importing chunk of {len(chunk)} keys failed, importing them one by one: {error}")
+                for key in chunk:
+                    await self.__import_single(key)
+                return
+
+        self.result.imported.extend(
+            PublicKeyAliased(alias=key.alias, value=public_key)
+            for key, public_key in zip(chunk, public_keys, strict=True)
+        )
+
+    async def __import_single(self, key: PrivateKeyAliased) -> None:
+        try:
+            public_key = await self.unlocked_wallet.import_key(private_key=key.value)
+        except bke.BeekeepyError as error:
+            self.result.failed[key.alias] = str(error) or type(error).__name__
+            return
+        self.result.imported.append(PublicKeyAliased(alias=key.alias, value=public_key))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from clive.__private.core.commands.abc.command_with_result import CommandWithResult
+
+if TYPE_CHECKING:
+    from clive.__private.core.node import Node
+
+
+@dataclass(kw_only=True)
+class ListAccountNames(CommandWithResult[list[str]]):
+    """Get names of accounts existing on the chain which start with the given prefix, in alphabetical order."""
+
+    node: Node
+    prefix: str
+    limit: int
+
+    async def _execute(self) -> None:
+        response = await self.node.api.database_api.list_accounts(start=self.prefix, limit=self.limit, order="by_name")
+        names = [account.name for account in response.accounts]
+        self._result = [name for name in names if name.startswith(self.prefix)]
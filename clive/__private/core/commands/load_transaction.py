@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import contextlib
 from dataclasses import dataclass
-from json import JSONDecodeError
 from typing import TYPE_CHECKING
 
-from clive.__private.core import iwax
 from clive.__private.core.commands.abc.command import CommandError
 from clive.__private.core.commands.abc.command_with_result import CommandWithResult
-from clive.__private.core.iwax import WaxOperationFailedError
-from clive.__private.models.schemas import DecodeError
+from clive.__private.core.transaction_file_codec import TransactionFileCodecError, load_transaction_file_async
 from clive.__private.models.transaction import Transaction
 
 if TYPE_CHECKING:
@@ -25,12 +21,7 @@ class LoadTransaction(CommandWithResult[Transaction]):
     file_path: Path
 
     async def _execute(self) -> None:
-        with contextlib.suppress(JSONDecodeError, DecodeError):
-            self._result = Transaction.parse_file(path=self.file_path)
-            return
-
-        with contextlib.suppress(WaxOperationFailedError, JSONDecodeError, DecodeError):
-            self._result = iwax.deserialize_transaction(self.file_path.read_bytes())
-            return
-
-        raise LoadTransactionError(self, f"Failed to parse transaction from file: {self.file_path}")
+        try:
+            self._result, _ = await load_transaction_file_async(self.file_path)
+        except TransactionFileCodecError as error:
+            raise LoadTransactionError(self, f"Failed to parse transaction from file: {self.file_path}") from error
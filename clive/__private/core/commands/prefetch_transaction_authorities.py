@@ -29,11 +29,13 @@ class PrefetchTransactionAuthorities(CommandWithResult[AccountAuthorities]):
     Attributes:
         transaction: The transaction to analyze for required signing authorities.
         node: The node to fetch account data from.
+        cache: Already fetched accounts, filled with the fetched ones. Can be shared between commands processing
+            many transactions, so the same accounts are not fetched again.
     """
 
     transaction: Transaction
     node: Node
-    _cache: dict[str, Account] = field(default_factory=dict, init=False)
+    cache: AccountAuthorities = field(default_factory=dict)
 
     async def _execute(self) -> None:
         required = get_transaction_required_authorities(self.transaction)
@@ -53,10 +55,10 @@ class PrefetchTransactionAuthorities(CommandWithResult[AccountAuthorities]):
             await self._fetch_and_cache(new_accounts)
             previous_layer = new_accounts
 
-        self._result = self._cache
+        self._result = self.cache
 
     async def _fetch_and_cache(self, account_names: list[str]) -> None:
-        names_to_fetch = [name for name in account_names if name not in self._cache]
+        names_to_fetch = [name for name in account_names if name not in self.cache]
         if not names_to_fetch:
             return
 
@@ -67,7 +69,7 @@ class PrefetchTransactionAuthorities(CommandWithResult[AccountAuthorities]):
             accounts = await self._fetch_accounts_individually(names_to_fetch)
 
         for account in accounts:
-            self._cache[account.name] = account
+            self.cache[account.name] = account
 
     async def _fetch_accounts_individually(self, account_names: list[str]) -> list[Account]:
         results: list[Account] = []
@@ -82,11 +84,11 @@ class PrefetchTransactionAuthorities(CommandWithResult[AccountAuthorities]):
     def _collect_account_auths_from_cached(self, previous_layer_names: list[str]) -> list[str]:
         new_names: list[str] = []
         for name in previous_layer_names:
-            account = self._cache.get(name)
+            account = self.cache.get(name)
             if account is None:
                 continue
             for authority in (account.owner, account.active, account.posting):
                 for auth_account_name, _weight in authority.account_auths:
-                    if auth_account_name not in self._cache and auth_account_name not in new_names:
+                    if auth_account_name not in self.cache and auth_account_name not in new_names:
                         new_names.append(auth_account_name)
         return new_names
@@ -3,8 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
-from clive.__private.core import iwax
-from clive.__private.core.commands.abc.command import Command
+from clive.__private.core.commands.abc.command import Command, CommandError
+from clive.__private.core.transaction_file_codec import TransactionFileCodecError, save_transaction_file_async
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from clive.__private.models.transaction import Transaction
 
 
+class SaveTransactionError(CommandError):
+    pass
+
+
 @dataclass(kw_only=True)
 class SaveTransaction(Command):
     transaction: Transaction
@@ -20,20 +24,14 @@ class SaveTransaction(Command):
     """If not provided, the format will be determined by the file extension automatically."""
 
     async def _execute(self) -> None:
-        if self.force_format == "json":
-            self.__save_as_json()
-        elif self.force_format == "bin":
-            self.__save_as_binary()
+        if self.force_format is not None:
+            file_format = self.force_format
         else:
-            self.__save_as_binary() if self.__should_save_as_binary() else self.__save_as_json()
-
-    def __save_as_json(self) -> None:
-        serialized = self.transaction.json(order="sorted", indent=4)
-        self.file_path.write_text(serialized)
-
-    def __save_as_binary(self) -> None:
-        serialized = iwax.serialize_transaction(self.transaction)
-        self.file_path.write_bytes(serialized)
+            file_format = "bin" if self.__should_save_as_binary() else "json"
+        try:
+            await save_transaction_file_async(self.transaction, self.file_path, file_format)
+        except TransactionFileCodecError as error:
+            raise SaveTransactionError(self, f"Failed to save transaction to file: {self.file_path}") from error
 
     def __should_save_as_binary(self) -> bool:
         return self.file_path.suffix in (".bin", ".binary")
@@ -10,6 +10,8 @@ from clive.__private.logger import logger
 if TYPE_CHECKING:
     from beekeepy import AsyncSession
 
+    from clive.__private.core.beekeeper_manager import WalletStateWatcher
+
 
 @dataclass(kw_only=True)
 class SetTimeout(Command):
@@ -17,10 +19,14 @@ class SetTimeout(Command):
     time: timedelta | None = None
     permanent: bool = False
     """Will take precedence when `time` is also set."""
+    wallet_state_watcher: WalletStateWatcher | None = None
+    """Will be notified about the new timeout, so it can predict the lock moment."""
 
     async def _execute(self) -> None:
         timeout_in_seconds = self._determine_timeout().total_seconds()
         await self.session.set_timeout(seconds=int(timeout_in_seconds))
+        if self.wallet_state_watcher is not None:
+            self.wallet_state_watcher.notify_timeout_set(int(timeout_in_seconds))
         logger.info(f"Timeout set to {timeout_in_seconds} s.")
 
     def _determine_timeout(self) -> timedelta:
@@ -7,7 +7,7 @@ from clive.__private.core.commands.abc.command import Command, CommandError
 from clive.__private.core.commands.abc.command_in_unlocked import CommandInUnlocked
 from clive.__private.core.commands.abc.command_with_result import CommandWithResult
 from clive.__private.core.constants.data_retrieval import ALREADY_SIGNED_MODE_DEFAULT
-from clive.__private.core.iwax import calculate_sig_digest
+from clive.__private.core.iwax import calculate_sig_digest_async
 from clive.__private.models.transaction import Transaction
 
 if TYPE_CHECKING:
@@ -38,7 +38,7 @@ class Sign(CommandInUnlocked, CommandWithResult[Transaction]):
     async def _execute(self) -> None:
         self.__throw_already_signed_error_when_needed()
 
-        sig_digest = calculate_sig_digest(self.transaction, self.chain_id)
+        sig_digest = await calculate_sig_digest_async(self.transaction, self.chain_id)
         result = await self.unlocked_wallet.sign_digest(sig_digest=sig_digest, key=self.key.value)
 
         self.__set_transaction_signature(result)
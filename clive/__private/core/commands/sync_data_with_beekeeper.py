@@ -3,15 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from clive.__private.core.commands.abc.command import Command
+from clive.__private.core.commands.abc.command import Command, CommandError
 from clive.__private.core.commands.abc.command_in_unlocked import CommandInUnlocked
-from clive.__private.core.commands.import_key import ImportKey
+from clive.__private.core.commands.import_keys import ImportKeys
 
 if TYPE_CHECKING:
-    from clive.__private.core.keys import PrivateKeyAliased, PublicKeyAliased
+    from clive.__private.core.keys import PrivateKeyAliased
+    from clive.__private.core.keys.bulk import KeysImportResult
     from clive.__private.core.profile import Profile
 
 
+class KeysImportFailedError(CommandError):
+    def __init__(self, command: Command, result: KeysImportResult) -> None:
+        self.result = result
+        failed = ", ".join(f"{alias} ({reason})" for alias, reason in result.failed.items())
+        super().__init__(command, f"Failed to import {len(result.failed)} key(s) to beekeeper: {failed}")
+
+
 @dataclass(kw_only=True)
 class SyncDataWithBeekeeper(CommandInUnlocked, Command):
     profile: Profile
@@ -20,9 +28,11 @@ class SyncDataWithBeekeeper(CommandInUnlocked, Command):
         await self.__import_pending_keys()
 
     async def __import_pending_keys(self) -> None:
-        async def import_key(key_to_import: PrivateKeyAliased) -> PublicKeyAliased:
-            return await ImportKey(
-                unlocked_wallet=self.unlocked_wallet, key_to_import=key_to_import
+        async def import_keys(keys_to_import: list[PrivateKeyAliased]) -> KeysImportResult:
+            return await ImportKeys(
+                unlocked_wallet=self.unlocked_wallet, keys_to_import=keys_to_import
             ).execute_with_result()
 
-        await self.profile.keys.import_pending_to_beekeeper(import_key)
+        result = await self.profile.keys.import_pending_to_beekeeper_in_bulk(import_keys)
+        if not result.is_complete:
+            raise KeysImportFailedError(self, result)
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from beekeepy import AsyncSession
 
     from clive.__private.core.app_state import AppState, LockSource
+    from clive.__private.core.beekeeper_manager import WalletStateWatcher
 
 
 class InvalidWalletAmountError(CommandError):
@@ -36,9 +37,24 @@ class InvalidWalletStateError(CommandError):
 
 @dataclass(kw_only=True)
 class SyncStateWithBeekeeper(Command):
+    """
+    Switch the application into locked or unlocked mode according to the state of wallets in the beekeeper.
+
+    Attributes:
+        session: The beekeeper session to check the state of wallets in.
+        app_state: The application state to lock or unlock.
+        source: What triggered the synchronization, passed when locking.
+        wallet_state_watcher: When given, beekeeper is asked only when the watcher says a poll is due.
+    """
+
     session: AsyncSession
     app_state: AppState
     source: LockSource = "unknown"
+    wallet_state_watcher: WalletStateWatcher | None = None
+
+    @property
+    def _should_skip_execution(self) -> bool:
+        return self.wallet_state_watcher is not None and not self.wallet_state_watcher.is_poll_due
 
     async def _execute(self) -> None:
         await self.__sync_state()
@@ -56,9 +72,17 @@ class SyncStateWithBeekeeper(Command):
             (wallet for wallet in wallets if EncryptionService.is_encryption_wallet_name(wallet.name)), None
         )
 
+        if bool(user_wallet) != bool(encryption_wallet):
+            raise InvalidWalletStateError(self)
+
+        is_unlocked = user_wallet is not None
+        if self.wallet_state_watcher is not None:
+            await self.wallet_state_watcher.observe(self.session, is_unlocked=is_unlocked)
+
+        if is_unlocked == self.app_state.is_unlocked:
+            return  # no transition, nothing to switch
+
         if user_wallet and encryption_wallet:
             await self.app_state.unlock(WalletContainer(user_wallet, encryption_wallet))
-        elif not user_wallet and not encryption_wallet:
-            await self.app_state.lock(self.source)
         else:
-            raise InvalidWalletStateError(self)
+            await self.app_state.lock(self.source)
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from beekeepy import AsyncSession, AsyncUnlockedWallet
 
     from clive.__private.core.app_state import AppState
+    from clive.__private.core.beekeeper_manager import WalletStateWatcher
     from clive.__private.core.types import MigrationStatus
 
 
@@ -40,6 +41,7 @@ class Unlock(CommandPasswordSecured, CommandWithResult[UnlockWalletStatus]):
             Required when `permanent` is False.
         permanent: If True, the timeout will be permanent; otherwise, `time` should also be given.
         app_state: The application state to unlock, if available.
+        wallet_state_watcher: Will be notified about the set timeout, so it can predict the lock moment.
     """
 
     profile_name: str
@@ -47,9 +49,15 @@ class Unlock(CommandPasswordSecured, CommandWithResult[UnlockWalletStatus]):
     time: timedelta | None = None
     permanent: bool = True
     app_state: AppState | None = None
+    wallet_state_watcher: WalletStateWatcher | None = None
 
     async def _execute(self) -> None:
-        await SetTimeout(session=self.session, time=self.time, permanent=self.permanent).execute()
+        await SetTimeout(
+            session=self.session,
+            time=self.time,
+            permanent=self.permanent,
+            wallet_state_watcher=self.wallet_state_watcher,
+        ).execute()
 
         encryption_wallet = await self._unlock_wallet(EncryptionService.get_encryption_wallet_name(self.profile_name))
         user_wallet = await self._unlock_wallet(self.profile_name)
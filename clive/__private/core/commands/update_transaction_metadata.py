@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from clive.__private.core import iwax
 from clive.__private.core.commands.abc.command import Command
 from clive.__private.core.commands.unsign import UnSign
 from clive.__private.core.constants.date import TRANSACTION_EXPIRATION_TIMEDELTA_DEFAULT
@@ -21,7 +20,7 @@ class UpdateTransactionMetadata(Command):
     transaction: Transaction
     node: Node
     expiration: timedelta | datetime = TRANSACTION_EXPIRATION_TIMEDELTA_DEFAULT
-    """Expiration as a relative offset from gdpo time or an absolute datetime."""
+    """Expiration as a relative offset from the head block time or an absolute datetime."""
 
     async def _execute(self) -> None:
         from datetime import datetime  # noqa: PLC0415
@@ -29,14 +28,17 @@ class UpdateTransactionMetadata(Command):
         # clear existing signatures
         self.transaction = await UnSign(transaction=self.transaction).execute_with_result()
 
-        # get dynamic global properties
-        gdpo = await self.node.api.database_api.get_dynamic_global_properties()
-        block_id = gdpo.head_block_id
+        # reuse the recently seen head block as reference, fetch it only when there is no fresh one
+        tapos_references = self.node.tapos_references
+        reference = tapos_references.get_fresh()
+        if reference is None:
+            gdpo = await self.node.api.database_api.get_dynamic_global_properties()
+            reference = tapos_references.remember(gdpo)
+        head_block_time = tapos_references.estimate_head_block_time(reference)
 
         # set header
-        tapos_data = iwax.get_tapos_data(block_id)
-        ref_block_num = tapos_data.ref_block_num
-        ref_block_prefix = tapos_data.ref_block_prefix
+        ref_block_num = reference.ref_block_num
+        ref_block_prefix = reference.ref_block_prefix
 
         assert ref_block_num >= 0, f"ref_block_num value `{ref_block_num}` is invalid`"
         assert ref_block_prefix > 0, f"ref_block_prefix value `{ref_block_prefix}` is invalid`"
@@ -48,5 +50,5 @@ class UpdateTransactionMetadata(Command):
         if isinstance(self.expiration, datetime):
             self.transaction.expiration = HiveDateTime(self.expiration)
         else:
-            self.transaction.expiration = gdpo.time + self.expiration
-        self.transaction.local.last_update_head_block_time = gdpo.time
+            self.transaction.expiration = head_block_time + self.expiration
+        self.transaction.local.last_update_head_block_time = head_block_time
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.core.commands.abc.command_with_result import CommandWithResult
+from clive.__private.core.commands.load_transaction import LoadTransaction, LoadTransactionError
+from clive.__private.core.commands.prefetch_transaction_authorities import PrefetchTransactionAuthorities
+from clive.__private.core.iwax import (
+    calculate_sig_digest_async,
+    get_public_key_from_signature,
+    get_transaction_required_authorities,
+)
+from clive.__private.core.signature_verification import (
+    AccountWeightedAuthorities,
+    AuthorityVerifier,
+    SignatureVerificationResult,
+    WeightedAuthority,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from clive.__private.core.commands.prefetch_transaction_authorities import AccountAuthorities
+    from clive.__private.core.node import Node
+    from clive.__private.models.transaction import Transaction
+
+TRANSACTION_FILE_SUFFIXES: Final[tuple[str, ...]] = (".json", ".bin")
+MAX_PARALLEL_VERIFICATIONS: Final[int] = 8
+
+type TransactionFileVerification = SignatureVerificationResult | LoadTransactionError
+"""Verification result or the error of loading the transaction from file."""
+
+
+def collect_transaction_files(path: Path) -> list[Path]:
+    """
+    Get the transaction file or all transaction files (`.json`, `.bin`) from the directory.
+
+    Args:
+        path: Path to the transaction file or directory with transaction files.
+
+    Returns:
+        Sorted paths of transaction files.
+    """
+    if not path.is_dir():
+        return [path]
+    return sorted(
+        child for child in path.iterdir() if child.is_file() and child.suffix.lower() in TRANSACTION_FILE_SUFFIXES
+    )
+
+
+@dataclass(kw_only=True)
+class VerifyTransactionSignatures(CommandWithResult[SignatureVerificationResult]):
+    """
+    Verify locally whether signatures of the transaction satisfy its required authorities, without broadcasting it.
+
+    Public keys are recovered from the signatures and required authorities are resolved the same way as when
+    signing (see `PrefetchTransactionAuthorities`).
+
+    Attributes:
+        transaction: The transaction to verify.
+        node: The node to fetch account authorities from.
+        chain_id: The chain id the transaction was signed for.
+        authorities_cache: Already fetched accounts, can be shared when verifying many transactions.
+    """
+
+    transaction: Transaction
+    node: Node
+    chain_id: str
+    authorities_cache: AccountAuthorities = field(default_factory=dict)
+
+    async def _execute(self) -> None:
+        accounts = await PrefetchTransactionAuthorities(
+            transaction=self.transaction, node=self.node, cache=self.authorities_cache
+        ).execute_with_result()
+        required = get_transaction_required_authorities(self.transaction)
+        sig_digest = await calculate_sig_digest_async(self.transaction, self.chain_id)
+        signing_keys = {
+            str(signature): get_public_key_from_signature(sig_digest, str(signature))
+            for signature in self.transaction.signatures
+        }
+
+        verifier = AuthorityVerifier(
+            {name: AccountWeightedAuthorities.from_account(account) for name, account in accounts.items()}
+        )
+        self._result = verifier.verify(
+            required_accounts={
+                "owner": required.owner_accounts,
+                "active": required.active_accounts,
+                "posting": required.posting_accounts,
+            },
+            signing_keys=signing_keys,
+            other_authorities=[WeightedAuthority.from_authority(other) for other in required.other_authorities],
+        )
+
+
+@dataclass(kw_only=True)
+class VerifyTransactionFilesSignatures(CommandWithResult[dict[Path, TransactionFileVerification]]):
+    """
+    Verify signatures of transactions loaded from many files in parallel.
+
+    Account authorities are fetched once and shared between the transactions.
+
+    Attributes:
+        paths: Paths of transaction files or directories with them (see `collect_transaction_files`).
+        node: The node to fetch account authorities from.
+        chain_id: The chain id the transactions were signed for.
+        max_parallel: Maximum number of transactions verified at the same time.
+    """
+
+    paths: Sequence[Path]
+    node: Node
+    chain_id: str
+    max_parallel: int = MAX_PARALLEL_VERIFICATIONS
+
+    async def _execute(self) -> None:
+        file_paths = [file_path for path in self.paths for file_path in collect_transaction_files(Path(path))]
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        authorities_cache: AccountAuthorities = {}
+
+        async def verify(file_path: Path) -> TransactionFileVerification:
+            async with semaphore:
+                try:
+                    transaction = await LoadTransaction(file_path=file_path).execute_with_result()
+                except LoadTransactionError as error:
+                    return error
+                return await VerifyTransactionSignatures(
+                    transaction=transaction,
+                    node=self.node,
+                    chain_id=self.chain_id,
+                    authorities_cache=authorities_cache,
+                ).execute_with_result()
+
+        results = await asyncio.gather(*(verify(file_path) for file_path in file_paths))
+        self._result = dict(zip(file_paths, results, strict=True))
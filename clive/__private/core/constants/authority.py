@@ -11,3 +11,6 @@ AUTHORITY_LEVELS: Final[tuple[AuthorityLevel, ...]] = get_args(AuthorityLevel)
 DEFAULT_AUTHORITY_THRESHOLD: Final[int] = 1
 DEFAULT_AUTHORITY_WEIGHT: Final[int] = 1
 HIVE_MAX_SIG_CHECK_DEPTH: Final[int] = 2
+
+DEFAULT_DERIVED_KEY_ALIAS_TEMPLATE: Final[str] = "{account_name}@{role}"
+"""Alias given to keys derived from seed, `account_name` and `role` placeholders are replaced."""
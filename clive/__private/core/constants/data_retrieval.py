@@ -22,5 +22,9 @@ PROPOSAL_STATUS_DEFAULT: Final[ProposalStatuses] = "votable"
 WITNESSES_SEARCH_MODE_DEFAULT: Final[WitnessesSearchModes] = "search_top_with_voted_first"
 WITNESSES_SEARCH_BY_PATTERN_LIMIT_DEFAULT: Final[int] = 50
 
+DEFAULT_UPCOMING_FUTURE_SCHEDULED_TRANSFERS_AMOUNT: Final[int] = 10
+
+VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT: Final[int] = 20
+
 ALREADY_SIGNED_MODES: Final[tuple[AlreadySignedMode, ...]] = get_args(AlreadySignedMode)
 ALREADY_SIGNED_MODE_DEFAULT: Final[AlreadySignedMode] = "multisign"
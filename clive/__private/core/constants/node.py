@@ -23,6 +23,12 @@ HIVE_MAX_ACCOUNT_WITNESS_VOTES: Final[int] = 30
 HIVE_GOVERNANCE_VOTE_EXPIRATION_PERIOD_DAYS: Final[int] = 365
 HIVE_BLOCK_INTERVAL_SECONDS: Final[int] = 3  # HIVE_BLOCK_INTERVAL from protocol config
 HIVE_MAX_TIME_UNTIL_SIGNATURE_EXPIRATION_SECONDS: Final[int] = 86400  # 24h, HIVE_MAX_TIME_UNTIL_SIGNATURE_EXPIRATION
+HIVE_MAX_WITHDRAW_ROUTES: Final[int] = 10
+DATABASE_API_SINGLE_QUERY_LIMIT: Final[int] = 1000  # max number of entries returned by a single `list_*` call
+HIVE_TAPOS_WINDOW_BLOCKS: Final[int] = 2**16  # ref_block_num holds only lower 16 bits of the referenced block number
+HIVE_MAX_TRANSACTION_SIZE_BYTES: Final[int] = 1024 * 64  # HIVE_MAX_TRANSACTION_SIZE, of the signed transaction
+HIVE_RC_REGEN_TIME_SECONDS: Final[int] = 60 * 60 * 24 * 5  # HIVE_RC_REGEN_TIME, time of full RC regeneration
+BLOCK_SIZE_RESERVED_FOR_HEADER_BYTES: Final[int] = 256  # transaction can't exceed maximum_block_size minus this
 
 # removal values (special values that are used to remove something in the blockchain state)
 # e.g. DelegateVestingSharesOperation requires to be broadcast with amount of 0 to remove delegation
@@ -62,6 +68,7 @@ MAX_NUMBER_OF_WITNESSES_VOTES = HIVE_MAX_ACCOUNT_WITNESS_VOTES
 
 # RC delegations
 HIVE_RC_DELEGATION_MIN_ACCOUNT_CREATION_FEE_DIVISOR: Final[int] = 3  # see rc_utility.cpp: account_creation_fee / 3
+HIVE_RC_MAX_ACCOUNTS_PER_DELEGATION_OP: Final[int] = 100  # max number of delegatees in a single `delegate_rc`
 
 # uncategorized
 NULL_ACCOUNT_KEY_VALUE: Final[str] = "STM1111111111111111111111111111111114T1Anm"
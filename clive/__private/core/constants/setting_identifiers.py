@@ -32,6 +32,24 @@ NODE_REFRESH_ALARMS_RATE_SECS: Final[str] = "NODE.REFRESH_ALARMS_RATE_SECS"
 NODE_COMMUNICATION_TOTAL_TIMEOUT_SECS: Final[str] = "NODE.COMMUNICATION_TOTAL_TIMEOUT_SECS"
 NODE_COMMUNICATION_ATTEMPTS_AMOUNT: Final[str] = "NODE.COMMUNICATION_ATTEMPTS_AMOUNT"
 NODE_COMMUNICATION_RETRIES_DELAY_SECS: Final[str] = "NODE.COMMUNICATION_RETRIES_DELAY_SECS"
+NODE_COMMUNICATION_RETRIES_MAX_DELAY_SECS: Final[str] = "NODE.COMMUNICATION_RETRIES_MAX_DELAY_SECS"
+NODE_RETRIES_ON_TIMEOUT: Final[str] = "NODE.RETRIES_ON_TIMEOUT"
+NODE_RETRIES_ON_CONNECTION_ERROR: Final[str] = "NODE.RETRIES_ON_CONNECTION_ERROR"
+NODE_RETRIES_ON_SERVER_ERROR: Final[str] = "NODE.RETRIES_ON_SERVER_ERROR"
+NODE_RETRIES_ON_JSON_RPC_ERROR: Final[str] = "NODE.RETRIES_ON_JSON_RPC_ERROR"
+NODE_CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final[str] = "NODE.CIRCUIT_BREAKER_FAILURE_THRESHOLD"
+NODE_CIRCUIT_BREAKER_OPEN_SECS: Final[str] = "NODE.CIRCUIT_BREAKER_OPEN_SECS"
+NODE_CONNECTION_LIMIT: Final[str] = "NODE.CONNECTION_LIMIT"
+NODE_KEEPALIVE_TIMEOUT_SECS: Final[str] = "NODE.KEEPALIVE_TIMEOUT_SECS"
+NODE_DNS_CACHE_TTL_SECS: Final[str] = "NODE.DNS_CACHE_TTL_SECS"
+NODE_TAPOS_REFERENCE_MAX_AGE_SECS: Final[str] = "NODE.TAPOS_REFERENCE_MAX_AGE_SECS"
+NODE_BASIC_INFO_CACHE_MAX_AGE_SECS: Final[str] = "NODE.BASIC_INFO_CACHE_MAX_AGE_SECS"
+
+STORAGE_SAVE_COALESCE_WINDOW_SECS: Final[str] = "STORAGE.SAVE_COALESCE_WINDOW_SECS"
+STORAGE_SAVE_MAX_BACKLOG: Final[str] = "STORAGE.SAVE_MAX_BACKLOG"
+
+WAX_OFFLOAD_SIZE_THRESHOLD: Final[str] = "WAX.OFFLOAD_SIZE_THRESHOLD"
+WAX_CPU_WORKERS: Final[str] = "WAX.CPU_WORKERS"
 
 SECRETS_NODE_ADDRESS: Final[str] = "SECRETS.NODE_ADDRESS"
 SECRETS_DEFAULT_PRIVATE_KEY: Final[str] = "SECRETS.DEFAULT_PRIVATE_KEY"
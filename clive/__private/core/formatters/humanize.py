@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import re
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, tzinfo
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 import humanize
 import inflection
@@ -46,6 +48,22 @@ if TYPE_CHECKING:
     from clive.__private.models.schemas import HbdExchangeRate, OperationBase, PriceFeed
 
 
+FORMATTER_CACHE_SIZE: Final[int] = 4096
+"""Maximum number of results remembered by each of the memoized formatters."""
+
+
+@dataclass(frozen=True)
+class _TotalVesting:
+    total_vesting_fund_hive: Asset.Hive
+    total_vesting_shares: Asset.Vests
+
+
+def clear_formatter_caches() -> None:
+    """Forget results of all the memoized formatters."""
+    for cached in (_align_to_dot, _humanize_natural_timedelta, _format_datetime, _humanize_asset, _humanize_votes):
+        cached.cache_clear()
+
+
 def _round_to_precision(data: Decimal, precision: int) -> Decimal:
     return DecimalConverter.round_to_precision(data, precision=precision)
 
@@ -96,6 +114,11 @@ def align_to_dot(*strings: str, center_to: int | str | None = None) -> list[str]
     Returns:
         Values aligned to the dot.
     """
+    return list(_align_to_dot(strings, center_to))
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def _align_to_dot(strings: tuple[str, ...], center_to: int | str | None) -> tuple[str, ...]:
     strings_ = list(strings)
 
     if center_to is not None:
@@ -120,7 +143,7 @@ def align_to_dot(*strings: str, center_to: int | str | None = None) -> list[str]
             aligned_string = " " * spaces_to_enter + string
         aligned_strings.append(aligned_string)
 
-    return aligned_strings
+    return tuple(aligned_strings)
 
 
 def humanize_binding_id(id_: str) -> str:
@@ -194,11 +217,36 @@ def humanize_natural_time(value: datetime | timedelta) -> str:
     Returns:
         A human-readable data representing the time difference.
     """
-    if isinstance(value, datetime) and is_null_date(value):
+    if isinstance(value, timedelta):
+        return _humanize_natural_timedelta(_truncate_to_natural_time_resolution(value))
+    if is_null_date(value):
         return "never"
     return humanize.naturaltime(value)
 
 
+def _truncate_to_natural_time_resolution(value: timedelta) -> timedelta:
+    """
+    Truncate the time difference to the resolution it is humanized with, so the cached text is reused until it changes.
+
+    Below a day the text depends on the whole seconds only, above on the whole days only.
+
+    Args:
+        value: The time difference.
+
+    Returns:
+        The time difference truncated towards zero.
+    """
+    magnitude = abs(value)
+    resolution = timedelta(seconds=1) if magnitude < timedelta(days=1) else timedelta(days=1)
+    truncated = magnitude // resolution * resolution
+    return truncated if value >= timedelta(0) else -truncated
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def _humanize_natural_timedelta(value: timedelta) -> str:
+    return humanize.naturaltime(value)
+
+
 def humanize_datetime(value: datetime, *, with_time: bool = True, with_relative_time: bool = False) -> str:
     """
     Return pretty formatted datetime.
@@ -228,13 +276,18 @@ def humanize_datetime(value: datetime, *, with_time: bool = True, with_relative_
     if is_null_date(value):
         return "never"
 
-    format_ = TIME_FORMAT_WITH_SECONDS if with_time else TIME_FORMAT_DAYS
-    formatted = value.strftime(format_)
+    formatted = _format_datetime(value, value.tzinfo, with_time=with_time)
     if with_relative_time:
         return f"{formatted} ({humanize_natural_time(utc_now() - value.astimezone(UTC))})"
     return formatted
 
 
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def _format_datetime(value: datetime, _tzinfo: tzinfo | None, *, with_time: bool) -> str:
+    # timezone is a part of the cache key, the same moment in other timezones is equal but formatted differently
+    return value.strftime(TIME_FORMAT_WITH_SECONDS if with_time else TIME_FORMAT_DAYS)
+
+
 def humanize_class_name(cls: str | type[Any]) -> str:
     """
     Return pretty formatted class name.
@@ -603,8 +656,13 @@ def humanize_votes_with_suffix(votes: int, data: TotalVestingProtocol) -> str:
     Returns:
         A human-readable data representing the votes converted to hive power with suffix.
     """
-    hive_power = calculate_witness_votes_hp(votes, data)
-    return humanize_hive_power(hive_power)
+    return _humanize_votes(votes, int(data.total_vesting_fund_hive.amount), int(data.total_vesting_shares.amount))
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def _humanize_votes(votes: int, total_vesting_fund_hive: int, total_vesting_shares: int) -> str:
+    data = _TotalVesting(Asset.Hive(amount=total_vesting_fund_hive), Asset.Vests(amount=total_vesting_shares))
+    return humanize_hive_power(calculate_witness_votes_hp(votes, data))
 
 
 def humanize_votes_with_comma(votes: int, data: TotalVestingProtocol) -> str:
@@ -664,9 +722,28 @@ def humanize_asset(
     Returns:
         A human-readable data representing the asset amount with an optional symbol.
     """
+    return _humanize_asset(
+        type(asset),
+        int(asset.amount),
+        show_symbol=show_symbol,
+        sign_prefix=sign_prefix,
+        use_short_form=use_short_form,
+    )
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def _humanize_asset(
+    asset_type: type[Asset.AnyT],
+    amount: int,
+    *,
+    show_symbol: bool,
+    sign_prefix: SignPrefixT,
+    use_short_form: bool,
+) -> str:
+    asset = asset_type(amount=amount)
 
     def apply_prefix(amount_str: str) -> str:
-        return f"{sign_prefix}{amount_str}" if sign_prefix and int(asset.amount) != 0 else amount_str
+        return f"{sign_prefix}{amount_str}" if sign_prefix and amount != 0 else amount_str
 
     pretty_amount = asset.pretty_amount()
     asset_symbol = Asset.get_symbol(asset) if show_symbol else ""
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
 import datetime
+import json
+import threading
+import time
 from collections.abc import Callable
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any, Final, Protocol, cast
 
 import wax
+from clive.__private.core._thread import get_cpu_thread_pool
 from clive.__private.core.constants.precision import HIVE_PERCENT_PRECISION_DOT_PLACES
 from clive.__private.core.decimal_conventer import DecimalConverter
 from clive.__private.core.percent_conversions import hive_percent_to_percent
+from clive.__private.core.vesting_share_ratio import AssetAmountOutOfRangeError, VestingShareRatio
 from clive.exceptions import CliveError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from decimal import Decimal
 
     from clive.__private.core.keys import PrivateKey, PublicKey
@@ -21,6 +31,104 @@ if TYPE_CHECKING:
     from wax.wax_result import python_encrypted_memo
 
 
+WAX_CALL_HISTOGRAM_BUCKETS_SECS: Final[tuple[float, ...]] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+"""Upper bounds of histogram buckets. Calls longer than the last bound are counted in an additional bucket."""
+
+OPERATION_SIZE_CACHE_SIZE: Final[int] = 4096
+_SIZING_TRANSACTION_TEMPLATE: Final[str] = (
+    '{{"ref_block_num":0,"ref_block_prefix":0,"expiration":"1970-01-01T00:00:00",'
+    '"operations":[{}],"extensions":[],"signatures":[]}}'
+)
+_CUSTOM_JSON_OPERATION_TAG: Final[int] = 18
+
+
+@dataclass
+class WaxCallHistogram:
+    """Distribution of durations of calls to a single wax function."""
+
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(WAX_CALL_HISTOGRAM_BUCKETS_SECS) + 1))
+    calls: int = 0
+    offloaded_calls: int = 0
+    total_secs: float = 0
+    max_secs: float = 0
+
+    @property
+    def mean_secs(self) -> float:
+        return self.total_secs / self.calls if self.calls else 0
+
+    def record(self, duration_secs: float, *, offloaded: bool = False) -> None:
+        self.bucket_counts[bisect.bisect_left(WAX_CALL_HISTOGRAM_BUCKETS_SECS, duration_secs)] += 1
+        self.calls += 1
+        self.offloaded_calls += int(offloaded)
+        self.total_secs += duration_secs
+        self.max_secs = max(self.max_secs, duration_secs)
+
+
+_call_histograms: dict[str, WaxCallHistogram] = {}
+_call_histograms_lock = threading.Lock()
+
+
+def get_call_histograms() -> dict[str, WaxCallHistogram]:
+    """
+    Get timing histograms of wax calls, recorded since the start or the last reset.
+
+    Returns:
+        Copies of the histograms keyed by the wax function name.
+    """
+    with _call_histograms_lock:
+        return {
+            name: WaxCallHistogram(
+                bucket_counts=list(histogram.bucket_counts),
+                calls=histogram.calls,
+                offloaded_calls=histogram.offloaded_calls,
+                total_secs=histogram.total_secs,
+                max_secs=histogram.max_secs,
+            )
+            for name, histogram in _call_histograms.items()
+        }
+
+
+def reset_call_histograms() -> None:
+    with _call_histograms_lock:
+        _call_histograms.clear()
+
+
+def call_timed[T](name: str, func: Callable[[], T], *, offloaded: bool = False) -> T:
+    """
+    Call the wax function recording its duration in the timing histogram.
+
+    Args:
+        name: Name of the histogram to record the duration in.
+        func: The call to be made.
+        offloaded: Whether the call is made in the CPU thread pool.
+
+    Returns:
+        Result of the call.
+    """
+    start = time.perf_counter()
+    try:
+        return func()
+    finally:
+        duration = time.perf_counter() - start
+        with _call_histograms_lock:
+            _call_histograms.setdefault(name, WaxCallHistogram()).record(duration, offloaded=offloaded)
+
+
+async def _call_offloaded[T](name: str, input_size: int, func: Callable[[], T]) -> T:
+    """
+    Call the wax function in the CPU thread pool if its input is big enough, so it doesn't block the event loop.
+
+    Small calls are made inline, as the cost of switching threads would exceed the cost of the call itself.
+    """
+    from clive.__private.settings import safe_settings  # noqa: PLC0415
+
+    if input_size <= safe_settings.wax.offload_size_threshold:
+        return call_timed(name, func)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_thread_pool(), partial(call_timed, name, func, offloaded=True))
+
+
 def cast_hiveint_args[F: Callable[..., Any]](func: F) -> F:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
@@ -108,7 +216,18 @@ def __as_binary_json(item: OperationUnion | Transaction) -> str:
 
 
 def validate_transaction(transaction: Transaction) -> None:
-    return __validate_wax_response(wax.validate_transaction(__as_binary_json(transaction)))
+    return call_timed("validate_transaction", partial(__validate_transaction, __as_binary_json(transaction)))
+
+
+async def validate_transaction_async(transaction: Transaction) -> None:
+    transaction_json = __as_binary_json(transaction)
+    return await _call_offloaded(
+        "validate_transaction", len(transaction_json), partial(__validate_transaction, transaction_json)
+    )
+
+
+def __validate_transaction(transaction_json: str) -> None:
+    return __validate_wax_response(wax.validate_transaction(transaction_json))
 
 
 def validate_operation(operation: OperationUnion) -> None:
@@ -116,29 +235,126 @@ def validate_operation(operation: OperationUnion) -> None:
 
 
 def calculate_sig_digest(transaction: Transaction, chain_id: str) -> str:
-    result = wax.calculate_sig_digest(__as_binary_json(transaction), chain_id)
+    return call_timed("calculate_sig_digest", partial(__calculate_sig_digest, __as_binary_json(transaction), chain_id))
+
+
+async def calculate_sig_digest_async(transaction: Transaction, chain_id: str) -> str:
+    transaction_json = __as_binary_json(transaction)
+    return await _call_offloaded(
+        "calculate_sig_digest", len(transaction_json), partial(__calculate_sig_digest, transaction_json, chain_id)
+    )
+
+
+def __calculate_sig_digest(transaction_json: str, chain_id: str) -> str:
+    result = wax.calculate_sig_digest(transaction_json, chain_id)
+    __validate_wax_response(result)
+    return result.result
+
+
+def get_public_key_from_signature(sig_digest: str, signature: str) -> str:
+    """Recover the public key which made the signature of given digest."""
+    return call_timed("get_public_key_from_signature", partial(__get_public_key_from_signature, sig_digest, signature))
+
+
+def __get_public_key_from_signature(sig_digest: str, signature: str) -> str:
+    result = wax.get_public_key_from_signature(sig_digest, signature)
     __validate_wax_response(result)
     return result.result
 
 
 def calculate_transaction_id(transaction: Transaction) -> str:
-    result = wax.calculate_transaction_id(__as_binary_json(transaction))
+    return call_timed("calculate_transaction_id", partial(__calculate_transaction_id, __as_binary_json(transaction)))
+
+
+def __calculate_transaction_id(transaction_json: str) -> str:
+    result = wax.calculate_transaction_id(transaction_json)
     __validate_wax_response(result)
     return result.result
 
 
 def serialize_transaction(transaction: Transaction) -> bytes:
-    result = wax.serialize_transaction(__as_binary_json(transaction))
+    return call_timed("serialize_transaction", partial(__serialize_transaction, __as_binary_json(transaction)))
+
+
+async def serialize_transaction_async(transaction: Transaction) -> bytes:
+    transaction_json = __as_binary_json(transaction)
+    return await _call_offloaded(
+        "serialize_transaction", len(transaction_json), partial(__serialize_transaction, transaction_json)
+    )
+
+
+def __serialize_transaction(transaction_json: str) -> bytes:
+    result = wax.serialize_transaction(transaction_json)
     __validate_wax_response(result)
     return result.result.encode()
 
 
+def calculate_operation_size(operation: OperationUnion) -> int:
+    """
+    Calculate the number of bytes the operation takes in the serialized transaction.
+
+    Sizes are cached by the operation JSON, so sizing the same operation again doesn't call wax.
+
+    Args:
+        operation: The operation to be sized.
+
+    Returns:
+        Size of the serialized operation, including its type tag.
+    """
+    return __calculate_operation_size(__as_binary_json(operation))
+
+
+@lru_cache(maxsize=OPERATION_SIZE_CACHE_SIZE)
+def __calculate_operation_size(operation_json: str) -> int:
+    operation = json.loads(operation_json)
+    if operation["type"] == "custom_json_operation":
+        # wax can't serialize custom JSON operations (see BuildTransaction), but their layout is simple to pack
+        return __calculate_custom_json_operation_size(operation["value"])
+
+    with_operation = call_timed(
+        "serialize_transaction", partial(__serialize_transaction, _SIZING_TRANSACTION_TEMPLATE.format(operation_json))
+    )
+    without_operation = call_timed(
+        "serialize_transaction", partial(__serialize_transaction, _SIZING_TRANSACTION_TEMPLATE.format(""))
+    )
+    # both have a single byte of operations count, serialized form is hex so each byte takes two characters
+    return (len(with_operation) - len(without_operation)) // 2
+
+
+def __calculate_custom_json_operation_size(value: dict[str, Any]) -> int:
+    from clive.__private.core.transaction_sizing import varint_size  # noqa: PLC0415
+
+    def string_size(text: str) -> int:
+        encoded_length = len(text.encode())
+        return varint_size(encoded_length) + encoded_length
+
+    def strings_size(texts: list[str]) -> int:
+        return varint_size(len(texts)) + sum(string_size(text) for text in texts)
+
+    return (
+        varint_size(_CUSTOM_JSON_OPERATION_TAG)
+        + strings_size(value["required_auths"])
+        + strings_size(value["required_posting_auths"])
+        + string_size(value["id"])
+        + string_size(value["json"])
+    )
+
+
 def deserialize_transaction(transaction: bytes) -> Transaction:
     from clive.__private.models.transaction import Transaction  # noqa: PLC0415
 
-    result = wax.deserialize_transaction(transaction.decode())
+    return Transaction.parse_raw(deserialize_transaction_to_json(transaction.decode()))
+
+
+def deserialize_transaction_to_json(serialized_transaction: str) -> str:
+    """Convert the hex of serialized transaction into its JSON, without parsing it into the model."""
+    return call_timed("deserialize_transaction", partial(__deserialize_transaction_to_json, serialized_transaction))
+
+
+def __deserialize_transaction_to_json(serialized_transaction: str) -> str:
+    result = wax.deserialize_transaction(serialized_transaction)
     __validate_wax_response(result)
-    return Transaction.parse_raw(result.result)
+    return result.result
 
 
 def calculate_public_key(wif: str) -> PublicKey:
@@ -223,16 +439,52 @@ def calculate_hbd_to_hive(_hbd: Asset.Hbd, current_price_feed: PriceFeed) -> Ass
 
 @cast_hiveint_args
 def calculate_vests_to_hp(_vests: int | Asset.Vests, data: TotalVestingProtocol) -> Asset.Hive:
-    vests_json_asset = wax.vests(_vests) if isinstance(_vests, int) else to_python_json_asset(_vests)
+    from clive.__private.models.asset import Asset  # noqa: PLC0415
+
+    amount = _vests if isinstance(_vests, int) else int(_vests.amount)
+    ratio = VestingShareRatio.from_data(data)
+    if ratio.can_convert(amount):
+        with suppress(AssetAmountOutOfRangeError):  # wax reports it on its own
+            return Asset.Hive(amount=ratio.vests_to_hp(amount))
+
     result = wax.calculate_vests_to_hp(
-        vests=vests_json_asset,
+        vests=wax.vests(amount),
         total_vesting_fund_hive=to_python_json_asset(data.total_vesting_fund_hive),
         total_vesting_shares=to_python_json_asset(data.total_vesting_shares),
     )
     return cast("Asset.Hive", from_python_json_asset(result))
 
 
+def calculate_vests_to_hp_many(vests: Iterable[Asset.Vests], data: TotalVestingProtocol) -> list[Asset.Hive]:
+    """
+    Convert many VESTS amounts to HP at once, with the ratio of the global properties calculated once.
+
+    Args:
+        vests: Amounts to convert.
+        data: Global properties or other object providing the total vesting fund and shares.
+
+    Returns:
+        Converted amounts, in order of the given ones.
+    """
+    from clive.__private.models.asset import Asset  # noqa: PLC0415
+
+    amounts = [int(amount.amount) for amount in vests]
+    ratio = VestingShareRatio.from_data(data)
+    if all(ratio.can_convert(amount) for amount in amounts):
+        with suppress(AssetAmountOutOfRangeError):  # wax reports it on its own
+            return [Asset.Hive(amount=hive) for hive in ratio.vests_to_hp_many(amounts)]
+    return [calculate_vests_to_hp(amount, data) for amount in amounts]
+
+
 def calculate_hp_to_vests(_hive: Asset.Hive, data: TotalVestingProtocol) -> Asset.Vests:
+    from clive.__private.models.asset import Asset  # noqa: PLC0415
+
+    amount = int(_hive.amount)
+    ratio = VestingShareRatio.from_data(data)
+    if ratio.can_convert(amount):
+        with suppress(AssetAmountOutOfRangeError):  # wax reports it on its own
+            return Asset.Vests(amount=ratio.hp_to_vests(amount))
+
     result = wax.calculate_hp_to_vests(
         hive=to_python_json_asset(_hive),
         total_vesting_fund_hive=to_python_json_asset(data.total_vesting_fund_hive),
@@ -283,14 +535,32 @@ def decode_encrypted_memo(encoded_memo: str) -> python_encrypted_memo:
 def get_transaction_required_authorities(
     transaction: Transaction,
 ) -> wax.python_required_authority_collection:
-    return wax.get_transaction_required_authorities(__as_binary_json(transaction))
+    return call_timed(
+        "get_transaction_required_authorities",
+        partial(wax.get_transaction_required_authorities, __as_binary_json(transaction)),
+    )
 
 
 def collect_signing_keys(
     transaction: Transaction,
     retrieve_authorities: Callable[[list[str]], dict[str, wax.python_authorities]],
 ) -> list[str]:
-    return wax.collect_signing_keys(__as_binary_json(transaction), retrieve_authorities)
+    return call_timed(
+        "collect_signing_keys", partial(wax.collect_signing_keys, __as_binary_json(transaction), retrieve_authorities)
+    )
+
+
+async def collect_signing_keys_async(
+    transaction: Transaction,
+    retrieve_authorities: Callable[[list[str]], dict[str, wax.python_authorities]],
+) -> list[str]:
+    """Same as `collect_signing_keys`, but `retrieve_authorities` could be called from the CPU thread pool."""
+    transaction_json = __as_binary_json(transaction)
+    return await _call_offloaded(
+        "collect_signing_keys",
+        len(transaction_json),
+        partial(wax.collect_signing_keys, transaction_json, retrieve_authorities),
+    )
 
 
 def minimize_required_signatures(  # noqa: PLR0913
@@ -316,7 +586,41 @@ def minimize_required_signatures(  # noqa: PLR0913
         max_account_auths=max_account_auths,
         allow_strict_and_mixed_authorities=allow_strict_and_mixed_authorities,
     )
-    return wax.minimize_required_signatures(__as_binary_json(signed_transaction), data)
+    return call_timed(
+        "minimize_required_signatures",
+        partial(wax.minimize_required_signatures, __as_binary_json(signed_transaction), data),
+    )
+
+
+async def minimize_required_signatures_async(  # noqa: PLR0913
+    signed_transaction: Transaction,
+    chain_id: str,
+    available_keys: list[str],
+    authorities_map: dict[str, wax.python_authorities],
+    get_witness_key: Callable[[str], str],
+    *,
+    max_recursion: int | None = None,
+    max_membership: int | None = None,
+    max_account_auths: int | None = None,
+    allow_strict_and_mixed_authorities: bool = True,
+) -> list[str]:
+    """Same as `minimize_required_signatures`, but `get_witness_key` could be called from the CPU thread pool."""
+    data = wax.python_minimize_required_signatures_data(
+        chain_id=chain_id,
+        available_keys=available_keys,
+        authorities_map=authorities_map,
+        get_witness_key=get_witness_key,
+        max_recursion=max_recursion,
+        max_membership=max_membership,
+        max_account_auths=max_account_auths,
+        allow_strict_and_mixed_authorities=allow_strict_and_mixed_authorities,
+    )
+    transaction_json = __as_binary_json(signed_transaction)
+    return await _call_offloaded(
+        "minimize_required_signatures",
+        len(transaction_json),
+        partial(wax.minimize_required_signatures, transaction_json, data),
+    )
 
 
 def convert_schemas_account_to_python_authorities(account: Account) -> wax.python_authorities:
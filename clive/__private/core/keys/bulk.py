@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.core._thread import get_cpu_thread_pool
+from clive.__private.core.constants.authority import DEFAULT_DERIVED_KEY_ALIAS_TEMPLATE
+from clive.__private.core.keys.keys import PrivateKey, PrivateKeyAliased, PublicKeyAliased
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from clive.__private.core.keys.key_manager import KeyManager
+    from clive.__private.core.types import AuthorityLevel
+
+DERIVATION_CHUNK_SIZE: Final[int] = 32
+"""Number of keys derived by a single worker thread task, amortizes the cost of scheduling the task."""
+
+
+@dataclass(frozen=True)
+class KeyPair:
+    private_key: PrivateKeyAliased
+    public_key: PublicKeyAliased
+
+    @property
+    def alias(self) -> str:
+        return self.private_key.alias
+
+    @classmethod
+    def from_private_key(cls, private_key: PrivateKey) -> KeyPair:
+        """
+        Calculate the public key of the private key.
+
+        Args:
+            private_key: The private key, when it's not aliased, the public key value is used as an alias.
+
+        Returns:
+            The key pair.
+        """
+        if isinstance(private_key, PrivateKeyAliased):
+            return cls(private_key=private_key, public_key=private_key.calculate_public_key())
+        public_key = private_key.calculate_public_key()
+        alias = public_key.value
+        return cls(private_key=private_key.with_alias(alias), public_key=public_key.with_alias(alias))
+
+
+@dataclass(frozen=True)
+class KeyDerivationRequest:
+    """Derivation of a key from seed for given account and role, like `clive generate key-from-seed` does."""
+
+    account_name: str
+    role: AuthorityLevel
+    alias_template: str = DEFAULT_DERIVED_KEY_ALIAS_TEMPLATE
+
+    @property
+    def alias(self) -> str:
+        return self.alias_template.format(account_name=self.account_name, role=self.role)
+
+    def derive(self, seed: str) -> KeyPair:
+        private_key = PrivateKey.generate_from_seed(seed, self.account_name, role=self.role, with_alias=self.alias)
+        return KeyPair.from_private_key(private_key)
+
+
+@dataclass
+class KeysDeduplication:
+    """
+    Key pairs split by whether they should be imported.
+
+    Attributes:
+        new: Key pairs not known to the key manager yet.
+        already_known: Key pairs whose public key is already known (under any alias) or repeated in the input.
+        alias_conflicts: Key pairs whose alias is already used by a different key.
+    """
+
+    new: list[KeyPair] = field(default_factory=list)
+    already_known: list[KeyPair] = field(default_factory=list)
+    alias_conflicts: list[KeyPair] = field(default_factory=list)
+
+
+@dataclass
+class KeysImportResult:
+    """
+    Result of importing many keys into the beekeeper, some of them might fail while the others are imported.
+
+    Attributes:
+        imported: Keys imported successfully.
+        failed: Reasons of failure, by alias of the key.
+    """
+
+    imported: list[PublicKeyAliased] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.failed
+
+
+async def derive_key_pairs(seed: str, requests: Iterable[KeyDerivationRequest]) -> list[KeyPair]:
+    """
+    Derive keys from the seed in the CPU thread pool, in chunks processed in parallel.
+
+    Args:
+        seed: The seed (like secret phrase) keys are derived from.
+        requests: Accounts and roles to derive keys for.
+
+    Returns:
+        Derived key pairs, in order of requests.
+    """
+
+    def derive_chunk(chunk: Sequence[KeyDerivationRequest]) -> list[KeyPair]:
+        return [request.derive(seed) for request in chunk]
+
+    return await _run_in_chunks(derive_chunk, requests)
+
+
+async def calculate_key_pairs(private_keys: Iterable[PrivateKey]) -> list[KeyPair]:
+    """
+    Calculate public keys of many private keys in the CPU thread pool, in chunks processed in parallel.
+
+    Args:
+        private_keys: The private keys to calculate public keys of, not aliased ones are aliased with public keys.
+
+    Returns:
+        Key pairs, in order of private keys.
+    """
+
+    def calculate_chunk(chunk: Sequence[PrivateKey]) -> list[KeyPair]:
+        return [KeyPair.from_private_key(private_key) for private_key in chunk]
+
+    return await _run_in_chunks(calculate_chunk, private_keys)
+
+
+def deduplicate_key_pairs(key_manager: KeyManager, key_pairs: Iterable[KeyPair]) -> KeysDeduplication:
+    """
+    Split key pairs by whether they are new to the key manager, using its alias and public key indexes.
+
+    Args:
+        key_manager: The key manager to check against.
+        key_pairs: Key pairs to check.
+
+    Returns:
+        Key pairs split by whether they should be imported.
+    """
+    deduplication = KeysDeduplication()
+    seen_public_keys: set[str] = set()
+    seen_aliases: set[str] = set()
+
+    for key_pair in key_pairs:
+        public_key_value = key_pair.public_key.value
+        if public_key_value in seen_public_keys or key_manager.is_public_key_known(key_pair.public_key):
+            deduplication.already_known.append(key_pair)
+        elif key_pair.alias in seen_aliases or not key_manager.is_alias_available(key_pair.alias):
+            deduplication.alias_conflicts.append(key_pair)
+        else:
+            deduplication.new.append(key_pair)
+        seen_public_keys.add(public_key_value)
+        seen_aliases.add(key_pair.alias)
+
+    return deduplication
+
+
+async def _run_in_chunks[InputT, OutputT](
+    function: Callable[[Sequence[InputT]], list[OutputT]], items: Iterable[InputT]
+) -> list[OutputT]:
+    loop = asyncio.get_running_loop()
+    pool = get_cpu_thread_pool()
+    chunks = itertools.batched(items, DERIVATION_CHUNK_SIZE)
+    results = await asyncio.gather(*(loop.run_in_executor(pool, function, chunk) for chunk in chunks))
+    return list(itertools.chain.from_iterable(results))
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Awaitable, Callable, Iterable, Iterator
-from typing import Final
-
-from clive.__private.core.keys.keys import KeyAliased, PrivateKey, PrivateKeyAliased, PublicKey, PublicKeyAliased
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.core.keys.keys import (
+    Key,
+    KeyAliased,
+    PrivateKey,
+    PrivateKeyAliased,
+    PublicKey,
+    PublicKeyAliased,
+)
 from clive.__private.core.str_utils import is_text_matching_pattern
 from clive.__private.logger import logger
 from clive.exceptions import CliveError
 
+if TYPE_CHECKING:
+    from clive.__private.core.keys.bulk import KeysImportResult
+
 ImportCallbackT = Callable[[PrivateKeyAliased], Awaitable[PublicKeyAliased]]
+BulkImportCallbackT = Callable[[list[PrivateKeyAliased]], Awaitable["KeysImportResult"]]
 
 
 class KeyManagerError(CliveError):
@@ -37,11 +49,17 @@ class MultipleKeysFoundError(KeyManagerError):
 
 
 class KeyManager:
-    """A container-like object, that manages a number of keys, which you iterate over to see all the public keys."""
+    """
+    A container-like object, that manages a number of keys, which you iterate over to see all the public keys.
+
+    Keys are indexed by alias and by public key value, so membership checks don't scan all the keys.
+    """
 
     def __init__(self) -> None:
-        self.__keys: set[PublicKeyAliased] = set()
-        self.__keys_to_import: set[PrivateKeyAliased] = set()
+        self.__keys: dict[str, PublicKeyAliased] = {}
+        self.__public_key_values: Counter[str] = Counter()
+        self.__keys_to_import: dict[str, PrivateKeyAliased] = {}
+        self._revision = 0
 
     def __iter__(self) -> Iterator[PublicKeyAliased]:
         return iter(self._sorted_keys())
@@ -65,7 +83,15 @@ class KeyManager:
         Returns:
             True if the key is in the key manager, False otherwise.
         """
-        return key in list(self.__keys)
+        if isinstance(key, KeyAliased):
+            public_key = key.calculate_public_key() if isinstance(key, PrivateKeyAliased) else key
+            return self.__keys.get(public_key.alias) == public_key
+        return self.is_public_key_known(key)
+
+    @property
+    def change_marker(self) -> int:
+        """A value that changes whenever public keys are added, removed or renamed. Keys to import are not tracked."""
+        return self._revision
 
     @property
     def first(self) -> PublicKeyAliased:
@@ -85,16 +111,30 @@ class KeyManager:
             KeyNotFoundError: When there are no keys in the manager,
             MultipleKeysFoundError: When there are multiple different keys in the manager.
         """
-        public_key_values = {key.value for key in self.__keys}
-        if not public_key_values:
+        if not self.__public_key_values:
             raise KeyNotFoundError
-        if len(public_key_values) > 1:
+        if len(self.__public_key_values) > 1:
             raise MultipleKeysFoundError
         return self.first
 
     def is_alias_available(self, alias: str) -> bool:
         return self._is_public_alias_available(alias) and self._is_key_to_import_alias_available(alias)
 
+    def is_public_key_known(self, key: str | PublicKey | PrivateKey) -> bool:
+        """
+        Check if the public key (or the one of a private key) is known under any alias.
+
+        Args:
+            key: Raw public/private key or a key instance.
+
+        Returns:
+            True if there is a key with such public key in the key manager, False otherwise.
+        """
+        if isinstance(key, str):
+            key = PublicKey(value=key) if Key.determine_key_type(key) is PublicKey else PrivateKey(value=key)
+        public_key = key.calculate_public_key() if isinstance(key, PrivateKey) else key
+        return public_key.value in self.__public_key_values
+
     def get_all_aliases(self) -> list[str]:
         return [aliased_key.alias for aliased_key in self]
 
@@ -116,10 +156,10 @@ class KeyManager:
 
     def get_from_alias(self, value: str | PublicKeyAliased) -> PublicKeyAliased:
         alias = value if isinstance(value, str) else value.alias
-        for key in self.__keys:
-            if key.alias == alias:
-                return key
-        raise KeyNotFoundError(alias)
+        try:
+            return self.__keys[alias]
+        except KeyError:
+            raise KeyNotFoundError(alias) from None
 
     def get_first_from_public_key(self, value: str | PublicKey) -> PublicKeyAliased:
         value = value if isinstance(value, str) else value.value
@@ -131,7 +171,9 @@ class KeyManager:
     def add(self, *keys: PublicKeyAliased) -> None:
         for key in keys:
             self._assert_no_alias_conflict(key.alias)
-            self.__keys.add(key)
+            self.__keys[key.alias] = key
+            self.__public_key_values[key.value] += 1
+            self._revision += 1
 
     def remove(self, *keys: PublicKeyAliased) -> None:
         """
@@ -141,7 +183,13 @@ class KeyManager:
             *keys: The keys to remove.
         """
         for key in keys:
-            self.__keys.remove(key)
+            if self.__keys.get(key.alias) != key:
+                raise KeyError(key)
+            del self.__keys[key.alias]
+            self.__public_key_values[key.value] -= 1
+            if not self.__public_key_values[key.value]:
+                del self.__public_key_values[key.value]
+            self._revision += 1
 
     def rename(self, old_alias: str, new_alias: str) -> None:
         """
@@ -156,46 +204,58 @@ class KeyManager:
         """
         self._assert_no_alias_conflict(new_alias)
 
-        for key in self.__keys:
-            if key.alias == old_alias:
-                self.__keys.remove(key)
-                self.__keys.add(key.with_alias(new_alias))
-                return
-        raise KeyNotFoundError(old_alias)
+        key = self.__keys.pop(old_alias, None)
+        if key is None:
+            raise KeyNotFoundError(old_alias)
+        self.__keys[new_alias] = key.with_alias(new_alias)
+        self._revision += 1
 
     def add_to_import(self, *keys: PrivateKeyAliased) -> None:
         for key in keys:
             self._assert_no_alias_conflict(key.alias)
-            self.__keys_to_import.add(key)
+            self.__keys_to_import[key.alias] = key
 
     def set_to_import(self, keys: Iterable[PrivateKeyAliased]) -> None:
         keys_to_import = list(keys)
         for key in keys_to_import:
             # since "keys to import" will be new (replaced), we should check for conflicts with the public keys only
             self._assert_no_public_alias_conflict(key.alias)
-        self.__keys_to_import = set(keys_to_import)
+        self.__keys_to_import = {key.alias: key for key in keys_to_import}
 
     def clear_to_import(self) -> None:
         self.__keys_to_import.clear()
 
     async def import_pending_to_beekeeper(self, import_callback: ImportCallbackT) -> None:
-        imported_keys = [await import_callback(key) for key in self.__keys_to_import]
+        imported_keys = [await import_callback(key) for key in self.__keys_to_import.values()]
         self.__keys_to_import.clear()
         self.add(*imported_keys)
         logger.debug("Imported all pending keys to beekeeper.")
 
+    async def import_pending_to_beekeeper_in_bulk(self, import_callback: BulkImportCallbackT) -> KeysImportResult:
+        """
+        Import all pending keys at once, keys which failed to be imported stay pending.
+
+        Args:
+            import_callback: Imports the given keys, reporting which of them failed instead of raising.
+
+        Returns:
+            The result of importing the keys.
+        """
+        result = await import_callback(list(self.__keys_to_import.values()))
+        for key in result.imported:
+            del self.__keys_to_import[key.alias]
+        self.add(*result.imported)
+        logger.debug(f"Imported {len(result.imported)} pending keys to beekeeper, {len(result.failed)} failed.")
+        return result
+
     def _sorted_keys(self, *, reverse: bool = False) -> list[PublicKeyAliased]:
-        return sorted(self.__keys, key=lambda key: key.alias, reverse=reverse)
+        return sorted(self.__keys.values(), key=lambda key: key.alias, reverse=reverse)
 
     def _is_public_alias_available(self, alias: str) -> bool:
-        return self._is_alias_available(alias, self.__keys)
+        return alias not in self.__keys
 
     def _is_key_to_import_alias_available(self, alias: str) -> bool:
-        return self._is_alias_available(alias, self.__keys_to_import)
-
-    def _is_alias_available(self, alias: str, keys: Iterable[KeyAliased]) -> bool:
-        known_aliases = [key.alias for key in keys]
-        return alias not in known_aliases
+        return alias not in self.__keys_to_import
 
     def _assert_no_alias_conflict(self, alias: str) -> None:
         if not self.is_alias_available(alias):
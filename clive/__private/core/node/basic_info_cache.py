@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from clive.__private.models.schemas import Config, Version
+
+
+def calculate_version_fingerprint(version: Version) -> str:
+    """
+    Calculate the fingerprint of the node version, it changes whenever the node is upgraded or replaced.
+
+    Args:
+        version: Result of database_api.get_version, it also contains the chain id.
+
+    Returns:
+        Hex digest of the version.
+    """
+    return hashlib.sha256(version.json(order="sorted").encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class PersistedNodeBasicInfo:
+    """
+    Parts of the node basic info which don't change as long as the node is not upgraded or replaced.
+
+    Attributes:
+        config: Result of database_api.get_config.
+        version: Result of database_api.get_version.
+        saved_at: When the data was fetched from the node or last confirmed to be up to date (wall clock time).
+    """
+
+    config: Config
+    version: Version
+    saved_at: float
+
+    @property
+    def fingerprint(self) -> str:
+        return calculate_version_fingerprint(self.version)
+
+    @property
+    def network_type(self) -> str:
+        return self.version.node_type
+
+    @property
+    def chain_id(self) -> str:
+        return self.config.HIVE_CHAIN_ID
+
+
+class _BasicInfoCacheEntry(msgspec.Struct):
+    saved_at: float
+    fingerprint: str
+    config: str
+    version: str
+
+
+class NodeBasicInfoCache:
+    """
+    File with config and version of nodes, keyed by the node address, so CLI runs don't have to fetch them again.
+
+    Args:
+        cache_path: Path of the file with cached data.
+        max_age_secs: How long the data is considered up to date, older data should be revalidated before it is used.
+        clock: Source of the current (wall clock) time, entries are compared with it between runs.
+    """
+
+    def __init__(self, cache_path: Path, max_age_secs: float, *, clock: Callable[[], float] = time.time) -> None:
+        self._cache_path = cache_path
+        self._max_age_secs = max_age_secs
+        self._clock = clock
+
+    def load(self, address: str) -> PersistedNodeBasicInfo | None:
+        """
+        Load the cached data of the node.
+
+        Args:
+            address: Address of the node.
+
+        Returns:
+            The cached data or None when the node was not cached or the data is not readable.
+        """
+        from clive.__private.models.schemas import Config, Version  # noqa: PLC0415
+
+        entry = self._load_entries().get(address)
+        if entry is None:
+            return None
+
+        try:
+            info = PersistedNodeBasicInfo(
+                config=Config.parse_raw(entry.config), version=Version.parse_raw(entry.version), saved_at=entry.saved_at
+            )
+        except (msgspec.DecodeError, msgspec.ValidationError) as error:
+            logger.debug(f"Cached basic info of {address} is not valid, it will be fetched again: {error}")
+            return None
+
+        if info.fingerprint != entry.fingerprint:
+            return None
+        return info
+
+    def store(self, address: str, config: Config, version: Version) -> PersistedNodeBasicInfo:
+        """
+        Store the data freshly fetched from the node.
+
+        Args:
+            address: Address of the node.
+            config: Result of database_api.get_config.
+            version: Result of database_api.get_version.
+
+        Returns:
+            The stored data.
+        """
+        info = PersistedNodeBasicInfo(config=config, version=version, saved_at=self._clock())
+        entries = self._load_entries()
+        entries[address] = _BasicInfoCacheEntry(
+            saved_at=info.saved_at, fingerprint=info.fingerprint, config=config.json(), version=version.json()
+        )
+        self._save(entries)
+        return info
+
+    def confirm(self, address: str, info: PersistedNodeBasicInfo) -> PersistedNodeBasicInfo:
+        """
+        Mark the cached data as up to date, because the node still reports the same version.
+
+        Args:
+            address: Address of the node.
+            info: The confirmed data.
+
+        Returns:
+            The data with the updated time of saving.
+        """
+        entries = self._load_entries()
+        entry = entries.get(address)
+        if entry is not None and entry.fingerprint == info.fingerprint:
+            entry.saved_at = self._clock()
+            self._save(entries)
+        return PersistedNodeBasicInfo(config=info.config, version=info.version, saved_at=self._clock())
+
+    def is_stale(self, info: PersistedNodeBasicInfo) -> bool:
+        """Check whether the data should be revalidated, because it was not confirmed for too long."""
+        return self._clock() - info.saved_at > self._max_age_secs
+
+    def _load_entries(self) -> dict[str, _BasicInfoCacheEntry]:
+        try:
+            return msgspec.json.decode(self._cache_path.read_bytes(), type=dict[str, _BasicInfoCacheEntry])
+        except (OSError, msgspec.DecodeError, msgspec.ValidationError):
+            return {}
+
+    def _save(self, entries: dict[str, _BasicInfoCacheEntry]) -> None:
+        with suppress(OSError):  # not being able to persist the cache is not critical, data will be fetched again
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_bytes(msgspec.json.encode(entries))
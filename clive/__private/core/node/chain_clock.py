@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import UTC, timedelta
+from typing import TYPE_CHECKING, ClassVar, Protocol
+
+from clive.__private.core.constants.node import HIVE_BLOCK_INTERVAL_SECONDS
+from clive.__private.core.date_utils import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+
+class HeadBlockProtocol(Protocol):
+    """
+    Simply pass gdpo, or object that provides the head block information.
+
+    Attributes:
+        head_block_number: Number of the head block.
+        time: Time of the head block.
+        last_irreversible_block_num: Number of the last irreversible block.
+    """
+
+    @property
+    def head_block_number(self) -> int: ...
+
+    @property
+    def time(self) -> datetime: ...
+
+    @property
+    def last_irreversible_block_num(self) -> int: ...
+
+
+@dataclass(frozen=True)
+class _Seed:
+    head_block_number: int
+    head_block_time: datetime
+    last_irreversible_block_num: int
+    seeded_at: float
+
+
+class ChainClock:
+    """
+    Extrapolates the head block locally between fetches of the dynamic global properties.
+
+    Blocks are produced every `HIVE_BLOCK_INTERVAL_SECONDS`, so after seeding with the fetched properties the head
+    block number, its time and the last irreversible block can be predicted without asking the node.
+    Each seed narrows down the moment (in the local monotonic time) at which blocks are produced. Within these
+    bounds the age of the head block measured with the wall clock is trusted, otherwise (e.g. the wall clock is
+    not synchronized) the latest possible moment is taken, so predictions don't go ahead of the chain.
+    Drift (e.g. caused by missed blocks) is corrected by the next seed.
+
+    Args:
+        clock: Source of monotonic time, in seconds.
+        wall_clock: Source of the current UTC time, compared with the head block time.
+    """
+
+    BLOCK_INTERVAL_SECS: ClassVar[float] = HIVE_BLOCK_INTERVAL_SECONDS
+
+    MAX_EXTRAPOLATION_SECS: ClassVar[float] = 30.0
+    """How long after the last seed the values are extrapolated, later they stop (node may be gone)."""
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, wall_clock: Callable[[], datetime] = utc_now
+    ) -> None:
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._seed: _Seed | None = None
+        self._production_offset_bounds: tuple[float, float] | None = None
+        self._production_offset: float | None = None
+        """Local time at which block number 0 would be produced, all blocks are produced in intervals from it."""
+        self._last_drift_blocks = 0
+
+    @property
+    def is_seeded(self) -> bool:
+        return self._seed is not None
+
+    @property
+    def last_drift_blocks(self) -> int:
+        """How many blocks the prediction was ahead (positive) or behind (negative) at the last seed."""
+        return self._last_drift_blocks
+
+    @property
+    def head_block_number(self) -> int:
+        return self._seed_ensure.head_block_number + self._blocks_since_seed()
+
+    @property
+    def head_block_time(self) -> datetime:
+        blocks = self._blocks_since_seed()
+        return self._seed_ensure.head_block_time + timedelta(seconds=blocks * self.BLOCK_INTERVAL_SECS)
+
+    @property
+    def last_irreversible_block_num(self) -> int:
+        return self._seed_ensure.last_irreversible_block_num + self._blocks_since_seed()
+
+    @property
+    def secs_until_next_block(self) -> float:
+        """Time after which the head block number is expected to change, a whole interval when it's not known."""
+        if self._production_offset is None:
+            return self.BLOCK_INTERVAL_SECS
+        elapsed_in_interval = (self._clock() - self._production_offset) % self.BLOCK_INTERVAL_SECS
+        return self.BLOCK_INTERVAL_SECS - elapsed_in_interval
+
+    def seed(self, data: HeadBlockProtocol) -> None:
+        """
+        Correct the clock with freshly fetched head block information.
+
+        Args:
+            data: The fetched information, e.g. dynamic global properties.
+        """
+        now = self._clock()
+        if self._seed is not None:
+            self._last_drift_blocks = self.head_block_number - data.head_block_number
+            if self._last_drift_blocks > 0:
+                # went ahead of the chain, so the schedule has shifted (e.g. missed blocks) - learn it anew
+                self._production_offset_bounds = None
+
+        self._seed = _Seed(
+            head_block_number=data.head_block_number,
+            head_block_time=data.time,
+            last_irreversible_block_num=data.last_irreversible_block_num,
+            seeded_at=now,
+        )
+        self._narrow_production_offset(now, data.head_block_number)
+        self._production_offset = self._estimate_production_offset(now, data)
+
+    def reset(self) -> None:
+        """Forget everything that was seeded, e.g. when switching to another node."""
+        self._seed = None
+        self._production_offset_bounds = None
+        self._production_offset = None
+        self._last_drift_blocks = 0
+
+    @property
+    def _seed_ensure(self) -> _Seed:
+        assert self._seed is not None, "Chain clock was not seeded yet."
+        return self._seed
+
+    def _narrow_production_offset(self, observed_at: float, head_block_number: int) -> None:
+        # the head block was produced within the last interval before observing it
+        lower = observed_at - (head_block_number + 1) * self.BLOCK_INTERVAL_SECS
+        upper = observed_at - head_block_number * self.BLOCK_INTERVAL_SECS
+        if self._production_offset_bounds is not None:
+            previous_lower, previous_upper = self._production_offset_bounds
+            if max(lower, previous_lower) < min(upper, previous_upper):
+                lower, upper = max(lower, previous_lower), min(upper, previous_upper)
+            # otherwise the schedule has shifted (missed blocks, local clock hiccup), start anew
+        self._production_offset_bounds = (lower, upper)
+
+    def _estimate_production_offset(self, observed_at: float, data: HeadBlockProtocol) -> float:
+        assert self._production_offset_bounds is not None, "Bounds are narrowed before estimating."
+        lower, upper = self._production_offset_bounds
+        head_block_time = data.time if data.time.tzinfo is not None else data.time.replace(tzinfo=UTC)
+        head_block_age_secs = (self._wall_clock() - head_block_time).total_seconds()
+        hinted = observed_at - head_block_age_secs - data.head_block_number * self.BLOCK_INTERVAL_SECS
+        return hinted if lower < hinted <= upper else upper
+
+    def _blocks_since_seed(self) -> int:
+        seed = self._seed_ensure
+        assert self._production_offset is not None, "Production offset is known once seeded."
+        now = min(self._clock(), seed.seeded_at + self.MAX_EXTRAPOLATION_SECS)
+        expected_head_block_number = math.floor((now - self._production_offset) / self.BLOCK_INTERVAL_SECS)
+        return max(0, expected_head_block_number - seed.head_block_number)
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import socket
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import msgspec
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+from beekeepy.communication import AioHttpCommunicator
+
+from clive.__private.core.node.resilience import NodeServerError
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Callable
+    from pathlib import Path
+    from types import SimpleNamespace
+
+    from beekeepy.communication import CommunicationSettings, Request, Response
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """
+    Settings of the pool of HTTP connections to the node.
+
+    Attributes:
+        limit_per_host: Maximum number of simultaneous connections to the node.
+        keepalive_timeout_secs: How long an idle connection is kept open for reuse.
+        dns_cache_ttl_secs: How long resolved addresses of the node are cached.
+        dns_cache_path: Where resolved addresses are persisted between runs, not persisted when None.
+        ssl_context: Context used for TLS connections, default verification is used when None.
+    """
+
+    limit_per_host: int = 8
+    keepalive_timeout_secs: float = 30
+    dns_cache_ttl_secs: float = 300
+    dns_cache_path: Path | None = None
+    ssl_context: ssl.SSLContext | None = None
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """
+    Statistics of connections made by the pool.
+
+    Attributes:
+        new_connections: Number of requests for which a new connection had to be established.
+        reused_connections: Number of requests sent through an already open (kept alive) connection.
+        connect_secs: Total time of establishing new connections (TCP connect and TLS handshake), DNS excluded.
+        dns_resolutions: Number of host resolutions done with the system resolver.
+        dns_cache_hits: Number of host resolutions answered from the cache, also the one persisted between runs.
+    """
+
+    new_connections: int = 0
+    reused_connections: int = 0
+    connect_secs: float = 0.0
+    dns_resolutions: int = 0
+    dns_cache_hits: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.new_connections + self.reused_connections
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+    @property
+    def average_connect_secs(self) -> float:
+        return self.connect_secs / self.new_connections if self.new_connections else 0.0
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Create aiohttp trace config collecting these metrics.
+
+        Returns:
+            The trace config to be passed to the client session.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_resolve_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_resolve_end)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        return trace_config
+
+    async def _on_connection_create_start(self, _session: object, context: SimpleNamespace, _params: object) -> None:
+        context.connection_start = time.perf_counter()
+        context.dns_secs = 0.0
+
+    async def _on_connection_create_end(self, _session: object, context: SimpleNamespace, _params: object) -> None:
+        self.new_connections += 1
+        self.connect_secs += time.perf_counter() - context.connection_start - context.dns_secs
+
+    async def _on_connection_reuse(self, _session: object, _context: SimpleNamespace, _params: object) -> None:
+        self.reused_connections += 1
+
+    async def _on_dns_resolve_start(self, _session: object, context: SimpleNamespace, _params: object) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def _on_dns_resolve_end(self, _session: object, context: SimpleNamespace, _params: object) -> None:
+        context.dns_secs = time.perf_counter() - context.dns_start
+
+    async def _on_dns_cache_hit(self, _session: object, _context: SimpleNamespace, _params: object) -> None:
+        self.dns_cache_hits += 1
+
+
+class _DnsCacheEntry(msgspec.Struct):
+    expires_at: float
+    addresses: list[dict[str, str | int]]
+
+
+class PersistentDnsResolver(AbstractResolver):
+    """
+    Resolver which persists resolved addresses in a file, so short CLI runs don't have to resolve the node again.
+
+    Args:
+        cache_path: Path of the file with resolved addresses.
+        ttl_secs: How long resolved addresses are valid.
+        metrics: Metrics to be updated with resolutions.
+        clock: Source of the current (wall clock) time, entries are compared with it between runs.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path,
+        ttl_secs: float,
+        metrics: ConnectionPoolMetrics,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._resolver = DefaultResolver()
+        self._cache_path = cache_path
+        self._ttl_secs = ttl_secs
+        self._metrics = metrics
+        self._clock = clock
+        self._entries = self._load()
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        key = f"{host}:{port}:{int(family)}"
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self._metrics.dns_cache_hits += 1
+            return [ResolveResult(**address) for address in entry.addresses]  # type: ignore[typeddict-item]
+
+        addresses = await self._resolver.resolve(host, port, family)
+        self._metrics.dns_resolutions += 1
+        self._entries[key] = _DnsCacheEntry(
+            expires_at=self._clock() + self._ttl_secs, addresses=[dict(address) for address in addresses]
+        )
+        self._save()
+        return addresses
+
+    def forget(self, host: str) -> None:
+        """Forget addresses of the host, e.g. because connecting to it failed and they might be outdated."""
+        keys = [key for key in self._entries if key.rsplit(":", maxsplit=2)[0] == host]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self._save()
+
+    async def close(self) -> None:
+        await self._resolver.close()
+
+    def _load(self) -> dict[str, _DnsCacheEntry]:
+        try:
+            entries = msgspec.json.decode(self._cache_path.read_bytes(), type=dict[str, _DnsCacheEntry])
+        except (OSError, msgspec.DecodeError, msgspec.ValidationError):
+            return {}
+        now = self._clock()
+        return {key: entry for key, entry in entries.items() if entry.expires_at > now}
+
+    def _save(self) -> None:
+        with suppress(OSError):  # not being able to persist the cache is not critical, addresses will be resolved
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_bytes(msgspec.json.encode(self._entries))
+
+
+class PooledAioHttpCommunicator(AioHttpCommunicator):
+    """
+    Communicator keeping connections to the node alive and reusing them, with DNS cache and collected metrics.
+
+    HTTP/1.1 pipelining is not supported by aiohttp (nor by most of API nodes), so requests which can be sent
+    together should use the batch handle instead. Python `ssl` can't serialize TLS sessions, so handshakes can't be
+    resumed between runs, persisting resolved addresses and keeping connections alive is what's done instead.
+    HTTP 5xx responses without a JSON-RPC response are raised as `NodeServerError`, so they can be retried.
+
+    Args:
+        *args: Positional arguments for the AioHttpCommunicator.
+        settings: Communication settings.
+        pool_settings: Settings of the connection pool.
+        **kwargs: Keyword arguments for the AioHttpCommunicator.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        settings: CommunicationSettings,
+        pool_settings: ConnectionPoolSettings | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, settings=settings, **kwargs)
+        self._pool_settings = pool_settings or ConnectionPoolSettings()
+        self._pooled_session: aiohttp.ClientSession | None = None
+        self._resolver: PersistentDnsResolver | None = None
+        self.metrics = ConnectionPoolMetrics()
+
+    @property
+    async def session(self) -> aiohttp.ClientSession:
+        if self._pooled_session is None or self._pooled_session.closed:
+            await self._close_resolver()  # the one of the previous session
+            self._pooled_session = self._create_session()
+        return self._pooled_session
+
+    async def close(self) -> None:
+        """Close the pooled connections, for use in the event loop which sent the requests."""
+        if self._pooled_session is not None:
+            await self._pooled_session.close()
+            self._pooled_session = None
+        await self._close_resolver()
+
+    def teardown(self) -> None:
+        if self._pooled_session is not None:
+            self._asyncio_run(self._pooled_session.close())
+            self._pooled_session = None
+        if self._resolver is not None:
+            self._asyncio_run(self._close_resolver())
+        super().teardown()
+
+    async def _close_resolver(self) -> None:
+        if self._resolver is not None:
+            await self._resolver.close()  # connector doesn't close the resolver it was given
+            self._resolver = None
+
+    async def _async_send(self, request: Request) -> Response:
+        response = await super()._async_send(request)
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR and not self._is_json(response.body):
+            raise NodeServerError(
+                request.url.as_string(), request.body or "", status_code=response.status_code, body=response.body
+            )
+        return response
+
+    @staticmethod
+    def _is_json(body: str) -> bool:
+        """Check whether the body may be a JSON-RPC response, e.g. an error of the node passed on by the proxy."""
+        try:
+            json.loads(body)
+        except json.JSONDecodeError:
+            return False
+        return True
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        settings = self._pool_settings
+        resolver = None
+        if settings.dns_cache_path is not None:
+            resolver = self._resolver = PersistentDnsResolver(
+                settings.dns_cache_path, settings.dns_cache_ttl_secs, self.metrics
+            )
+
+        connector = aiohttp.TCPConnector(
+            limit_per_host=settings.limit_per_host,
+            keepalive_timeout=settings.keepalive_timeout_secs,
+            use_dns_cache=True,
+            ttl_dns_cache=int(settings.dns_cache_ttl_secs),
+            resolver=resolver,
+            ssl=settings.ssl_context if settings.ssl_context is not None else True,
+        )
+        trace_config = self.metrics.create_trace_config()
+        trace_config.on_request_exception.append(self._on_request_exception)
+        logger.debug(f"Creating node connection pool: {settings}")
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_request_exception(
+        self, _session: object, _context: SimpleNamespace, params: aiohttp.TraceRequestExceptionParams
+    ) -> None:
+        if self._resolver is not None and params.url.host is not None:
+            self._resolver.forget(params.url.host)
@@ -10,14 +10,27 @@ import beekeepy.exceptions as bke
 
 from clive.__private.core.commands.data_retrieval.get_node_basic_info import GetNodeBasicInfo, NodeBasicInfoData
 from clive.__private.core.node.async_hived.async_handle import AsyncHived
+from clive.__private.core.node.basic_info_cache import (
+    NodeBasicInfoCache,
+    PersistedNodeBasicInfo,
+    calculate_version_fingerprint,
+)
+from clive.__private.core.node.chain_clock import ChainClock
+from clive.__private.core.node.connection_pool import ConnectionPoolMetrics, PooledAioHttpCommunicator
+from clive.__private.core.node.resilience import ResilientOverseer
+from clive.__private.core.node.tapos_reference import TaposReferenceManager
+from clive.__private.logger import logger
 from clive.__private.settings import safe_settings
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from beekeepy.communication import AbstractCommunicator
     from beekeepy.interfaces import HttpUrl
 
+    from clive.__private.core.node.resilience import CircuitBreaker, ResiliencePolicy
     from clive.__private.core.profile import Profile
+    from clive.__private.core.transaction_sizing import RcCostEstimator
     from clive.__private.models.schemas import Config, DynamicGlobalProperties, Version
 
 
@@ -27,6 +40,10 @@ class Node(AsyncHived):
         _node: Node
         _basic_info: NodeBasicInfoData | None = field(init=False, default=None)
         _online: bool | None = None
+        _rc_cost_estimator: RcCostEstimator | None = field(init=False, default=None)
+        _persisted_basic_info: PersistedNodeBasicInfo | None = field(init=False, default=None)
+        _is_persisted_basic_info_loaded: bool = field(init=False, default=False)
+        _revalidation_task: asyncio.Task[None] | None = field(init=False, default=None)
         _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
 
         @property
@@ -57,7 +74,7 @@ class Node(AsyncHived):
 
         @property
         async def config(self) -> Config:
-            return (await self.basic_info).config
+            return (await self._immutable_basic_info).config
 
         @property
         def config_ensure(self) -> Config:
@@ -72,7 +89,7 @@ class Node(AsyncHived):
 
         @property
         async def version(self) -> Version:
-            return (await self.basic_info).version
+            return (await self._immutable_basic_info).version
 
         @property
         def version_ensure(self) -> Version:
@@ -124,7 +141,7 @@ class Node(AsyncHived):
 
         @property
         async def network_type(self) -> str:
-            return (await self.basic_info).network_type
+            return (await self._immutable_basic_info).network_type
 
         @property
         def network_type_ensure(self) -> str:
@@ -139,7 +156,7 @@ class Node(AsyncHived):
 
         @property
         async def chain_id(self) -> str:
-            return (await self.basic_info).chain_id
+            return (await self._immutable_basic_info).chain_id
 
         @property
         def chain_id_ensure(self) -> str:
@@ -152,18 +169,53 @@ class Node(AsyncHived):
                 return self.basic_info_ensure.chain_id
             return None
 
+        @property
+        async def rc_cost_estimator(self) -> RcCostEstimator:
+            """Estimator of transaction RC costs, resource parameters and pool are fetched once and cached."""
+            gdpo = await self.dynamic_global_properties
+            async with self._lock:
+                if self._rc_cost_estimator is None:
+                    self._rc_cost_estimator = await self._node._fetch_rc_cost_estimator(gdpo)
+            return self._rc_cost_estimator
+
+        async def wait_for_revalidation(self) -> None:
+            """Wait until the revalidation of basic info persisted between runs, if started, is finished."""
+            if self._revalidation_task is not None:
+                await asyncio.shield(self._revalidation_task)
+
+        def cancel_revalidation(self) -> None:
+            if self._revalidation_task is not None:
+                self._revalidation_task.cancel()
+                self._revalidation_task = None
+
         def clear(self) -> None:
             self._basic_info = None
+            self._rc_cost_estimator = None
+            self._persisted_basic_info = None
+            self._is_persisted_basic_info_loaded = False
+            self.cancel_revalidation()
+            self._node.chain_clock.reset()
+            self._node.tapos_references.clear()
 
         async def update_dynamic_global_properties(
             self, new_data: DynamicGlobalProperties, *, update_only_when_definitely_newer_data: bool = True
         ) -> None:
             def set_data() -> None:
                 basic_info.dynamic_global_properties = new_data
+                self._node.notify_dynamic_global_properties_seen(new_data)
 
             def is_incoming_dgpo_data_newer() -> bool:
                 return current_data.head_block_number < new_data.head_block_number
 
+            if self._basic_info is None and (persisted := await self._get_usable_persisted_basic_info()) is not None:
+                # config and version are known from the previous runs, so there is no need to fetch them with gdpo
+                self._basic_info = NodeBasicInfoData(
+                    config=persisted.config, version=persisted.version, dynamic_global_properties=new_data
+                )
+                self._node.notify_dynamic_global_properties_seen(new_data)
+                self._set_online()
+                return
+
             basic_info = await self.basic_info
             current_data = basic_info.dynamic_global_properties
 
@@ -183,11 +235,90 @@ class Node(AsyncHived):
                 if self._basic_info is None:
                     await self._node._sync_node_basic_info()
 
+        @property
+        async def _immutable_basic_info(self) -> NodeBasicInfoData | PersistedNodeBasicInfo:
+            """Basic info fetched in this run or, when not fetched yet, the one persisted between runs."""
+            if self._basic_info is None and (persisted := await self._get_usable_persisted_basic_info()) is not None:
+                return persisted
+            return await self.basic_info
+
+        async def _get_usable_persisted_basic_info(self) -> PersistedNodeBasicInfo | None:
+            """Basic info persisted between runs, checked against the node first when not confirmed for too long."""
+            persisted = self._load_persisted_basic_info()
+            cache = self._node.basic_info_cache
+            if persisted is not None and cache is not None and cache.is_stale(persisted):
+                # e.g. checks of the previous runs were interrupted, so the node could have been upgraded meanwhile
+                await self.wait_for_revalidation()
+                if self._basic_info is not None:
+                    return None  # version changed, basic info was fetched again
+            return self._persisted_basic_info
+
+        def _load_persisted_basic_info(self) -> PersistedNodeBasicInfo | None:
+            cache = self._node.basic_info_cache
+            if cache is None:
+                return None
+
+            if not self._is_persisted_basic_info_loaded:
+                self._is_persisted_basic_info_loaded = True
+                self._persisted_basic_info = cache.load(self._node.http_endpoint_key)
+                if self._persisted_basic_info is not None:
+                    # only get_version is called, so node upgrades are noticed by the next run already
+                    self._revalidation_task = asyncio.create_task(
+                        self._revalidate_persisted_basic_info(self._persisted_basic_info),
+                        name="revalidate_node_basic_info",
+                    )
+            return self._persisted_basic_info
+
+        async def _revalidate_persisted_basic_info(self, persisted: PersistedNodeBasicInfo) -> None:
+            """Check in the background whether the node still has the same version, only get_version is called."""
+            cache = self._node.basic_info_cache
+            assert cache is not None, "revalidation is started only when the cache is enabled"
+            try:
+                version = await self._node.api.database_api.get_version()
+                if calculate_version_fingerprint(version) == persisted.fingerprint:
+                    if cache.is_stale(persisted):  # the file is not rewritten on every run
+                        self._persisted_basic_info = cache.confirm(self._node.http_endpoint_key, persisted)
+                    return
+
+                logger.info(f"Version of node {self._node.http_endpoint} changed, fetching its basic info again.")
+                self._persisted_basic_info = None
+                self._basic_info = None  # could be completed with the outdated config and version
+                await self._fetch_basic_info()
+            except bke.CommunicationError as error:
+                logger.warning(f"Revalidation of cached node basic info failed: {error}")
+
     def __init__(self, profile: Profile) -> None:
         self.__profile = profile
+        self.chain_clock = ChainClock()
+        self.tapos_references = TaposReferenceManager(safe_settings.node.tapos_reference_max_age_secs)
         self.cached = self.CachedData(self)
+        basic_info_cache_max_age_secs = safe_settings.node.basic_info_cache_max_age_secs
+        self.basic_info_cache = (
+            NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, basic_info_cache_max_age_secs)
+            if basic_info_cache_max_age_secs
+            else None
+        )
         super().__init__(settings=safe_settings.node.settings_factory(self.http_endpoint))
 
+    @property
+    def connection_pool_metrics(self) -> ConnectionPoolMetrics:
+        """Statistics of connections made to the node, e.g. how many of them were reused."""
+        communicator = self._overseer.communicator
+        assert isinstance(communicator, PooledAioHttpCommunicator), "Node always uses the pooled communicator"
+        return communicator.metrics
+
+    @property
+    def resilience_policy(self) -> ResiliencePolicy:
+        """Retry budgets, backoff and circuit breaker applied to requests sent to the node."""
+        overseer = self._overseer
+        assert isinstance(overseer, ResilientOverseer), "Node always uses the resilient overseer"
+        return overseer.policy
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Breaker failing requests fast during an outage, subscribe to it to observe its state transitions."""
+        return self.resilience_policy.circuit_breaker
+
     @property
     def http_endpoint(self) -> HttpUrl:
         """Return endpoint where handle is connected to."""
@@ -206,6 +337,16 @@ class Node(AsyncHived):
         """
         raise NotImplementedError("use set_address method!")
 
+    @property
+    def http_endpoint_key(self) -> str:
+        """Address of the node as a key of data persisted between runs."""
+        return str(self.http_endpoint)
+
+    def _get_recommended_communicator(self) -> AbstractCommunicator:
+        return PooledAioHttpCommunicator(
+            settings=self._settings, pool_settings=safe_settings.node.connection_pool_settings_factory()
+        )
+
     @contextmanager
     def modified_connection_details(
         self,
@@ -234,6 +375,11 @@ class Node(AsyncHived):
         self.__profile._set_node_address(address)
         self.cached.clear()
 
+    def notify_dynamic_global_properties_seen(self, gdpo: DynamicGlobalProperties) -> None:
+        """Let the local chain state follow the freshly fetched properties."""
+        self.chain_clock.seed(gdpo)
+        self.tapos_references.remember(gdpo)
+
     def change_related_profile(self, profile: Profile) -> None:
         self.__profile = profile
 
@@ -245,9 +391,47 @@ class Node(AsyncHived):
         self.__profile.set_chain_id(chain_id_from_node)
         return chain_id_from_node
 
+    def _persist_basic_info(self, basic_info: NodeBasicInfoData) -> None:
+        """Store config and version for the next runs, unless the same ones are already stored and up to date."""
+        if self.basic_info_cache is None:
+            return
+
+        persisted = self.cached._persisted_basic_info
+        if not self.cached._is_persisted_basic_info_loaded:
+            persisted = self.basic_info_cache.load(self.http_endpoint_key)
+        if (
+            persisted is not None
+            and persisted.fingerprint == calculate_version_fingerprint(basic_info.version)
+            and not self.basic_info_cache.is_stale(persisted)
+        ):
+            self.cached._persisted_basic_info = persisted
+        else:
+            self.cached._persisted_basic_info = self.basic_info_cache.store(
+                self.http_endpoint_key, basic_info.config, basic_info.version
+            )
+        self.cached._is_persisted_basic_info_loaded = True
+
+    async def _fetch_rc_cost_estimator(self, gdpo: DynamicGlobalProperties) -> RcCostEstimator:
+        from clive.__private.core.transaction_sizing import RcCostEstimator  # noqa: PLC0415
+
+        async with await self.batch() as node:
+            resource_params = await node.api.rc_api.get_resource_params()
+            resource_pool = await node.api.rc_api.get_resource_pool()
+        return RcCostEstimator(
+            resource_params=resource_params,
+            resource_pool=resource_pool,
+            total_vesting_shares=int(gdpo.total_vesting_shares.amount),
+        )
+
+    def teardown(self) -> None:
+        self.cached.cancel_revalidation()
+        super().teardown()
+
     async def _sync_node_basic_info(self) -> None:
         try:
             self.cached._basic_info = await GetNodeBasicInfo(self).execute_with_result()
+            self.notify_dynamic_global_properties_seen(self.cached._basic_info.dynamic_global_properties)
+            self._persist_basic_info(self.cached._basic_info)
         except bke.CommunicationError as error:
             if error.response is None:
                 self.cached._set_offline()
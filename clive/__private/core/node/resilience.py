@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import beekeepy.exceptions as bke
+from beekeepy.communication import CommonOverseer
+
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from beekeepy._communication.abc.communicator_models import Methods
+    from beekeepy._communication.abc.rules import RulesClassifier
+    from beekeepy.communication import AsyncCallbacks
+    from beekeepy.exceptions import Json
+    from beekeepy.interfaces import HttpUrl
+
+FailureKind = Literal["timeout", "connection", "server_error", "json_rpc_error"]
+CircuitState = Literal["closed", "open", "half_open"]
+
+TRANSIENT_RESPONSE_ERRORS: Final[tuple[type[bke.OverseerError], ...]] = (
+    bke.UnparsableResponseError,
+    bke.JussiResponseError,
+    bke.DifferenceBetweenAmountOfRequestsAndResponsesError,
+    bke.NullResultError,
+)
+"""Invalid responses which may not happen again, unlike errors reported by the node (e.g. missing authority)."""
+
+
+class NodeServerError(bke.CommunicationError):
+    """Raised when the node (or a proxy in front of it) responds with HTTP 5xx without a JSON-RPC response."""
+
+    def __init__(self, url: str, request: str, *, status_code: int, body: str) -> None:
+        self.status_code = status_code
+        super().__init__(url, request, message=f"Node responded with HTTP {status_code}: {body[:200]}")
+
+
+class CircuitOpenError(bke.CommunicationError):
+    """Raised without sending the request, because the node failed too many times in a row."""
+
+    def __init__(self, url: str, request: str, *, consecutive_failures: int, retry_in_secs: float) -> None:
+        self.consecutive_failures = consecutive_failures
+        self.retry_in_secs = retry_in_secs
+        super().__init__(
+            url,
+            request,
+            message=(
+                f"Node failed {consecutive_failures} times in a row, requests are not sent to it for the next"
+                f" {retry_in_secs:.1f}s."
+            ),
+        )
+
+
+def classify_failure(error: Exception) -> FailureKind | None:
+    """
+    Classify the error of a single attempt of sending a request.
+
+    Args:
+        error: Error raised by the overseer or the communicator.
+
+    Returns:
+        Kind of the failure, or None when the node responded properly, e.g. with an error caused by the request.
+    """
+    if isinstance(error, bke.TimeoutExceededError):
+        return "timeout"
+    if isinstance(error, NodeServerError):
+        return "server_error"
+    if isinstance(error, TRANSIENT_RESPONSE_ERRORS):
+        return "json_rpc_error"
+    if isinstance(error, bke.OverseerError | CircuitOpenError):
+        return None
+    if isinstance(error, bke.CommunicationError) and error.response is None:
+        return "connection"
+    return None
+
+
+@dataclass(frozen=True)
+class RetryBudgets:
+    """
+    How many times a request is retried after failing, separately for each kind of failure.
+
+    Attributes:
+        timeout: Retries after the node didn't respond in time, each of them may take the whole timeout.
+        connection: Retries after the connection couldn't be established or was broken (e.g. refused).
+        server_error: Retries after HTTP 5xx responses (e.g. the node behind a proxy is restarting).
+        json_rpc_error: Retries after invalid JSON-RPC responses (e.g. unparsable or with null result).
+    """
+
+    timeout: int = 1
+    connection: int = 2
+    server_error: int = 3
+    json_rpc_error: int = 4
+
+    def for_failure(self, kind: FailureKind) -> int:
+        budget: int = getattr(self, kind)
+        return budget
+
+
+@dataclass(frozen=True)
+class ExponentialBackoff:
+    """
+    Delays between retries, doubled with each retry and jittered, so clients don't retry in lockstep.
+
+    Attributes:
+        base_secs: Delay before the first retry (before jitter).
+        max_secs: Upper limit of the delay.
+    """
+
+    base_secs: float = 0.2
+    max_secs: float = 5.0
+
+    def calculate_delay(self, retry: int, random_: Callable[[], float] = random.random) -> float:
+        """
+        Calculate the delay before the retry, half of it is fixed and the other half is random ("equal jitter").
+
+        Args:
+            retry: Number of retries already done for this request.
+            random_: Source of random numbers in [0, 1).
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.max_secs, self.base_secs * 2**retry)
+        return delay / 2 + delay / 2 * random_()
+
+
+@dataclass(frozen=True)
+class CircuitStateChange:
+    """
+    Transition of the circuit breaker to another state.
+
+    Attributes:
+        previous: State before the transition.
+        current: State after the transition.
+        consecutive_failures: Number of failures in a row when the transition happened.
+    """
+
+    previous: CircuitState
+    current: CircuitState
+    consecutive_failures: int
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to the node after too many failures in a row, so an outage is reported immediately.
+
+    When closed, requests are sent normally. After `failure_threshold` failed attempts in a row the circuit opens and
+    requests fail fast without being sent. After `open_secs` it becomes half-open and lets a single probe request
+    through - its success closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold: Failures in a row which open the circuit, 0 disables the breaker.
+        open_secs: How long the circuit stays open before a probe request is let through.
+        clock: Source of monotonic time, in seconds.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, open_secs: float = 10, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._open_secs = open_secs
+        self._clock = clock
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._is_probe_in_flight = False
+        self._listeners: list[Callable[[CircuitStateChange], None]] = []
+        self.rejected_requests = 0
+        """Number of requests which failed fast, without being sent."""
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == "open" and self.retry_in_secs == 0:
+            self._transition("half_open")
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def retry_in_secs(self) -> float:
+        """Time left until a probe request is let through, 0 when the circuit is not open."""
+        if self._state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self._open_secs - self._clock())
+
+    def subscribe(self, listener: Callable[[CircuitStateChange], None]) -> None:
+        """
+        Get notified about every state transition.
+
+        Args:
+            listener: Called with the transition, right after it happened.
+        """
+        self._listeners.append(listener)
+
+    def try_acquire(self) -> bool:
+        """
+        Check whether a request can be sent now, reserves the probe when half-open.
+
+        Returns:
+            False when the request should fail fast.
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._is_probe_in_flight:
+            self._is_probe_in_flight = True
+            return True
+        self.rejected_requests += 1
+        return False
+
+    def record_success(self) -> None:
+        """Mark the attempt as successful, closes the circuit."""
+        self._is_probe_in_flight = False
+        self._consecutive_failures = 0
+        if self._state != "closed":
+            self._transition("closed")
+
+    def record_failure(self) -> None:
+        """Mark the attempt as failed, opens the circuit after too many failures or a failed probe."""
+        self._is_probe_in_flight = False
+        self._consecutive_failures += 1
+        is_threshold_reached = bool(self._failure_threshold) and self._consecutive_failures >= self._failure_threshold
+        if self._state == "half_open" or (self._state == "closed" and is_threshold_reached):
+            self._opened_at = self._clock()
+            self._transition("open")
+
+    def release(self) -> None:
+        """End the attempt without a verdict (e.g. it was cancelled), so another probe can be sent."""
+        self._is_probe_in_flight = False
+
+    def _transition(self, state: CircuitState) -> None:
+        failures = self._consecutive_failures
+        change = CircuitStateChange(previous=self._state, current=state, consecutive_failures=failures)
+        self._state = state
+        log = logger.warning if state == "open" else logger.info
+        log(f"Node circuit breaker: {change.previous} -> {change.current} ({change.consecutive_failures} failures)")
+        for listener in self._listeners:
+            listener(change)
+
+
+@dataclass
+class ResilienceMetrics:
+    """
+    Statistics of failures of requests sent to the node.
+
+    Attributes:
+        failures: Number of failed attempts, per kind of failure.
+        retries: Number of retries done, per kind of failure which caused them.
+        backoff_secs: Total time spent waiting between retries.
+    """
+
+    failures: Counter[FailureKind]
+    retries: Counter[FailureKind]
+    backoff_secs: float = 0.0
+
+
+class ResiliencePolicy:
+    """
+    Retries failed requests within budgets of the kind of failure, with backoff, guarded by the circuit breaker.
+
+    Args:
+        budgets: Retry budgets per kind of failure.
+        backoff: Delays between retries.
+        circuit_breaker: Breaker shared by all requests sent to the node.
+        sleep: Used to wait between retries.
+        random_: Source of random numbers in [0, 1), for jitter.
+    """
+
+    def __init__(
+        self,
+        budgets: RetryBudgets | None = None,
+        backoff: ExponentialBackoff | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        random_: Callable[[], float] = random.random,
+    ) -> None:
+        self.budgets = budgets or RetryBudgets()
+        self.backoff = backoff or ExponentialBackoff()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = ResilienceMetrics(failures=Counter(), retries=Counter())
+        self._sleep = sleep
+        self._random = random_
+
+    async def execute[T](self, send: Callable[[], Awaitable[T]], *, url: str, request: str, max_retries: int) -> T:
+        """
+        Send the request, retrying it when failed.
+
+        Args:
+            send: Sends a single attempt of the request.
+            url: Address of the node, for errors.
+            request: Body of the request, for errors.
+            max_retries: Limit of retries of a single request, caps every budget.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker doesn't let the request through.
+
+        Returns:
+            The result of the successful attempt.
+        """
+        retries: Counter[FailureKind] = Counter()
+        breaker = self.circuit_breaker
+        while True:
+            if not breaker.try_acquire():
+                raise CircuitOpenError(
+                    url,
+                    request,
+                    consecutive_failures=breaker.consecutive_failures,
+                    retry_in_secs=breaker.retry_in_secs,
+                )
+
+            try:
+                result = await send()
+            except bke.CommunicationError as error:
+                kind = classify_failure(error)
+                if kind is None:
+                    breaker.record_success()  # node responded, the request itself was refused
+                    raise
+
+                breaker.record_failure()
+                self.metrics.failures[kind] += 1
+                if retries[kind] >= min(self.budgets.for_failure(kind), max_retries) or breaker.state != "closed":
+                    raise
+
+                delay = self.backoff.calculate_delay(retries.total(), self._random)
+                retries[kind] += 1
+                self.metrics.retries[kind] += 1
+                self.metrics.backoff_secs += delay
+                logger.debug(f"Retrying request to {url} after {kind} in {delay:.2f}s ({retries[kind]}. retry)")
+                await self._sleep(delay)
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+
+class ResilientOverseer(CommonOverseer):
+    """
+    Overseer retrying requests according to the resilience policy instead of the fixed amount of retries.
+
+    Invalid responses are not retried by the overseer itself, so they are not retried twice. Waiting for the node
+    to release its locks is still done by the overseer, it's not a failure of the node.
+
+    Args:
+        *args: Positional arguments for the CommonOverseer.
+        policy: Resilience policy, created from settings when not given.
+        **kwargs: Keyword arguments for the CommonOverseer.
+    """
+
+    def __init__(self, *args: Any, policy: ResiliencePolicy | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if policy is None:
+            from clive.__private.settings import safe_settings  # noqa: PLC0415
+
+            policy = safe_settings.node.resilience_policy_factory()
+        self.policy = policy
+
+    async def async_send(
+        self, url: HttpUrl, method: Methods, data: str | None = None, callbacks: AsyncCallbacks | None = None
+    ) -> Json | list[Json]:
+        return await self.policy.execute(
+            partial(super().async_send, url, method, data, callbacks),
+            url=str(url),
+            request=data or "",
+            max_retries=self.communicator.settings.max_retries,
+        )
+
+    def _rules(self) -> RulesClassifier:
+        rules = super()._rules()
+        return replace(rules, preliminary=[*rules.preliminary, *rules.finitely_repeatable], finitely_repeatable=[])
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Protocol
+
+from clive.__private.core import iwax
+from clive.__private.core.constants.node import HIVE_BLOCK_INTERVAL_SECONDS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class TaposSourceProtocol(Protocol):
+    """
+    Simply pass gdpo, or object that provides the head block id.
+
+    Attributes:
+        head_block_number: Number of the head block.
+        head_block_id: Id of the head block.
+        time: Time of the head block.
+    """
+
+    @property
+    def head_block_number(self) -> int: ...
+
+    @property
+    def head_block_id(self) -> str: ...
+
+    @property
+    def time(self) -> datetime: ...
+
+
+@dataclass(frozen=True)
+class TaposReference:
+    """
+    Block referenced by transactions (TaPoS - transaction as proof of stake), seen at the given local time.
+
+    Attributes:
+        block_num: Number of the referenced block.
+        block_id: Id of the referenced block.
+        block_time: Time of the referenced block.
+        seen_at: Local monotonic time at which the block was the head block.
+    """
+
+    block_num: int
+    block_id: str
+    block_time: datetime
+    seen_at: float
+
+    @property
+    def ref_block_num(self) -> int:
+        return self._tapos_data[0]
+
+    @property
+    def ref_block_prefix(self) -> int:
+        return self._tapos_data[1]
+
+    @cached_property
+    def _tapos_data(self) -> tuple[int, int]:
+        tapos_data = iwax.get_tapos_data(self.block_id)
+        return tapos_data.ref_block_num, tapos_data.ref_block_prefix
+
+
+class TaposReferenceManager:
+    """
+    Remembers the newest head block seen in fetched dynamic global properties, so transactions can reference it.
+
+    Reference is reused until it gets older than the age limit, so building many transactions doesn't need to
+    fetch the head block for each one. The limit should be far below the TaPoS validity window
+    (`HIVE_TAPOS_WINDOW_BLOCKS`), also as a fresh reference is less likely to be forked out than an old one is
+    to be invalid.
+
+    Args:
+        max_age_secs: How long the seen reference is reused.
+        clock: Source of monotonic time, in seconds.
+    """
+
+    def __init__(self, max_age_secs: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._max_age_secs = max_age_secs
+        self._clock = clock
+        self._newest: TaposReference | None = None
+
+    @property
+    def newest(self) -> TaposReference | None:
+        return self._newest
+
+    def remember(self, data: TaposSourceProtocol) -> TaposReference:
+        """
+        Remember the head block of the fetched data, unless it or a newer one is already known.
+
+        Args:
+            data: The fetched data, e.g. dynamic global properties.
+
+        Returns:
+            The newest known reference.
+        """
+        if self._newest is None or self._newest.block_num < data.head_block_number:
+            self._newest = TaposReference(
+                block_num=data.head_block_number,
+                block_id=data.head_block_id,
+                block_time=data.time,
+                seen_at=self._clock(),
+            )
+        return self._newest
+
+    def get_fresh(self) -> TaposReference | None:
+        """Get the newest reference if it can still be used, None if the head block should be fetched."""
+        if self._newest is None or self._get_age_secs(self._newest) > self._max_age_secs:
+            return None
+        return self._newest
+
+    def estimate_head_block_time(self, reference: TaposReference) -> datetime:
+        """
+        Estimate the current head block time, transactions referencing older blocks still expire relative to it.
+
+        Only whole block intervals elapsed since the reference was seen are counted, as at least that many blocks
+        were produced since then. This way the estimate doesn't go ahead of the node, which would reject the
+        expiration set to the maximum allowed offset from its head block time.
+
+        Args:
+            reference: The used reference.
+
+        Returns:
+            Time of the reference block moved by the whole block intervals elapsed since it was seen.
+        """
+        elapsed_blocks = int(self._get_age_secs(reference) // HIVE_BLOCK_INTERVAL_SECONDS)
+        return reference.block_time + timedelta(seconds=elapsed_blocks * HIVE_BLOCK_INTERVAL_SECONDS)
+
+    def clear(self) -> None:
+        self._newest = None
+
+    def _get_age_secs(self, reference: TaposReference) -> float:
+        return self._clock() - reference.seen_at
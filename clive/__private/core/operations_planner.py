@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import itertools
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from clive.__private.core.constants.node import (
+    HIVE_RC_MAX_ACCOUNTS_PER_DELEGATION_OP,
+    MAX_NUMBER_OF_PROPOSAL_IDS_IN_SINGLE_OPERATION,
+    MAX_NUMBER_OF_WITNESSES_VOTES,
+)
+from clive.__private.core.ensure_vests import ensure_vests
+from clive.__private.models.asset import Asset, AssetError
+from clive.__private.models.schemas import AccountWitnessVoteOperation, UpdateProposalVotesOperation
+from clive.exceptions import CliveError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from clive.__private.models.schemas import DynamicGlobalProperties
+
+
+class InvalidTargetStateError(CliveError):
+    """Raised when the target state can't be loaded or is not valid."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class TargetState:
+    """
+    Desired state of RC delegations and votes of an account, sections which are None are left untouched.
+
+    The file is a JSON object with optional sections, e.g.:
+    {
+        "rc_delegations": {"alice": "10.000 HP", "bob": "20000.000000 VESTS"},
+        "witness_votes": ["gtg", "blocktrades"],
+        "proposal_votes": [0, 1]
+    }
+    Delegatees not listed in the present section get their delegations removed, the same applies to votes.
+
+    Attributes:
+        rc_delegations: Amount of RC delegated to each delegatee.
+        witness_votes: Names of witnesses to vote for.
+        proposal_votes: Ids of proposals to vote for.
+    """
+
+    rc_delegations: dict[str, Asset.VotingT] | None = None
+    witness_votes: frozenset[str] | None = None
+    proposal_votes: frozenset[int] | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> TargetState:
+        """
+        Load the target state from a JSON file.
+
+        Args:
+            path: Path to the file.
+
+        Raises:
+            InvalidTargetStateError: If the file can't be read or its content is not valid.
+
+        Returns:
+            The loaded target state.
+        """
+        try:
+            content = json.loads(path.read_text())
+        except (OSError, ValueError) as error:
+            raise InvalidTargetStateError(f"Failed to load target state from {path}: {error}") from error
+        return cls.from_dict(content)
+
+    @classmethod
+    def from_dict(cls, content: Any) -> TargetState:  # noqa: ANN401
+        """
+        Create the target state from the parsed JSON content.
+
+        Args:
+            content: The parsed content of the target state file.
+
+        Raises:
+            InvalidTargetStateError: If the content is not valid.
+
+        Returns:
+            The created target state.
+        """
+        if not isinstance(content, dict):
+            raise InvalidTargetStateError("Target state must be a JSON object.")
+
+        unknown_sections = set(content) - {"rc_delegations", "witness_votes", "proposal_votes"}
+        if unknown_sections:
+            raise InvalidTargetStateError(f"Unknown sections of target state: {sorted(unknown_sections)}.")
+
+        witness_votes = content.get("witness_votes")
+        if witness_votes is not None:
+            witness_votes = frozenset(cls._ensure_list_of(witness_votes, str, "witness_votes"))
+            if len(witness_votes) > MAX_NUMBER_OF_WITNESSES_VOTES:
+                raise InvalidTargetStateError(
+                    f"It's not allowed to vote for more than {MAX_NUMBER_OF_WITNESSES_VOTES} witnesses."
+                )
+
+        proposal_votes = content.get("proposal_votes")
+        if proposal_votes is not None:
+            proposal_votes = frozenset(cls._ensure_list_of(proposal_votes, int, "proposal_votes"))
+
+        rc_delegations = content.get("rc_delegations")
+        if rc_delegations is not None:
+            rc_delegations = cls._parse_rc_delegations(rc_delegations)
+
+        return cls(rc_delegations=rc_delegations, witness_votes=witness_votes, proposal_votes=proposal_votes)
+
+    @staticmethod
+    def _ensure_list_of[T](value: Any, item_type: type[T], section: str) -> list[T]:  # noqa: ANN401
+        if not isinstance(value, list) or not all(
+            isinstance(item, item_type) and not isinstance(item, bool) for item in value
+        ):
+            raise InvalidTargetStateError(f"Section `{section}` must be a list of {item_type.__name__}.")
+        return value
+
+    @staticmethod
+    def _parse_rc_delegations(value: Any) -> dict[str, Asset.VotingT]:  # noqa: ANN401
+        if not isinstance(value, dict):
+            raise InvalidTargetStateError("Section `rc_delegations` must be an object of delegatee and amount.")
+
+        rc_delegations: dict[str, Asset.VotingT] = {}
+        for delegatee, raw_amount in value.items():
+            try:
+                amount = Asset.from_legacy(str(raw_amount).upper().replace("HP", "HIVE"))
+            except AssetError as error:
+                raise InvalidTargetStateError(f"Invalid RC delegation amount for `{delegatee}`: {error}") from error
+            if not isinstance(amount, Asset.Hive | Asset.Vests):
+                raise InvalidTargetStateError(f"RC delegation amount for `{delegatee}` must be given in HP or VESTS.")
+            rc_delegations[delegatee] = amount
+        return rc_delegations
+
+
+@dataclass(frozen=True, kw_only=True)
+class CurrentState:
+    """
+    State of RC delegations and votes of an account, as fetched from the node.
+
+    Attributes:
+        rc_delegations: Amount of RC delegated to each delegatee.
+        witness_votes: Names of voted witnesses.
+        proposal_votes: Ids of voted proposals.
+        gdpo: Needed to convert HP amounts of the target state to VESTS.
+    """
+
+    rc_delegations: dict[str, int] = field(default_factory=dict)
+    witness_votes: frozenset[str] = frozenset()
+    proposal_votes: frozenset[int] = frozenset()
+    gdpo: DynamicGlobalProperties | None = None
+
+
+@dataclass(frozen=True)
+class RcDelegationChange:
+    """Single `delegate_rc` setting the same amount of RC (0 removes the delegation) for all the delegatees."""
+
+    delegatees: tuple[str, ...]
+    max_rc: int
+    delta_rc: int
+    """Change of the RC delegated by the account after the operation is applied."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class OperationsPlan:
+    """
+    Operations which turn the current state into the target state.
+
+    Attributes:
+        rc_delegations: Changes of RC delegations, ordered so delegations freeing RC are applied first.
+        witness_votes: Witness votes, unvotes are first so the limit of votes is not exceeded in between.
+        proposal_votes: Proposal votes, grouped by as many ids as a single operation allows.
+        changes_amount: Number of single changes (e.g. a vote for one witness), which is the number of operations
+            needed when each target is processed one by one.
+    """
+
+    rc_delegations: list[RcDelegationChange] = field(default_factory=list)
+    witness_votes: list[AccountWitnessVoteOperation] = field(default_factory=list)
+    proposal_votes: list[UpdateProposalVotesOperation] = field(default_factory=list)
+    changes_amount: int = 0
+
+    @property
+    def operations_amount(self) -> int:
+        return len(self.rc_delegations) + len(self.witness_votes) + len(self.proposal_votes)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.operations_amount == 0
+
+    @property
+    def rc_delegations_delta(self) -> int:
+        """Change of the RC delegated by the account after the whole plan is applied."""
+        return sum(change.delta_rc for change in self.rc_delegations)
+
+
+def plan_operations(*, account_name: str, target: TargetState, current: CurrentState) -> OperationsPlan:
+    """
+    Diff the target state against the current one and pack the differences into the minimal number of operations.
+
+    Args:
+        account_name: Account which delegates RC and votes.
+        target: The desired state.
+        current: The state fetched from the node.
+
+    Returns:
+        The planned operations.
+    """
+    rc_delegations: list[RcDelegationChange] = []
+    witness_votes: list[AccountWitnessVoteOperation] = []
+    proposal_votes: list[UpdateProposalVotesOperation] = []
+    changes_amount = 0
+
+    if target.rc_delegations is not None:
+        target_rc = {
+            delegatee: _convert_to_vests_amount(amount, current.gdpo)
+            for delegatee, amount in target.rc_delegations.items()
+        }
+        rc_delegations = _plan_rc_delegations(target_rc, current.rc_delegations)
+        changes_amount += sum(len(change.delegatees) for change in rc_delegations)
+
+    if target.witness_votes is not None:
+        unvoted = sorted(current.witness_votes - target.witness_votes)
+        voted = sorted(target.witness_votes - current.witness_votes)
+        witness_votes = [
+            AccountWitnessVoteOperation(account=account_name, witness=witness, approve=False) for witness in unvoted
+        ] + [AccountWitnessVoteOperation(account=account_name, witness=witness, approve=True) for witness in voted]
+        changes_amount += len(witness_votes)
+
+    if target.proposal_votes is not None:
+        unvoted_ids = current.proposal_votes - target.proposal_votes
+        voted_ids = target.proposal_votes - current.proposal_votes
+        proposal_votes = [
+            *_create_proposal_votes(account_name, unvoted_ids, approve=False),
+            *_create_proposal_votes(account_name, voted_ids, approve=True),
+        ]
+        changes_amount += len(unvoted_ids) + len(voted_ids)
+
+    return OperationsPlan(
+        rc_delegations=rc_delegations,
+        witness_votes=witness_votes,
+        proposal_votes=proposal_votes,
+        changes_amount=changes_amount,
+    )
+
+
+def _convert_to_vests_amount(amount: Asset.VotingT, gdpo: DynamicGlobalProperties | None) -> int:
+    if isinstance(amount, Asset.Vests):
+        return int(amount.amount)
+    assert gdpo is not None, "Gdpo is needed to convert HP to VESTS."
+    return int(ensure_vests(amount, gdpo).amount)
+
+
+def _plan_rc_delegations(target: dict[str, int], current: dict[str, int]) -> list[RcDelegationChange]:
+    changed: defaultdict[int, list[str]] = defaultdict(list)
+    for delegatee in sorted(target.keys() | current.keys()):
+        max_rc = target.get(delegatee, 0)
+        if max_rc != current.get(delegatee, 0):
+            changed[max_rc].append(delegatee)
+
+    changes = [
+        RcDelegationChange(
+            delegatees=chunk, max_rc=max_rc, delta_rc=sum(max_rc - current.get(delegatee, 0) for delegatee in chunk)
+        )
+        for max_rc, delegatees in changed.items()
+        for chunk in itertools.batched(delegatees, HIVE_RC_MAX_ACCOUNTS_PER_DELEGATION_OP)
+    ]
+    # when changes freeing RC go first, the RC delegated in between never exceeds the one delegated at the end
+    return sorted(changes, key=lambda change: change.delta_rc)
+
+
+def _create_proposal_votes(
+    account_name: str, proposal_ids: Iterable[int], *, approve: bool
+) -> list[UpdateProposalVotesOperation]:
+    return [
+        UpdateProposalVotesOperation(voter=account_name, proposal_ids=list(chunk), approve=approve, extensions=[])
+        for chunk in itertools.batched(sorted(proposal_ids), MAX_NUMBER_OF_PROPOSAL_IDS_IN_SINGLE_OPERATION)
+    ]
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Final
 import beekeepy.interfaces as bki
 
 from clive.__private.core.accounts.account_manager import AccountManager
+from clive.__private.core.change_journal import ChangeJournal
 from clive.__private.core.constants.date import TRANSACTION_EXPIRATION_TIMEDELTA_DEFAULT
 from clive.__private.core.constants.node import (
     TRANSACTION_EXPIRATION_TIMEDELTA_MAX,
@@ -18,7 +19,6 @@ from clive.__private.logger import logger
 from clive.__private.models.schemas import ChainId, OperationRepresentationUnion, OperationUnion, is_matching_model
 from clive.__private.models.transaction import Transaction
 from clive.__private.settings import safe_settings
-from clive.__private.storage.runtime_to_storage_converter import RuntimeToStorageConverter
 from clive.__private.storage.service.service import PersistentStorageService
 from clive.__private.validators.profile_name_validator import ProfileNameValidator
 from clive.exceptions import CliveError
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
     from beekeepy.interfaces import HttpUrl
 
     from clive.__private.core.accounts.accounts import Account
+    from clive.__private.core.change_journal import ChangeMarkers
     from clive.__private.core.encryption import EncryptionService
 
 
@@ -121,21 +122,39 @@ class Profile:
             self.set_transaction_expiration(transaction_expiration)
 
         self._skip_save = False
-        self._hash_of_stored_profile: int | None = None
+        self._change_journal = ChangeJournal()
         self._should_enable_known_accounts = should_enable_known_accounts
 
-    def __hash__(self) -> int:
-        return hash(RuntimeToStorageConverter(self).create_storage_model())
+    @property
+    def change_journal(self) -> ChangeJournal:
+        return self._change_journal
 
     @property
-    def hash_of_stored_profile(self) -> int | None:
-        """Return hash of stored profile, None if profile is not stored."""
-        return self._hash_of_stored_profile
+    def change_markers(self) -> ChangeMarkers:
+        """
+        Return cheap to compute markers of each persisted section of the profile.
+
+        Comparing them with the ones captured during the last save tells which sections are dirty,
+        without serializing the profile.
+        """
+        return {
+            "settings": (
+                self.name,
+                self._chain_id,
+                self._node_address,
+                self.tui_theme,
+                self._transaction_expiration,
+                self._should_enable_known_accounts,
+            ),
+            "accounts": self._accounts.change_marker,
+            "keys": self.keys.change_marker,
+            "transaction": (self.transaction.change_marker, self.transaction_file_path),
+        }
 
     @property
     def is_newly_created(self) -> bool:
         """Determine if the profile is newly created (has not been saved yet)."""
-        return self._hash_of_stored_profile is None
+        return not self._change_journal.is_persisted
 
     @property
     def accounts(self) -> AccountManager:
@@ -168,7 +187,9 @@ class Profile:
 
     @property
     def should_be_saved(self) -> bool:
-        return not self.is_skip_save_set and self.hash_of_stored_profile != hash(self)
+        if self.is_skip_save_set:
+            return False
+        return self.is_newly_created or self._change_journal.has_changes(self.change_markers)
 
     @property
     def should_enable_known_accounts(self) -> bool:
@@ -262,7 +283,7 @@ class Profile:
             ProfileDoesNotExistsError: If this profile is not stored, it could not be removed.
             MultipleProfileVersionsError: If multiple versions / back-ups of profile exist and force is False.
         """
-        self._unset_hash_of_stored_profile()
+        self._mark_as_not_stored()
         self.delete_by_name(self.name)
 
     @classmethod
@@ -320,6 +341,16 @@ class Profile:
         """
         return PersistentStorageService.list_stored_profile_names()
 
+    @classmethod
+    def get_last_used_profile_name(cls) -> str | None:
+        """
+        Get name of the stored profile that was most recently loaded or saved.
+
+        Returns:
+            Name of the last used profile or None if it's unknown.
+        """
+        return PersistentStorageService.get_last_used_profile_name()
+
     @classmethod
     async def load(cls, name: str, encryption_service: EncryptionService) -> Profile:
         """
@@ -412,12 +443,12 @@ class Profile:
     def _get_secret_node_address() -> HttpUrl | None:
         return safe_settings.secrets.node_address
 
-    def _update_hash_of_stored_profile(self, new_hash: int | None = None) -> None:
-        """Update the hash of stored profile to a given value. None means recalculate."""
-        self._hash_of_stored_profile = new_hash if new_hash is not None else hash(self)
+    def _mark_as_stored(self, markers: ChangeMarkers | None = None) -> None:
+        """Mark the given state of the profile as stored. None means the current state."""
+        self._change_journal.mark_persisted(markers if markers is not None else self.change_markers)
 
-    def _unset_hash_of_stored_profile(self) -> None:
-        self._hash_of_stored_profile = None
+    def _mark_as_not_stored(self) -> None:
+        self._change_journal.forget_persisted()
 
     def _get_initial_node_address(self, given_node_address: str | HttpUrl | None = None) -> HttpUrl:
         secret_node_address = self._get_secret_node_address()
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+from clive.__private.core.constants.authority import DEFAULT_AUTHORITY_THRESHOLD, HIVE_MAX_SIG_CHECK_DEPTH
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from clive.__private.core.types import AuthorityLevelRegular
+    from clive.__private.models.schemas import Account
+
+_SATISFYING_LEVELS: Final[dict[AuthorityLevelRegular, tuple[AuthorityLevelRegular, ...]]] = {
+    "owner": ("owner",),
+    "active": ("active", "owner"),
+    "posting": ("posting", "active", "owner"),
+}
+"""Levels satisfying the required one, from the required one up."""
+
+
+def _as_weights(auths: Any) -> dict[str, int]:  # noqa: ANN401
+    items = auths.items() if isinstance(auths, dict) else auths
+    return {str(name): int(weight) for name, weight in items}
+
+
+@dataclass(frozen=True)
+class WeightedAuthority:
+    """Authority with weighted keys and accounts, satisfied when the weight of approvals reaches the threshold."""
+
+    weight_threshold: int
+    key_auths: dict[str, int] = field(default_factory=dict)
+    account_auths: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_authority(cls, authority: Any) -> WeightedAuthority:  # noqa: ANN401
+        """
+        Create from the schemas `Authority` (auths as list of pairs) or wax `python_authority` (auths as dicts).
+
+        Args:
+            authority: The authority to convert.
+
+        Returns:
+            The converted authority.
+        """
+        return cls(
+            weight_threshold=int(authority.weight_threshold),
+            key_auths=_as_weights(authority.key_auths),
+            account_auths=_as_weights(authority.account_auths),
+        )
+
+
+@dataclass(frozen=True)
+class AccountWeightedAuthorities:
+    owner: WeightedAuthority
+    active: WeightedAuthority
+    posting: WeightedAuthority
+
+    @classmethod
+    def from_account(cls, account: Account) -> AccountWeightedAuthorities:
+        return cls(
+            owner=WeightedAuthority.from_authority(account.owner),
+            active=WeightedAuthority.from_authority(account.active),
+            posting=WeightedAuthority.from_authority(account.posting),
+        )
+
+    def __getitem__(self, level: AuthorityLevelRegular) -> WeightedAuthority:
+        return getattr(self, level)  # type: ignore[no-any-return]
+
+
+@dataclass(frozen=True)
+class RequiredAuthorityCheck:
+    """
+    Result of checking a single authority required by the transaction.
+
+    Attributes:
+        account: The account whose authority is required, None for authorities not bound to an account.
+        level: The required level of the account authority, None for authorities not bound to an account.
+        weight: Weight of approvals given by the signatures.
+        weight_threshold: Weight needed to satisfy the authority.
+        missing_keys: Keys which could add weight to the unsatisfied authority, empty when it's satisfied.
+    """
+
+    account: str | None
+    level: AuthorityLevelRegular | None
+    weight: int
+    weight_threshold: int
+    missing_keys: tuple[str, ...] = ()
+
+    @property
+    def is_satisfied(self) -> bool:
+        return self.weight >= self.weight_threshold
+
+    @property
+    def name(self) -> str:
+        return f"{self.account}@{self.level}" if self.account is not None else "other authority"
+
+
+@dataclass(frozen=True)
+class SignatureVerificationResult:
+    """
+    Result of verifying whether signatures of the transaction satisfy its required authorities.
+
+    Attributes:
+        checks: Results of checking each of the required authorities.
+        signing_keys: Public keys recovered from signatures, by signature.
+        redundant_signatures: Signatures not approving any of the required authorities, given above the already
+            reached threshold or duplicated. Such signatures would make the node reject the transaction.
+    """
+
+    checks: tuple[RequiredAuthorityCheck, ...]
+    signing_keys: dict[str, str]
+    redundant_signatures: tuple[str, ...]
+
+    @property
+    def is_satisfied(self) -> bool:
+        return all(check.is_satisfied for check in self.checks)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the transaction would pass the authority check on the node."""
+        return self.is_satisfied and not self.redundant_signatures
+
+    @property
+    def satisfied(self) -> list[RequiredAuthorityCheck]:
+        return [check for check in self.checks if check.is_satisfied]
+
+    @property
+    def unsatisfied(self) -> list[RequiredAuthorityCheck]:
+        return [check for check in self.checks if not check.is_satisfied]
+
+    @property
+    def missing_keys(self) -> list[str]:
+        return sorted({key for check in self.unsatisfied for key in check.missing_keys})
+
+
+@dataclass
+class _Evaluation:
+    weight: int = 0
+    used_keys: set[str] = field(default_factory=set)
+    missing_keys: set[str] = field(default_factory=set)
+
+
+class AuthorityVerifier:
+    """
+    Evaluates weighted authority thresholds against keys recovered from signatures, like the node does.
+
+    Account authorities are followed recursively up to `max_depth` (active authority of the referenced account is
+    used for owner and active checks, posting for posting ones). Like on the node, a required level is satisfied
+    also by any higher one (owner satisfies active, active or owner satisfies posting) and then keys of the
+    satisfying level are counted as used. Approvals are counted only until the threshold is reached, so signatures
+    of keys above it are reported as redundant.
+
+    Args:
+        accounts: Authorities of accounts referenced by the transaction, by account name.
+        max_depth: Maximum depth of following account authorities.
+    """
+
+    def __init__(
+        self, accounts: Mapping[str, AccountWeightedAuthorities], *, max_depth: int = HIVE_MAX_SIG_CHECK_DEPTH
+    ) -> None:
+        self._accounts = accounts
+        self._max_depth = max_depth
+
+    def verify(
+        self,
+        required_accounts: Mapping[AuthorityLevelRegular, Iterable[str]],
+        signing_keys: Mapping[str, str],
+        other_authorities: Iterable[WeightedAuthority] = (),
+    ) -> SignatureVerificationResult:
+        """
+        Check which of the required authorities are satisfied by the signing keys.
+
+        Args:
+            required_accounts: Accounts whose authority of given level is required.
+            signing_keys: Public keys recovered from signatures, by signature.
+            other_authorities: Required authorities not bound to an account.
+
+        Returns:
+            The verification result.
+        """
+        provided_keys = set(signing_keys.values())
+        used_keys: set[str] = set()
+        checks: list[RequiredAuthorityCheck] = []
+
+        for level, account_names in required_accounts.items():
+            for account_name in sorted(account_names):
+                account = self._accounts.get(account_name)
+                if account is None:
+                    checks.append(RequiredAuthorityCheck(account_name, level, 0, DEFAULT_AUTHORITY_THRESHOLD))
+                    continue
+                checks.append(self._check_account(account, level, provided_keys, used_keys, account=account_name))
+
+        checks.extend(
+            self._check(authority, "active", provided_keys, used_keys, account=None) for authority in other_authorities
+        )
+
+        return SignatureVerificationResult(
+            checks=tuple(checks),
+            signing_keys=dict(signing_keys),
+            redundant_signatures=self._find_redundant_signatures(signing_keys, used_keys),
+        )
+
+    def _check_account(
+        self,
+        authorities: AccountWeightedAuthorities,
+        level: AuthorityLevelRegular,
+        provided_keys: set[str],
+        used_keys: set[str],
+        *,
+        account: str,
+    ) -> RequiredAuthorityCheck:
+        for satisfying_level in _SATISFYING_LEVELS[level]:
+            authority = authorities[satisfying_level]
+            evaluation = self._evaluate(authority, satisfying_level, provided_keys, depth=0)
+            if evaluation.weight >= authority.weight_threshold:
+                used_keys.update(evaluation.used_keys)
+                return RequiredAuthorityCheck(account, level, evaluation.weight, authority.weight_threshold)
+        return self._check(authorities[level], level, provided_keys, used_keys, account=account)
+
+    def _check(
+        self,
+        authority: WeightedAuthority,
+        level: AuthorityLevelRegular,
+        provided_keys: set[str],
+        used_keys: set[str],
+        *,
+        account: str | None,
+    ) -> RequiredAuthorityCheck:
+        evaluation = self._evaluate(authority, level, provided_keys, depth=0)
+        is_satisfied = evaluation.weight >= authority.weight_threshold
+        used_keys.update(evaluation.used_keys)  # also for partial approvals, other parties may still sign
+        return RequiredAuthorityCheck(
+            account=account,
+            level=level if account is not None else None,
+            weight=evaluation.weight,
+            weight_threshold=authority.weight_threshold,
+            missing_keys=() if is_satisfied else tuple(sorted(evaluation.missing_keys)),
+        )
+
+    def _evaluate(
+        self, authority: WeightedAuthority, level: AuthorityLevelRegular, provided_keys: set[str], *, depth: int
+    ) -> _Evaluation:
+        evaluation = _Evaluation()
+
+        for key, weight in sorted(authority.key_auths.items()):
+            if evaluation.weight >= authority.weight_threshold:
+                return evaluation
+            if key in provided_keys:
+                evaluation.weight += weight
+                evaluation.used_keys.add(key)
+            else:
+                evaluation.missing_keys.add(key)
+
+        if depth >= self._max_depth:
+            return evaluation
+
+        nested_level: AuthorityLevelRegular = "posting" if level == "posting" else "active"
+        for account_name, weight in sorted(authority.account_auths.items()):
+            if evaluation.weight >= authority.weight_threshold:
+                return evaluation
+            account = self._accounts.get(account_name)
+            if account is None:
+                continue
+            nested_authority = account[nested_level]
+            nested = self._evaluate(nested_authority, nested_level, provided_keys, depth=depth + 1)
+            evaluation.used_keys.update(nested.used_keys)
+            if nested.weight >= nested_authority.weight_threshold:
+                evaluation.weight += weight
+            else:
+                evaluation.missing_keys.update(nested.missing_keys)
+
+        return evaluation
+
+    @staticmethod
+    def _find_redundant_signatures(signing_keys: Mapping[str, str], used_keys: set[str]) -> tuple[str, ...]:
+        redundant = []
+        seen_keys: set[str] = set()
+        for signature, key in signing_keys.items():
+            if key not in used_keys or key in seen_keys:
+                redundant.append(signature)
+            seen_keys.add(key)
+        return tuple(redundant)
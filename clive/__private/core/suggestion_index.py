@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class SuggestionIndex:
+    """
+    Prefix index of suggestions, ranking the ones used recently and frequently first.
+
+    Suggestions are kept in a sorted array, so all suggestions starting with a prefix form a contiguous slice that
+    is found with a binary search - prefix lookup is O(log n + k) where k is the number of returned suggestions.
+    Usage is tracked only for a bounded number of suggestions, so ranking them doesn't depend on the index size.
+
+    Args:
+        suggestions: Initial suggestions.
+        case_sensitive: Whether prefix matching should be case-sensitive.
+    """
+
+    BULK_INSERT_THRESHOLD: ClassVar[int] = 32
+    """Above that number of suggestions added at once, the array is sorted again instead of inserting one by one."""
+
+    USAGE_HISTORY_SIZE: ClassVar[int] = 256
+    """How many most recently used suggestions are remembered for ranking."""
+
+    def __init__(self, suggestions: Iterable[str] = (), *, case_sensitive: bool = True) -> None:
+        self._case_sensitive = case_sensitive
+        self._keys: list[str] = []
+        self._suggestions: dict[str, str] = {}
+        self._usage: OrderedDict[str, int] = OrderedDict()
+        """Use count of recently used suggestions (by comparison key), ordered from the least recently used."""
+        self.add(*suggestions)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, suggestion: object) -> bool:
+        return isinstance(suggestion, str) and self._key(suggestion) in self._suggestions
+
+    def add(self, *suggestions: str) -> None:
+        new_keys: list[str] = []
+        for suggestion in suggestions:
+            key = self._key(suggestion)
+            if key not in self._suggestions:
+                self._suggestions[key] = suggestion
+                new_keys.append(key)
+
+        if len(new_keys) > self.BULK_INSERT_THRESHOLD:
+            self._keys.extend(new_keys)
+            self._keys.sort()
+            return
+
+        for key in new_keys:
+            bisect.insort(self._keys, key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._suggestions.clear()
+        self._usage.clear()
+
+    def record_use(self, suggestion: str) -> None:
+        """
+        Mark the suggestion as used, so it's ranked higher in the following lookups.
+
+        Args:
+            suggestion: The used suggestion. Ignored if it's not in the index.
+        """
+        key = self._key(suggestion)
+        if key not in self._suggestions:
+            return
+
+        self._usage[key] = self._usage.pop(key, 0) + 1
+        if len(self._usage) > self.USAGE_HISTORY_SIZE:
+            self._usage.popitem(last=False)
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Iterate over suggestions starting with the prefix in alphabetical order.
+
+        Args:
+            prefix: The prefix to match.
+
+        Yields:
+            Matching suggestions.
+        """
+        prefix_key = self._key(prefix)
+        keys = self._keys
+        for index in range(bisect.bisect_left(keys, prefix_key), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix_key):
+                return
+            yield self._suggestions[key]
+
+    def find(self, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Find suggestions starting with the prefix.
+
+        Args:
+            prefix: The prefix to match.
+            limit: Maximum number of suggestions to return. Unlimited if None.
+
+        Returns:
+            Matching suggestions - the used ones first (more frequently used first, then more recently used first),
+            then the rest in alphabetical order.
+        """
+        prefix_key = self._key(prefix)
+        used_keys = [key for key in reversed(self._usage) if key.startswith(prefix_key)]
+        used_keys.sort(key=self._usage.__getitem__, reverse=True)  # stable, so recency order is kept on ties
+        found = [self._suggestions[key] for key in used_keys[:limit]]
+
+        used = set(used_keys)
+        for suggestion in self.iter_prefix(prefix):
+            if limit is not None and len(found) >= limit:
+                break
+            if self._key(suggestion) not in used:
+                found.append(suggestion)
+        return found
+
+    def _key(self, suggestion: str) -> str:
+        return suggestion if self._case_sensitive else suggestion.casefold()
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import json
+import mmap
+import textwrap
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import msgspec
+
+from clive.__private.core import iwax
+from clive.__private.core._thread import get_cpu_thread_pool
+from clive.__private.logger import logger
+from clive.__private.models.schemas import DecodeError, ValidationError
+from clive.__private.models.transaction import Transaction
+from clive.exceptions import CliveError
+from wax.exceptions import WaxError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from clive.__private.models.schemas import OperationRepresentationUnion
+
+type TransactionFileFormat = Literal["json", "bin"]
+
+OPERATIONS_CHUNK_SIZE: Final[int] = 256
+"""Number of operations decoded or encoded at once, bounds the memory needed for the intermediate data."""
+
+BINARY_WRITE_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+_JSON_INDENT: Final[int] = 4
+_FORMAT_DETECTION_PREFIX_SIZE: Final[int] = 64
+_INDENT: Final[str] = " " * _JSON_INDENT
+
+
+class TransactionFileCodecError(CliveError):
+    def __init__(self, path: Path, reason: str) -> None:
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Failed to process transaction file {path}: {reason}")
+
+
+@dataclass(frozen=True)
+class TransactionFileStats:
+    """
+    Statistics of loading or saving a transaction file.
+
+    Attributes:
+        path: Path of the transaction file.
+        file_format: Format of the transaction file.
+        size_bytes: Size of the file.
+        operations_amount: Number of operations in the transaction.
+        elapsed_secs: Time of loading or saving the file.
+        sha256: Hash of the file content, calculated while processing it.
+        peak_memory_bytes: Peak of memory allocated while processing the file, None when not measured.
+    """
+
+    path: Path
+    file_format: TransactionFileFormat
+    size_bytes: int
+    operations_amount: int
+    elapsed_secs: float
+    sha256: str
+    peak_memory_bytes: int | None = None
+
+    @property
+    def throughput_bytes_per_sec(self) -> float:
+        return self.size_bytes / self.elapsed_secs if self.elapsed_secs else float("inf")
+
+    def __str__(self) -> str:
+        peak_memory = "not measured" if self.peak_memory_bytes is None else f"{self.peak_memory_bytes / 2**20:.2f} MiB"
+        return (
+            f"{self.path} ({self.file_format}, {self.operations_amount} operations, {self.size_bytes} bytes):"
+            f" {self.elapsed_secs:.3f}s, {self.throughput_bytes_per_sec / 2**20:.2f} MiB/s,"
+            f" peak memory {peak_memory}"
+        )
+
+
+class _PeakMemoryMeter:
+    """Measures peak of memory allocated by Python with tracemalloc, which is expensive so it's opt-in."""
+
+    def __init__(self, *, enabled: bool) -> None:
+        self._enabled = enabled
+        self._was_tracing = False
+        self._baseline = 0
+
+    def start(self) -> None:
+        if not self._enabled:
+            return
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> int | None:
+        if not self._enabled:
+            return None
+        peak = tracemalloc.get_traced_memory()[1] - self._baseline
+        if not self._was_tracing:
+            tracemalloc.stop()
+        return peak
+
+
+def load_transaction_file(path: Path, *, measure_memory: bool = False) -> tuple[Transaction, TransactionFileStats]:
+    """
+    Load the transaction from a JSON or binary file, without creating full copies of its content.
+
+    The file is memory-mapped. Operations are decoded from the JSON in chunks into the `Transaction` model, so
+    only one chunk of intermediate data lives in memory at once. Binary files (hex of the serialized transaction)
+    are converted to JSON with wax and decoded the same way.
+
+    Args:
+        path: Path of the transaction file.
+        measure_memory: Whether to measure the peak memory, slows down the loading.
+
+    Raises:
+        TransactionFileCodecError: When the file is empty or doesn't contain a valid transaction.
+
+    Returns:
+        The loaded transaction and statistics of loading it.
+    """
+    size = path.stat().st_size
+    if not size:
+        raise TransactionFileCodecError(path, "file is empty")  # empty file can't be memory-mapped
+
+    meter = _PeakMemoryMeter(enabled=measure_memory)
+    meter.start()
+    start = time.perf_counter()
+
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        sha256 = hashlib.sha256(content).hexdigest()
+        file_format = _detect_format(content)
+        transaction = _decode_transaction_content(content, file_format)
+
+    if isinstance(transaction, str):
+        meter.stop()
+        raise TransactionFileCodecError(path, transaction)
+
+    stats = TransactionFileStats(
+        path=path,
+        file_format=file_format,
+        size_bytes=size,
+        operations_amount=len(transaction.operations),
+        elapsed_secs=time.perf_counter() - start,
+        sha256=sha256,
+        peak_memory_bytes=meter.stop(),
+    )
+    logger.debug(f"Transaction file loaded: {stats}")
+    return transaction, stats
+
+
+def save_transaction_file(
+    transaction: Transaction, path: Path, file_format: TransactionFileFormat, *, measure_memory: bool = False
+) -> TransactionFileStats:
+    """
+    Save the transaction to a JSON or binary file, encoding it incrementally while hashing the written content.
+
+    JSON is written in the same layout as `Transaction.json(order="sorted", indent=4)`, operations are encoded in
+    chunks, so the whole document is never held in memory.
+
+    Args:
+        transaction: The transaction to save.
+        path: Path of the transaction file.
+        file_format: Format of the transaction file.
+        measure_memory: Whether to measure the peak memory, slows down the saving.
+
+    Raises:
+        TransactionFileCodecError: When the transaction can't be serialized to the binary format.
+
+    Returns:
+        Statistics of saving the transaction.
+    """
+    meter = _PeakMemoryMeter(enabled=measure_memory)
+    meter.start()
+    start = time.perf_counter()
+
+    with path.open("wb") as file:
+        writer = _HashingWriter(file)
+        if file_format == "json":
+            _encode_json(transaction, writer)
+        else:
+            try:
+                _encode_binary(transaction, writer)
+            except (iwax.WaxOperationFailedError, WaxError) as error:
+                meter.stop()
+                raise TransactionFileCodecError(path, str(error)) from error
+
+    stats = TransactionFileStats(
+        path=path,
+        file_format=file_format,
+        size_bytes=writer.written_bytes,
+        operations_amount=len(transaction.operations),
+        elapsed_secs=time.perf_counter() - start,
+        sha256=writer.sha256,
+        peak_memory_bytes=meter.stop(),
+    )
+    logger.debug(f"Transaction file saved: {stats}")
+    return stats
+
+
+async def load_transaction_file_async(
+    path: Path, *, measure_memory: bool = False
+) -> tuple[Transaction, TransactionFileStats]:
+    """Same as `load_transaction_file`, but done in the CPU thread pool, so the event loop is not blocked."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_cpu_thread_pool(), partial(load_transaction_file, path, measure_memory=measure_memory)
+    )
+
+
+async def save_transaction_file_async(
+    transaction: Transaction, path: Path, file_format: TransactionFileFormat, *, measure_memory: bool = False
+) -> TransactionFileStats:
+    """Same as `save_transaction_file`, but done in the CPU thread pool, so the event loop is not blocked."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_cpu_thread_pool(),
+        partial(save_transaction_file, transaction, path, file_format, measure_memory=measure_memory),
+    )
+
+
+def _detect_format(content: mmap.mmap) -> TransactionFileFormat:
+    # binary file contains only hex digits, so JSON object is recognized by its first character
+    return "json" if content[:_FORMAT_DETECTION_PREFIX_SIZE].lstrip().startswith(b"{") else "bin"
+
+
+def _decode_transaction_content(content: mmap.mmap, file_format: TransactionFileFormat) -> Transaction | str:
+    # Reason of the error is returned instead of raising it - traceback would keep views of the content alive and
+    # the file couldn't be unmapped.
+    try:
+        if file_format == "json":
+            return _decode_json(content)
+        # wax accepts only the whole serialized transaction, decoded straight from the mapped file
+        return _decode_json(iwax.deserialize_transaction_to_json(str(content, "ascii").strip()))
+    except (
+        msgspec.DecodeError,
+        msgspec.ValidationError,
+        DecodeError,
+        ValidationError,
+        iwax.WaxOperationFailedError,
+        WaxError,
+        UnicodeDecodeError,
+    ) as error:
+        return str(error)
+
+
+def _decode_json(content: mmap.mmap | str) -> Transaction:
+    # Raw values are views of the content, they must not outlive this function as the file gets unmapped
+    fields = msgspec.json.decode(content, type=dict[str, msgspec.Raw])
+    raw_operations = fields.pop("operations", msgspec.Raw(b"[]"))
+    fields["operations"] = msgspec.Raw(b"[]")
+    transaction = Transaction.parse_raw(msgspec.json.encode(fields))
+
+    operations: list[OperationRepresentationUnion] = []
+    raw_operations_items = msgspec.json.decode(raw_operations, type=list[msgspec.Raw])
+    for chunk in itertools.batched(raw_operations_items, OPERATIONS_CHUNK_SIZE):
+        # transaction model is used as the container, so operations are decoded exactly like by `parse_raw`
+        operations.extend(Transaction.parse_raw(b'{"operations":[' + b",".join(chunk) + b"]}").operations)
+    transaction.operations = operations
+    return transaction
+
+
+class _HashingWriter:
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self._digest = hashlib.sha256()
+        self.written_bytes = 0
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def write(self, data: bytes | memoryview) -> None:
+        self._file.write(data)
+        self._digest.update(data)
+        self.written_bytes += len(data)
+
+
+def _encode_json(transaction: Transaction, writer: _HashingWriter) -> None:
+    # Header fields are encoded by the model (so e.g. empty collections are omitted like in the whole transaction),
+    # operations separately in chunks. Both are laid out like `json.dumps` lays out the whole transaction.
+    header = msgspec.structs.replace(transaction, operations=[]).json(order="sorted", remove_whitespaces=True)
+    fields: dict[str, Any] = msgspec.json.decode(header)
+    keys = sorted([*fields, "operations"] if transaction.operations else fields)
+    if not keys:
+        writer.write(b"{}")
+        return
+
+    writer.write(b"{")
+    for index, key in enumerate(keys):
+        separator = "," if index else ""
+        writer.write(f"{separator}\n{_INDENT}{json.dumps(key, ensure_ascii=False)}: ".encode())
+        if key == "operations":
+            _encode_json_operations(transaction.operations, writer)
+        else:
+            value = json.dumps(fields[key], ensure_ascii=False, indent=_JSON_INDENT)
+            writer.write(textwrap.indent(value, _INDENT).removeprefix(_INDENT).encode())
+    writer.write(b"\n}")
+
+
+def _encode_json_operations(operations: list[OperationRepresentationUnion], writer: _HashingWriter) -> None:
+    operation_indent = _INDENT * 2
+    writer.write(b"[\n")
+    for index, chunk in enumerate(itertools.batched(operations, OPERATIONS_CHUNK_SIZE)):
+        encoded = ",\n".join(
+            textwrap.indent(operation.json(order="sorted", indent=_JSON_INDENT), operation_indent)
+            for operation in chunk
+        )
+        writer.write(((",\n" if index else "") + encoded).encode())
+    writer.write(f"\n{_INDENT}]".encode())
+
+
+def _encode_binary(transaction: Transaction, writer: _HashingWriter) -> None:
+    serialized = memoryview(iwax.serialize_transaction(transaction))
+    for offset in range(0, len(serialized), BINARY_WRITE_CHUNK_SIZE):
+        writer.write(serialized[offset : offset + BINARY_WRITE_CHUNK_SIZE])
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.core import iwax
+from clive.__private.core.constants.node import (
+    BLOCK_SIZE_RESERVED_FOR_HEADER_BYTES,
+    HIVE_BLOCK_INTERVAL_SECONDS,
+    HIVE_MAX_TRANSACTION_SIZE_BYTES,
+    HIVE_RC_REGEN_TIME_SECONDS,
+)
+from clive.exceptions import CliveError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from clive.__private.models.schemas import (
+        DynamicGlobalProperties,
+        GetResourceParams,
+        GetResourcePool,
+        OperationUnion,
+    )
+
+TRANSACTION_HEADER_SIZE_BYTES: Final[int] = 2 + 4 + 4
+"""ref_block_num (uint16), ref_block_prefix (uint32) and expiration (uint32)."""
+
+SIGNATURE_SIZE_BYTES: Final[int] = 65
+EMPTY_EXTENSIONS_SIZE_BYTES: Final[int] = 1
+
+
+class OperationTooLargeError(CliveError):
+    """Raised when a single operation doesn't fit in a transaction on its own."""
+
+    def __init__(self, index: int, size: int, max_size: int) -> None:
+        self.index = index
+        self.size = size
+        self.max_size = max_size
+        super().__init__(
+            f"Operation #{index + 1} takes {size} bytes, it can't fit in a transaction of at most {max_size} bytes."
+        )
+
+
+def varint_size(value: int) -> int:
+    """Return the number of bytes the unsigned value takes when serialized as varint (7 bits per byte)."""
+    size = 1
+    while value >= 0x80:  # noqa: PLR2004
+        value >>= 7
+        size += 1
+    return size
+
+
+def estimate_transaction_size(operation_sizes: Sequence[int], *, signatures_amount: int = 1) -> int:
+    """
+    Calculate the size of the signed transaction consisting of operations of given sizes.
+
+    Args:
+        operation_sizes: Sizes of serialized operations.
+        signatures_amount: Number of signatures the transaction will have.
+
+    Returns:
+        Size of the serialized transaction with signatures.
+    """
+    return _calculate_transaction_size(len(operation_sizes), sum(operation_sizes), signatures_amount)
+
+
+def calculate_max_transaction_size(gdpo: DynamicGlobalProperties | None = None) -> int:
+    """
+    Calculate the maximum size of a transaction accepted by the node.
+
+    Args:
+        gdpo: When given, the limit coming from the maximum block size is also considered.
+
+    Returns:
+        The maximum size of the signed transaction.
+    """
+    if gdpo is None:
+        return HIVE_MAX_TRANSACTION_SIZE_BYTES
+    block_limit = int(gdpo.maximum_block_size) - BLOCK_SIZE_RESERVED_FOR_HEADER_BYTES
+    return min(HIVE_MAX_TRANSACTION_SIZE_BYTES, block_limit)
+
+
+def split_operations(operation_sizes: Sequence[int], *, max_size: int, signatures_amount: int = 1) -> list[range]:
+    """
+    Split operations into the fewest transactions which keep the order of operations and fit the size limit.
+
+    Operations are packed greedily - each transaction takes as many following operations as possible. Since the size
+    of a transaction only grows with every added operation, no other order-preserving split needs fewer transactions.
+
+    Args:
+        operation_sizes: Sizes of serialized operations, in the order they have to be broadcast.
+        max_size: Maximum size of the signed transaction.
+        signatures_amount: Number of signatures each transaction will have.
+
+    Raises:
+        OperationTooLargeError: If any operation doesn't fit in a transaction on its own.
+
+    Returns:
+        Ranges of indexes of operations, one per transaction.
+    """
+    parts: list[range] = []
+    start = 0
+    operations_size = 0
+    for index, size in enumerate(operation_sizes):
+        if _calculate_transaction_size(index - start + 1, operations_size + size, signatures_amount) <= max_size:
+            operations_size += size
+            continue
+
+        if _calculate_transaction_size(1, size, signatures_amount) > max_size:
+            raise OperationTooLargeError(index, size, max_size)
+        parts.append(range(start, index))
+        start = index
+        operations_size = size
+
+    if start < len(operation_sizes):
+        parts.append(range(start, len(operation_sizes)))
+    return parts
+
+
+def _calculate_transaction_size(operations_amount: int, operations_size: int, signatures_amount: int) -> int:
+    return (
+        TRANSACTION_HEADER_SIZE_BYTES
+        + varint_size(operations_amount)
+        + operations_size
+        + EMPTY_EXTENSIONS_SIZE_BYTES
+        + varint_size(signatures_amount)
+        + SIGNATURE_SIZE_BYTES * signatures_amount
+    )
+
+
+@dataclass(frozen=True)
+class RcCostEstimator:
+    """
+    Estimate the RC cost of a transaction the same way the node prices it, from rc_api resource parameters.
+
+    Only resources every transaction consumes are estimated - history bytes (the size of the transaction), execution
+    time (of the transaction, its signatures and operations) and state bytes of the transaction object. Operations
+    which create lasting state (e.g. comments or account creations) cost more than estimated.
+
+    Attributes:
+        resource_params: Result of rc_api.get_resource_params.
+        resource_pool: Result of rc_api.get_resource_pool.
+        total_vesting_shares: Raw amount of all VESTS, RC regenerate proportionally to it.
+    """
+
+    resource_params: GetResourceParams
+    resource_pool: GetResourcePool
+    total_vesting_shares: int
+
+    def estimate(self, transaction_size: int, operation_names: Sequence[str], *, signatures_amount: int = 1) -> int:
+        """
+        Estimate the RC cost of the transaction.
+
+        Args:
+            transaction_size: Size of the signed transaction.
+            operation_names: Names of operations in the transaction, e.g. "transfer".
+            signatures_amount: Number of signatures of the transaction.
+
+        Returns:
+            The estimated RC cost.
+        """
+        execution_time = self.resource_params.size_info.resource_execution_time
+        execution_usage = (
+            int(execution_time.transaction_time)
+            + int(execution_time.verify_authority_time) * signatures_amount
+            + sum(int(getattr(execution_time, f"{name}_time", 0)) for name in operation_names)
+        )
+        state_usage = int(self.resource_params.size_info.resource_state_bytes.transaction_base_size)
+
+        return (
+            self._calculate_resource_cost("resource_history_bytes", transaction_size)
+            + self._calculate_resource_cost("resource_execution_time", execution_usage)
+            + self._calculate_resource_cost("resource_state_bytes", state_usage)
+        )
+
+    @property
+    def _rc_regen_per_block(self) -> int:
+        return self.total_vesting_shares // (HIVE_RC_REGEN_TIME_SECONDS // HIVE_BLOCK_INTERVAL_SECONDS)
+
+    def _calculate_resource_cost(self, resource: str, usage: int) -> int:
+        """Price the usage on the resource curve, mirrors compute_rc_cost_of_resource of hived."""
+        if usage <= 0:
+            return 0
+        param = getattr(self.resource_params.resource_params, resource)
+        pool = int(getattr(self.resource_pool.resource_pool, resource).pool)
+        curve = param.price_curve_params
+        numerator = ((self._rc_regen_per_block * int(curve.coeff_a)) >> int(curve.shift)) + 1
+        numerator *= usage * int(param.resource_dynamics_params.resource_unit)
+        denominator = int(curve.coeff_b) + max(pool, 0)
+        return numerator // denominator + 1
+
+
+@dataclass(frozen=True)
+class TransactionPart:
+    """
+    Operations which fit in a single transaction.
+
+    Attributes:
+        operations: Indexes of operations of the whole operation list which belong to this transaction.
+        size: Size of the signed transaction.
+        rc_cost: Estimated RC cost of the transaction, None when resource parameters were not available.
+    """
+
+    operations: range
+    size: int
+    rc_cost: int | None = None
+
+
+@dataclass(frozen=True)
+class TransactionSplit:
+    """
+    Operations divided into the fewest transactions, which have to be broadcast in the given order.
+
+    Attributes:
+        parts: Transactions the operations are divided into.
+        max_size: Maximum size of the signed transaction used for splitting.
+    """
+
+    parts: list[TransactionPart] = field(default_factory=list)
+    max_size: int = HIVE_MAX_TRANSACTION_SIZE_BYTES
+
+    @property
+    def is_split(self) -> bool:
+        """Whether the operations don't fit in a single transaction."""
+        return len(self.parts) > 1
+
+    @property
+    def total_size(self) -> int:
+        return sum(part.size for part in self.parts)
+
+    @property
+    def total_rc_cost(self) -> int | None:
+        if any(part.rc_cost is None for part in self.parts):
+            return None
+        return sum(part.rc_cost for part in self.parts if part.rc_cost is not None)
+
+
+def split_transaction(
+    operations: Sequence[OperationUnion],
+    *,
+    max_size: int = HIVE_MAX_TRANSACTION_SIZE_BYTES,
+    signatures_amount: int = 1,
+    rc_cost_estimator: RcCostEstimator | None = None,
+) -> TransactionSplit:
+    """
+    Size the operations and split them into the fewest transactions fitting the size limit, keeping their order.
+
+    Sizes of operations are cached, so sizing the transaction again after a change serializes only new operations.
+
+    Args:
+        operations: Operations in the order they have to be broadcast.
+        max_size: Maximum size of the signed transaction.
+        signatures_amount: Number of signatures each transaction will have.
+        rc_cost_estimator: When given, the RC cost of each transaction is estimated.
+
+    Raises:
+        OperationTooLargeError: If any operation doesn't fit in a transaction on its own.
+
+    Returns:
+        The split of operations.
+    """
+    operation_sizes = [iwax.calculate_operation_size(operation) for operation in operations]
+    parts: list[TransactionPart] = []
+    for indexes in split_operations(operation_sizes, max_size=max_size, signatures_amount=signatures_amount):
+        size = estimate_transaction_size(
+            [operation_sizes[index] for index in indexes], signatures_amount=signatures_amount
+        )
+        rc_cost = None
+        if rc_cost_estimator is not None:
+            rc_cost = rc_cost_estimator.estimate(
+                size, [operations[index].get_name() for index in indexes], signatures_amount=signatures_amount
+            )
+        parts.append(TransactionPart(operations=indexes, size=size, rc_cost=rc_cost))
+    return TransactionSplit(parts=parts, max_size=max_size)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, ClassVar, Final, cast
+
+from clive.__private.core.commands.data_retrieval.find_scheduled_transfers import (
+    AccountFutureScheduledTransferData,
+    FutureScheduledTransfer,
+    calculate_possible_amount,
+)
+from clive.__private.models.asset import Asset
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from clive.__private.core.commands.data_retrieval.find_scheduled_transfers import ScheduledTransfer
+
+type _DefinitionKey = tuple[str, str, int, str, str, datetime, int, int]
+type ProjectionKey = tuple[tuple[_DefinitionKey, ...], str, str]
+
+PROJECTIONS_CACHE_SIZE: Final[int] = 8
+
+
+class TransferScheduleProjection:
+    """
+    Projects future executions of all recurrent transfer definitions of an account onto a single timeline.
+
+    Executions of each definition form an arithmetic sequence of dates (trigger date + n * recurrence), so the
+    timeline is created lazily by a heap merge of those sequences - only the executions that were asked for are ever
+    materialized, no matter how many remaining executions the definitions have. The running balance is simulated
+    in the same pass, so each projected execution knows the possible balance after it and the first execution that
+    could fail due to lack of funds is tracked.
+
+    Projections are cached (see `of`) until the definitions or the balance change, and the already projected part of
+    the timeline is reused by subsequent queries.
+
+    Args:
+        scheduled_transfers: Recurrent transfer definitions.
+        hive_balance: Current HIVE balance of the account.
+        hbd_balance: Current HBD balance of the account.
+    """
+
+    _CACHE: ClassVar[OrderedDict[ProjectionKey, TransferScheduleProjection]] = OrderedDict()
+
+    def __init__(
+        self, scheduled_transfers: Sequence[ScheduledTransfer], hive_balance: Asset.Hive, hbd_balance: Asset.Hbd
+    ) -> None:
+        self._scheduled_transfers = list(scheduled_transfers)
+        self._hive_balance = hive_balance
+        self._hbd_balance = hbd_balance
+        self._projected: list[FutureScheduledTransfer] = []
+        self._executions = self._project()
+        self._is_exhausted = False
+        self._first_lack_of_funds_index: int | None = None
+
+    @classmethod
+    def of(
+        cls, scheduled_transfers: Sequence[ScheduledTransfer], hive_balance: Asset.Hive, hbd_balance: Asset.Hbd
+    ) -> TransferScheduleProjection:
+        """
+        Get the projection of given definitions and balance, reusing the cached one if nothing changed.
+
+        Args:
+            scheduled_transfers: Recurrent transfer definitions.
+            hive_balance: Current HIVE balance of the account.
+            hbd_balance: Current HBD balance of the account.
+
+        Returns:
+            Projection of the given definitions.
+        """
+        key = cls._create_key(scheduled_transfers, hive_balance, hbd_balance)
+        projection = cls._CACHE.get(key)
+        if projection is not None:
+            cls._CACHE.move_to_end(key)
+            return projection
+
+        projection = cls(scheduled_transfers, hive_balance, hbd_balance)
+        cls._CACHE[key] = projection
+        if len(cls._CACHE) > PROJECTIONS_CACHE_SIZE:
+            cls._CACHE.popitem(last=False)
+        return projection
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._CACHE.clear()
+
+    @property
+    def total_executions_amount(self) -> int:
+        return sum(max(st.remaining_executions, 0) for st in self._scheduled_transfers)
+
+    @property
+    def projected_executions_amount(self) -> int:
+        return len(self._projected)
+
+    def get_upcoming(
+        self, amount: int | None = None, *, until: datetime | None = None, offset: int = 0
+    ) -> AccountFutureScheduledTransferData:
+        """
+        Get a page of upcoming executions ordered by their trigger date.
+
+        Args:
+            amount: Maximum number of executions to return. Unlimited if None, then `until` has to be given.
+            until: Return only executions triggered not later than this date.
+            offset: Number of earliest executions to skip.
+
+        Returns:
+            Upcoming executions with possible balance after each of them.
+        """
+        assert amount is not None or until is not None, "Either amount or until has to be given, horizon is unbounded."
+        until = self._ensure_aware(until)
+
+        end = None if amount is None else offset + amount
+        if end is not None:
+            self._project_while(lambda: len(self._projected) < end)
+        if until is not None:
+            self._project_while(lambda: not self._projected or self._projected[-1].trigger_date <= until)
+
+        page = self._projected[offset:end]
+        if until is not None:
+            page = [execution for execution in page if execution.trigger_date <= until]
+        return AccountFutureScheduledTransferData(future_scheduled_transfers=page)
+
+    def find_first_lack_of_funds(self, *, until: datetime | None = None) -> FutureScheduledTransfer | None:
+        """
+        Find the first execution that could fail due to lack of funds.
+
+        Args:
+            until: Do not look for executions triggered later than this date. Whole timeline is checked if None.
+
+        Returns:
+            The first execution that could fail or None if there is no such execution in the horizon.
+        """
+        until = self._ensure_aware(until)
+        self._project_while(
+            lambda: self._first_lack_of_funds_index is None
+            and (until is None or not self._projected or self._projected[-1].trigger_date <= until)
+        )
+
+        if self._first_lack_of_funds_index is None:
+            return None
+        execution = self._projected[self._first_lack_of_funds_index]
+        return execution if until is None or execution.trigger_date <= until else None
+
+    def _project_while(self, condition: Callable[[], bool]) -> None:
+        while not self._is_exhausted and condition():
+            execution = next(self._executions, None)
+            if execution is None:
+                self._is_exhausted = True
+                return
+            if self._first_lack_of_funds_index is None and execution.is_lack_of_funds():
+                self._first_lack_of_funds_index = len(self._projected)
+            self._projected.append(execution)
+
+    def _project(self) -> Iterator[FutureScheduledTransfer]:
+        # heap items: (trigger date, definition index, execution index) - definition index keeps ties stable
+        heap = [
+            (st.trigger_date, definition_index, 0)
+            for definition_index, st in enumerate(self._scheduled_transfers)
+            if st.remaining_executions > 0
+        ]
+        heapq.heapify(heap)
+        steps = [timedelta(hours=st.recurrence) for st in self._scheduled_transfers]
+
+        hive_balance: Asset.Hive = self._hive_balance
+        hbd_balance: Asset.Hbd = self._hbd_balance
+        while heap:
+            trigger_date, definition_index, execution_index = heap[0]
+            st = self._scheduled_transfers[definition_index]
+            if execution_index + 1 < st.remaining_executions:
+                heapq.heapreplace(heap, (trigger_date + steps[definition_index], definition_index, execution_index + 1))
+            else:
+                heapq.heappop(heap)
+
+            if Asset.is_hive(st.amount):
+                hive_balance = cast("Asset.Hive", calculate_possible_amount(hive_balance, st.amount))
+                possible_amount: Asset.LiquidT = hive_balance
+            else:
+                hbd_balance = cast("Asset.Hbd", calculate_possible_amount(hbd_balance, st.amount))
+                possible_amount = hbd_balance
+
+            # remaining executions of a future transfer has always been its execution index, counting up
+            yield FutureScheduledTransfer(
+                amount=st.amount,
+                from_=st.from_,
+                memo=st.memo,
+                pair_id=st.pair_id,
+                possible_amount=possible_amount,
+                recurrence=st.recurrence,
+                remaining_executions=execution_index,
+                to=st.to,
+                trigger_date=trigger_date,
+            )
+
+    @staticmethod
+    def _create_key(
+        scheduled_transfers: Sequence[ScheduledTransfer], hive_balance: Asset.Hive, hbd_balance: Asset.Hbd
+    ) -> ProjectionKey:
+        definitions = tuple(
+            (
+                st.from_,
+                st.to,
+                st.pair_id,
+                Asset.to_legacy(st.amount),
+                st.memo,
+                st.trigger_date,
+                st.recurrence,
+                st.remaining_executions,
+            )
+            for st in scheduled_transfers
+        )
+        return definitions, Asset.to_legacy(hive_balance), Asset.to_legacy(hbd_balance)
+
+    @staticmethod
+    def _ensure_aware(value: datetime | None) -> datetime | None:
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=UTC)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
+
+from clive.exceptions import CliveError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from clive.__private.core.iwax import TotalVestingProtocol
+
+SHARE_TYPE_MAX: Final[int] = 2**63 - 1
+"""Maximum amount of an asset on the chain, amounts are stored as `int64` (`share_type`)."""
+
+
+class AssetAmountOutOfRangeError(CliveError):
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        super().__init__(f"Asset amount {amount} is out of range of the chain share type.")
+
+
+def checked_amount(amount: int) -> int:
+    """
+    Ensure the amount fits in the chain share type, like the chain asserts on asset arithmetic.
+
+    Args:
+        amount: Amount in the internal representation (integer, precision given by the asset).
+
+    Raises:
+        AssetAmountOutOfRangeError: When the amount does not fit.
+
+    Returns:
+        The same amount.
+    """
+    if not -SHARE_TYPE_MAX - 1 <= amount <= SHARE_TYPE_MAX:
+        raise AssetAmountOutOfRangeError(amount)
+    return amount
+
+
+@dataclass(frozen=True)
+class VestingShareRatio:
+    """
+    Price of VESTS in HIVE given by the global properties, converting amounts with plain integer math.
+
+    Conversions match the chain (`asset * price`): the amount is multiplied with 128-bit precision and floored,
+    so the results are the same as the ones calculated by wax, without converting the assets back and forth.
+
+    Attributes:
+        total_vesting_fund_hive: Amount of the total vesting fund in HIVE (internal representation).
+        total_vesting_shares: Amount of the total vesting shares (internal representation).
+    """
+
+    total_vesting_fund_hive: int
+    total_vesting_shares: int
+
+    @classmethod
+    def from_data(cls, data: TotalVestingProtocol) -> VestingShareRatio:
+        """
+        Get the ratio of the given global properties, cached as the properties change only once per block.
+
+        Args:
+            data: Global properties or other object providing the total vesting fund and shares.
+
+        Returns:
+            The ratio.
+        """
+        return _get_vesting_share_ratio(int(data.total_vesting_fund_hive.amount), int(data.total_vesting_shares.amount))
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether amounts can be converted, the chain rejects prices with non-positive amounts."""
+        return self.total_vesting_fund_hive > 0 and self.total_vesting_shares > 0
+
+    def vests_to_hp(self, vests: int) -> int:
+        return self.__multiply(vests, self.total_vesting_fund_hive, self.total_vesting_shares)
+
+    def hp_to_vests(self, hive: int) -> int:
+        return self.__multiply(hive, self.total_vesting_shares, self.total_vesting_fund_hive)
+
+    def vests_to_hp_many(self, vests: Iterable[int]) -> list[int]:
+        return [self.vests_to_hp(amount) for amount in vests]
+
+    def can_convert(self, amount: int) -> bool:
+        """
+        Check if the amount can be converted with plain integer math.
+
+        Negative amounts are not converted here, the chain converts them as unsigned which is not worth mirroring.
+
+        Args:
+            amount: Amount to convert (internal representation).
+
+        Returns:
+            Whether the amount can be converted.
+        """
+        return self.is_valid and 0 <= amount <= SHARE_TYPE_MAX
+
+    def __multiply(self, amount: int, multiplier: int, divisor: int) -> int:
+        assert self.can_convert(amount), f"Amount {amount} can't be converted with ratio {self}"
+        return checked_amount(amount * multiplier // divisor)
+
+
+@lru_cache(maxsize=16)
+def _get_vesting_share_ratio(total_vesting_fund_hive: int, total_vesting_shares: int) -> VestingShareRatio:
+    return VestingShareRatio(total_vesting_fund_hive, total_vesting_shares)
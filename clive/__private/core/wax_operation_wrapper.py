@@ -7,6 +7,7 @@ from clive.__private.models.schemas import AccountName, OperationUnion
 from clive.exceptions import WrongTypeError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from decimal import Decimal
 
     import wax
@@ -112,6 +113,17 @@ class WaxRcDelegationWrapper(WaxOperationWrapper):
 
         return cls(wax_op)
 
+    @classmethod
+    def create_delegations(cls, *, from_account: str, delegatees: Sequence[str], max_rc: int) -> Self:
+        from wax.hive_apps_operations.rc import ResourceCreditsOperation  # noqa: PLC0415
+
+        assert delegatees, "At least one delegatee is required."
+        wax_op = ResourceCreditsOperation()
+        wax_op.delegate(from_account, max_rc, *delegatees)
+        wax_op.authorize(required_posting_auths=from_account)
+
+        return cls(wax_op)
+
     @classmethod
     def create_removal(cls, *, from_account: str, delegatee: str) -> Self:
         from wax.hive_apps_operations.rc import ResourceCreditsOperation  # noqa: PLC0415
@@ -10,6 +10,7 @@ from clive.__private.core.known_exchanges import KnownExchanges
 from clive.__private.core.node import Node
 from clive.__private.core.profile import Profile
 from clive.__private.core.wallet_container import WalletContainer
+from clive.__private.storage.service.service import PersistentStorageService
 from clive.exceptions import ProfileNotLoadedError
 from wax.wax_factory import create_hive_chain
 from wax.wax_options import WaxChainOptions
@@ -133,6 +134,8 @@ class World:
         async with self._during_closure():
             if self._should_save_profile_on_close:
                 await self.commands.save_profile()
+            # encryption of pending profile writes requires beekeeper, so flush them before its teardown
+            await PersistentStorageService.flush_pending_writes()
             if self.is_node_available:
                 self.node.teardown()
             self._beekeeper_manager.teardown()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, Literal, TextIO
 
 from loguru import logger as loguru_logger
 from loguru._simple_sinks import StreamSink
@@ -12,6 +16,7 @@ from clive.__private.core.constants.env import KNOWN_FIRST_PARTY_PACKAGES, LAUNC
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from loguru import Message, Record
     from loguru._logger import Core
     from textual import Logger as TextualLogger
 
@@ -19,6 +24,18 @@ if TYPE_CHECKING:
 
 LogFilePaths = tuple[Path, ...]
 GroupLogFilePaths = dict[str, LogFilePaths]
+type LogCategory = Literal["clive", "1st_party", "3rd_party"]
+
+LEVEL_NAME_BY_METHOD: Final[dict[str, str]] = {
+    "trace": "TRACE",
+    "debug": "DEBUG",
+    "info": "INFO",
+    "success": "SUCCESS",
+    "warning": "WARNING",
+    "error": "ERROR",
+    "critical": "CRITICAL",
+    "exception": "ERROR",
+}
 
 LOG_FORMAT: Final[str] = (
     "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green>"
@@ -28,6 +45,87 @@ LOG_FORMAT: Final[str] = (
 )
 
 
+@lru_cache(maxsize=1024)
+def get_log_category(logger_name: str) -> LogCategory:
+    """Categorize the logger (module) name, which is done only once per name as the result is cached."""
+    if "clive" in logger_name:
+        return "clive"
+    if any(pkg in logger_name for pkg in KNOWN_FIRST_PARTY_PACKAGES):
+        return "1st_party"
+    return "3rd_party"
+
+
+@dataclass
+class LogFilesGroup:
+    """Log files of a single log level directory with the minimal level of records written to them per category."""
+
+    paths: LogFilePaths
+    min_level_no_per_category: dict[LogCategory, int]
+
+    def accepts(self, level_no: int, category: LogCategory) -> bool:
+        return level_no >= self.min_level_no_per_category[category]
+
+
+class LogFilesSink:
+    """
+    Loguru sink writing records to all log files (of all log level directories) from a single writer thread.
+
+    Records are filtered and formatted in the logging thread, then only put into a queue, so the file I/O doesn't
+    block the caller (e.g. the event loop). The writer thread fans records out to the files of the groups that accept
+    them and flushes the files once the queue is drained.
+
+    Args:
+        groups: Log files groups to write to.
+    """
+
+    def __init__(self, groups: list[LogFilesGroup]) -> None:
+        self._groups = groups
+        self._files: list[list[TextIO]] = [
+            [path.open("a", encoding="utf-8") for path in group.paths] for group in groups
+        ]
+        self._queue: queue.SimpleQueue[tuple[str, int, LogCategory] | None] = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_queued, name="clive_log_writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def min_level_no(self) -> int:
+        return min(min(group.min_level_no_per_category.values()) for group in self._groups)
+
+    def accepts(self, record: Record) -> bool:
+        category = get_log_category(record["name"] or "")
+        level_no = record["level"].no
+        return any(group.accepts(level_no, category) for group in self._groups)
+
+    def write(self, message: Message) -> None:
+        record = message.record
+        self._queue.put((str(message), record["level"].no, get_log_category(record["name"] or "")))
+
+    def stop(self) -> None:
+        """Write all queued records and close the files, called by loguru when the sink is removed."""
+        self._queue.put(None)
+        self._writer.join()
+        for files in self._files:
+            for file in files:
+                file.close()
+
+    def _write_queued(self) -> None:
+        while (item := self._queue.get()) is not None:
+            text, level_no, category = item
+            for group, files in zip(self._groups, self._files, strict=True):
+                if group.accepts(level_no, category):
+                    for file in files:
+                        file.write(text)
+
+            if self._queue.empty():
+                self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        for files in self._files:
+            for file in files:
+                file.flush()
+
+
 class InterceptHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         # Get corresponding Loguru level if it exists
@@ -46,25 +144,56 @@ class InterceptHandler(logging.Handler):
 
 
 class Logger:
-    """Logger used to log into both Textual (textual console) and Loguru (file located in logs/)."""
+    """
+    Logger used to log into both Textual (textual console) and Loguru (file located in logs/).
+
+    Level methods (e.g. `logger.debug`) are created once and cached. Records below the minimal level of all loguru
+    handlers are dropped right away (also for the textual console), so they cost almost nothing. To also skip building
+    the message of such records, pass it lazily - as a format string with arguments (`logger.debug("Value: {}", value)`)
+    or as a callable returning the message (`logger.debug(lambda: f"Value: {value}")`).
+    """
 
     def __init__(self) -> None:
         self.__enabled_loguru = True
         self.__enabled_textual = True
+        self.__files_handler_id: int | None = None
 
     def __getattr__(self, item: str) -> Callable[..., None]:
+        hooked = self._create_hooked(item)
+        if not item.startswith("__"):
+            # cache it as an instance attribute, so `__getattr__` is not called again for this item
+            setattr(self, item, hooked)
+        return hooked
+
+    def _create_hooked(self, item: str) -> Callable[..., None]:
+        try_one_of = f"Try one of: {self._get_safe_settings_lazy().AVAILABLE_LOG_LEVELS}"
+        loguru_attr = getattr(loguru_logger.opt(depth=1), item, None)
+        loguru_core: Core = loguru_logger._core  # type: ignore[attr-defined]
+        level_name = LEVEL_NAME_BY_METHOD.get(item)
+        level_no = loguru_logger.level(level_name).no if level_name is not None else None
+        textual_log_attr: Callable[..., None] | None = None
+
         def _hooked(*args: Any, **kwargs: Any) -> None:
-            try_one_of = f"Try one of: {self._get_safe_settings_lazy().AVAILABLE_LOG_LEVELS}"
+            nonlocal textual_log_attr
+
+            if self.__enabled_loguru and level_no is not None and level_no < loguru_core.min_level:
+                return  # dropped for the textual console too, so it doesn't get records that won't be saved anyway
+            if not self.__enabled_loguru and not self.__enabled_textual:
+                return
+
+            if level_no is not None and args and callable(args[0]):
+                args = (args[0](), *args[1:])
 
             if self.__enabled_loguru:
-                patched = loguru_logger.opt(depth=1)
-                loguru_attr = getattr(patched, item, None)
                 assert callable(loguru_attr), f"Loguru {item} is not callable. {try_one_of}"
                 loguru_attr(*args, **kwargs)
             if self.__enabled_textual:
-                textual_logger = self._get_textual_logger_lazy()
-                textual_log_attr = getattr(textual_logger, item, None)
-                assert callable(textual_log_attr), f"Textual {item} is not callable. {try_one_of}"
+                if textual_log_attr is None:
+                    textual_log_attr = getattr(self._get_textual_logger_lazy(), item, None)
+                    assert callable(textual_log_attr), f"Textual {item} is not callable. {try_one_of}"
+                if level_no is not None and len(args) > 1 and isinstance(args[0], str):
+                    args = (args[0].format(*args[1:], **kwargs),)
+                    kwargs = {}
                 textual_log_attr(*args, **kwargs)
 
         return _hooked
@@ -143,18 +272,28 @@ class Logger:
     def _remove_stream_handlers(self) -> None:
         """Remove all handlers that log to stdout and stderr."""
         core: Core = loguru_logger._core  # type: ignore[attr-defined]
-        for handler in core.handlers.values():
-            if isinstance(handler._sink, StreamSink):
+        for handler in list(core.handlers.values()):
+            # loguru wraps every sink with a `write` method in StreamSink, also the one writing to log files
+            if isinstance(handler._sink, StreamSink) and handler._id != self.__files_handler_id:
                 loguru_logger.remove(handler._id)
 
     def _add_file_handlers(self, log_paths: GroupLogFilePaths) -> None:
-        for log_level, paths in log_paths.items():
-            for path in paths:
-                loguru_logger.add(
-                    sink=path,
-                    format=LOG_FORMAT,
-                    filter=self._make_filter(level=log_level),
-                )
+        if self.__files_handler_id is not None:
+            loguru_logger.remove(self.__files_handler_id)  # flushes records queued so far to previous files
+
+        sink = LogFilesSink(
+            [
+                LogFilesGroup(paths=paths, min_level_no_per_category=self._get_min_level_no_per_category(log_level))
+                for log_level, paths in log_paths.items()
+            ]
+        )
+        self.__files_handler_id = loguru_logger.add(
+            sink=sink,
+            level=sink.min_level_no,
+            format=LOG_FORMAT,
+            filter=sink.accepts,
+            colorize=False,
+        )
 
     def _get_1st_party_log_level(self) -> str:
         return self._get_safe_settings_lazy().log.level_1st_party
@@ -162,25 +301,13 @@ class Logger:
     def _get_3rd_party_log_level(self) -> str:
         return self._get_safe_settings_lazy().log.level_3rd_party
 
-    def _make_filter(self, *, level: str) -> Callable[..., bool]:
-        level_mapping: dict[str, int] = {
-            "clive": getattr(logging, level),
-            "1st_party": getattr(logging, self._get_1st_party_log_level()),
-            "3rd_party": getattr(logging, self._get_3rd_party_log_level()),
+    def _get_min_level_no_per_category(self, level: str) -> dict[LogCategory, int]:
+        directory_level_no: int = getattr(logging, level)
+        return {
+            "clive": directory_level_no,
+            "1st_party": max(directory_level_no, getattr(logging, self._get_1st_party_log_level())),
+            "3rd_party": max(directory_level_no, getattr(logging, self._get_3rd_party_log_level())),
         }
 
-        def _filter(record: dict[str, Any]) -> bool:
-            is_clive = "clive" in record["name"]
-            is_1st_party = any(pkg in record["name"] for pkg in KNOWN_FIRST_PARTY_PACKAGES)
-
-            category = "clive" if is_clive else "1st_party" if is_1st_party else "3rd_party"
-            min_required_level_no = level_mapping[category]
-            directory_level_no = level_mapping["clive"]
-            record_level_no: int = record["level"].no
-
-            return record_level_no >= directory_level_no and record_level_no >= min_required_level_no
-
-        return _filter
-
 
 logger = Logger()
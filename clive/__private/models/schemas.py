@@ -33,6 +33,7 @@ __all__ = [  # noqa: RUF022
     "ListWitnesses",
     "ListWitnessVotes",
     "ListRcDirectDelegations",
+    "ListVestingDelegations",
     "ListWithdrawVestingRoutes",
     # find API response aliases (have nested list property which stores actual model)
     "FindAccounts",
@@ -45,6 +46,8 @@ __all__ = [  # noqa: RUF022
     "FindWitnesses",
     # get API responses (have unnecessary nested property which stores actual model)
     "GetAccountHistory",
+    "GetResourceParams",
+    "GetResourcePool",
     "GetTransaction",
     # get API responses (have no unnecessary nested  properties, just the model itself)
     "Config",
@@ -182,6 +185,7 @@ if TYPE_CHECKING:
         ListDeclineVotingRightsRequests,
         ListProposals,
         ListProposalVotes,
+        ListVestingDelegations,
         ListWithdrawVestingRoutes,
         ListWitnesses,
         ListWitnessVotes,
@@ -197,7 +201,7 @@ if TYPE_CHECKING:
         WithdrawVestingRoutesFundament,
         WitnessesFundament,
     )
-    from schemas.apis.rc_api import FindRcAccounts, ListRcDirectDelegations
+    from schemas.apis.rc_api import FindRcAccounts, GetResourceParams, GetResourcePool, ListRcDirectDelegations
     from schemas.apis.rc_api.fundaments_of_responses import RcAccount, RcDirectDelegations
     from schemas.apis.transaction_status_api import FindTransaction
     from schemas.base import field
@@ -341,6 +345,7 @@ lazy_getattr = lazy_module_factory(
         "ListDeclineVotingRightsRequests",
         "ListProposals",
         "ListProposalVotes",
+        "ListVestingDelegations",
         "ListWithdrawVestingRoutes",
         "ListWitnesses",
         "ListWitnessVotes",
@@ -474,6 +479,8 @@ lazy_getattr = lazy_module_factory(
     ),
     ("schemas.base", "field"),
     ("schemas.apis.rc_api", "FindRcAccounts"),
+    ("schemas.apis.rc_api", "GetResourceParams"),
+    ("schemas.apis.rc_api", "GetResourcePool"),
     ("schemas.apis.rc_api", "ListRcDirectDelegations"),
     ("schemas.apis.transaction_status_api", "FindTransaction", "TransactionStatus"),
     *aggregate_same_import(
@@ -33,6 +33,41 @@ class TransactionLocalData:
     last_update_head_block_time: HiveDateTime | None = None
 
 
+@dataclass(frozen=True, eq=False)
+class TransactionChangeMarker:
+    """
+    Cheap snapshot of the transaction content used to detect changes without serialization.
+
+    Operations and extensions are compared by identity, so replacing, adding, removing or reordering them is detected.
+    Operations are expected to be immutable once they are put into the transaction.
+
+    Attributes:
+        operations: Operations of the transaction at the moment of taking the snapshot.
+        extensions: Extensions of the transaction at the moment of taking the snapshot.
+        metadata: TaPoS fields, expiration and signatures at the moment of taking the snapshot.
+    """
+
+    operations: tuple[object, ...]
+    extensions: tuple[object, ...]
+    metadata: tuple[object, ...]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TransactionChangeMarker):
+            return NotImplemented
+        return (
+            self.metadata == other.metadata
+            and self._is_identical(self.operations, other.operations)
+            and self._is_identical(self.extensions, other.extensions)
+        )
+
+    def __hash__(self) -> int:
+        return hash((tuple(map(id, self.operations)), tuple(map(id, self.extensions)), self.metadata))
+
+    @staticmethod
+    def _is_identical(first: tuple[object, ...], second: tuple[object, ...]) -> bool:
+        return len(first) == len(second) and all(a is b for a, b in zip(first, second, strict=True))
+
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
@@ -76,6 +111,14 @@ class Transaction(SchemasTransaction):
     def is_tapos_set(self) -> bool:
         return self.ref_block_num >= 0 and self.ref_block_prefix > 0
 
+    @property
+    def change_marker(self) -> TransactionChangeMarker:
+        return TransactionChangeMarker(
+            operations=tuple(self.operations),
+            extensions=tuple(self.extensions),
+            metadata=(self.ref_block_num, self.ref_block_prefix, self.expiration, tuple(self.signatures)),
+        )
+
     @property
     def operations_models(self) -> list[OperationUnion]:
         """Get only the operation models from already stored operations representations."""
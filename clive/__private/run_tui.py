@@ -12,10 +12,18 @@ def _hide_never_awaited_warnings_in_non_dev_mode() -> None:
 
 def run_tui() -> None:
     from clive.__private.before_launch import prepare_before_launch  # noqa: PLC0415
-    from clive.__private.ui.app import Clive  # noqa: PLC0415
-    from clive.__private.ui.bindings import initialize_bindings_files  # noqa: PLC0415
+    from clive.__private.ui.stylesheet_bundle import (  # noqa: PLC0415
+        StylesheetBundle,
+        refresh_stylesheet_bundle_if_modified,
+    )
 
     _hide_never_awaited_warnings_in_non_dev_mode()
     prepare_before_launch()
+    StylesheetBundle.prepare()  # before importing the app, so stylesheets of widgets are taken from the bundle
+
+    from clive.__private.ui.app import Clive  # noqa: PLC0415
+    from clive.__private.ui.bindings import initialize_bindings_files  # noqa: PLC0415
+
     initialize_bindings_files()
     Clive().run()
+    refresh_stylesheet_bundle_if_modified()
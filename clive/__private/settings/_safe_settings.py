@@ -12,6 +12,7 @@ import beekeepy.interfaces as bki
 import beekeepy.settings as bks
 from inflection import underscore
 
+from clive.__private.core.constants.node import HIVE_BLOCK_INTERVAL_SECONDS, HIVE_TAPOS_WINDOW_BLOCKS
 from clive.__private.core.constants.setting_identifiers import (
     BEEKEEPER_CLOSE_TIMEOUT,
     BEEKEEPER_COMMUNICATION_ATTEMPTS_AMOUNT,
@@ -31,16 +32,32 @@ from clive.__private.core.constants.setting_identifiers import (
     LOG_LEVEL_3RD_PARTY,
     LOG_LEVELS,
     MAX_NUMBER_OF_TRACKED_ACCOUNTS,
+    NODE_BASIC_INFO_CACHE_MAX_AGE_SECS,
     NODE_CHAIN_ID,
+    NODE_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    NODE_CIRCUIT_BREAKER_OPEN_SECS,
     NODE_COMMUNICATION_ATTEMPTS_AMOUNT,
     NODE_COMMUNICATION_RETRIES_DELAY_SECS,
+    NODE_COMMUNICATION_RETRIES_MAX_DELAY_SECS,
     NODE_COMMUNICATION_TOTAL_TIMEOUT_SECS,
+    NODE_CONNECTION_LIMIT,
+    NODE_DNS_CACHE_TTL_SECS,
+    NODE_KEEPALIVE_TIMEOUT_SECS,
     NODE_REFRESH_ALARMS_RATE_SECS,
     NODE_REFRESH_RATE_SECS,
+    NODE_RETRIES_ON_CONNECTION_ERROR,
+    NODE_RETRIES_ON_JSON_RPC_ERROR,
+    NODE_RETRIES_ON_SERVER_ERROR,
+    NODE_RETRIES_ON_TIMEOUT,
+    NODE_TAPOS_REFERENCE_MAX_AGE_SECS,
     SECRETS_DEFAULT_PRIVATE_KEY,
     SECRETS_NODE_ADDRESS,
     SELECT_FILE_ROOT_PATH,
+    STORAGE_SAVE_COALESCE_WINDOW_SECS,
+    STORAGE_SAVE_MAX_BACKLOG,
     USE_WAX_AUTOSIGN,
+    WAX_CPU_WORKERS,
+    WAX_OFFLOAD_SIZE_THRESHOLD,
 )
 from clive.__private.core.formatters.humanize import humanize_validation_result
 from clive.__private.settings._settings import get_settings
@@ -50,6 +67,9 @@ if TYPE_CHECKING:
     from beekeepy.interfaces import HttpUrl
     from beekeepy.settings import InterfaceSettings, RemoteHandleSettings
 
+    from clive.__private.core.node.connection_pool import ConnectionPoolSettings
+    from clive.__private.core.node.resilience import ResiliencePolicy
+
 _AvailableLogLevels = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 _AvailableLogLevelsContainer = list[_AvailableLogLevels]
 _AVAILABLE_LOG_LEVELS: tuple[_AvailableLogLevels, ...] = get_args(_AvailableLogLevels)
@@ -324,8 +344,100 @@ class SafeSettings:
         def communication_retries_delay_secs(self) -> float:
             return self._get_node_communication_retries_delay_secs()
 
+        @property
+        def communication_retries_max_delay_secs(self) -> float:
+            return self._get_node_communication_retries_max_delay_secs()
+
+        @property
+        def retries_on_timeout(self) -> int:
+            return self._get_node_retries_on_timeout()
+
+        @property
+        def retries_on_connection_error(self) -> int:
+            return self._get_node_retries_on_connection_error()
+
+        @property
+        def retries_on_server_error(self) -> int:
+            return self._get_node_retries_on_server_error()
+
+        @property
+        def retries_on_json_rpc_error(self) -> int:
+            return self._get_node_retries_on_json_rpc_error()
+
+        @property
+        def circuit_breaker_failure_threshold(self) -> int:
+            return self._get_node_circuit_breaker_failure_threshold()
+
+        @property
+        def circuit_breaker_open_secs(self) -> float:
+            return self._get_node_circuit_breaker_open_secs()
+
+        @property
+        def connection_limit(self) -> int:
+            return self._get_node_connection_limit()
+
+        @property
+        def keepalive_timeout_secs(self) -> float:
+            return self._get_node_keepalive_timeout_secs()
+
+        @property
+        def dns_cache_ttl_secs(self) -> float:
+            return self._get_node_dns_cache_ttl_secs()
+
+        @property
+        def tapos_reference_max_age_secs(self) -> float:
+            return self._get_node_tapos_reference_max_age_secs()
+
+        @property
+        def dns_cache_path(self) -> Path:
+            return self._parent._get_data_path() / "node_dns_cache.json"
+
+        @property
+        def basic_info_cache_max_age_secs(self) -> float:
+            return self._get_node_basic_info_cache_max_age_secs()
+
+        @property
+        def basic_info_cache_path(self) -> Path:
+            return self._parent._get_data_path() / "node_basic_info_cache.json"
+
+        def connection_pool_settings_factory(self) -> ConnectionPoolSettings:
+            from clive.__private.core.node.connection_pool import ConnectionPoolSettings  # noqa: PLC0415
+
+            return ConnectionPoolSettings(
+                limit_per_host=self.connection_limit,
+                keepalive_timeout_secs=self.keepalive_timeout_secs,
+                dns_cache_ttl_secs=self.dns_cache_ttl_secs,
+                dns_cache_path=self.dns_cache_path if self.dns_cache_ttl_secs else None,
+            )
+
+        def resilience_policy_factory(self) -> ResiliencePolicy:
+            from clive.__private.core.node.resilience import (  # noqa: PLC0415
+                CircuitBreaker,
+                ExponentialBackoff,
+                ResiliencePolicy,
+                RetryBudgets,
+            )
+
+            return ResiliencePolicy(
+                budgets=RetryBudgets(
+                    timeout=self.retries_on_timeout,
+                    connection=self.retries_on_connection_error,
+                    server_error=self.retries_on_server_error,
+                    json_rpc_error=self.retries_on_json_rpc_error,
+                ),
+                backoff=ExponentialBackoff(
+                    base_secs=self.communication_retries_delay_secs, max_secs=self.communication_retries_max_delay_secs
+                ),
+                circuit_breaker=CircuitBreaker(
+                    failure_threshold=self.circuit_breaker_failure_threshold, open_secs=self.circuit_breaker_open_secs
+                ),
+            )
+
         def settings_factory(self, http_endpoint: HttpUrl) -> RemoteHandleSettings:
+            from clive.__private.core.node.resilience import ResilientOverseer  # noqa: PLC0415
+
             remote_handle_settings = bks.RemoteHandleSettings(http_endpoint=http_endpoint)
+            remote_handle_settings.overseer = ResilientOverseer
 
             remote_handle_settings.timeout = timedelta(seconds=self.communication_timeout_total_secs)
             remote_handle_settings.max_retries = self.communication_attempts_amount
@@ -350,7 +462,7 @@ class SafeSettings:
             return value_
 
         def _get_node_refresh_rate_secs(self) -> float:
-            return self._parent._get_number(NODE_REFRESH_RATE_SECS, default=1.5, minimum=1)
+            return self._parent._get_number(NODE_REFRESH_RATE_SECS, default=6, minimum=1)
 
         def _get_node_refresh_alarms_rate_secs(self) -> float:
             return self._parent._get_number(NODE_REFRESH_ALARMS_RATE_SECS, default=30, minimum=5)
@@ -364,6 +476,81 @@ class SafeSettings:
         def _get_node_communication_retries_delay_secs(self) -> float:
             return self._parent._get_number(NODE_COMMUNICATION_RETRIES_DELAY_SECS, default=0.2, minimum=0)
 
+        def _get_node_communication_retries_max_delay_secs(self) -> float:
+            return self._parent._get_number(NODE_COMMUNICATION_RETRIES_MAX_DELAY_SECS, default=5, minimum=0)
+
+        def _get_node_retries_on_timeout(self) -> int:
+            return int(self._parent._get_number(NODE_RETRIES_ON_TIMEOUT, default=1, minimum=0))
+
+        def _get_node_retries_on_connection_error(self) -> int:
+            return int(self._parent._get_number(NODE_RETRIES_ON_CONNECTION_ERROR, default=2, minimum=0))
+
+        def _get_node_retries_on_server_error(self) -> int:
+            return int(self._parent._get_number(NODE_RETRIES_ON_SERVER_ERROR, default=3, minimum=0))
+
+        def _get_node_retries_on_json_rpc_error(self) -> int:
+            return int(self._parent._get_number(NODE_RETRIES_ON_JSON_RPC_ERROR, default=4, minimum=0))
+
+        def _get_node_circuit_breaker_failure_threshold(self) -> int:
+            return int(self._parent._get_number(NODE_CIRCUIT_BREAKER_FAILURE_THRESHOLD, default=5, minimum=0))
+
+        def _get_node_circuit_breaker_open_secs(self) -> float:
+            return self._parent._get_number(NODE_CIRCUIT_BREAKER_OPEN_SECS, default=10, minimum=0)
+
+        def _get_node_connection_limit(self) -> int:
+            return int(self._parent._get_number(NODE_CONNECTION_LIMIT, default=8, minimum=1))
+
+        def _get_node_keepalive_timeout_secs(self) -> float:
+            return self._parent._get_number(NODE_KEEPALIVE_TIMEOUT_SECS, default=30, minimum=0)
+
+        def _get_node_dns_cache_ttl_secs(self) -> float:
+            return self._parent._get_number(NODE_DNS_CACHE_TTL_SECS, default=300, minimum=0)
+
+        def _get_node_basic_info_cache_max_age_secs(self) -> float:
+            return self._parent._get_number(NODE_BASIC_INFO_CACHE_MAX_AGE_SECS, default=86400, minimum=0)
+
+        def _get_node_tapos_reference_max_age_secs(self) -> float:
+            setting_name = NODE_TAPOS_REFERENCE_MAX_AGE_SECS
+            value = self._parent._get_number(setting_name, default=60, minimum=0)
+            limit = HIVE_TAPOS_WINDOW_BLOCKS * HIVE_BLOCK_INTERVAL_SECONDS // 2
+            if value > limit:
+                details = f"Should be at most {limit} seconds, to stay safely inside the TaPoS validity window."
+                raise SettingsValueError(setting_name=setting_name, value=str(value), details=details)
+            return value
+
+    @dataclass
+    class _Storage(_Namespace):
+        @property
+        def save_coalesce_window_secs(self) -> float:
+            return self._get_storage_save_coalesce_window_secs()
+
+        @property
+        def save_max_backlog(self) -> int:
+            return self._get_storage_save_max_backlog()
+
+        def _get_storage_save_coalesce_window_secs(self) -> float:
+            return self._parent._get_number(STORAGE_SAVE_COALESCE_WINDOW_SECS, default=0, minimum=0)
+
+        def _get_storage_save_max_backlog(self) -> int:
+            return int(self._parent._get_number(STORAGE_SAVE_MAX_BACKLOG, default=8, minimum=1))
+
+    @dataclass
+    class _Wax(_Namespace):
+        @property
+        def offload_size_threshold(self) -> int:
+            return self._get_wax_offload_size_threshold()
+
+        @property
+        def cpu_workers(self) -> int:
+            """Number of CPU thread pool workers, 0 means it should be determined from the number of CPUs."""
+            return self._get_wax_cpu_workers()
+
+        def _get_wax_offload_size_threshold(self) -> int:
+            return int(self._parent._get_number(WAX_OFFLOAD_SIZE_THRESHOLD, default=16384, minimum=0))
+
+        def _get_wax_cpu_workers(self) -> int:
+            return int(self._parent._get_number(WAX_CPU_WORKERS, default=0, minimum=0))
+
     def __init__(self) -> None:
         self._namespaces: set[type[SafeSettings._Namespace]] = set()
         self.dev = self._create_namespace(self._Dev)
@@ -371,6 +558,8 @@ class SafeSettings:
         self.secrets = self._create_namespace(self._Secrets)
         self.beekeeper = self._create_namespace(self._Beekeeper)
         self.node = self._create_namespace(self._Node)
+        self.storage = self._create_namespace(self._Storage)
+        self.wax = self._create_namespace(self._Wax)
 
     @property
     def data_path(self) -> Path:
@@ -388,6 +577,10 @@ class SafeSettings:
     def default_bindings_path(self) -> Path:
         return self.data_path / "default_bindings.toml"
 
+    @property
+    def stylesheet_bundle_path(self) -> Path:
+        return self.data_path / "stylesheet_bundle.json"
+
     @property
     def max_number_of_tracked_accounts(self) -> int:
         return self._get_max_number_of_tracked_accounts()
@@ -3,6 +3,8 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import TYPE_CHECKING, get_args
 
+import msgspec
+
 from clive.__private.core.alarms.alarm_identifier import DateTimeAlarmIdentifier
 from clive.__private.core.alarms.specific_alarms.recovery_account_warning_listed import (
     RecoveryAccountWarningListedAlarmIdentifier,
@@ -13,11 +15,14 @@ from clive.__private.storage.current_model import ProfileStorageModel
 from clive.exceptions import CliveError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from clive.__private.core.accounts.accounts import TrackedAccount
     from clive.__private.core.alarms.alarm import AnyAlarm
     from clive.__private.core.alarms.alarm_identifier import AlarmIdentifier
     from clive.__private.core.keys import PublicKeyAliased
     from clive.__private.core.profile import Profile
+    from clive.__private.models.schemas import PreconfiguredBaseModel
 
 
 class AlarmIdentifierRuntimeToStorageConversionError(CliveError):
@@ -29,13 +34,55 @@ class RuntimeToStorageConverter:
         self._profile = profile
 
     def create_storage_model(self) -> ProfileStorageModel:
-        return ProfileStorageModel(
-            name=self._profile.name,
-            working_account=self._working_account_to_model_representation(),
+        return self._create_storage_model(
             tracked_accounts=self._tracked_accounts_to_model_container(),
             known_accounts=self._known_accounts_to_model_container(),
             key_aliases=self._key_aliases_to_model_container(),
             transaction=self._transaction_to_model(),
+        )
+
+    def create_storage_json(self) -> str:
+        """
+        Create the serialized storage model, encoding only the sections that changed since they were last encoded.
+
+        Only the small skeleton with profile settings is always encoded. Fragments of accounts, keys and transaction
+        are cached in the profile change journal and reused as long as their change markers stay the same.
+
+        Returns:
+            Serialized storage model, equivalent to the one created with `create_storage_model().json()`.
+        """
+        journal = self._profile.change_journal
+        markers = self._profile.change_markers
+
+        skeleton = self._create_storage_model(tracked_accounts=[], known_accounts=[], key_aliases=[], transaction=None)
+        content = msgspec.json.decode(skeleton.json(), type=dict[str, msgspec.Raw])
+
+        fragments: dict[str, tuple[str, Callable[[], bytes]]] = {
+            "tracked_accounts": ("accounts", self._encode_tracked_accounts),
+            "known_accounts": ("accounts", self._encode_known_accounts),
+            "key_aliases": ("keys", self._encode_key_aliases),
+            "transaction": ("transaction", self._encode_transaction),
+        }
+        for field_name, (section, encode) in fragments.items():
+            content[field_name] = msgspec.Raw(journal.get_fragment(field_name, markers[section], encode))
+
+        return msgspec.json.encode(content).decode()
+
+    def _create_storage_model(
+        self,
+        *,
+        tracked_accounts: list[ProfileStorageModel.TrackedAccountStorageModel],
+        known_accounts: list[str],
+        key_aliases: list[ProfileStorageModel.KeyAliasStorageModel],
+        transaction: ProfileStorageModel.TransactionStorageModel | None,
+    ) -> ProfileStorageModel:
+        return ProfileStorageModel(
+            name=self._profile.name,
+            working_account=self._working_account_to_model_representation(),
+            tracked_accounts=tracked_accounts,
+            known_accounts=known_accounts,
+            key_aliases=key_aliases,
+            transaction=transaction,
             chain_id=self._profile.chain_id,
             node_address=str(self._profile.node_address),
             tui_theme=self._profile.tui_theme,
@@ -58,19 +105,39 @@ class RuntimeToStorageConverter:
     def _key_aliases_to_model_container(self) -> list[ProfileStorageModel.KeyAliasStorageModel]:
         return [self._key_alias_to_model(key) for key in self._profile.keys]
 
-    def _transaction_to_model(self) -> ProfileStorageModel.TransactionStorageModel:
+    def _transaction_to_model(self, *, copy: bool = True) -> ProfileStorageModel.TransactionStorageModel:
+        def copy_if_needed[T](value: T) -> T:
+            return deepcopy(value) if copy else value
+
         transaction_core = Transaction(
-            operations=deepcopy(self._profile.operation_representations),
+            operations=copy_if_needed(self._profile.operation_representations),
             ref_block_num=self._profile.transaction.ref_block_num,
             ref_block_prefix=self._profile.transaction.ref_block_prefix,
             expiration=self._profile.transaction.expiration,
-            extensions=deepcopy(self._profile.transaction.extensions),
-            signatures=deepcopy(self._profile.transaction.signatures),
+            extensions=copy_if_needed(self._profile.transaction.extensions),
+            signatures=copy_if_needed(self._profile.transaction.signatures),
         )
         return ProfileStorageModel.TransactionStorageModel(
             transaction_core=transaction_core, transaction_file_path=self._profile.transaction_file_path
         )
 
+    def _encode_tracked_accounts(self) -> bytes:
+        return self._encode_models(self._tracked_accounts_to_model_container())
+
+    def _encode_known_accounts(self) -> bytes:
+        return msgspec.json.encode(self._known_accounts_to_model_container())
+
+    def _encode_key_aliases(self) -> bytes:
+        return self._encode_models(self._key_aliases_to_model_container())
+
+    def _encode_transaction(self) -> bytes:
+        # encoded right away, so there is no need to copy the runtime transaction content
+        return self._transaction_to_model(copy=False).json().encode()
+
+    @staticmethod
+    def _encode_models(models: Sequence[PreconfiguredBaseModel]) -> bytes:
+        return b"[" + b",".join(model.json().encode() for model in models) + b"]"
+
     def _tracked_account_to_model(self, account: TrackedAccount) -> ProfileStorageModel.TrackedAccountStorageModel:
         alarms = [self._alarm_to_model(alarm) for alarm in account._alarms.all_alarms if alarm.has_identifier]
         return ProfileStorageModel.TrackedAccountStorageModel(name=account.name, alarms=alarms)
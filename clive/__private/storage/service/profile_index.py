@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.logger import logger
+from clive.__private.models.schemas import PreconfiguredBaseModel
+from clive.__private.storage.service.writer import atomic_write_text
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+type VersionResolver = Callable[[Path], int | None]
+
+PROFILE_INDEX_VERSION: Final[int] = 1
+RACY_CHANGE_WINDOW_NS: Final[int] = 2_000_000_000
+"""Directories changed that close to their scan could change again unnoticed, so they are always rescanned."""
+
+
+class ProfileIndexFileEntry(PreconfiguredBaseModel):
+    name: str
+    size: int
+    mtime_ns: int
+    storage_version: int | None = None
+
+
+class ProfileIndexDirectoryEntry(PreconfiguredBaseModel):
+    changed_ns: int
+    scanned_at_ns: int
+    files: list[ProfileIndexFileEntry] = []  # noqa: RUF012
+
+
+class ProfileIndexModel(PreconfiguredBaseModel):
+    index_version: int = PROFILE_INDEX_VERSION
+    storage_changed_ns: int = 0
+    storage_scanned_at_ns: int = 0
+    directories: dict[str, ProfileIndexDirectoryEntry] = {}  # noqa: RUF012
+    last_used_ns: dict[str, int] = {}  # noqa: RUF012
+
+
+class ProfileIndex:
+    """
+    Unencrypted index of the profile storage directory, so stored profiles can be listed without globbing the disk.
+
+    Holds only non-secret metadata: directory listing (file names, sizes, mtimes, storage versions) and the last time
+    each profile was used. It is validated against directory change timestamps - only directories whose timestamp
+    changed (or was too recent to be trusted) are rescanned, and the index file is rewritten only if anything changed.
+
+    Args:
+        storage_directory: Directory containing profile directories.
+        index_path: Path of the index file. Should not be placed inside the storage directory.
+        version_resolver: Resolves storage version of the profile file from its path.
+    """
+
+    def __init__(self, storage_directory: Path, index_path: Path, version_resolver: VersionResolver) -> None:
+        self._storage_directory = storage_directory
+        self._index_path = index_path
+        self._version_resolver = version_resolver
+        self._is_modified = False
+        self._model = self._read()
+
+    @property
+    def profile_directory_names(self) -> list[str]:
+        return list(self._model.directories)
+
+    def iter_file_paths(self) -> Iterator[Path]:
+        for directory_name, directory in self._model.directories.items():
+            for file in directory.files:
+                yield self._storage_directory / directory_name / file.name
+
+    def get_last_used_ns(self, profile_name: str) -> int | None:
+        return self._model.last_used_ns.get(profile_name)
+
+    def validate(self) -> None:
+        """Bring the index up to date with the storage directory, rescanning only what could have changed."""
+        storage_changed_ns = self._stat_changed_ns(self._storage_directory)
+        if storage_changed_ns is None:
+            self._set_directories({})
+            return
+
+        if not self._is_trusted(storage_changed_ns, self._model.storage_changed_ns, self._model.storage_scanned_at_ns):
+            self._rescan_storage_directory(storage_changed_ns)
+
+        for directory_name, directory in list(self._model.directories.items()):
+            changed_ns = self._stat_changed_ns(self._storage_directory / directory_name)
+            if changed_ns is None:
+                self._remove_directory(directory_name)
+            elif not self._is_trusted(changed_ns, directory.changed_ns, directory.scanned_at_ns):
+                self.rescan_directory(directory_name)
+
+    def rescan_directory(self, directory_name: str) -> None:
+        directory_path = self._storage_directory / directory_name
+        scanned_at_ns = time.time_ns()
+        changed_ns = self._stat_changed_ns(directory_path)
+        if changed_ns is None:
+            self._remove_directory(directory_name)
+            return
+
+        files: list[ProfileIndexFileEntry] = []
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                files.append(
+                    ProfileIndexFileEntry(
+                        name=entry.name,
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        storage_version=self._version_resolver(directory_path / entry.name),
+                    )
+                )
+        files.sort(key=lambda file: file.name)
+
+        previous = self._model.directories.get(directory_name)
+        if (
+            previous is None
+            or previous.changed_ns != changed_ns
+            or previous.files != files
+            or self._is_trusted(changed_ns, changed_ns, scanned_at_ns)
+        ):
+            # persist also when the entry becomes trusted, so next runs don't have to rescan it
+            self._is_modified = True
+        self._model.directories[directory_name] = ProfileIndexDirectoryEntry(
+            changed_ns=changed_ns, scanned_at_ns=scanned_at_ns, files=files
+        )
+
+    def mark_used(self, profile_name: str, used_ns: int | None = None) -> None:
+        self._model.last_used_ns[profile_name] = time.time_ns() if used_ns is None else used_ns
+        self._is_modified = True
+
+    def forget(self, profile_name: str) -> None:
+        if self._model.last_used_ns.pop(profile_name, None) is not None:
+            self._is_modified = True
+        self._remove_directory(profile_name)
+
+    def dump(self) -> str:
+        """Serialize the index to the content of the index file."""
+        return self._model.json()
+
+    def save_if_modified(self) -> None:
+        if not self._is_modified:
+            return
+
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self._index_path, self.dump())
+        except OSError as error:
+            # index is only an optimization, so failing to write it can't break any storage operation
+            logger.warning(f"Could not write profile index to {self._index_path}: {error}")
+        else:
+            self._is_modified = False
+
+    def _read(self) -> ProfileIndexModel:
+        try:
+            model = ProfileIndexModel.parse_builtins(json.loads(self._index_path.read_text()))
+        except FileNotFoundError:
+            model = None
+        except Exception as error:  # noqa: BLE001
+            logger.debug(f"Profile index at {self._index_path} is corrupted, rebuilding it. Reason: {error}")
+            model = None
+
+        if model is None or model.index_version != PROFILE_INDEX_VERSION:
+            self._is_modified = True
+            return ProfileIndexModel()
+        return model
+
+    def _rescan_storage_directory(self, storage_changed_ns: int) -> None:
+        scanned_at_ns = time.time_ns()
+        with os.scandir(self._storage_directory) as entries:
+            directory_names = {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+
+        for directory_name in set(self._model.directories) - directory_names:
+            self._remove_directory(directory_name)
+        for directory_name in directory_names - set(self._model.directories):
+            self.rescan_directory(directory_name)
+
+        if self._model.storage_changed_ns != storage_changed_ns or self._is_trusted(
+            storage_changed_ns, storage_changed_ns, scanned_at_ns
+        ):
+            self._is_modified = True
+        self._model.storage_changed_ns = storage_changed_ns
+        self._model.storage_scanned_at_ns = scanned_at_ns
+
+    def _set_directories(self, directories: dict[str, ProfileIndexDirectoryEntry]) -> None:
+        if self._model.directories != directories:
+            self._model.directories = directories
+            self._is_modified = True
+
+    def _remove_directory(self, directory_name: str) -> None:
+        if self._model.directories.pop(directory_name, None) is not None:
+            self._is_modified = True
+
+    @staticmethod
+    def _is_trusted(current_changed_ns: int, indexed_changed_ns: int, scanned_at_ns: int) -> bool:
+        return current_changed_ns == indexed_changed_ns and scanned_at_ns - indexed_changed_ns > RACY_CHANGE_WINDOW_NS
+
+    @staticmethod
+    def _stat_changed_ns(path: Path) -> int | None:
+        """
+        Get the timestamp of the last change of the directory.
+
+        Inode change time is taken into account too, because mtime alone can be restored by copying tools
+        (e.g. `shutil.copytree`), which would hide added or removed entries.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return max(stat.st_mtime_ns, stat.st_ctime_ns)
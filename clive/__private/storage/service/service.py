@@ -3,8 +3,9 @@ from __future__ import annotations
 import contextlib
 import re
 import shutil
+import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Final, Literal
+from typing import TYPE_CHECKING, ClassVar, Final, Literal
 
 from clive.__private.core.commands.abc.command_encryption import CommandRequiresUnlockedEncryptionWalletError
 from clive.__private.core.commands.decrypt import CommandDecryptError
@@ -19,6 +20,8 @@ from clive.__private.storage.service.exceptions import (
     ProfileDoesNotExistsError,
     ProfileEncryptionError,
 )
+from clive.__private.storage.service.profile_index import ProfileIndex
+from clive.__private.storage.service.writer import ProfileWriter
 from clive.__private.storage.storage_history import StorageHistory
 from clive.__private.storage.storage_to_runtime_converter import StorageToRuntimeConverter
 
@@ -44,6 +47,10 @@ class PersistentStorageService:
     PROFILE_FILENAME_SUFFIX: Final[str] = ".profile"
     PROFILE_VERSION_FILE_REGEX: Final[str] = r"^v(\d+)\.(profile|backup)$"
     FIRST_REVISION: Final[str] = "c600278a"
+    PROFILE_INDEX_FILENAME: Final[str] = "profiles_index.json"
+
+    _pending_index_updates: ClassVar[dict[str, int]] = {}
+    """Profiles used since the last index write, with the time they were used at."""
 
     ProfileFileTypes = Literal["profile", "backup", "all"]
 
@@ -79,12 +86,14 @@ class PersistentStorageService:
         """
         self._raise_if_profile_with_name_already_exists_on_first_save(profile)
         if not profile.should_be_saved:
-            logger.debug("Saving profile skipped... Looks like was explicitly skipped or hash didn't changed.")
+            logger.debug("Saving profile skipped... Looks like was explicitly skipped or nothing has changed.")
             return
 
-        profile_model = RuntimeToStorageConverter(profile).create_storage_model()
-        await self._save_profile_model(profile_model)
-        profile._update_hash_of_stored_profile()
+        # markers are captured before encoding, so changes made while saving will be picked up by the next save
+        markers = profile.change_markers
+        profile_json = RuntimeToStorageConverter(profile).create_storage_json()
+        await self._save_profile_json(profile.name, profile_json)
+        profile._mark_as_stored(markers)
 
     async def load_profile(self, profile_name: str) -> Profile:
         """
@@ -106,7 +115,8 @@ class PersistentStorageService:
         profile_storage_model = result.model
 
         profile = StorageToRuntimeConverter(profile_storage_model).create_profile()
-        profile._update_hash_of_stored_profile()
+        profile._mark_as_stored()
+        await self._update_profile_index(profile_name)
         return profile
 
     async def migrate(self, profile_name: str) -> MigrationStatus:
@@ -144,6 +154,10 @@ class PersistentStorageService:
         if profile_dir.exists():  # we can store only a legacy version of the profile
             shutil.rmtree(profile_dir)
 
+        index = cls._get_profile_index()
+        index.forget(profile_name)
+        index.save_if_modified()
+
     @classmethod
     def list_stored_profile_names(cls) -> list[str]:
         """
@@ -155,14 +169,30 @@ class PersistentStorageService:
         profile_names = {filepath.profile_name for filepath in cls._get_filepaths()}
         return sorted(profile_names)
 
+    @classmethod
+    def get_last_used_profile_name(cls) -> str | None:
+        """
+        Get name of the stored profile that was most recently loaded or saved.
+
+        Returns:
+            Name of the last used profile or None if there is no stored profile or none of them was used yet.
+        """
+        index = cls._get_profile_index()
+        last_used = {
+            profile_name: last_used_ns
+            for profile_name in cls.list_stored_profile_names()
+            if (last_used_ns := index.get_last_used_ns(profile_name)) is not None
+        }
+        return max(last_used, key=lambda profile_name: last_used[profile_name]) if last_used else None
+
     @classmethod
     def is_profile_stored(cls, profile_name: str) -> bool:
         return profile_name in cls.list_stored_profile_names()
 
     @classmethod
-    def is_profile_file(cls, path: Path, *, file_type: ProfileFileTypes = "profile") -> bool:
+    def is_profile_file(cls, path: Path, *, file_type: ProfileFileTypes = "profile", check_exists: bool = True) -> bool:
         conditions: list[Callable[[], bool]] = [
-            lambda: path.is_file(),
+            lambda: not check_exists or path.is_file(),
             lambda: path.suffix in cls._get_suffixes_for_file_type(file_type),
             lambda: cls.get_version_from_profile_file(path) is not None,
         ]
@@ -220,6 +250,49 @@ class PersistentStorageService:
     def _get_storage_directory(cls) -> Path:
         return safe_settings.data_path / "data"
 
+    @classmethod
+    def _get_profile_index_path(cls) -> Path:
+        # placed outside the storage directory, so writing the index doesn't change the storage directory mtime
+        return safe_settings.data_path / cls.PROFILE_INDEX_FILENAME
+
+    @classmethod
+    def _get_profile_index(cls) -> ProfileIndex:
+        """Get the profile index validated against the storage directory, rebuilding outdated parts if needed."""
+        index = ProfileIndex(cls._get_storage_directory(), cls._get_profile_index_path(), cls._get_storage_version)
+        index.validate()
+        index.save_if_modified()
+        return index
+
+    @classmethod
+    async def _update_profile_index(cls, profile_name: str) -> None:
+        """
+        Record the profile as used in the index.
+
+        Index is written through the `ProfileWriter`, so updates arriving while the index is being written are merged
+        into a single write. The content is rendered when the write starts, so no merged update is lost.
+        """
+        cls._pending_index_updates[profile_name] = time.time_ns()
+        try:
+            await ProfileWriter.get_instance().write(cls._get_profile_index_path(), "", cls._render_profile_index)
+        except OSError as error:
+            # index is only an optimization, so failing to write it can't break any storage operation
+            logger.warning(f"Could not write profile index: {error}")
+
+    @classmethod
+    async def _render_profile_index(cls, _: str) -> str:
+        index = ProfileIndex(cls._get_storage_directory(), cls._get_profile_index_path(), cls._get_storage_version)
+        pending_updates, cls._pending_index_updates = cls._pending_index_updates, {}
+        for profile_name, used_ns in pending_updates.items():
+            index.rescan_directory(profile_name)
+            index.mark_used(profile_name, used_ns)
+        return index.dump()
+
+    @classmethod
+    def _get_storage_version(cls, path: Path) -> int | None:
+        if path.parent.name == cls.FIRST_REVISION:
+            return 0
+        return cls.get_version_from_profile_file(path)
+
     @classmethod
     def _get_profile_filepath_to_read(cls, profile_name: str) -> Path | None:
         filepaths = cls._get_filepaths(profile_name)
@@ -241,6 +314,8 @@ class PersistentStorageService:
         """
         Retrieve file paths of profiles stored on the disk.
 
+        Files are enumerated from the profile index instead of globbing the storage directory.
+
         If include_impossible_to_load=False, it will retrieve only profiles that
         we have a corresponding version of model for.
         It means any newer versions won't be picked up. (Like we're on v2, but there is v3.profile)
@@ -253,11 +328,10 @@ class PersistentStorageService:
         Returns:
             A set of objects containing information about the stored profiles.
         """
-        storage_dir = cls._get_storage_directory()
         paths: set[PersistentStorageService.ProfileFileInfo] = set()
 
-        for path in storage_dir.glob("*/*"):
-            if not cls.is_profile_file(path, file_type=file_type):
+        for path in cls._get_profile_index().iter_file_paths():
+            if not cls.is_profile_file(path, file_type=file_type, check_exists=False):
                 continue
 
             is_model_cls_available = cls._is_model_cls_for_versioned_profile_file_available(path)
@@ -287,19 +361,43 @@ class PersistentStorageService:
             ProfileEncryptionError: If profile could not be saved e.g. due to beekeeper wallet being locked
                 or communication with beekeeper failed.
         """
-        profile_directory = self.get_profile_directory(profile_model.name)
+        await self._save_profile_json(profile_model.name, profile_model.json())
+
+    async def _save_profile_json(self, profile_name: str, profile_json: str) -> None:
+        """
+        Save already serialized profile model to the storage.
+
+        File is replaced atomically and saves arriving close to each other are merged into a single write,
+        see `ProfileWriter`.
+
+        Args:
+            profile_name: Name of the profile to be saved.
+            profile_json: Serialized profile model.
+
+        Raises:
+            ProfileEncryptionError: If profile could not be saved e.g. due to beekeeper wallet being locked
+                or communication with beekeeper failed.
+        """
+        profile_directory = self.get_profile_directory(profile_name)
 
         # create data directory if it doesn't exist
         profile_directory.mkdir(parents=True, exist_ok=True)
 
+        filepath = profile_directory / self.get_current_version_profile_filename()
+        await ProfileWriter.get_instance().write(filepath, profile_json, self._encrypt_profile_json)
+        await self._update_profile_index(profile_name)
+
+    @classmethod
+    async def flush_pending_writes(cls) -> None:
+        """Write all profiles waiting in the writer queue right away, should be called before shutdown."""
+        await ProfileWriter.get_instance().flush()
+
+    async def _encrypt_profile_json(self, profile_json: str) -> str:
         try:
-            encrypted_profile = await self._encryption_service.encrypt(profile_model.json())
+            return await self._encryption_service.encrypt(profile_json)
         except (CommandEncryptError, CommandRequiresUnlockedEncryptionWalletError) as error:
             raise ProfileEncryptionError from error
 
-        filepath = profile_directory / self.get_current_version_profile_filename()
-        filepath.write_text(encrypted_profile)
-
     async def _load_and_migrate_latest_profile_model(self, profile_name: str) -> _MigrationResult:
         """
         Find current version of profile storage model by name in the clive data directory or migrate older version.
@@ -417,4 +515,6 @@ class PersistentStorageService:
 
     @classmethod
     def _assert_path_is_profile_file(cls, path: Path, *, file_type: ProfileFileTypes = "profile") -> None:
-        assert cls.is_profile_file(path, file_type=file_type), f"Looks like {path} is not a profile file."
+        # existence is not checked, paths come from the profile index or are going to be accessed anyway
+        message = f"Looks like {path} is not a profile file."
+        assert cls.is_profile_file(path, file_type=file_type, check_exists=False), message
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from clive.__private.core._async import event_wait
+from clive.__private.logger import logger
+from clive.__private.settings import safe_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+
+type ContentEncoder = Callable[[str], Awaitable[str]]
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """
+    Replace the file content atomically, so it contains either the old or the new content, even after a crash.
+
+    Content is written to a temporary file in the same directory, flushed to the disk and then renamed over the target.
+
+    Args:
+        path: Path of the file to be replaced.
+        content: New content of the file.
+    """
+    file_descriptor, temporary_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temporary_path = Path(temporary_name)
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        temporary_path.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temporary_path.unlink()
+        raise
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist the rename in the directory entry. Not every platform allows opening a directory, so it's optional."""
+    with contextlib.suppress(OSError):
+        directory_descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
+
+
+@dataclass
+class _PendingWrite:
+    content: str
+    encode: ContentEncoder
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+    flush_requested: asyncio.Event = field(default_factory=asyncio.Event)
+    merged_saves: int = 1
+
+
+class ProfileWriter:
+    """
+    Writes profile files atomically, merging saves that arrive close to each other into a single encode + write.
+
+    Saves of the same file arriving within the coalescing window (or while the previous write of that file is still
+    in progress) are merged, so only the latest content is encoded and written. Every caller still awaits until
+    the content it requested (or a newer one) is on the disk, and gets the error if that write failed.
+
+    Args:
+        coalesce_window_secs: How long to wait for more saves after the first one before writing.
+        max_backlog: Maximum number of files with pending writes. When exceeded, all pending writes are flushed
+            right away instead of waiting for the coalescing window. It only limits how long saves are delayed,
+            callers are not blocked (there is no backpressure), the new save is still queued.
+    """
+
+    _INSTANCES: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, ProfileWriter]] = WeakKeyDictionary()
+
+    def __init__(self, *, coalesce_window_secs: float = 0, max_backlog: int = 8) -> None:
+        self._coalesce_window_secs = coalesce_window_secs
+        self._max_backlog = max_backlog
+        self._pending: dict[Path, _PendingWrite] = {}
+        self._locks: dict[Path, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def get_instance(cls) -> ProfileWriter:
+        """Get the writer bound to the currently running event loop, creating it with settings values if needed."""
+        loop = asyncio.get_running_loop()
+        instance = cls._INSTANCES.get(loop)
+        if instance is None:
+            instance = cls(
+                coalesce_window_secs=safe_settings.storage.save_coalesce_window_secs,
+                max_backlog=safe_settings.storage.save_max_backlog,
+            )
+            cls._INSTANCES[loop] = instance
+        return instance
+
+    @property
+    def pending_writes_amount(self) -> int:
+        return len(self._pending)
+
+    async def write(self, path: Path, content: str, encode: ContentEncoder) -> None:
+        """
+        Request writing the content to the file and wait until it (or a newer content) is written.
+
+        Args:
+            path: Path of the file to write.
+            content: Content to write, before encoding.
+            encode: Coroutine function encoding (e.g. encrypting) the content before it's written.
+        """
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        pending = self._pending.get(path)
+        if pending is not None:
+            pending.content = content
+            pending.encode = encode
+            pending.merged_saves += 1
+            pending.waiters.append(waiter)
+        else:
+            if len(self._pending) >= self._max_backlog:
+                logger.debug(f"Profile writer backlog limit ({self._max_backlog}) reached, flushing pending writes.")
+                self._request_flush()
+            pending = _PendingWrite(content=content, encode=encode, waiters=[waiter])
+            self._pending[path] = pending
+            self._start_task(self._write_pending(path, pending))
+
+        await waiter
+
+    async def flush(self) -> None:
+        """Write all pending content right away and wait until it's done."""
+        self._request_flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _request_flush(self) -> None:
+        for pending in self._pending.values():
+            pending.flush_requested.set()
+
+    def _start_task(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write_pending(self, path: Path, pending: _PendingWrite) -> None:
+        if self._coalesce_window_secs > 0:
+            await event_wait(pending.flush_requested, self._coalesce_window_secs)
+
+        async with self._get_lock(path):
+            # more saves could be merged while waiting for the previous write of this file
+            if self._pending.get(path) is pending:
+                del self._pending[path]
+
+            if pending.merged_saves > 1:
+                logger.debug(f"Merged {pending.merged_saves} saves of {path} into a single write.")
+
+            try:
+                encoded = await pending.encode(pending.content)
+                atomic_write_text(path, encoded)
+            except Exception as error:  # noqa: BLE001
+                self._resolve_waiters(pending, error)
+            except BaseException:
+                for waiter in pending.waiters:
+                    waiter.cancel()
+                raise
+            else:
+                self._resolve_waiters(pending)
+
+    def _get_lock(self, path: Path) -> asyncio.Lock:
+        lock = self._locks.get(path)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[path] = lock
+        return lock
+
+    @staticmethod
+    def _resolve_waiters(pending: _PendingWrite, error: Exception | None = None) -> None:
+        for waiter in pending.waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
@@ -3,17 +3,17 @@ from __future__ import annotations
 import asyncio
 import math
 import traceback
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import asynccontextmanager, contextmanager, suppress
 from typing import TYPE_CHECKING, Any, ClassVar, Final, cast, get_args
 
 import beekeepy.exceptions as bke
-from textual import on, work
+from textual import events, on, work
 from textual._context import active_app
 from textual.app import App
 from textual.await_complete import AwaitComplete
 from textual.notifications import Notification, Notify, SeverityLevel
 from textual.reactive import var
-from textual.worker import NoActiveWorker, WorkerCancelled, get_current_worker
+from textual.worker import NoActiveWorker, WorkerCancelled, WorkerFailed, get_current_worker
 
 from clive.__private.core.async_guard import AsyncGuard
 from clive.__private.core.constants.terminal import TERMINAL_HEIGHT, TERMINAL_WIDTH
@@ -30,12 +30,15 @@ from clive.__private.ui.forms.create_profile.profile_credentials_form_screen imp
 from clive.__private.ui.forms.create_profile.welcome_form_screen import WelcomeFormScreen
 from clive.__private.ui.get_css import get_relative_css_path
 from clive.__private.ui.help import Help
+from clive.__private.ui.refresh_scheduler import RefreshScheduler
 from clive.__private.ui.screens.dashboard import Dashboard
 from clive.__private.ui.screens.quit import Quit
 from clive.__private.ui.screens.settings import Settings
 from clive.__private.ui.screens.settings.switch_node_address import SwitchNodeAddress
 from clive.__private.ui.screens.transaction_summary import TransactionSummary
 from clive.__private.ui.screens.unlock import Unlock
+from clive.__private.ui.snapshot_engine import SnapshotEngine
+from clive.__private.ui.stylesheet_bundle import BundledStylesheet
 from clive.__private.ui.tui_world import TUIWorld
 from clive.__private.ui.types import CliveModes
 from clive.exceptions import ScreenNotFoundError
@@ -120,6 +123,7 @@ class Clive(App[int]):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
+        self.stylesheet = BundledStylesheet(variables=self.get_css_variables())
         self._world: TUIWorld | None = None
 
         self._screen_remove_guard = AsyncGuard()
@@ -134,6 +138,12 @@ class Clive(App[int]):
         self.custom_bindings = self._load_bindings_from_file()
         self.update_keymap(self.custom_bindings.keymap)
 
+        self._refresh_scheduler = RefreshScheduler()
+        self._refresh_scheduler_task: asyncio.Task[None] | None = None
+        self._snapshot_engine = SnapshotEngine(
+            on_trigger=lambda: self._refresh_scheduler.trigger(self._NODE_DATA_WORKER_GROUP_NAME)
+        )
+
     @property
     def world(self) -> TUIWorld:
         assert self._world is not None, "World is not set yet."
@@ -146,6 +156,16 @@ class Clive(App[int]):
         assert mode in modes, f"Mode {mode} is not in the list of modes: {modes}"
         return cast("CliveModes", mode)
 
+    @property
+    def snapshot_engine(self) -> SnapshotEngine:
+        """Gathers updates of data providers, fetched together with the node data."""
+        return self._snapshot_engine
+
+    @property
+    def refresh_wakeups_per_minute(self) -> float:
+        """How many times per minute periodic refreshes woke up the app recently."""
+        return self._refresh_scheduler.wakeups_per_minute
+
     @staticmethod
     def app_instance() -> Clive:
         return cast("Clive", active_app.get())
@@ -265,18 +285,24 @@ class Clive(App[int]):
         self._world = await TUIWorld().setup()
 
     async def on_mount(self) -> None:
-        self._refresh_node_data_interval = self.set_interval(
-            safe_settings.node.refresh_rate_secs, self._retrigger_update_data_from_node, pause=True
+        self._refresh_scheduler.add_job(
+            self._NODE_DATA_WORKER_GROUP_NAME,
+            self._retrigger_update_data_from_node,
+            interval_secs=safe_settings.node.refresh_rate_secs,
         )
-        self._refresh_alarms_data_interval = self.set_interval(
-            safe_settings.node.refresh_alarms_rate_secs, self._retrigger_update_alarms_data, pause=True
+        self._refresh_scheduler.add_job(
+            self._ALARMS_DATA_WORKER_GROUP_NAME,
+            self._retrigger_update_alarms_data,
+            interval_secs=safe_settings.node.refresh_alarms_rate_secs,
+            after=self._NODE_DATA_WORKER_GROUP_NAME,
         )
-
-        self._refresh_beekeeper_wallet_lock_status_interval = self.set_interval(
-            safe_settings.beekeeper.refresh_timeout_secs,
+        self._refresh_scheduler.add_job(
+            self._WALLET_LOCK_STATUS_WORKER_GROUP_NAME,
             self._retrigger_update_wallet_lock_status_from_beekeeper,
-            pause=True,
+            interval_secs=safe_settings.beekeeper.refresh_timeout_secs,
+            is_adaptive=False,  # wallet lock should be detected on time, no matter the activity
         )
+        self._refresh_scheduler_task = asyncio.create_task(self._refresh_scheduler.run(), name="refresh_scheduler")
         self.watch(self.world, "profile_reactive", self.save_profile_in_worker)
         self.watch(self, "theme", self._update_theme_in_profile)
 
@@ -287,7 +313,24 @@ class Clive(App[int]):
 
         await self._switch_to_initial_mode()
 
+    async def on_event(self, event: events.Event) -> None:
+        if isinstance(event, events.Key | events.MouseDown | events.MouseScrollUp | events.MouseScrollDown):
+            self._refresh_scheduler.notify_activity()
+        await super().on_event(event)
+
+    @on(events.AppFocus)
+    def _resume_refresh_rate_on_app_focus(self) -> None:
+        self._refresh_scheduler.notify_focus_changed(is_focused=True)
+
+    @on(events.AppBlur)
+    def _back_off_refresh_rate_on_app_blur(self) -> None:
+        self._refresh_scheduler.notify_focus_changed(is_focused=False)
+
     async def on_unmount(self) -> None:
+        if self._refresh_scheduler_task is not None:
+            self._refresh_scheduler_task.cancel()
+        self._refresh_scheduler.cancel_running()
+
         if self._world is not None:
             # There might be an exception during world setup and therefore world might not be available.
             # Then when accessing self.world, it will raise an exception which will hide the original one.
@@ -364,25 +407,29 @@ class Clive(App[int]):
         self.push_screen(SwitchNodeAddressDialog())
 
     def pause_refresh_alarms_data_interval(self) -> None:
-        self._refresh_alarms_data_interval.pause()
+        self._refresh_scheduler.pause(self._ALARMS_DATA_WORKER_GROUP_NAME)
         self.workers.cancel_group(self, self._ALARMS_DATA_WORKER_GROUP_NAME)
 
     def resume_refresh_alarms_data_interval(self) -> None:
-        self._refresh_alarms_data_interval.resume()
+        self._refresh_scheduler.resume(self._ALARMS_DATA_WORKER_GROUP_NAME)
 
     def pause_refresh_node_data_interval(self) -> None:
-        self._refresh_node_data_interval.pause()
+        self._refresh_scheduler.pause(self._NODE_DATA_WORKER_GROUP_NAME)
         self.workers.cancel_group(self, self._NODE_DATA_WORKER_GROUP_NAME)
 
     def resume_refresh_node_data_interval(self) -> None:
-        self._refresh_node_data_interval.resume()
+        self._refresh_scheduler.resume(self._NODE_DATA_WORKER_GROUP_NAME)
 
     async def pause_refresh_beekeeper_wallet_lock_status_interval(self) -> None:
-        self._refresh_beekeeper_wallet_lock_status_interval.pause()
+        self._refresh_scheduler.pause(self._WALLET_LOCK_STATUS_WORKER_GROUP_NAME)
         await self._wait_for_worker_group_except_current(self._WALLET_LOCK_STATUS_WORKER_GROUP_NAME)
 
     def resume_refresh_beekeeper_wallet_lock_status_interval(self) -> None:
-        self._refresh_beekeeper_wallet_lock_status_interval.resume()
+        self._refresh_scheduler.resume(self._WALLET_LOCK_STATUS_WORKER_GROUP_NAME)
+
+    def notify_transaction_broadcasted(self) -> None:
+        """Refresh data more often for a while, as the broadcasted transaction will change it soon."""
+        self._refresh_scheduler.notify_broadcast()
 
     async def pause_periodic_intervals(self) -> None:
         self.pause_refresh_node_data_interval()
@@ -429,8 +476,11 @@ class Clive(App[int]):
 
     @work(name="alarms data update worker", group=_ALARMS_DATA_WORKER_GROUP_NAME, exclusive=True)
     async def update_alarms_data(self) -> None:
-        while not self.world.profile.accounts.is_tracked_accounts_node_data_available:  # noqa: ASYNC110
-            await asyncio.sleep(0.1)
+        while not self.world.profile.accounts.is_tracked_accounts_node_data_available:
+            # alarms are calculated from node data, so wait until it's refreshed (instead of polling)
+            self._refresh_scheduler.trigger(self._NODE_DATA_WORKER_GROUP_NAME)
+            await self._refresh_scheduler.wait_for_completion(self._NODE_DATA_WORKER_GROUP_NAME)
+
         accounts = self.world.profile.accounts.tracked
         wrapper = await self.world.commands.update_alarms_data(accounts=accounts)
         if wrapper.error_occurred:
@@ -438,12 +488,23 @@ class Clive(App[int]):
             return
 
         self.trigger_profile_watchers()
+        self._refresh_scheduler.notify_completed(self._ALARMS_DATA_WORKER_GROUP_NAME)
 
     @work(name="node data update worker", group=_NODE_DATA_WORKER_GROUP_NAME, exclusive=True)
     async def update_data_from_node(self) -> None:
         accounts = self.world.profile.accounts.tracked  # accounts list gonna be empty, but dgpo will be refreshed
 
-        wrapper = await self.world.commands.update_node_data(accounts=accounts)
+        from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound  # noqa: PLC0415
+
+        # data of the pending providers is fetched in the same batch as node data
+        snapshot_round = SnapshotRound(self.world.node)
+        result = await self._snapshot_engine.run_round(
+            snapshot_round, self.world.commands.update_node_data(accounts=accounts, snapshot_round=snapshot_round)
+        )
+        if isinstance(result, BaseException):
+            raise result
+
+        wrapper = result
         if wrapper.error_occurred:
             error = wrapper.error
             if isinstance(error, bke.CommunicationError) and error.response is None:
@@ -455,10 +516,13 @@ class Clive(App[int]):
 
         self.trigger_profile_watchers()
         self.trigger_node_watchers()
+        self._refresh_scheduler.notify_completed(self._NODE_DATA_WORKER_GROUP_NAME)
 
     @work(name="beekeeper wallet lock status update worker", group=_WALLET_LOCK_STATUS_WORKER_GROUP_NAME)
     async def update_wallet_lock_status_from_beekeeper(self) -> None:
-        await self.world.commands.sync_state_with_beekeeper("beekeeper_wallet_lock_status_update_worker")
+        await self.world.commands.sync_state_with_beekeeper(
+            "beekeeper_wallet_lock_status_update_worker", only_when_poll_due=True
+        )
 
     def switch_mode_with_reset(self, new_mode: CliveModes) -> AwaitComplete:
         """
@@ -591,6 +655,7 @@ class Clive(App[int]):
         logger.debug(f"Current mode: {self.current_mode}")
         logger.debug(f"Screen stack: {self.screen_stack}")
         logger.debug(f"Screen stacks: {self._screen_stacks}")
+        logger.debug(f"Refresh wakeups per minute: {self.refresh_wakeups_per_minute}")
 
         if self.world.is_node_available:
             cached_dgpo = self.world.node.cached.dynamic_global_properties_or_none
@@ -622,17 +687,24 @@ class Clive(App[int]):
     def is_worker_group_empty(self, group: str) -> bool:
         return not bool([worker for worker in self.workers if worker.group == group])
 
-    def _retrigger_update_data_from_node(self) -> None:
-        if self.is_worker_group_empty(self._NODE_DATA_WORKER_GROUP_NAME):
-            self.update_data_from_node()
+    async def _retrigger_update_data_from_node(self) -> None:
+        while self.is_worker_group_empty(self._NODE_DATA_WORKER_GROUP_NAME):
+            await self._wait_for_refresh_worker(self.update_data_from_node())
+            if not self._snapshot_engine.is_update_requested:
+                break  # otherwise some provider requested update during the refresh, serve it right away
 
-    def _retrigger_update_alarms_data(self) -> None:
+    async def _retrigger_update_alarms_data(self) -> None:
         if self.is_worker_group_empty(self._ALARMS_DATA_WORKER_GROUP_NAME):
-            self.update_alarms_data()
+            await self._wait_for_refresh_worker(self.update_alarms_data())
 
-    def _retrigger_update_wallet_lock_status_from_beekeeper(self) -> None:
+    async def _retrigger_update_wallet_lock_status_from_beekeeper(self) -> None:
         if self.is_worker_group_empty(self._WALLET_LOCK_STATUS_WORKER_GROUP_NAME):
-            self.update_wallet_lock_status_from_beekeeper()
+            await self._wait_for_refresh_worker(self.update_wallet_lock_status_from_beekeeper())
+
+    async def _wait_for_refresh_worker(self, worker: Worker[None]) -> None:
+        # cancellation (e.g. when locking) is expected and failures are already handled by Textual
+        with suppress(WorkerCancelled, WorkerFailed):
+            await worker.wait()
 
     async def _switch_to_initial_mode(self) -> None:
         if not Profile.is_any_profile_saved():
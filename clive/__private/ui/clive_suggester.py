@@ -1,26 +1,60 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar
 
-from textual.suggester import SuggestFromList
+from textual.suggester import Suggester
+
+from clive.__private.core.suggestion_index import SuggestionIndex
+from clive.__private.logger import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Callable, Iterable
+
+type SuggestionSource = Callable[[str], Awaitable[Iterable[str]]]
+"""Asynchronous source of additional suggestions for given prefix, asked when none of the local ones match."""
 
 
-class CliveSuggester(SuggestFromList):
+class CliveSuggester(Suggester):
     """
     Suggester that can track the position of suggestion selection.
 
     Can be used mainly for CliveInput - to switch between suggestions by user action.
 
+    Suggestions are kept in a prefix index, so matching them on every keystroke doesn't require a scan of all of
+    them. Matches are ordered alphabetically (not in the order suggestions were added), with the ones recorded
+    as used (see `record_use`) first. Textual's cache is disabled because the suggestion for the same value changes
+    with the selection position.
+
     Args:
         suggestions: Initial suggestions to fill the suggester with.
+        source: Optional asynchronous source asked when no local suggestion matches. Its results are cached and a
+            lookup that is still in progress is cancelled when a newer one starts.
+        source_debounce_secs: How long the value has to stay unchanged before the source is asked, so it's not
+            asked on every keystroke while typing. Defaults to `SOURCE_DEBOUNCE_SECS`.
     """
 
-    def __init__(self, suggestions: Iterable[str] | None = None) -> None:
-        super().__init__(suggestions or [])
-        self.cache = None
+    MAX_MATCHES: ClassVar[int] = 100
+    """Maximum number of matches that can be switched between."""
+
+    SOURCE_CACHE_SIZE: ClassVar[int] = 64
+
+    SOURCE_DEBOUNCE_SECS: ClassVar[float] = 0.3
+
+    def __init__(
+        self,
+        suggestions: Iterable[str] | None = None,
+        *,
+        source: SuggestionSource | None = None,
+        source_debounce_secs: float | None = None,
+    ) -> None:
+        super().__init__(use_cache=False, case_sensitive=True)
+        self._suggestion_index = SuggestionIndex(suggestions or [], case_sensitive=self.case_sensitive)
+        self._source = source
+        self._source_debounce_secs = self.SOURCE_DEBOUNCE_SECS if source_debounce_secs is None else source_debounce_secs
+        self._source_cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._source_lookup: asyncio.Task[list[str] | None] | None = None
         self._matched: list[str] = []
         self._index: int = 0
 
@@ -31,19 +65,22 @@ class CliveSuggester(SuggestFromList):
         return None
 
     def add_suggestion(self, *suggestions: str) -> None:
-        self._suggestions.extend(suggestion for suggestion in suggestions if suggestion not in self._suggestions)
-        self._for_comparison = (
-            self._suggestions if self.case_sensitive else [suggestion.casefold() for suggestion in self._suggestions]
-        )
+        self._suggestion_index.add(*suggestions)
 
     def clear_suggestions(self) -> None:
-        self._suggestions.clear()
-        self._for_comparison.clear()
+        self._suggestion_index.clear()
+        self._source_cache.clear()
         self._matched.clear()
         self.reset_selection()
 
+    def record_use(self, suggestion: str) -> None:
+        """Rank the suggestion higher from now on, e.g. after it was accepted by the user."""
+        self._suggestion_index.record_use(suggestion)
+
     async def get_suggestion(self, value: str) -> str | None:
-        new_matches = self._match(value)
+        new_matches = await self._match(value)
+        if new_matches is None:
+            return None  # superseded by the lookup for a newer value, which will update the state
 
         if not new_matches:
             self._matched = []
@@ -68,7 +105,50 @@ class CliveSuggester(SuggestFromList):
     def reset_selection(self) -> None:
         self._index = 0
 
-    def _match(self, value: str) -> list[str]:
-        return [
-            self._suggestions[i] for i, suggestion in enumerate(self._for_comparison) if suggestion.startswith(value)
-        ]
+    async def _match(self, value: str) -> list[str] | None:
+        if self._source_lookup is not None:
+            self._source_lookup.cancel()  # user kept typing, result for the previous value is no longer needed
+
+        matches = self._suggestion_index.find(value, limit=self.MAX_MATCHES)
+        if matches or self._source is None:
+            return matches
+        return await self._lookup_source(value)
+
+    async def _lookup_source(self, value: str) -> list[str] | None:
+        cached = self._source_cache.get(value)
+        if cached is not None:
+            self._source_cache.move_to_end(value)
+            return cached
+
+        lookup = asyncio.create_task(self._call_source(value))
+        self._source_lookup = lookup
+        try:
+            matches = await lookup
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            if current_task is not None and current_task.cancelling():
+                raise
+            return None
+        finally:
+            if self._source_lookup is lookup:
+                self._source_lookup = None
+
+        if matches is None:
+            return []  # failed lookup is not cached, so it can be retried
+        self._source_cache[value] = matches
+        if len(self._source_cache) > self.SOURCE_CACHE_SIZE:
+            self._source_cache.popitem(last=False)
+        return matches
+
+    async def _call_source(self, value: str) -> list[str] | None:
+        assert self._source is not None, "Source should be checked before calling it."
+        if self._source_debounce_secs > 0:
+            # cancelled meanwhile if the user keeps typing, so the source is asked only for the final value
+            await asyncio.sleep(self._source_debounce_secs)
+
+        try:
+            suggestions = await self._source(value)
+        except Exception as error:  # noqa: BLE001
+            logger.debug(f"Suggestion source failed for `{value}`: {error}")
+            return None
+        return [suggestion for suggestion in suggestions if suggestion.startswith(value)][: self.MAX_MATCHES]
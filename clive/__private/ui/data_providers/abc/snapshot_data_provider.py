@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+
+from clive.__private.ui.data_providers.abc.data_provider import DataProvider
+
+if TYPE_CHECKING:
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
+
+
+class SnapshotDataProvider[ProviderContentT](DataProvider[ProviderContentT]):
+    """
+    Provider whose data is fetched in the snapshot round, together with the node data and other providers.
+
+    Periodic updates wait for the next node data refresh, explicit ones (`update`, `restart`) trigger it.
+    """
+
+    async def _update(self) -> None:
+        await self.app.snapshot_engine.request_update(self, trigger=True)
+
+    @abstractmethod
+    async def update_in_snapshot(self, snapshot_round: SnapshotRound) -> None:
+        """
+        Define the logic to update the provider data, with retrievals joining the given round.
+
+        Args:
+            snapshot_round: The round which should be passed to the retrieval commands.
+        """
+
+    def _update_if_not_ongoing(self) -> None:
+        name = self.get_worker_name()
+        if self.app.is_worker_group_empty(name):
+            self.run_worker(self._update_on_next_refresh(), name=name, group=name, exclusive=True)
+
+    async def _update_on_next_refresh(self) -> None:
+        await self.app.snapshot_engine.request_update(self, trigger=False)
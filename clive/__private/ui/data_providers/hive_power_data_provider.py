@@ -1,26 +1,63 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, ClassVar
+
 from textual.reactive import var
 
 from clive.__private.core.commands.data_retrieval.hive_power_data import HivePowerData
-from clive.__private.ui.data_providers.abc.data_provider import DataProvider
+from clive.__private.core.constants.data_retrieval import VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
+from clive.__private.ui.data_providers.abc.snapshot_data_provider import SnapshotDataProvider
 from clive.__private.ui.not_updated_yet import NotUpdatedYet
 
+if TYPE_CHECKING:
+    from textual.worker import Worker
+
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
+
+
+class HivePowerDataProvider(SnapshotDataProvider[HivePowerData]):
+    """
+    A class for retrieving information about hive power, with a single page of delegations sized to fit the screen.
+
+    Args:
+        paused: Whether the data provider is paused.
+        init_update: Whether to perform an initial update.
+    """
 
-class HivePowerDataProvider(DataProvider[HivePowerData]):
     _content: HivePowerData | NotUpdatedYet = var(NotUpdatedYet(), init=False)  # type: ignore[assignment]
 
+    DELEGATIONS_PAGE_SIZE: ClassVar[int] = VESTING_DELEGATIONS_PAGE_SIZE_DEFAULT
+
     def __init__(self, *, paused: bool = False, init_update: bool = True) -> None:
         super().__init__(paused=paused, init_update=init_update)
+        self.__delegations_page_no = 0
+
+    @property
+    def delegations_page_no(self) -> int:
+        return self.__delegations_page_no
 
-    async def _update(self) -> None:
+    async def update_in_snapshot(self, snapshot_round: SnapshotRound) -> None:
         account_name = self.profile.accounts.working.name
 
-        wrapper = await self.commands.retrieve_hp_data(account_name=account_name)
+        wrapper = await self.commands.retrieve_hp_data(
+            account_name=account_name,
+            delegations_page_no=self.__delegations_page_no,
+            delegations_page_size=self.DELEGATIONS_PAGE_SIZE,
+            snapshot_round=snapshot_round,
+        )
 
         if wrapper.error_occurred:
             self.notify("Failed to retrieve hive power data.", severity="error")
             return
 
         result = wrapper.result_or_raise
+        if not result.delegations and self.__delegations_page_no:
+            # delegations were removed in the meantime and the page is out of range
+            self.change_delegations_page(0)
+            return
+
         self._content = result
+
+    def change_delegations_page(self, page_no: int) -> Worker[None]:
+        self.__delegations_page_no = page_no
+        return self.update()
@@ -5,14 +5,16 @@ from typing import TYPE_CHECKING
 from textual.reactive import var
 
 from clive.__private.core.commands.data_retrieval.proposals_data import ProposalsData, ProposalsDataRetrieval
-from clive.__private.ui.data_providers.abc.data_provider import DataProvider
+from clive.__private.ui.data_providers.abc.snapshot_data_provider import SnapshotDataProvider
 from clive.__private.ui.not_updated_yet import NotUpdatedYet
 
 if TYPE_CHECKING:
     from textual.worker import Worker
 
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
 
-class ProposalsDataProvider(DataProvider[ProposalsData]):
+
+class ProposalsDataProvider(SnapshotDataProvider[ProposalsData]):
     _content: ProposalsData | NotUpdatedYet = var(NotUpdatedYet(), init=False)  # type: ignore[assignment]
 
     def __init__(self, *, paused: bool = False, init_update: bool = True) -> None:
@@ -21,12 +23,16 @@ class ProposalsDataProvider(DataProvider[ProposalsData]):
         self.__order_direction: ProposalsDataRetrieval.OrderDirections = ProposalsDataRetrieval.DEFAULT_ORDER_DIRECTION
         self.__status: ProposalsDataRetrieval.Statuses = ProposalsDataRetrieval.DEFAULT_STATUS
 
-    async def _update(self) -> None:
+    async def update_in_snapshot(self, snapshot_round: SnapshotRound) -> None:
         proxy = self.profile.accounts.working.data.proxy
         account_name = proxy if proxy else self.profile.accounts.working.name
 
         wrapper = await self.commands.retrieve_proposals_data(
-            account_name=account_name, order=self.__order, order_direction=self.__order_direction, status=self.__status
+            account_name=account_name,
+            order=self.__order,
+            order_direction=self.__order_direction,
+            status=self.__status,
+            snapshot_round=snapshot_round,
         )
 
         if wrapper.error_occurred:
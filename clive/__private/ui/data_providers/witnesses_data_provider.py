@@ -5,14 +5,16 @@ from typing import TYPE_CHECKING
 from textual.reactive import var
 
 from clive.__private.core.commands.data_retrieval.witnesses_data import WitnessesData, WitnessesDataRetrieval
-from clive.__private.ui.data_providers.abc.data_provider import DataProvider
+from clive.__private.ui.data_providers.abc.snapshot_data_provider import SnapshotDataProvider
 from clive.__private.ui.not_updated_yet import NotUpdatedYet
 
 if TYPE_CHECKING:
     from textual.worker import Worker
 
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
 
-class WitnessesDataProvider(DataProvider[WitnessesData]):
+
+class WitnessesDataProvider(SnapshotDataProvider[WitnessesData]):
     """
     A class for retrieving information about witnesses.
 
@@ -32,7 +34,7 @@ class WitnessesDataProvider(DataProvider[WitnessesData]):
         self.__mode: WitnessesDataRetrieval.Modes = WitnessesDataRetrieval.DEFAULT_MODE
         self.__witness_name_pattern: str | None = None
 
-    async def _update(self) -> None:
+    async def update_in_snapshot(self, snapshot_round: SnapshotRound) -> None:
         proxy = self.profile.accounts.working.data.proxy
         account_name = proxy if proxy else self.profile.accounts.working.name
 
@@ -41,6 +43,7 @@ class WitnessesDataProvider(DataProvider[WitnessesData]):
             mode=self.__mode,
             witness_name_pattern=self.__witness_name_pattern,
             search_by_pattern_limit=self.__search_by_pattern_limit,
+            snapshot_round=snapshot_round,
         )
 
         if wrapper.error_occurred:
@@ -63,24 +63,24 @@ class ModifyExpirationDialog(CliveActionDialog["timedelta | datetime | None"]):
         self._is_signed = is_signed
 
     def _get_head_block_time(self) -> datetime | None:
-        gdpo = self.node.cached.dynamic_global_properties_or_none
-        if gdpo is None:
+        # extrapolated by the chain clock, node data is refreshed less often than blocks are produced
+        if self.node.cached.dynamic_global_properties_or_none is None or not self.node.chain_clock.is_seeded:
             return None
-        return gdpo.time
+        return self.node.chain_clock.head_block_time
 
     def _get_head_block_time_text(self) -> str:
-        gdpo = self.node.cached.dynamic_global_properties_or_none
-        if gdpo is None:
+        head_block_time = self._get_head_block_time()
+        if head_block_time is None:
             return f"Head block time: {NOT_AVAILABLE_LABEL}"
-        return f"Head block time: {humanize_datetime(gdpo.time)}"
+        return f"Head block time: {humanize_datetime(head_block_time)}"
 
     @staticmethod
     def _format_expiration_label(abs_time: datetime, remaining: timedelta) -> str:
         return f"Expiration: {humanize_datetime(abs_time)}, {humanize_natural_time(-remaining)}"
 
     def _get_expiration_info_text(self) -> str:
-        gdpo = self.node.cached.dynamic_global_properties_or_none
-        if gdpo is None:
+        head_block_time = self._get_head_block_time()
+        if head_block_time is None:
             return f"Expiration: {NOT_AVAILABLE_LABEL}"
 
         expiration_value = self._expiration_value
@@ -91,14 +91,14 @@ class ModifyExpirationDialog(CliveActionDialog["timedelta | datetime | None"]):
             pass
 
         if isinstance(expiration_value, datetime):
-            return self._format_expiration_label(expiration_value, expiration_value - gdpo.time)
+            return self._format_expiration_label(expiration_value, expiration_value - head_block_time)
 
         if self._is_signed:
-            ref = gdpo.time
+            ref = head_block_time
         else:
-            ref = self._metadata_block_time if self._metadata_block_time is not None else gdpo.time
+            ref = self._metadata_block_time if self._metadata_block_time is not None else head_block_time
         abs_time = ref + expiration_value
-        return self._format_expiration_label(abs_time, abs_time - gdpo.time)
+        return self._format_expiration_label(abs_time, abs_time - head_block_time)
 
     def on_mount(self) -> None:
         self.set_interval(3, self._refresh_expiration_info)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from clive.__private.ui.stylesheet_bundle import StylesheetBundle
+
 
 def get_relative_css_path(file_path: str | Path, *, name: str = "") -> Path:
     """
@@ -30,6 +32,9 @@ def get_css_from_relative_path(file_path: str | Path, *, name: str = "") -> str:
     """
     Get the css from file. For more info check `get_relative_css_path`.
 
+    Content is taken from the stylesheet bundle once it's prepared at the app start. Before that, or when the file is
+    not bundled or changed since then, the file is read.
+
     Args:
         file_path: The path to the file next to which the css file is located.
         name: Explicit name of the css file.
@@ -37,4 +42,7 @@ def get_css_from_relative_path(file_path: str | Path, *, name: str = "") -> str:
     Returns:
         The content of the css file.
     """
-    return get_relative_css_path(file_path, name=name).read_text()
+    css_path = get_relative_css_path(file_path, name=name)
+    bundle = StylesheetBundle.get_prepared()
+    css = bundle.get(css_path) if bundle is not None else None
+    return css if css is not None else css_path.read_text()
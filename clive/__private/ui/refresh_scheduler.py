@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, Final
+
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+WAKEUPS_WINDOW_SECS: Final[float] = 60.0
+
+
+@dataclass(kw_only=True)
+class RefreshJob:
+    """
+    Periodic refresh registered in the `RefreshScheduler`.
+
+    Args:
+        name: Unique name of the job.
+        callback: Performs the refresh, awaited by the scheduler.
+        interval_secs: Base interval between refreshes.
+        after: Name of the job this one depends on. Such job is not run by its own timer - when its interval
+            elapses it's only marked as due and is run right after the data of the job it depends on is refreshed.
+        is_adaptive: Whether the interval should be adapted to the app activity (e.g. backed off while idle).
+    """
+
+    name: str
+    callback: Callable[[], Awaitable[None]]
+    interval_secs: float
+    after: str | None = None
+    is_adaptive: bool = True
+    is_paused: bool = True
+    is_due: bool = False
+    next_run_at: float = 0.0
+    running: asyncio.Task[None] | None = None
+    completed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def is_running(self) -> bool:
+        return self.running is not None and not self.running.done()
+
+
+class RefreshScheduler:
+    """
+    Runs periodic refreshes of the app from a single loop, sleeping until the nearest one is due.
+
+    Readiness of refreshed data is signalled with `notify_completed` and can be awaited with `wait_for_completion`
+    instead of polling. Jobs depending on another one are run immediately after its data is refreshed.
+    Intervals of adaptive jobs are backed off while the app is idle or unfocused and tightened for a while after
+    a transaction is broadcasted (when changes on the chain are expected soon).
+
+    Args:
+        clock: Source of monotonic time, in seconds.
+    """
+
+    IDLE_AFTER_SECS: ClassVar[float] = 60.0
+    """Time without user activity after which the app is considered idle."""
+
+    IDLE_BACKOFF_FACTOR: ClassVar[float] = 4.0
+    """Multiplier of adaptive intervals while the app is idle or unfocused."""
+
+    BROADCAST_BOOST_SECS: ClassVar[float] = 30.0
+    """How long intervals stay tightened after a broadcast."""
+
+    BROADCAST_BOOST_FACTOR: ClassVar[float] = 0.5
+    """Multiplier of adaptive intervals after a broadcast."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._jobs: dict[str, RefreshJob] = {}
+        self._wakeup = asyncio.Event()
+        self._wakeups: deque[float] = deque()
+        self._last_activity_at = clock()
+        self._is_focused = True
+        self._boosted_until = 0.0
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._is_focused or self._clock() - self._last_activity_at >= self.IDLE_AFTER_SECS
+
+    @property
+    def is_boosted(self) -> bool:
+        return self._clock() < self._boosted_until
+
+    @property
+    def wakeups_per_minute(self) -> float:
+        """Number of scheduler wakeups during the last minute, a measure of the idle CPU cost of refreshing."""
+        self._forget_old_wakeups()
+        return float(len(self._wakeups))
+
+    def add_job(
+        self,
+        name: str,
+        callback: Callable[[], Awaitable[None]],
+        *,
+        interval_secs: float,
+        after: str | None = None,
+        is_adaptive: bool = True,
+    ) -> None:
+        assert name not in self._jobs, f"Job {name} is already registered."
+        assert after is None or after in self._jobs, f"Job {after} should be registered before its dependents."
+        self._jobs[name] = RefreshJob(
+            name=name, callback=callback, interval_secs=interval_secs, after=after, is_adaptive=is_adaptive
+        )
+
+    def get_interval(self, name: str) -> float:
+        """Get the current, adapted interval of the job."""
+        job = self._jobs[name]
+        if not job.is_adaptive:
+            return job.interval_secs
+        if self.is_boosted:
+            return job.interval_secs * self.BROADCAST_BOOST_FACTOR
+        if self.is_idle:
+            return job.interval_secs * self.IDLE_BACKOFF_FACTOR
+        return job.interval_secs
+
+    def pause(self, *names: str) -> None:
+        for job in self._get_jobs(names):
+            job.is_paused = True
+            job.is_due = False
+
+    def resume(self, *names: str) -> None:
+        now = self._clock()
+        for job in self._get_jobs(names):
+            if job.is_paused:
+                job.is_paused = False
+                job.next_run_at = now + self.get_interval(job.name)
+        self._wake_up()
+
+    def trigger(self, name: str) -> None:
+        """Run the job as soon as possible, even if it's paused."""
+        self._start(self._jobs[name])
+
+    def notify_completed(self, name: str) -> None:
+        """Signal that data refreshed by the job is ready and run jobs which were waiting for it."""
+        job = self._jobs[name]
+        job.completed.set()
+        job.completed = asyncio.Event()
+
+        for dependent in self._jobs.values():
+            if dependent.after == name and dependent.is_due and not dependent.is_paused:
+                dependent.is_due = False
+                self._start(dependent)
+
+    async def wait_for_completion(self, name: str) -> None:
+        """Wait until the data of the job is refreshed next time."""
+        await self._jobs[name].completed.wait()
+
+    def notify_activity(self) -> None:
+        """Mark user activity, so the app is not considered idle anymore."""
+        was_idle = self.is_idle
+        self._last_activity_at = self._clock()
+        if was_idle:
+            self._reschedule()
+
+    def notify_focus_changed(self, *, is_focused: bool) -> None:
+        self._is_focused = is_focused
+        self._reschedule()
+
+    def notify_broadcast(self) -> None:
+        """Tighten intervals, as the broadcasted transaction will change the chain state soon."""
+        self._boosted_until = self._clock() + self.BROADCAST_BOOST_SECS
+        self._reschedule()
+
+    async def run(self) -> None:
+        """Run the scheduler loop until cancelled."""
+        while True:
+            now = self._clock()
+            for job in self._jobs.values():
+                if job.is_paused or now < job.next_run_at:
+                    continue
+
+                job.next_run_at = now + self.get_interval(job.name)
+                if job.after is not None:
+                    job.is_due = True  # will be run right after the data it depends on is refreshed
+                else:
+                    self._start(job)
+
+            await self._sleep_until_next_run()
+            self._wakeups.append(self._clock())
+            self._forget_old_wakeups()
+
+    def cancel_running(self) -> None:
+        """Cancel refreshes which are still ongoing, e.g. when the app is closing."""
+        for job in self._jobs.values():
+            if job.running is not None:
+                job.running.cancel()
+
+    async def _sleep_until_next_run(self) -> None:
+        next_run_at = min((job.next_run_at for job in self._jobs.values() if not job.is_paused), default=None)
+        self._wakeup.clear()
+        timeout = None if next_run_at is None else max(next_run_at - self._clock(), 0.0)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    def _start(self, job: RefreshJob) -> None:
+        if job.is_running:
+            return  # previous refresh is still ongoing, no need to stack them
+        job.running = asyncio.create_task(self._run_job(job), name=f"refresh_{job.name}")
+
+    async def _run_job(self, job: RefreshJob) -> None:
+        try:
+            await job.callback()
+        except Exception as error:  # noqa: BLE001
+            logger.error(f"Refresh job {job.name} failed: {error}")
+
+    def _reschedule(self) -> None:
+        """Recalculate next runs with current intervals, so changed conditions take effect without delay."""
+        now = self._clock()
+        for job in self._jobs.values():
+            if job.is_adaptive and not job.is_paused:
+                job.next_run_at = min(job.next_run_at, now + self.get_interval(job.name))
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        self._wakeup.set()
+
+    def _forget_old_wakeups(self) -> None:
+        window_start = self._clock() - WAKEUPS_WINDOW_SECS
+        while self._wakeups and self._wakeups[0] < window_start:
+            self._wakeups.popleft()
+
+    def _get_jobs(self, names: tuple[str, ...]) -> list[RefreshJob]:
+        return [self._jobs[name] for name in names] if names else list(self._jobs.values())
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from textual import on
+from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.widgets import Static, TabPane
 
@@ -14,7 +15,12 @@ from clive.__private.ui.dialogs.operation_summary.remove_delegation_dialog impor
 from clive.__private.ui.get_css import get_css_from_relative_path
 from clive.__private.ui.not_updated_yet import NotUpdatedYet
 from clive.__private.ui.screens.operations.bindings import OperationActionBindings
-from clive.__private.ui.widgets.buttons import CliveButton, OneLineButton
+from clive.__private.ui.widgets.buttons import (
+    CliveButton,
+    OneLineButton,
+    PageDownOneLineButton,
+    PageUpOneLineButton,
+)
 from clive.__private.ui.widgets.clive_basic import (
     CliveCheckerboardTable,
     CliveCheckerBoardTableCell,
@@ -23,7 +29,6 @@ from clive.__private.ui.widgets.clive_basic import (
 from clive.__private.ui.widgets.inputs.clive_validated_input import CliveValidatedInput
 from clive.__private.ui.widgets.inputs.hp_vests_amount_input import HPVestsAmountInput
 from clive.__private.ui.widgets.inputs.receiver_input import ReceiverInput
-from clive.__private.ui.widgets.place_taker import PlaceTaker
 from clive.__private.ui.widgets.scrolling import ScrollablePart
 from clive.__private.ui.widgets.section import Section
 from clive.__private.ui.widgets.transaction_buttons import TransactionButtons
@@ -36,11 +41,24 @@ if TYPE_CHECKING:
 
 
 class DelegationsTableHeader(Horizontal):
+    """Header of the `DelegationsTable`, with buttons switching pages of delegations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.button_up = PageUpOneLineButton()
+        self.button_down = PageDownOneLineButton()
+
     def compose(self) -> ComposeResult:
         yield Static("Delegate", classes=CLIVE_CHECKERBOARD_HEADER_CELL_CLASS_NAME)
         yield Static("Shares [HP]", classes=CLIVE_CHECKERBOARD_HEADER_CELL_CLASS_NAME)
         yield Static("Shares [VESTS]", classes=CLIVE_CHECKERBOARD_HEADER_CELL_CLASS_NAME)
-        yield PlaceTaker()
+        with Horizontal(id="delegations-page-buttons", classes=CLIVE_CHECKERBOARD_HEADER_CELL_CLASS_NAME):
+            yield self.button_up
+            yield self.button_down
+
+    def set_page_buttons_visibility(self, content: HivePowerData) -> None:
+        self.button_up.visible = content.delegations_page_no > 0
+        self.button_down.visible = content.has_more_delegations
 
 
 class Delegation(CliveCheckerboardTableRow):
@@ -70,16 +88,22 @@ class Delegation(CliveCheckerboardTableRow):
 
 
 class DelegationsTable(CliveCheckerboardTable):
-    """Table with delegations."""
+    """Table with delegations, shows a single page of them so only rows fitting the screen are rendered."""
 
+    BINDINGS = [
+        Binding("pageup", "previous_page", "PgUp"),
+        Binding("pagedown", "next_page", "PgDn"),
+    ]
     ATTRIBUTE_TO_WATCH = "_content"
     NO_CONTENT_TEXT = "You have no delegations"
 
     def __init__(self) -> None:
-        super().__init__(header=DelegationsTableHeader(), title="Current delegations", init_dynamic=False)
-        self._previous_delegations: list[VestingDelegation] | NotUpdatedYet = NotUpdatedYet()
+        self._delegations_header = DelegationsTableHeader()
+        super().__init__(header=self._delegations_header, title="Current delegations", init_dynamic=False)
+        self._previous_delegations: tuple[int, list[VestingDelegation]] | NotUpdatedYet = NotUpdatedYet()
 
     def create_dynamic_rows(self, content: HivePowerData) -> list[Delegation]:
+        self._delegations_header.set_page_buttons_visibility(content)
         aligned_hp, aligned_vests = content.get_delegations_aligned_amounts()
 
         return [
@@ -88,7 +112,7 @@ class DelegationsTable(CliveCheckerboardTable):
         ]
 
     def check_if_should_be_updated(self, content: HivePowerData) -> bool:
-        return self._previous_delegations != content.delegations
+        return self._previous_delegations != (content.delegations_page_no, content.delegations)
 
     def is_anything_to_display(self, content: HivePowerData) -> bool:
         return len(content.delegations) != 0
@@ -98,7 +122,21 @@ class DelegationsTable(CliveCheckerboardTable):
         return self.screen.query_exactly_one(HivePowerDataProvider)
 
     def update_previous_state(self, content: HivePowerData) -> None:
-        self._previous_delegations = content.delegations
+        self._previous_delegations = (content.delegations_page_no, content.delegations)
+
+    @on(PageDownOneLineButton.Pressed)
+    def action_next_page(self) -> None:
+        if not self.object_to_watch.is_content_set or not self.object_to_watch.content.has_more_delegations:
+            self.notify("No delegations on the next page", severity="warning")
+            return
+        self.object_to_watch.change_delegations_page(self.object_to_watch.delegations_page_no + 1)
+
+    @on(PageUpOneLineButton.Pressed)
+    def action_previous_page(self) -> None:
+        if self.object_to_watch.delegations_page_no <= 0:
+            self.notify("No delegations on the previous page", severity="warning")
+            return
+        self.object_to_watch.change_delegations_page(self.object_to_watch.delegations_page_no - 1)
 
 
 class DelegateHivePower(TabPane, OperationActionBindings):
@@ -7,6 +7,12 @@ from textual.reactive import reactive, var
 from textual.widgets import Label
 
 from clive.__private.core.formatters import humanize
+from clive.__private.core.transaction_sizing import (
+    OperationTooLargeError,
+    TransactionSplit,
+    calculate_max_transaction_size,
+    split_transaction,
+)
 from clive.__private.ui.clive_widget import CliveWidget
 from clive.__private.ui.widgets.buttons import OneLineButton, RefreshOneLineButton
 
@@ -94,6 +100,29 @@ class TransactionIdLabel(Label):
         return f"Transaction ID: {self.transaction_id}"
 
 
+class TransactionSizeLabel(Label):
+    """Label for displaying transaction size and the split, when operations don't fit in a single transaction."""
+
+    split: TransactionSplit | OperationTooLargeError = reactive(None, init=False)  # type: ignore[assignment]
+
+    def __init__(self, split: TransactionSplit | OperationTooLargeError) -> None:
+        super().__init__()
+        self.set_reactive(self.__class__.split, split)  # type: ignore[arg-type]
+
+    def render(self) -> str:
+        if isinstance(self.split, OperationTooLargeError):
+            return str(self.split)
+
+        if not self.split.is_split:
+            return f"Size: {self.split.total_size} B"
+
+        parts = ", ".join(f"{part.operations.start + 1}-{part.operations.stop}" for part in self.split.parts)
+        return (
+            f"Size: {self.split.total_size} B exceeds {self.split.max_size} B,"
+            f" operations fit in {len(self.split.parts)} transactions: {parts}"
+        )
+
+
 class UpdateMetadataButton(RefreshOneLineButton):
     def __init__(self) -> None:
         super().__init__("Update metadata", binding=self.custom_bindings.transaction_summary.update_metadata)
@@ -112,6 +141,7 @@ class TransactionMetadataContainer(Horizontal, CliveWidget):
             yield ExpirationHolder(self.profile.transaction.expiration)
             with Vertical(id="label-and-button-container"):
                 yield TransactionIdLabel(self.profile.transaction.calculate_transaction_id())
+                yield TransactionSizeLabel(self._split_transaction(self.profile.transaction))
                 yield Container(UpdateMetadataButton())
         else:
             yield Label("No operations in cart, can't calculate transaction metadata.", id="no-metadata")
@@ -137,3 +167,13 @@ class TransactionMetadataContainer(Horizontal, CliveWidget):
         tapos_holder.mutate_reactive(tapos_holder.__class__.transaction)  # type: ignore[arg-type]
         self.query_exactly_one(TransactionExpirationLabel).expiration = transaction.expiration
         self.query_exactly_one(TransactionIdLabel).transaction_id = transaction.calculate_transaction_id()
+        self.query_exactly_one(TransactionSizeLabel).split = self._split_transaction(transaction)
+
+    def _split_transaction(self, transaction: Transaction) -> TransactionSplit | OperationTooLargeError:
+        max_size = calculate_max_transaction_size(self.node.cached.dynamic_global_properties_or_none)
+        try:
+            return split_transaction(
+                transaction.operations_models, max_size=max_size, signatures_amount=max(len(transaction.signatures), 1)
+            )
+        except OperationTooLargeError as error:
+            return error
@@ -406,6 +406,7 @@ class TransactionSummary(BaseScreen):
             return
 
         self.notify(f"Transaction with ID '{transaction.calculate_transaction_id()}' successfully broadcasted!")
+        self.app.notify_transaction_broadcasted()
         self.profile.transaction.reset()
         self.profile.transaction_file_path = None
         self.app.trigger_profile_watchers()
@@ -7,7 +7,7 @@ import beekeepy.exceptions as bke
 from textual import on
 from textual.containers import Horizontal
 from textual.validation import Integer
-from textual.widgets import Button, Checkbox, Static
+from textual.widgets import Button, Checkbox, Select, Static
 
 from clive.__private.core.constants.tui.messages import get_press_help_message
 from clive.__private.core.profile import Profile
@@ -29,7 +29,13 @@ if TYPE_CHECKING:
 class SelectProfile(CliveSelect[str], CliveWidget):
     def __init__(self, *, disabled: bool = False) -> None:
         profiles = Profile.list_profiles()
-        super().__init__([(profile, profile) for profile in profiles], allow_blank=False, disabled=disabled)
+        last_used_profile = Profile.get_last_used_profile_name()
+        super().__init__(
+            [(profile, profile) for profile in profiles],
+            allow_blank=False,
+            value=last_used_profile if last_used_profile is not None else Select.BLANK,
+            disabled=disabled,
+        )
 
 
 class LockAfterTime(Horizontal):
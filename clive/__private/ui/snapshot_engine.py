@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from clive.__private.core.commands.data_retrieval.snapshot import SnapshotRound
+    from clive.__private.ui.data_providers.abc.snapshot_data_provider import SnapshotDataProvider
+
+
+class SnapshotEngine:
+    """
+    Gathers updates requested by data providers, so they are fetched together with the node data in one batch.
+
+    Periodic updates wait for the next node data refresh (so they follow its adaptive interval), while the
+    explicitly requested ones (e.g. after changing what the provider shows) trigger it immediately.
+
+    Args:
+        on_trigger: Called when an update is requested explicitly, should start the node data refresh.
+    """
+
+    def __init__(self, on_trigger: Callable[[], None]) -> None:
+        self._on_trigger = on_trigger
+        self._pending: dict[SnapshotDataProvider[Any], asyncio.Future[None]] = {}
+        self._is_triggered = False
+
+    @property
+    def is_update_requested(self) -> bool:
+        """Whether any provider requested an update explicitly and it is still waiting to be served."""
+        return self._is_triggered
+
+    async def request_update(self, provider: SnapshotDataProvider[Any], *, trigger: bool) -> None:
+        """
+        Wait until the provider is updated in the next round.
+
+        Args:
+            provider: The provider to update.
+            trigger: Whether the round should be started immediately instead of waiting for the next refresh.
+        """
+        future = self._pending.get(provider)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._pending[provider] = future
+
+        if trigger:
+            self._is_triggered = True
+            self._on_trigger()
+
+        await asyncio.shield(future)
+
+    async def run_round[T](self, snapshot_round: SnapshotRound, node_data: Awaitable[T]) -> T | BaseException:
+        """
+        Fetch the node data and update all the pending providers in a single round.
+
+        Args:
+            snapshot_round: The round all the retrievals join.
+            node_data: Retrieval of the node data, joining the round.
+
+        Returns:
+            Result of the node data retrieval or exception it raised.
+        """
+        pending, self._pending = self._pending, {}
+        self._is_triggered = False
+        try:
+            results = await snapshot_round.run(
+                node_data, *(self._serve(provider, future, snapshot_round) for provider, future in pending.items())
+            )
+        finally:
+            for future in pending.values():
+                future.cancel()  # no-op for served ones, the others should not wait for the round which is gone
+        return results[0]
+
+    async def _serve(
+        self, provider: SnapshotDataProvider[Any], future: asyncio.Future[None], snapshot_round: SnapshotRound
+    ) -> None:
+        if not provider.is_attached:
+            future.cancel()
+            return
+
+        try:
+            await provider.update_in_snapshot(snapshot_round)
+        except Exception as error:
+            logger.error(f"Update of {provider.get_worker_name()} failed: {error}")
+            if not future.done():
+                future.set_exception(error)  # raised in the worker of the provider, like if it updated on its own
+            raise
+        if not future.done():
+            future.set_result(None)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Final
+
+import msgspec
+from textual.css.stylesheet import Stylesheet
+
+from clive.__private.core.constants.env import ROOT_DIRECTORY
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from pathlib import PurePath
+
+STYLESHEETS_ROOT: Final[Path] = ROOT_DIRECTORY / "__private" / "ui"
+STYLESHEET_SUFFIX: Final[str] = ".scss"
+
+
+class BundledStylesheetEntry(msgspec.Struct, frozen=True):
+    """
+    Content of a single stylesheet stored in the bundle.
+
+    Attributes:
+        size: Size of the stylesheet file, used to detect changes without reading the file.
+        mtime_ns: Modification time of the stylesheet file, used to detect changes without reading the file.
+        sha256: Hash of the stylesheet content.
+        css: The stylesheet content.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    css: str
+
+    @classmethod
+    def read(cls, path: Path) -> BundledStylesheetEntry:
+        stat = path.stat()
+        css = path.read_text()
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=_hash_css(css), css=css)
+
+    def has_same_metadata(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def has_same_content(self, path: Path) -> bool:
+        try:
+            css = path.read_text()
+        except OSError:
+            return False
+        return _hash_css(css) == self.sha256
+
+
+class _StylesheetBundleContent(msgspec.Struct):
+    version: str
+    stylesheets: dict[str, BundledStylesheetEntry]
+    """Stylesheets by path relative to the stylesheets root."""
+
+
+@dataclass
+class StylesheetBundle:
+    """
+    All clive stylesheets gathered in a single file, so they are not read from files one by one on each launch.
+
+    The bundle is keyed by the clive version and hashes of stylesheets, so it's invalidated on upgrade and each
+    stylesheet changed after building the bundle is read from its file instead.
+
+    Args:
+        version: Version of clive the bundle was built for.
+        stylesheets: Stylesheets by path relative to the `root`.
+        root: Directory where the stylesheets are located.
+    """
+
+    version: str
+    stylesheets: dict[str, BundledStylesheetEntry] = field(default_factory=dict)
+    root: Path = STYLESHEETS_ROOT
+    is_modified: bool = field(default=False, init=False)
+    """Whether some stylesheets differ from the bundle, so it should be rebuilt."""
+    _prepared: ClassVar[StylesheetBundle | None] = None
+
+    @classmethod
+    def prepare(cls) -> StylesheetBundle:
+        """
+        Load the bundle at the app start, it's built and saved when it's missing or outdated.
+
+        Stylesheets are taken from the prepared bundle since then, so merely importing the app does not touch it.
+
+        Returns:
+            The prepared bundle.
+        """
+        if cls._prepared is not None:
+            return cls._prepared
+
+        from clive.__private.settings import safe_settings  # noqa: PLC0415
+
+        bundle_path = safe_settings.stylesheet_bundle_path
+        bundle = cls.load(bundle_path)
+        if bundle is None or not bundle.stylesheets:
+            bundle = build_stylesheet_bundle(bundle_path)
+        cls._prepared = bundle
+        return bundle
+
+    @classmethod
+    def get_prepared(cls) -> StylesheetBundle | None:
+        """Get the bundle loaded by `prepare`, None before the app start - stylesheets are read from files then."""
+        return cls._prepared
+
+    @classmethod
+    def build(cls, *, root: Path = STYLESHEETS_ROOT) -> StylesheetBundle:
+        """
+        Build the bundle by reading all stylesheets located in the `root` directory.
+
+        Args:
+            root: Directory where the stylesheets are located.
+
+        Returns:
+            The built bundle.
+        """
+        from clive import __version__  # noqa: PLC0415
+
+        start = time.perf_counter()
+        stylesheets = {
+            path.relative_to(root).as_posix(): BundledStylesheetEntry.read(path)
+            for path in sorted(root.rglob(f"*{STYLESHEET_SUFFIX}"))
+        }
+        logger.debug(f"Stylesheet bundle of {len(stylesheets)} files built in {time.perf_counter() - start:.3f}s")
+        return cls(version=__version__, stylesheets=stylesheets, root=root)
+
+    @classmethod
+    def load(cls, path: Path, *, root: Path = STYLESHEETS_ROOT) -> StylesheetBundle | None:
+        """
+        Load the bundle from the file, if it was built for the current clive version.
+
+        Args:
+            path: Path of the bundle file.
+            root: Directory where the stylesheets are located.
+
+        Returns:
+            The loaded bundle or None when the file is missing, invalid or built for other clive version.
+        """
+        from clive import __version__  # noqa: PLC0415
+
+        try:
+            content = msgspec.json.decode(path.read_bytes(), type=_StylesheetBundleContent)
+        except (OSError, msgspec.DecodeError, msgspec.ValidationError) as error:
+            logger.debug(f"Stylesheet bundle not loaded from {path}: {error}")
+            return None
+
+        if content.version != __version__:
+            logger.debug(f"Stylesheet bundle from {path} is outdated, built for version {content.version}")
+            return None
+        return cls(version=content.version, stylesheets=content.stylesheets, root=root)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = _StylesheetBundleContent(version=self.version, stylesheets=self.stylesheets)
+        path.write_bytes(msgspec.json.encode(content))
+
+    def get(self, path: str | PurePath) -> str | None:
+        """
+        Get the content of the stylesheet from the bundle.
+
+        Args:
+            path: Path of the stylesheet file.
+
+        Returns:
+            The stylesheet content or None when it's not bundled or the file changed since building the bundle.
+        """
+        absolute_path = Path(os.path.abspath(path))  # noqa: PTH100  # resolving symlinks is not needed
+        try:
+            key = absolute_path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+        entry = self.stylesheets.get(key)
+        if entry is not None and entry.has_same_metadata(absolute_path):
+            return entry.css
+
+        self.is_modified = True  # e.g. touched or edited during development, file content is checked
+        if entry is not None and entry.has_same_content(absolute_path):
+            return entry.css
+        return None
+
+
+class BundledStylesheet(Stylesheet):
+    """Stylesheet which takes the content of clive stylesheets (`CSS_PATH`) from the bundle instead of the files."""
+
+    def read(self, filename: str | PurePath) -> None:
+        bundle = StylesheetBundle.get_prepared()
+        css = bundle.get(filename) if bundle is not None else None
+        if css is None:
+            super().read(filename)
+            return
+        self.add_source(css, read_from=(os.path.abspath(filename), ""))  # noqa: PTH100  # same as textual does
+
+
+def build_stylesheet_bundle(path: Path | None = None) -> StylesheetBundle:
+    """
+    Build the stylesheet bundle and save it, so the next launches can use it.
+
+    Args:
+        path: Where to save the bundle, by default in the clive data directory.
+
+    Returns:
+        The built bundle.
+    """
+    from clive.__private.settings import safe_settings  # noqa: PLC0415
+
+    bundle_path = path or safe_settings.stylesheet_bundle_path
+    bundle = StylesheetBundle.build()
+    with suppress(OSError):  # not being able to save the bundle is not critical, stylesheets will be read again
+        bundle.save(bundle_path)
+        logger.debug(f"Stylesheet bundle saved to {bundle_path}")
+    return bundle
+
+
+def refresh_stylesheet_bundle_if_modified() -> None:
+    """Rebuild the stylesheet bundle when some stylesheets turned out to be changed since building it."""
+    bundle = StylesheetBundle.get_prepared()
+    if bundle is not None and bundle.is_modified:
+        build_stylesheet_bundle()
+
+
+def _hash_css(css: str) -> str:
+    return hashlib.sha256(css.encode()).hexdigest()
@@ -58,6 +58,8 @@ class HeaderIcon(TextualHeaderIcon, CliveWidget):
 
 
 class BlockDisplay(Horizontal, CliveWidget):
+    """Shows the head block, ticking with the chain clock between the node data refreshes."""
+
     def compose(self) -> ComposeResult:
         yield TitledLabel(
             "Block",
@@ -67,13 +69,24 @@ class BlockDisplay(Horizontal, CliveWidget):
             callback=self._get_last_block,
         )
 
+    def on_mount(self) -> None:
+        self._schedule_next_block()
+
+    def _schedule_next_block(self) -> None:
+        self.set_timer(self.node.chain_clock.secs_until_next_block, self._on_next_block)
+
+    def _on_next_block(self) -> None:
+        with contextlib.suppress(NoMatches):
+            self.query_exactly_one(DynamicLabel).force_update()
+        self._schedule_next_block()
+
     def _get_last_block(self) -> str:
-        if not self.node.cached.is_online_with_basic_info_available:
+        if not self.node.cached.is_online_with_basic_info_available or not self.node.chain_clock.is_seeded:
             return NOT_AVAILABLE_LABEL
 
-        gdpo = self.node.cached.dynamic_global_properties_ensure
-        block_num = gdpo.head_block_number
-        block_time = gdpo.time.time()
+        chain_clock = self.node.chain_clock
+        block_num = chain_clock.head_block_number
+        block_time = chain_clock.head_block_time.time()
         return f"{block_num} ({block_time} UTC)"
 
 
@@ -8,6 +8,7 @@ from textual.events import Mount
 
 from clive.__private.core.accounts.accounts import Account
 from clive.__private.core.constants.tui.placeholders import ACCOUNT_NAME_PLACEHOLDER
+from clive.__private.ui.clive_suggester import CliveSuggester
 from clive.__private.ui.widgets.inputs.text_input import TextInput
 from clive.__private.validators.bad_account_validator import BadAccountValidator
 
@@ -37,6 +38,10 @@ class AccountNameInput(TextInput):
         required: Whether the input is required.
         show_known_account: Whether to show known accounts with a specific style.
         show_bad_account: Whether to show bad accounts with a specific style.
+        suggest_profile_accounts: Whether to suggest names of tracked and known accounts from the profile
+            (used only when no suggester is given).
+        suggest_from_node: Whether to suggest names of accounts existing on the chain when none of the local
+            suggestions match (used only when no suggester is given).
         suggester: A suggester for auto-completion.
         validators: Validators for the input.
         validate_on: When to validate the input.
@@ -50,6 +55,8 @@ class AccountNameInput(TextInput):
     _UNKNOWN_ACCOUNT_CLASS: Final[str] = "-unknown-account"
     _BAD_ACCOUNT_CLASS: Final[str] = "-bad-account"
 
+    _NODE_SUGGESTIONS_LIMIT: Final[int] = 10
+
     DEFAULT_CSS = """
     AccountNameInput {
       height: auto;
@@ -91,6 +98,8 @@ class AccountNameInput(TextInput):
         required: bool = True,
         show_known_account: bool = True,
         show_bad_account: bool = True,
+        suggest_profile_accounts: bool = False,
+        suggest_from_node: bool = False,
         suggester: Suggester | None = None,
         validators: Validator | Iterable[Validator] | None = None,
         validate_on: Iterable[InputValidationOn] | None = None,
@@ -107,7 +116,10 @@ class AccountNameInput(TextInput):
             include_title_in_placeholder_when_blurred=include_title_in_placeholder_when_blurred,
             show_invalid_reasons=show_invalid_reasons,
             required=required,
-            suggester=suggester,
+            suggester=suggester
+            or self._create_account_names_suggester(
+                suggest_profile_accounts=suggest_profile_accounts, suggest_from_node=suggest_from_node
+            ),
             validators=validators or [BadAccountValidator(self.profile.accounts)],
             validate_on=validate_on,
             valid_empty=valid_empty,
@@ -144,6 +156,28 @@ class AccountNameInput(TextInput):
         if not self.profile.accounts.is_account_known(account_name):
             self.profile.accounts.known.add(account_name)
 
+        if isinstance(self.input.suggester, CliveSuggester):
+            self.input.suggester.add_suggestion(account_name)
+            self.input.suggester.record_use(account_name)
+
+    def _create_account_names_suggester(
+        self, *, suggest_profile_accounts: bool, suggest_from_node: bool
+    ) -> CliveSuggester | None:
+        if not suggest_profile_accounts and not suggest_from_node:
+            return None
+
+        names: list[str] = []
+        if suggest_profile_accounts:
+            accounts = self.profile.accounts
+            names = [account.name for account in accounts.tracked] + accounts.known.names
+        return CliveSuggester(names, source=self._list_account_names_on_node if suggest_from_node else None)
+
+    async def _list_account_names_on_node(self, prefix: str) -> list[str]:
+        if not prefix:
+            return []
+        wrapper = await self.commands.list_account_names(prefix=prefix, limit=self._NODE_SUGGESTIONS_LIMIT)
+        return wrapper.result_or_raise
+
     def _change_input_style(self, css_class: str, border_subtitle: str) -> None:
         self.input.remove_class(self._UNKNOWN_ACCOUNT_CLASS, self._KNOWN_ACCOUNT_CLASS, self._BAD_ACCOUNT_CLASS)
 
@@ -37,6 +37,8 @@ class ReceiverInput(AccountNameInput):
         required: bool = True,
         show_known_account: bool = True,
         show_bad_account: bool = True,
+        suggest_profile_accounts: bool = True,
+        suggest_from_node: bool = True,
         suggester: Suggester | None = None,
         validators: Validator | Iterable[Validator] | None = None,
         validate_on: Iterable[InputValidationOn] | None = None,
@@ -62,6 +64,8 @@ class ReceiverInput(AccountNameInput):
             disabled=disabled,
             show_bad_account=show_bad_account,
             show_known_account=show_known_account,
+            suggest_profile_accounts=suggest_profile_accounts,
+            suggest_from_node=suggest_from_node,
         )
         self._was_known_exchange_in_input = False
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
+from clive.__private.core.iwax import call_timed
 from wax.exceptions.chain_errors import PrivateKeyDetectedInMemoError
 
 if TYPE_CHECKING:
@@ -22,11 +24,16 @@ def contains_private_key(content: str, world: World) -> bool:
     for account in world.profile.accounts.tracked:
         authority = account.data.authority
         try:
-            world.wax_interface.scan_text_for_matching_private_keys(
-                content=content,
-                account=account.name,
-                account_authorities=authority.wax_authorities,
-                memo_key=authority.memo_key,
+            # validators are synchronous, so it can't be offloaded, but is still included in the wax timing histograms
+            call_timed(
+                "scan_text_for_matching_private_keys",
+                partial(
+                    world.wax_interface.scan_text_for_matching_private_keys,
+                    content=content,
+                    account=account.name,
+                    account_authorities=authority.wax_authorities,
+                    memo_key=authority.memo_key,
+                ),
             )
         except PrivateKeyDetectedInMemoError:
             return True
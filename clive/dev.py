@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from clive.__private.core.constants.setting_identifiers import IS_DEV
 from clive.__private.settings.clive_prefixed_envvar import clive_prefixed_envvar
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+BUILD_STYLESHEET_BUNDLE_OPTION = "--build-stylesheet-bundle"
+
 
 def is_in_dev_mode() -> bool:
     from clive.__private.settings import safe_settings  # noqa: PLC0415
@@ -12,17 +19,23 @@ def is_in_dev_mode() -> bool:
 
 def main() -> None:
     import os  # noqa: PLC0415
+    import sys  # noqa: PLC0415
 
     from rich.console import Console  # noqa: PLC0415
     from rich.style import Style  # noqa: PLC0415
 
     from clive.main import _is_cli_requested  # noqa: PLC0415
 
-    Console().print(
+    console = Console()
+    console.print(
         "-- Running in development mode (NOT FOR DIRECT USAGE!) --",
         style=Style(bgcolor="red", blink=True),
     )
 
+    if sys.argv[1:] == [BUILD_STYLESHEET_BUNDLE_OPTION]:
+        _build_stylesheet_bundle(console)
+        return
+
     if _is_cli_requested():  # don't run via textual_dev.run_app when CLI is requested (saves around 1s)
         from clive.__private.settings import get_settings  # noqa: PLC0415
         from clive.main import main as production_main  # noqa: PLC0415
@@ -47,5 +60,14 @@ def main() -> None:
     run_app("clive/main.py", [], environment)
 
 
+def _build_stylesheet_bundle(console: Console) -> None:
+    from clive.__private.settings import safe_settings  # noqa: PLC0415
+    from clive.__private.ui.stylesheet_bundle import build_stylesheet_bundle  # noqa: PLC0415
+
+    bundle = build_stylesheet_bundle()
+    bundle_path = safe_settings.stylesheet_bundle_path
+    console.print(f"Stylesheet bundle of {len(bundle.stylesheets)} stylesheets saved to {bundle_path}")
+
+
 if __name__ == "__main__":
     main()
@@ -257,6 +257,22 @@ class CLITester:
             **extract_params(locals()),
         )
 
+    def process_target_state(  # noqa: PLR0913
+        self,
+        *,
+        account_name: str | None = None,
+        from_file: Path,
+        sign_with: str | list[str] | None = None,
+        broadcast: bool | None = None,
+        save_file: Path | None = None,
+        force: bool | None = None,
+        autosign: bool | None = None,
+    ) -> CLITestResult:
+        return self.__invoke_command_with_options(
+            ["process", "target-state"],
+            **extract_params(locals()),
+        )
+
     def show_hive_power(self, *, account_name: str | None = None) -> CLITestResult:
         return self.__invoke_command_with_options(["show", "hive-power"], **extract_params(locals()))
 
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import pytest
+from typer.testing import CliRunner
+
+
+@pytest.mark.parametrize("command", [[], ["generate"], ["generate", "keys-from-seed"]])
+def test_help_is_displayed(command: list[str]) -> None:
+    # ARRANGE
+    from clive.__private.cli.main import cli  # noqa: PLC0415
+
+    # ACT
+    result = CliRunner().invoke(cli, [*command, "--help"])
+
+    # ASSERT
+    assert result.exit_code == 0, f"Help of `{' '.join(command)}` should be displayed, got: {result.output}"
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 import typer
 
-from clive.__private.cli.common.parsers import account_name
+from clive.__private.cli.common.parsers import account_name, authority_level
 from clive.__private.core.constants.cli import PERFORM_WORKING_ACCOUNT_LOAD
 
 
@@ -34,3 +34,14 @@ def test_account_name_valid(raw: str) -> None:
 def test_account_name_invalid(raw: str) -> None:
     with pytest.raises(typer.BadParameter):
         account_name(raw)
+
+
+@pytest.mark.parametrize("raw", ["owner", "active", "posting", "memo"])
+def test_authority_level_valid(raw: str) -> None:
+    assert authority_level(raw) == raw
+
+
+@pytest.mark.parametrize("raw", ["Owner", "witness", ""])
+def test_authority_level_invalid(raw: str) -> None:
+    with pytest.raises(typer.BadParameter):
+        authority_level(raw)
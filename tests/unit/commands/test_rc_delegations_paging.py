@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast
+
+import pytest
+
+from clive.__private.core.commands.data_retrieval.rc_data import list_next_rc_direct_delegations
+
+if TYPE_CHECKING:
+    from clive.__private.core.node import Node
+    from clive.__private.models.schemas import RcDirectDelegation
+
+DELEGATOR: Final[str] = "delegator"
+NODE_LIMIT: Final[int] = 1000
+
+
+@dataclass
+class FakeRcDirectDelegation:
+    from_: str
+    to: str
+
+
+@dataclass
+class FakeListRcDirectDelegations:
+    rc_direct_delegations: list[FakeRcDirectDelegation]
+
+
+class FakeRcApi:
+    """Lists delegations ordered by (from, to), like `list_rc_direct_delegations` does."""
+
+    def __init__(self, delegations: list[FakeRcDirectDelegation]) -> None:
+        self.delegations = delegations
+        self._keys = [(delegation.from_, delegation.to) for delegation in delegations]
+        self.calls = 0
+
+    async def list_rc_direct_delegations(self, *, start: tuple[str, str], limit: int) -> FakeListRcDirectDelegations:
+        assert limit <= NODE_LIMIT, "Node rejects bigger limits."
+        self.calls += 1
+        index = bisect.bisect_left(self._keys, start)
+        return FakeListRcDirectDelegations(self.delegations[index : index + limit])
+
+
+class FakeNode:
+    def __init__(self, delegations: list[FakeRcDirectDelegation]) -> None:
+        self.api = self
+        self.rc_api = FakeRcApi(delegations)
+
+
+def _create_delegations(amount: int) -> list[FakeRcDirectDelegation]:
+    delegations = [FakeRcDirectDelegation(DELEGATOR, f"delegatee-{number:06}") for number in range(amount)]
+    delegations.append(FakeRcDirectDelegation("next-delegator", "someone"))  # listing goes beyond the account
+    return sorted(delegations, key=lambda delegation: (delegation.from_, delegation.to))
+
+
+@pytest.mark.parametrize("delegations_amount", [0, NODE_LIMIT - 1, NODE_LIMIT, 2 * NODE_LIMIT, 2_500])
+async def test_all_delegations_of_account_are_listed(delegations_amount: int) -> None:
+    # ARRANGE
+    node = FakeNode(_create_delegations(delegations_amount))
+    first_page = (
+        await node.rc_api.list_rc_direct_delegations(start=(DELEGATOR, ""), limit=NODE_LIMIT)
+    ).rc_direct_delegations
+
+    # ACT
+    next_delegations = await list_next_rc_direct_delegations(
+        cast("Node", node), DELEGATOR, cast("list[RcDirectDelegation]", first_page)
+    )
+
+    # ASSERT
+    own_first_page = [delegation for delegation in first_page if delegation.from_ == DELEGATOR]
+    listed = [delegation.to for delegation in [*own_first_page, *next_delegations]]
+    expected = [delegation.to for delegation in node.rc_api.delegations if delegation.from_ == DELEGATOR]
+    assert listed == expected, "Each delegation of the account should be listed exactly once."
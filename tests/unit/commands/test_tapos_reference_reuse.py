@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Final, cast
+
+from clive.__private.core.commands.update_transaction_metadata import UpdateTransactionMetadata
+from clive.__private.core.constants.node import HIVE_BLOCK_INTERVAL_SECONDS, TRANSACTION_EXPIRATION_TIMEDELTA_MAX
+from clive.__private.core.node.tapos_reference import TaposReferenceManager
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+from clive.__private.models.schemas import TransferOperation
+from clive.__private.models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from clive.__private.core.node import Node
+
+BUILDS_AMOUNT: Final[int] = 1000
+SECS_BETWEEN_BUILDS: Final[float] = 0.1
+MAX_AGE_SECS: Final[float] = 60.0
+GDPO_CALLS_WITH_REFRESH: Final[int] = 2
+EXPIRATION: Final[timedelta] = timedelta(minutes=30)
+GENESIS_TIME: Final[datetime] = datetime(2016, 3, 24, 16, 0, tzinfo=UTC)
+
+
+@dataclass
+class FakeGdpo:
+    head_block_number: int
+    head_block_id: str
+    time: datetime
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeDatabaseApi:
+    def __init__(self, clock: FakeClock) -> None:
+        self._clock = clock
+        self.gdpo_calls = 0
+
+    async def get_dynamic_global_properties(self) -> FakeGdpo:
+        self.gdpo_calls += 1
+        head_block_number = 1_000_000 + math.floor(self._clock.now / HIVE_BLOCK_INTERVAL_SECONDS)
+        return FakeGdpo(
+            head_block_number=head_block_number,
+            head_block_id=f"{head_block_number:08x}" + "ab" * 16,
+            time=GENESIS_TIME + timedelta(seconds=head_block_number * HIVE_BLOCK_INTERVAL_SECONDS),
+        )
+
+
+class FakeNode:
+    def __init__(self, clock: FakeClock) -> None:
+        self.api = self
+        self.database_api = FakeDatabaseApi(clock)
+        self.tapos_references = TaposReferenceManager(MAX_AGE_SECS, clock=clock)
+
+
+def _create_transaction(index: int) -> Transaction:
+    return Transaction(
+        operations=Transaction.convert_operations(
+            [TransferOperation(from_="alice", to="bob", amount=Asset.hive(1), memo=f"transfer {index}")]
+        )
+    )
+
+
+async def _build(node: FakeNode, index: int, expiration: timedelta = EXPIRATION) -> Transaction:
+    command = UpdateTransactionMetadata(
+        transaction=_create_transaction(index), node=cast("Node", node), expiration=expiration
+    )
+    await command.execute()
+    return command.transaction
+
+
+async def test_reference_is_reused_across_consecutive_builds() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    node = FakeNode(clock)
+
+    # ACT
+    transactions = []
+    for index in range(BUILDS_AMOUNT):
+        transactions.append(await _build(node, index))
+        clock.now += SECS_BETWEEN_BUILDS
+
+    # ASSERT
+    expected_gdpo_calls = math.ceil(BUILDS_AMOUNT * SECS_BETWEEN_BUILDS / MAX_AGE_SECS)
+    logger.info(
+        f"Built {BUILDS_AMOUNT} transactions with {node.database_api.gdpo_calls} GDPO calls"
+        f" (instead of {BUILDS_AMOUNT})"
+    )
+    assert node.database_api.gdpo_calls <= expected_gdpo_calls
+    assert all(transaction.ref_block_prefix > 0 for transaction in transactions)
+    assert len({transaction.ref_block_num for transaction in transactions}) == node.database_api.gdpo_calls
+
+
+async def test_expiration_follows_head_block_time_while_reused() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    node = FakeNode(clock)
+    first = await _build(node, 0)
+    elapsed_secs = MAX_AGE_SECS / 2
+
+    # ACT
+    clock.now += elapsed_secs
+    second = await _build(node, 1)
+
+    # ASSERT
+    assert node.database_api.gdpo_calls == 1
+    assert second.ref_block_num == first.ref_block_num
+    assert second.expiration - first.expiration == timedelta(seconds=elapsed_secs)
+
+
+async def test_new_reference_is_fetched_when_too_old() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    node = FakeNode(clock)
+    first = await _build(node, 0)
+
+    # ACT
+    clock.now += MAX_AGE_SECS + HIVE_BLOCK_INTERVAL_SECONDS
+    second = await _build(node, 1)
+
+    # ASSERT
+    assert node.database_api.gdpo_calls == GDPO_CALLS_WITH_REFRESH, "Outdated reference should be fetched again."
+    assert second.ref_block_num != first.ref_block_num
+
+
+async def test_max_expiration_is_not_ahead_of_node_head_block_time() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    node = FakeNode(clock)
+    await _build(node, 0)
+    clock.now += MAX_AGE_SECS / 2 + HIVE_BLOCK_INTERVAL_SECONDS / 2  # in the middle of a block interval
+
+    # ACT
+    transaction = await _build(node, 1, expiration=TRANSACTION_EXPIRATION_TIMEDELTA_MAX)
+
+    # ASSERT
+    node_head_block_time = (await node.database_api.get_dynamic_global_properties()).time
+    assert node.database_api.gdpo_calls == GDPO_CALLS_WITH_REFRESH, "Reference should be reused by the second build."
+    assert transaction.expiration - node_head_block_time <= TRANSACTION_EXPIRATION_TIMEDELTA_MAX
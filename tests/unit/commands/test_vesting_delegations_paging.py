@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, cast
+
+import pytest
+
+from clive.__private.core.commands.data_retrieval.hive_power_data import find_vesting_delegations_page_start
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from clive.__private.core.node import Node
+
+DELEGATOR: Final[str] = "delegator"
+DELEGATIONS_AMOUNT: Final[int] = 20_000
+PAGE_SIZE: Final[int] = 20
+NODE_LIMIT: Final[int] = 1000
+
+
+@dataclass
+class FakeDelegation:
+    delegator: str
+    delegatee: str
+
+
+@dataclass
+class FakeListVestingDelegations:
+    delegations: list[FakeDelegation]
+
+
+class FakeDatabaseApi:
+    """Lists delegations ordered by (delegator, delegatee), like `list_vesting_delegations` by_delegation does."""
+
+    def __init__(self, delegations: list[FakeDelegation]) -> None:
+        self._delegations = delegations
+        self._keys = [(delegation.delegator, delegation.delegatee) for delegation in delegations]
+        self.calls = 0
+
+    async def list_vesting_delegations(
+        self, *, start: tuple[str, str], limit: int, order: str
+    ) -> FakeListVestingDelegations:
+        assert order == "by_delegation"
+        assert limit <= NODE_LIMIT, "Node rejects bigger limits."
+        self.calls += 1
+        index = bisect.bisect_left(self._keys, start)
+        return FakeListVestingDelegations(self._delegations[index : index + limit])
+
+
+class FakeNode:
+    def __init__(self, delegations: list[FakeDelegation]) -> None:
+        self.api = self
+        self.database_api = FakeDatabaseApi(delegations)
+
+
+def _create_delegations(amount: int) -> list[FakeDelegation]:
+    delegations = [FakeDelegation(DELEGATOR, f"delegatee-{number:06}") for number in range(amount)]
+    delegations.append(FakeDelegation("next-delegator", "someone"))  # listing goes beyond delegations of the account
+    return sorted(delegations, key=lambda delegation: (delegation.delegator, delegation.delegatee))
+
+
+def _own_delegatees(node: FakeNode) -> list[str]:
+    return [delegation.delegatee for delegation in node.database_api._delegations if delegation.delegator == DELEGATOR]
+
+
+@pytest.mark.parametrize("page_no", [0, 1, 49, 50, 51, 999])
+async def test_page_starts_from_right_delegatee(page_no: int) -> None:
+    # ARRANGE
+    node = FakeNode(_create_delegations(DELEGATIONS_AMOUNT))
+
+    # ACT
+    start = await find_vesting_delegations_page_start(
+        cast("Node", node), DELEGATOR, page_no=page_no, page_size=PAGE_SIZE
+    )
+
+    # ASSERT
+    expected = "" if page_no == 0 else _own_delegatees(node)[page_no * PAGE_SIZE]
+    assert start == expected
+
+
+async def test_page_out_of_range() -> None:
+    # ARRANGE
+    node = FakeNode(_create_delegations(DELEGATIONS_AMOUNT))
+
+    # ACT
+    start = await find_vesting_delegations_page_start(
+        cast("Node", node), DELEGATOR, page_no=DELEGATIONS_AMOUNT // PAGE_SIZE, page_size=PAGE_SIZE
+    )
+
+    # ASSERT
+    assert start is None
+
+
+async def test_paging_to_last_page_benchmark() -> None:
+    # ARRANGE
+    node = FakeNode(_create_delegations(DELEGATIONS_AMOUNT))
+    last_page_no = DELEGATIONS_AMOUNT // PAGE_SIZE - 1
+
+    # ACT
+    start_time = time.perf_counter()
+    start = await find_vesting_delegations_page_start(
+        cast("Node", node), DELEGATOR, page_no=last_page_no, page_size=PAGE_SIZE
+    )
+    elapsed = time.perf_counter() - start_time
+
+    # ASSERT
+    logger.info(
+        f"Found start of page {last_page_no} of {DELEGATIONS_AMOUNT} delegations with {node.database_api.calls}"
+        f" requests (instead of {last_page_no} page by page) in {elapsed:.4f}s"
+    )
+    assert start == _own_delegatees(node)[last_page_no * PAGE_SIZE]
+    assert node.database_api.calls <= DELEGATIONS_AMOUNT // (NODE_LIMIT - 1) + 1
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.core.constants.authority import AUTHORITY_LEVELS
+from clive.__private.core.keys import KeyManager, PrivateKey, PrivateKeyAliased
+from clive.__private.core.keys.bulk import (
+    KeyDerivationRequest,
+    KeysImportResult,
+    calculate_key_pairs,
+    deduplicate_key_pairs,
+    derive_key_pairs,
+)
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    import pytest
+
+    from clive.__private.core.keys.bulk import KeyPair
+
+SEED: Final[str] = "some secret phrase used as a seed"
+DERIVED_KEYS_AMOUNT: Final[int] = 400
+
+
+def _create_requests(accounts_amount: int) -> list[KeyDerivationRequest]:
+    return [
+        KeyDerivationRequest(account_name=f"account-{number}", role=role)
+        for number in range(accounts_amount)
+        for role in AUTHORITY_LEVELS
+    ]
+
+
+def _create_key_manager_with(*key_pairs: KeyPair) -> KeyManager:
+    keys = KeyManager()
+    keys.add(*[key_pair.public_key for key_pair in key_pairs])
+    return keys
+
+
+async def test_derived_keys_are_same_as_derived_one_by_one() -> None:
+    # ARRANGE
+    requests = _create_requests(accounts_amount=3)
+
+    # ACT
+    key_pairs = await derive_key_pairs(SEED, requests)
+
+    # ASSERT
+    assert [key_pair.alias for key_pair in key_pairs] == [request.alias for request in requests]
+    for key_pair, request in zip(key_pairs, requests, strict=True):
+        expected = PrivateKey.generate_from_seed(SEED, request.account_name, role=request.role)
+        assert key_pair.private_key.value == expected.value
+        assert key_pair.public_key.value == expected.calculate_public_key().value
+
+
+async def test_not_aliased_keys_are_aliased_with_public_key() -> None:
+    # ARRANGE
+    private_key = PrivateKey.generate()
+
+    # ACT
+    (key_pair,) = await calculate_key_pairs([private_key])
+
+    # ASSERT
+    assert key_pair.alias == private_key.calculate_public_key().value
+
+
+async def test_deduplication() -> None:
+    # ARRANGE
+    known, new, same_alias_as_known = await calculate_key_pairs(
+        [PrivateKey.generate(with_alias=alias) for alias in ("known", "new", "known")]
+    )
+    known_under_other_alias = (await calculate_key_pairs([known.private_key.with_alias("other")]))[0]
+    keys = _create_key_manager_with(known)
+
+    # ACT
+    deduplication = deduplicate_key_pairs(keys, [known_under_other_alias, new, same_alias_as_known, new])
+
+    # ASSERT
+    assert deduplication.new == [new]
+    assert deduplication.already_known == [known_under_other_alias, new], "Repeated keys should be skipped too."
+    assert deduplication.alias_conflicts == [same_alias_as_known]
+
+
+async def test_keys_failed_to_import_stay_pending() -> None:
+    # ARRANGE
+    keys = KeyManager()
+    imported, failed = PrivateKey.generate(with_alias="imported"), PrivateKey.generate(with_alias="failed")
+    keys.add_to_import(imported, failed)
+
+    async def import_keys(keys_to_import: list[PrivateKeyAliased]) -> KeysImportResult:
+        result = KeysImportResult()
+        for key in keys_to_import:
+            if key.alias == failed.alias:
+                result.failed[key.alias] = "invalid key"
+            else:
+                result.imported.append(key.calculate_public_key())
+        return result
+
+    # ACT
+    result = await keys.import_pending_to_beekeeper_in_bulk(import_keys)
+
+    # ASSERT
+    assert not result.is_complete
+    assert keys.get_all_aliases() == [imported.alias]
+    assert not keys.is_alias_available(failed.alias), "Failed key should still be pending to import."
+
+
+async def test_key_derivation_throughput_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    requests = _create_requests(accounts_amount=DERIVED_KEYS_AMOUNT // 4)
+    deriving_threads: list[int] = []
+    derive = KeyDerivationRequest.derive
+
+    def _derive(request: KeyDerivationRequest, seed: str) -> KeyPair:
+        deriving_threads.append(threading.get_ident())
+        return derive(request, seed)
+
+    # ACT
+    start = time.perf_counter()
+    sequential = [request.derive(SEED) for request in requests]
+    sequential_secs = time.perf_counter() - start
+
+    monkeypatch.setattr(KeyDerivationRequest, "derive", _derive)
+    start = time.perf_counter()
+    parallel = await derive_key_pairs(SEED, requests)
+    parallel_secs = time.perf_counter() - start
+
+    # ASSERT
+    logger.info(
+        f"Derived {len(requests)} keys: sequentially {len(requests) / sequential_secs:.0f} keys/s,"
+        f" in parallel {len(requests) / parallel_secs:.0f} keys/s"
+    )
+    assert parallel == sequential
+    assert len(deriving_threads) == len(requests)
+    assert threading.get_ident() not in deriving_threads, "Keys should be derived outside of the event loop thread."
@@ -1,10 +1,45 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.models.asset import Asset
+from clive.__private.models.schemas import TransferOperation
+from clive.__private.storage.runtime_to_storage_converter import RuntimeToStorageConverter
 
 if TYPE_CHECKING:
+    import pytest
+
     from clive.__private.core.world import World
 
+OPERATIONS_IN_CART_AMOUNT: Final[int] = 50
+
+
+def _fill_cart(world: World) -> None:
+    world.profile.add_operation(
+        *[
+            TransferOperation(from_="alice", to="bob", amount=Asset.hive(index + 1), memo=f"transfer {index}")
+            for index in range(OPERATIONS_IN_CART_AMOUNT)
+        ]
+    )
+
+
+def _count_serializations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def create_storage_json(self: RuntimeToStorageConverter) -> str:
+        calls.append("create_storage_json")
+        return original_create_storage_json(self)
+
+    def encode_transaction(self: RuntimeToStorageConverter) -> bytes:
+        calls.append("encode_transaction")
+        return original_encode_transaction(self)
+
+    original_create_storage_json = RuntimeToStorageConverter.create_storage_json
+    original_encode_transaction = RuntimeToStorageConverter._encode_transaction
+    monkeypatch.setattr(RuntimeToStorageConverter, "create_storage_json", create_storage_json)
+    monkeypatch.setattr(RuntimeToStorageConverter, "_encode_transaction", encode_transaction)
+    return calls
+
 
 async def test_if_profile_is_saved(world: World, prepare_profile_with_wallet: None, wallet_name: str) -> None:  # noqa: ARG001
     # ACT
@@ -13,3 +48,40 @@ async def test_if_profile_is_saved(world: World, prepare_profile_with_wallet: No
     # ASSERT
     actual_profiles = world.profile.list_profiles()
     assert actual_profiles == [wallet_name], f"Actual profiles are {actual_profiles}, expected are {[wallet_name]}"
+
+
+async def test_saving_unchanged_profile_does_no_serialization(
+    world: World,
+    prepare_profile_with_wallet: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # ARRANGE
+    _fill_cart(world)
+    await world.commands.save_profile()
+    calls = _count_serializations(monkeypatch)
+
+    # ACT
+    await world.commands.save_profile()
+
+    # ASSERT
+    assert not world.profile.should_be_saved, "Profile should not be marked for saving when nothing changed."
+    assert not calls, f"No serialization should happen for unchanged profile, but got: {calls}"
+
+
+async def test_saving_profile_reencodes_only_dirty_sections(
+    world: World,
+    prepare_profile_with_wallet: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # ARRANGE
+    _fill_cart(world)
+    await world.commands.save_profile()
+    calls = _count_serializations(monkeypatch)
+
+    # ACT
+    world.profile.accounts.add_known_account("carol")
+    await world.commands.save_profile()
+
+    # ASSERT
+    assert calls == ["create_storage_json"], f"Only the accounts section should be encoded, but got: {calls}"
+    assert not world.profile.should_be_saved, "Profile should be clean after saving."
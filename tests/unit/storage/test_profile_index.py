@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from clive.__private.core.profile import Profile
+from clive.__private.settings import safe_settings
+from clive.__private.storage.service import profile_index, writer
+from clive.__private.storage.service.profile_index import ProfileIndex
+from clive.__private.storage.service.service import PersistentStorageService
+from clive_local_tools.storage_migration import BLANK_PROFILES, copy_blank_profile_files
+
+if TYPE_CHECKING:
+    import pytest
+
+    from clive.__private.core.world import World
+
+
+def _create_index(tmp_path: Path) -> ProfileIndex:
+    version_resolver = PersistentStorageService.get_version_from_profile_file
+    return ProfileIndex(tmp_path / "data", tmp_path / "index.json", version_resolver)
+
+
+def _create_profile_file(tmp_path: Path, profile_name: str) -> Path:
+    path = tmp_path / "data" / profile_name / "v1.profile"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("encrypted content")
+    return path
+
+
+def _count_rescans(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    original_rescan_directory = ProfileIndex.rescan_directory
+
+    def rescan_directory(self: ProfileIndex, directory_name: str) -> None:
+        calls.append(directory_name)
+        original_rescan_directory(self, directory_name)
+
+    def rescan_storage_directory(self: ProfileIndex, storage_changed_ns: int) -> None:
+        calls.append("<storage>")
+        original_rescan_storage_directory(self, storage_changed_ns)
+
+    original_rescan_storage_directory = ProfileIndex._rescan_storage_directory
+    monkeypatch.setattr(ProfileIndex, "rescan_directory", rescan_directory)
+    monkeypatch.setattr(ProfileIndex, "_rescan_storage_directory", rescan_storage_directory)
+    return calls
+
+
+def test_stored_profiles_are_listed_without_globbing(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    copy_blank_profile_files(safe_settings.data_path)
+
+    def glob(*_: object) -> None:
+        raise AssertionError("Storage directory should not be globbed.")
+
+    monkeypatch.setattr(Path, "glob", glob)
+
+    # ACT
+    profile_names = PersistentStorageService.list_stored_profile_names()
+
+    # ASSERT
+    assert set(BLANK_PROFILES) <= set(profile_names), f"Not all profiles are listed, got: {profile_names}"
+
+
+def test_trusted_directories_are_not_rescanned(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    _create_profile_file(tmp_path, "alice")
+    monkeypatch.setattr(profile_index, "RACY_CHANGE_WINDOW_NS", -1)
+    index = _create_index(tmp_path)
+    index.validate()
+    index.save_if_modified()
+    calls = _count_rescans(monkeypatch)
+
+    # ACT
+    index = _create_index(tmp_path)
+    index.validate()
+
+    # ASSERT
+    assert not calls, f"Unchanged directories should not be rescanned, but got: {calls}"
+    assert list(index.iter_file_paths()) == [tmp_path / "data" / "alice" / "v1.profile"]
+
+
+def test_externally_added_and_removed_profiles_are_detected(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    alice_path = _create_profile_file(tmp_path, "alice")
+    monkeypatch.setattr(profile_index, "RACY_CHANGE_WINDOW_NS", -1)
+    index = _create_index(tmp_path)
+    index.validate()
+    index.save_if_modified()
+
+    # ACT
+    bob_path = _create_profile_file(tmp_path, "bob")
+    alice_path.unlink()
+    alice_path.parent.rmdir()
+    index = _create_index(tmp_path)
+    index.validate()
+
+    # ASSERT
+    assert list(index.iter_file_paths()) == [bob_path], "Index should reflect the current storage directory."
+
+
+def test_corrupted_index_is_rebuilt(tmp_path: Path) -> None:
+    # ARRANGE
+    alice_path = _create_profile_file(tmp_path, "alice")
+    (tmp_path / "index.json").write_text("{not a json")
+
+    # ACT
+    index = _create_index(tmp_path)
+    index.validate()
+    index.save_if_modified()
+
+    # ASSERT
+    assert list(index.iter_file_paths()) == [alice_path], "Index should be rebuilt from the storage directory."
+    assert json.loads((tmp_path / "index.json").read_text())["directories"], "Rebuilt index should be written."
+
+
+async def test_last_used_profile_is_recorded_without_secrets(
+    world: World,
+    prepare_profile_with_wallet: Profile,
+    wallet_password: str,
+) -> None:
+    # ARRANGE
+    profile = prepare_profile_with_wallet
+    profile.accounts.add_known_account("alice")
+
+    # ACT
+    await world.commands.save_profile()
+
+    # ASSERT
+    assert Profile.get_last_used_profile_name() == profile.name, "Saved profile should be the last used one."
+    index_content = (safe_settings.data_path / PersistentStorageService.PROFILE_INDEX_FILENAME).read_text()
+    assert "alice" not in index_content, "Profile content should not leak into the index."
+    assert wallet_password not in index_content, "Secrets should not leak into the index."
+
+
+async def test_concurrent_index_updates_are_merged_into_single_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    copy_blank_profile_files(safe_settings.data_path)
+    index_path = safe_settings.data_path / PersistentStorageService.PROFILE_INDEX_FILENAME
+    index_writes: list[Path] = []
+    original_atomic_write_text = writer.atomic_write_text
+
+    def atomic_write_text(path: Path, content: str) -> None:
+        if path == index_path:
+            index_writes.append(path)
+        original_atomic_write_text(path, content)
+
+    monkeypatch.setattr(writer, "atomic_write_text", atomic_write_text)
+
+    # ACT
+    await asyncio.gather(
+        *(PersistentStorageService._update_profile_index(profile_name) for profile_name in BLANK_PROFILES)
+    )
+
+    # ASSERT
+    assert len(index_writes) == 1, f"Index updates should be merged into a single write, got: {len(index_writes)}"
+    index = ProfileIndex(
+        PersistentStorageService._get_storage_directory(), index_path, PersistentStorageService._get_storage_version
+    )
+    assert all(index.get_last_used_ns(profile_name) is not None for profile_name in BLANK_PROFILES), (
+        "No merged update should be lost."
+    )
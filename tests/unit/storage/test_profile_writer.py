@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import signal
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from clive.__private.core.encryption import EncryptionService
+from clive.__private.core.profile import Profile
+from clive.__private.core.wallet_container import WalletContainer
+from clive.__private.logger import logger
+from clive.__private.storage.service import writer
+from clive.__private.storage.service.service import PersistentStorageService
+from clive.__private.storage.service.writer import ProfileWriter, atomic_write_text
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from clive.__private.core.world import World
+
+KILLS_AMOUNT: Final[int] = 20
+PAYLOAD_SIZE: Final[int] = 256 * 1024
+PAYLOAD_PATTERN: Final[re.Pattern[str]] = re.compile(rf"^(\d+):x{{{PAYLOAD_SIZE}}}:(\d+)$")
+MAX_BURST_WRITES: Final[int] = 2
+"""The first save of the burst is written right away, the rest is merged into one write."""
+
+WRITER_PROCESS_CODE: Final[str] = f"""
+import sys
+from pathlib import Path
+
+from clive.__private.storage.service.writer import atomic_write_text
+
+path = Path(sys.argv[1])
+index = 0
+while True:
+    index += 1
+    atomic_write_text(path, f"{{index}}:" + "x" * {PAYLOAD_SIZE} + f":{{index}}")
+    if index == 1:
+        print("ready", flush=True)
+"""
+
+
+class SimulatedCrashError(Exception):
+    pass
+
+
+async def _identity_encode(content: str) -> str:
+    return content
+
+
+def _assert_complete_payload(path: Path) -> int:
+    content = path.read_text()
+    match = PAYLOAD_PATTERN.match(content)
+    assert match is not None, f"File contains torn content of length {len(content)}."
+    assert match.group(1) == match.group(2), "File contains mixed content of two different writes."
+    return int(match.group(1))
+
+
+def test_file_is_never_torn_when_writer_process_is_killed(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "v1.profile"
+    last_index = 0
+
+    for _ in range(KILLS_AMOUNT):
+        process = subprocess.Popen(
+            [sys.executable, "-c", WRITER_PROCESS_CODE, str(path)], stdout=subprocess.PIPE, text=True
+        )
+        assert process.stdout is not None
+        assert process.stdout.readline().strip() == "ready", "Writer process should start writing."
+
+        # ACT
+        time.sleep(random.uniform(0, 0.05))  # noqa: S311
+        process.send_signal(signal.SIGKILL)
+        process.wait()
+
+        # ASSERT
+        last_index = _assert_complete_payload(path)
+
+    logger.info(f"Last complete write before kill had index {last_index}.")
+
+
+def test_previous_content_is_kept_when_write_fails_before_replace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # ARRANGE
+    path = tmp_path / "v1.profile"
+    atomic_write_text(path, "good")
+
+    def crash(*_: object) -> None:
+        raise SimulatedCrashError
+
+    monkeypatch.setattr(writer.Path, "replace", crash)
+
+    # ACT
+    with pytest.raises(SimulatedCrashError):
+        atomic_write_text(path, "torn")
+
+    # ASSERT
+    assert path.read_text() == "good", "Last good content should be preserved."
+    assert list(tmp_path.iterdir()) == [path], "Temporary file should be removed after failed write."
+
+
+async def test_saves_arriving_within_window_are_merged(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "v1.profile"
+    profile_writer = ProfileWriter(coalesce_window_secs=0.05)
+    encoded: list[str] = []
+
+    async def encode(content: str) -> str:
+        encoded.append(content)
+        return content
+
+    # ACT
+    await asyncio.gather(*[profile_writer.write(path, str(index), encode) for index in range(100)])
+
+    # ASSERT
+    assert encoded == ["99"], f"All saves should be merged into single encode of the latest content, got: {encoded}"
+    assert path.read_text() == "99", "Latest content should be written."
+
+
+async def test_error_is_propagated_to_all_merged_saves(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "v1.profile"
+    profile_writer = ProfileWriter(coalesce_window_secs=0.05)
+
+    async def encode(_: str) -> str:
+        raise SimulatedCrashError
+
+    # ACT
+    results = await asyncio.gather(
+        *[profile_writer.write(path, str(index), encode) for index in range(3)], return_exceptions=True
+    )
+
+    # ASSERT
+    assert all(isinstance(result, SimulatedCrashError) for result in results), f"Got: {results}"
+    assert not path.exists(), "Nothing should be written when encoding failed."
+
+
+async def test_flush_writes_pending_content_without_waiting_for_window(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "v1.profile"
+    profile_writer = ProfileWriter(coalesce_window_secs=60)
+    save = asyncio.create_task(profile_writer.write(path, "content", _identity_encode))
+    await asyncio.sleep(0)
+
+    # ACT
+    await asyncio.wait_for(profile_writer.flush(), timeout=5)
+
+    # ASSERT
+    assert save.done(), "Save should be completed after flush."
+    assert path.read_text() == "content", "Pending content should be written on flush."
+
+
+async def test_backlog_limit_forces_flush(tmp_path: Path) -> None:
+    # ARRANGE
+    profile_writer = ProfileWriter(coalesce_window_secs=60, max_backlog=2)
+    saves = [
+        asyncio.create_task(profile_writer.write(tmp_path / f"{index}.profile", "content", _identity_encode))
+        for index in range(3)
+    ]
+
+    # ACT
+    await asyncio.wait_for(asyncio.gather(*saves[:2]), timeout=5)
+
+    # ASSERT
+    assert profile_writer.pending_writes_amount == 1, "Only the save exceeding the backlog should be still pending."
+    await profile_writer.flush()
+
+
+async def test_last_good_profile_is_loadable_after_crash_during_save(
+    world: World,
+    prepare_profile_with_wallet: Profile,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # ARRANGE
+    encryption_service = EncryptionService(
+        WalletContainer(world.beekeeper_manager.user_wallet, world.beekeeper_manager.encryption_wallet)
+    )
+    profile = prepare_profile_with_wallet
+    profile.accounts.add_known_account("alice")
+    await profile.save(encryption_service)
+
+    def crash(*_: object) -> None:
+        raise SimulatedCrashError
+
+    monkeypatch.setattr(writer.Path, "replace", crash)
+    profile.accounts.add_known_account("bob")
+
+    # ACT
+    with pytest.raises(SimulatedCrashError):
+        await profile.save(encryption_service)
+    monkeypatch.undo()
+
+    # ASSERT
+    loaded = await Profile.load(profile.name, encryption_service)
+    assert loaded.accounts.is_account_known("alice"), "Last good profile should be loaded."
+    assert not loaded.accounts.is_account_known("bob"), "Content of the crashed save should not be visible."
+    assert profile.should_be_saved, "Profile should still be dirty after failed save."
+
+
+async def test_saves_per_second_benchmark(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    path = tmp_path / PersistentStorageService.get_current_version_profile_filename()
+    profile_writer = ProfileWriter()
+    saves_amount = 200
+    written: list[str] = []
+
+    def counted_atomic_write_text(target: Path, content: str) -> None:
+        written.append(content)
+        atomic_write_text(target, content)
+
+    monkeypatch.setattr(writer, "atomic_write_text", counted_atomic_write_text)
+
+    # ACT
+    start = time.perf_counter()
+    for index in range(saves_amount):
+        await profile_writer.write(path, str(index), _identity_encode)
+    sequential_elapsed = time.perf_counter() - start
+    sequential_writes = len(written)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[profile_writer.write(path, str(index), _identity_encode) for index in range(saves_amount)])
+    burst_elapsed = time.perf_counter() - start
+    burst_writes = len(written) - sequential_writes
+
+    # ASSERT
+    sequential_rate = saves_amount / sequential_elapsed
+    burst_rate = saves_amount / burst_elapsed
+    logger.info(
+        f"Atomic profile saves: {sequential_rate:.0f}/s sequential ({sequential_writes} writes),"
+        f" {burst_rate:.0f}/s in burst ({burst_writes} writes, coalesced)."
+    )
+    assert sequential_writes == saves_amount, "Every awaited save should be written."
+    assert burst_writes <= MAX_BURST_WRITES, f"Burst of saves should be coalesced, but took {burst_writes} writes."
+    assert written[-1] == str(saves_amount - 1), "Latest content should be written last."
+    assert path.read_text() == str(saves_amount - 1)
+    assert [child.name for child in tmp_path.iterdir()] == [path.name], "No temporary files should be left behind."
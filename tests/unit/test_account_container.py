@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from clive.__private.core.accounts import account_container
+from clive.__private.core.accounts.account_container import AccountContainerBase, KnownAccountContainer
+from clive.__private.core.accounts.account_manager import AccountManager
+from clive.__private.core.accounts.accounts import KnownAccount
+from clive.__private.core.accounts.exceptions import AccountAlreadyExistsError
+from clive.__private.core.accounts.known_accounts_file import (
+    KnownAccountsFileError,
+    dump_known_account_names,
+    load_known_account_names,
+)
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ACCOUNTS_AMOUNT: Final[int] = 100_000
+LOOKUPS_AMOUNT: Final[int] = 10_000
+
+
+def _account_name(index: int) -> str:
+    return f"account{index:06d}"
+
+
+def test_accounts_are_iterated_in_sorted_order() -> None:
+    # ARRANGE
+    container = KnownAccountContainer([KnownAccount("carol"), KnownAccount("alice")])
+
+    # ACT
+    container.add("bob", "dave")
+    container.remove("carol")
+
+    # ASSERT
+    assert container.names == ["alice", "bob", "dave"]
+    assert [account.name for account in container] == ["alice", "bob", "dave"]
+
+
+def test_get_and_contains_by_name() -> None:
+    # ARRANGE
+    container = KnownAccountContainer([KnownAccount("alice")])
+
+    # ACT & ASSERT
+    assert "alice" in container
+    assert KnownAccount("alice") in container
+    assert "bob" not in container
+    assert container.get("alice").name == "alice"
+
+
+def test_adding_duplicate_keeps_accounts_added_before() -> None:
+    # ARRANGE
+    container = KnownAccountContainer([KnownAccount("bob")])
+
+    # ACT
+    with pytest.raises(AccountAlreadyExistsError):
+        container.add("alice", "bob", "carol")
+
+    # ASSERT
+    assert container.names == ["alice", "bob"], "Accounts added before the duplicate should be kept."
+
+
+def test_iteration_is_not_affected_by_modification() -> None:
+    # ARRANGE
+    container = KnownAccountContainer([KnownAccount("alice"), KnownAccount("bob")])
+
+    # ACT
+    iterated = []
+    for account in container:
+        iterated.append(account.name)
+        container.add(f"{account.name}-copy")
+
+    # ASSERT
+    assert iterated == ["alice", "bob"]
+    assert container.names == ["alice", "alice-copy", "bob", "bob-copy"]
+
+
+@pytest.mark.parametrize("extension", ["csv", "json"])
+def test_known_accounts_file_roundtrip(tmp_path: Path, extension: str) -> None:
+    # ARRANGE
+    names = ["alice", "bob", "carol"]
+    path = tmp_path / f"known_accounts.{extension}"
+
+    # ACT
+    dump_known_account_names(path, names)
+    loaded = load_known_account_names(path)
+
+    # ASSERT
+    assert loaded == names
+
+
+def test_known_accounts_loaded_from_json_objects(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "known_accounts.json"
+    path.write_text('[{"name": "alice"}, {"name": "bob", "note": "friend"}]')
+
+    # ACT
+    loaded = load_known_account_names(path)
+
+    # ASSERT
+    assert loaded == ["alice", "bob"]
+
+
+def test_known_accounts_file_with_unsupported_extension(tmp_path: Path) -> None:
+    # ARRANGE
+    path = tmp_path / "known_accounts.txt"
+    path.write_text("alice")
+
+    # ACT & ASSERT
+    with pytest.raises(KnownAccountsFileError):
+        load_known_account_names(path)
+
+
+def test_import_known_accounts_skips_already_known() -> None:
+    # ARRANGE
+    manager = AccountManager(known_accounts=[KnownAccount("bob")])
+
+    # ACT
+    added = manager.import_known_accounts(["carol", "bob", "alice", "carol"])
+
+    # ASSERT
+    assert added == ["carol", "alice"]
+    assert manager.known.names == ["alice", "bob", "carol"]
+
+
+def test_address_book_at_scale_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    names = [_account_name(index) for index in reversed(range(ACCOUNTS_AMOUNT))]
+    manager = AccountManager()
+    rebuilds: list[int] = []
+    original_rebuild_sorted_index = AccountContainerBase._rebuild_sorted_index
+
+    def rebuild_sorted_index(self: AccountContainerBase[KnownAccount]) -> None:
+        rebuilds.append(len(self))
+        original_rebuild_sorted_index(self)
+
+    monkeypatch.setattr(AccountContainerBase, "_rebuild_sorted_index", rebuild_sorted_index)
+
+    # ACT
+    manager.import_known_accounts(names)
+    rebuilds_after_import = len(rebuilds)
+
+    name_comparisons: list[str] = []
+
+    def get_name(account: KnownAccount) -> str:
+        name_comparisons.append(account.name)
+        return account.name
+
+    monkeypatch.setattr(account_container, "_get_name", get_name)
+    for index in range(LOOKUPS_AMOUNT):
+        manager.is_account_known(_account_name(index * 7))
+        manager.known.get(_account_name(index * 3))
+    lookup_comparisons = len(name_comparisons)
+
+    manager.add_known_account(f"{_account_name(ACCOUNTS_AMOUNT // 2)}a")
+
+    # ASSERT
+    logger.info(
+        f"Address book of {ACCOUNTS_AMOUNT} accounts: {rebuilds_after_import} sort(s) on bulk import,"
+        f" {lookup_comparisons} comparisons in {LOOKUPS_AMOUNT * 2} lookups,"
+        f" {len(name_comparisons) - lookup_comparisons} comparisons on single add."
+    )
+    assert len(manager.known) == ACCOUNTS_AMOUNT + 1
+    assert manager.known.names == sorted(manager.known.names), "Accounts should be kept sorted."
+    assert rebuilds_after_import == 1, "Bulk import should sort accounts once."
+    assert len(rebuilds) == rebuilds_after_import, "Single add should not re-sort the container."
+    assert lookup_comparisons == 0, "Lookups by name should not scan the container."
+    max_single_add_comparisons = math.ceil(math.log2(ACCOUNTS_AMOUNT + 1)) + 1
+    assert len(name_comparisons) - lookup_comparisons <= max_single_add_comparisons, (
+        "Single add should bisect the sorted index."
+    )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+import pytest
+
+from clive.__private.core.node.chain_clock import ChainClock
+
+BLOCK_INTERVAL_SECS: Final[float] = ChainClock.BLOCK_INTERVAL_SECS
+GENESIS_TIME: Final[datetime] = datetime(2016, 3, 24, 16, 0, tzinfo=UTC)
+LIB_DISTANCE: Final[int] = 20
+SAMPLE_STEP_SECS: Final[float] = 0.1
+REFRESH_RATE_SECS: Final[float] = 6.0
+
+
+@dataclass
+class FakeGdpo:
+    head_block_number: int
+    time: datetime
+    last_irreversible_block_num: int
+
+
+class MockChain:
+    """
+    Deterministic chain producing a block every interval, with optionally missed blocks and skewed wall clock.
+
+    Local monotonic time is seconds since the genesis, slot `n` is produced at `production_offset + n * interval`.
+    """
+
+    def __init__(self, *, production_offset: float = 0.0, wall_clock_skew_secs: float = 0.0) -> None:
+        self.now = 1_000_000.0
+        self._production_offset = production_offset
+        self._wall_clock_skew = timedelta(seconds=wall_clock_skew_secs)
+        self._missed_slots: set[int] = set()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def wall_clock(self) -> datetime:
+        return GENESIS_TIME + timedelta(seconds=self.now) + self._wall_clock_skew
+
+    def miss_next_block(self) -> None:
+        self._missed_slots.add(self._current_slot() + 1)
+
+    def gdpo(self) -> FakeGdpo:
+        slot = self._current_slot()
+        while slot in self._missed_slots:
+            slot -= 1
+        head_block_number = slot - sum(1 for missed in self._missed_slots if missed <= slot)
+        return FakeGdpo(
+            head_block_number=head_block_number,
+            time=GENESIS_TIME + timedelta(seconds=self._production_offset + slot * BLOCK_INTERVAL_SECS),
+            last_irreversible_block_num=head_block_number - LIB_DISTANCE,
+        )
+
+    def _current_slot(self) -> int:
+        return math.floor((self.now - self._production_offset) / BLOCK_INTERVAL_SECS)
+
+
+def _create_clock(chain: MockChain) -> ChainClock:
+    return ChainClock(clock=chain.monotonic, wall_clock=chain.wall_clock)
+
+
+def _assert_extrapolated_like_chain(clock: ChainClock, chain: MockChain, *, secs: float) -> None:
+    steps = round(secs / SAMPLE_STEP_SECS)
+    for _ in range(steps):
+        chain.now += SAMPLE_STEP_SECS
+        expected = chain.gdpo()
+        assert clock.head_block_number == expected.head_block_number, f"at {chain.now}"
+        assert clock.head_block_time == expected.time, f"at {chain.now}"
+        assert clock.last_irreversible_block_num == expected.last_irreversible_block_num, f"at {chain.now}"
+
+
+@pytest.mark.parametrize("production_offset", [0.05, 1.23, 2.95])
+def test_extrapolates_head_block_between_refreshes(production_offset: float) -> None:
+    # ARRANGE
+    chain = MockChain(production_offset=production_offset)
+    clock = _create_clock(chain)
+
+    # ACT
+    clock.seed(chain.gdpo())
+
+    # ASSERT
+    _assert_extrapolated_like_chain(clock, chain, secs=REFRESH_RATE_SECS)
+
+
+def test_never_goes_ahead_of_chain_with_skewed_wall_clock() -> None:
+    # ARRANGE
+    chain = MockChain(production_offset=1.5, wall_clock_skew_secs=-10.0)
+    clock = _create_clock(chain)
+
+    # ACT & ASSERT
+    for _ in range(10):
+        clock.seed(chain.gdpo())
+        for _ in range(round(REFRESH_RATE_SECS / SAMPLE_STEP_SECS)):
+            chain.now += SAMPLE_STEP_SECS
+            expected_head_block_number = chain.gdpo().head_block_number
+            assert expected_head_block_number - 1 <= clock.head_block_number <= expected_head_block_number
+        chain.now += 0.7  # refreshes are not perfectly periodic, so the schedule gets narrowed down
+
+
+def test_drift_is_corrected_on_next_seed() -> None:
+    # ARRANGE
+    chain = MockChain(production_offset=0.5)
+    clock = _create_clock(chain)
+    clock.seed(chain.gdpo())
+
+    # ACT
+    chain.miss_next_block()
+    chain.now += REFRESH_RATE_SECS
+    clock.seed(chain.gdpo())
+
+    # ASSERT
+    assert clock.last_drift_blocks == 1
+    _assert_extrapolated_like_chain(clock, chain, secs=REFRESH_RATE_SECS)
+
+
+def test_extrapolation_stops_when_not_seeded_for_long() -> None:
+    # ARRANGE
+    chain = MockChain(production_offset=0.5)
+    clock = _create_clock(chain)
+    clock.seed(chain.gdpo())
+    chain.now += ChainClock.MAX_EXTRAPOLATION_SECS
+    head_block_number_at_limit = clock.head_block_number
+
+    # ACT
+    chain.now += 10 * BLOCK_INTERVAL_SECS
+
+    # ASSERT
+    assert clock.head_block_number == head_block_number_at_limit
+
+
+def test_secs_until_next_block() -> None:
+    # ARRANGE
+    chain = MockChain(production_offset=0.5)
+    clock = _create_clock(chain)
+    clock.seed(chain.gdpo())
+    head_block_number = chain.gdpo().head_block_number
+
+    # ACT
+    chain.now += clock.secs_until_next_block + SAMPLE_STEP_SECS / 10  # just after the block is produced
+
+    # ASSERT
+    assert chain.gdpo().head_block_number == head_block_number + 1
+    assert clock.head_block_number == head_block_number + 1
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import math
+from typing import Any, Final
+
+from clive.__private.core.suggestion_index import SuggestionIndex
+from clive.__private.logger import logger
+from clive.__private.ui.clive_suggester import CliveSuggester
+
+SUGGESTIONS_AMOUNT: Final[int] = 50_000
+TYPED_VALUE: Final[str] = "account04999"
+NODE_LATENCY_SECONDS: Final[float] = 0.01
+
+
+class CountingList(list[str]):
+    """List counting how many of its items were inspected, both by indexing and by bisecting."""
+
+    inspections: int = 0
+
+    def __getitem__(self, index: Any) -> Any:  # noqa: ANN401
+        self.inspections += 1
+        return super().__getitem__(index)
+
+
+class MockedListAccounts:
+    """Local mock of `database_api.list_accounts` ordered by name."""
+
+    def __init__(self, names: list[str], *, latency: float = NODE_LATENCY_SECONDS) -> None:
+        self._names = sorted(names)
+        self._latency = latency
+        self.calls: list[str] = []
+
+    async def __call__(self, start: str, limit: int = 10) -> list[str]:
+        self.calls.append(start)
+        await asyncio.sleep(self._latency)
+        index = bisect.bisect_left(self._names, start)
+        return self._names[index : index + limit]
+
+
+def test_suggestion_index_ranks_used_suggestions_first() -> None:
+    # ARRANGE
+    index = SuggestionIndex(["alice", "alicja", "alex", "bob"])
+
+    # ACT
+    index.record_use("alicja")
+    index.record_use("alex")
+    index.record_use("alex")
+
+    # ASSERT
+    assert index.find("al") == ["alex", "alicja", "alice"], "More frequently used should be first."
+    assert index.find("ali") == ["alicja", "alice"]
+    assert index.find("b") == ["bob"]
+    assert index.find("c") == []
+
+
+async def test_suggester_switches_between_matches() -> None:
+    # ARRANGE
+    suggester = CliveSuggester(["bob", "alice", "alicja"])
+
+    # ACT
+    first = await suggester.get_suggestion("ali")
+    suggester.next_selection()
+    second = await suggester.get_suggestion("ali")
+
+    # ASSERT
+    assert (first, second) == ("alice", "alicja")
+
+
+async def test_source_is_asked_only_when_nothing_matches_locally_and_results_are_cached() -> None:
+    # ARRANGE
+    source = MockedListAccounts(["gtg", "gtg-backup", "hiveio"], latency=0)
+    suggester = CliveSuggester(["alice"], source=source, source_debounce_secs=0)
+
+    # ACT
+    local = await suggester.get_suggestion("ali")
+    remote = await suggester.get_suggestion("gtg")
+    remote_again = await suggester.get_suggestion("gtg")
+
+    # ASSERT
+    assert local == "alice"
+    assert remote == remote_again == "gtg"
+    assert source.calls == ["gtg"], "Source should be asked once and only for values not matching locally."
+
+
+async def test_stale_source_lookup_is_cancelled() -> None:
+    # ARRANGE
+    source = MockedListAccounts(["gtg", "gtg-backup", "hiveio"])
+    suggester = CliveSuggester(source=source, source_debounce_secs=0)
+
+    # ACT
+    stale = asyncio.create_task(suggester.get_suggestion("g"))
+    await asyncio.sleep(0)  # let the first lookup start
+    latest = await suggester.get_suggestion("hi")
+
+    # ASSERT
+    assert await stale is None, "Stale lookup should be dropped."
+    assert latest == "hiveio"
+    assert suggester.current_suggestion == "hiveio", "Stale lookup should not override the latest matches."
+
+
+async def test_source_is_asked_only_after_typing_stops() -> None:
+    # ARRANGE
+    source = MockedListAccounts(["gtg", "gtg-backup", "hiveio"], latency=0)
+    suggester = CliveSuggester(source=source, source_debounce_secs=NODE_LATENCY_SECONDS)
+
+    # ACT
+    for prefix in ["g", "gt"]:
+        asyncio.create_task(suggester.get_suggestion(prefix))  # noqa: RUF006
+        await asyncio.sleep(0)  # keystrokes come faster than the debounce delay
+    suggestion = await suggester.get_suggestion("gtg")
+
+    # ASSERT
+    assert suggestion == "gtg"
+    assert source.calls == ["gtg"], "Source should be asked only for the value typed last."
+
+
+async def test_typing_with_many_suggestions_benchmark() -> None:
+    # ARRANGE
+    suggester = CliveSuggester(f"account{index:06d}" for index in reversed(range(SUGGESTIONS_AMOUNT)))
+    prefixes = [TYPED_VALUE[:length] for length in range(1, len(TYPED_VALUE) + 1)]
+    keys = CountingList(suggester._suggestion_index._keys)
+    suggester._suggestion_index._keys = keys
+    max_inspections_per_keystroke = math.ceil(math.log2(SUGGESTIONS_AMOUNT)) + CliveSuggester.MAX_MATCHES + 1
+
+    # ACT
+    inspections_per_keystroke = []
+    for prefix in prefixes:
+        keys.inspections = 0
+        suggestion = await suggester.get_suggestion(prefix)
+        inspections_per_keystroke.append(keys.inspections)
+
+    # ASSERT
+    logger.info(
+        f"Suggestions for {len(prefixes)} keystrokes among {SUGGESTIONS_AMOUNT} suggestions:"
+        f" max {max(inspections_per_keystroke)} inspected per keystroke, total {sum(inspections_per_keystroke)}."
+    )
+    assert suggestion == f"{TYPED_VALUE}0"
+    assert max(inspections_per_keystroke) <= max_inspections_per_keystroke, (
+        "Suggestions should be found without scanning all of them on a keystroke."
+    )
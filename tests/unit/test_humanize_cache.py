@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Final
+
+import humanize
+import pytest
+
+from clive.__private.core.formatters.humanize import (
+    _align_to_dot,
+    _format_datetime,
+    _humanize_asset,
+    _humanize_natural_timedelta,
+    _humanize_votes,
+    align_to_dot,
+    clear_formatter_caches,
+    humanize_asset,
+    humanize_datetime,
+    humanize_hive_power,
+    humanize_natural_time,
+    humanize_votes_with_suffix,
+)
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+
+SEED: Final[int] = 44
+ROWS_AMOUNT: Final[int] = 100
+RENDERS_AMOUNT: Final[int] = 1000
+
+
+@dataclass
+class FakeGlobalProperties:
+    total_vesting_fund_hive: Asset.Hive
+    total_vesting_shares: Asset.Vests
+
+
+@dataclass
+class FakeWitness:
+    owner: str
+    votes: int
+    created: datetime
+
+
+@dataclass
+class FakeProposal:
+    subject: str
+    total_votes: int
+    daily_pay: Asset.Hbd
+    start_date: datetime
+    end_date: datetime
+
+
+CACHED_FORMATTERS: Final = (
+    _align_to_dot,
+    _format_datetime,
+    _humanize_asset,
+    _humanize_natural_timedelta,
+    _humanize_votes,
+)
+GDPO: Final[FakeGlobalProperties] = FakeGlobalProperties(Asset.hive(200_000_000), Asset.vests(400_000_000_000))
+
+
+def _create_witnesses(rng: random.Random) -> list[FakeWitness]:
+    return [
+        FakeWitness(
+            f"witness-{number}",
+            votes=rng.randint(10**12, 10**17),
+            created=datetime(2016, 3, 24, tzinfo=UTC) + timedelta(days=rng.randint(0, 3000)),
+        )
+        for number in range(ROWS_AMOUNT)
+    ]
+
+
+def _create_proposals(rng: random.Random) -> list[FakeProposal]:
+    start_date = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        FakeProposal(
+            f"proposal-{number}",
+            total_votes=rng.randint(10**12, 10**17),
+            daily_pay=Asset.Hbd(amount=rng.randint(1, 10**7)),
+            start_date=start_date + timedelta(days=rng.randint(0, 300)),
+            end_date=start_date + timedelta(days=rng.randint(301, 900)),
+        )
+        for number in range(ROWS_AMOUNT)
+    ]
+
+
+def _render_witnesses(witnesses: list[FakeWitness]) -> list[tuple[str, ...]]:
+    return [
+        (witness.owner, humanize_votes_with_suffix(witness.votes, GDPO), humanize_datetime(witness.created))
+        for witness in witnesses
+    ]
+
+
+def _render_proposals(proposals: list[FakeProposal]) -> list[tuple[str, ...]]:
+    rows = []
+    for proposal in proposals:
+        daily_pay = humanize_asset(proposal.daily_pay)
+        votes = humanize_votes_with_suffix(proposal.total_votes, GDPO)
+        rows.append(
+            (
+                proposal.subject,
+                *align_to_dot(daily_pay, votes),
+                humanize_datetime(proposal.start_date, with_time=False),
+                humanize_datetime(proposal.end_date, with_time=False, with_relative_time=True),
+            )
+        )
+    return rows
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        timedelta(0),
+        timedelta(microseconds=999_999),
+        timedelta(seconds=59, microseconds=999_999),
+        timedelta(minutes=1, seconds=59),
+        timedelta(minutes=59, seconds=59),
+        timedelta(hours=1, minutes=59),
+        timedelta(hours=23, minutes=59, seconds=59),
+        timedelta(days=1, hours=23),
+        timedelta(days=45, hours=12),
+        timedelta(days=400, hours=23),
+    ],
+)
+@pytest.mark.parametrize("sign", [1, -1])
+def test_natural_time_is_same_as_without_cache(delta: timedelta, sign: int) -> None:
+    # ARRANGE
+    clear_formatter_caches()
+    value = delta * sign
+
+    # ACT
+    result = humanize_natural_time(value)
+
+    # ASSERT
+    assert result == humanize.naturaltime(value)
+
+
+def test_natural_time_is_reused_within_bucket() -> None:
+    # ARRANGE
+    clear_formatter_caches()
+
+    # ACT
+    first = humanize_natural_time(timedelta(days=2, hours=1))
+    second = humanize_natural_time(timedelta(days=2, hours=23, minutes=59))
+
+    # ASSERT
+    assert first == second == "2 days ago"
+
+
+def test_cached_formatters_return_independent_results() -> None:
+    # ARRANGE
+    clear_formatter_caches()
+    aligned = align_to_dot("2.00 %", "12.00 %")
+
+    # ACT
+    aligned.append("mutated by caller")
+
+    # ASSERT
+    assert align_to_dot("2.00 %", "12.00 %") == [" 2.00 %", "12.00 %"]
+    assert humanize_hive_power(Asset.hive(1035.401)) == "1.0K HP"
+
+
+def test_same_moment_in_other_timezone_is_not_taken_from_cache() -> None:
+    # ARRANGE
+    clear_formatter_caches()
+    moment = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+    # ACT
+    in_utc = humanize_datetime(moment)
+    in_other_timezone = humanize_datetime(moment.astimezone(timezone(timedelta(hours=2))))
+
+    # ASSERT
+    assert in_utc == "2025-01-01T12:00:00"
+    assert in_other_timezone == "2025-01-01T14:00:00"
+
+
+def _count_formatter_calls() -> int:
+    """Sum how many times the memoized formatters really formatted a value since their caches were cleared."""
+    return sum(formatter.cache_info().misses for formatter in CACHED_FORMATTERS)
+
+
+def test_rendering_tables_benchmark() -> None:
+    # ARRANGE
+    rng = random.Random(SEED)  # noqa: S311
+    witnesses = _create_witnesses(rng)
+    proposals = _create_proposals(rng)
+
+    # ACT
+    uncached_calls = 0
+    for _ in range(RENDERS_AMOUNT):
+        clear_formatter_caches()
+        expected = (_render_witnesses(witnesses), _render_proposals(proposals))
+        uncached_calls += _count_formatter_calls()
+    single_render_calls = uncached_calls // RENDERS_AMOUNT
+
+    clear_formatter_caches()
+    for _ in range(RENDERS_AMOUNT):
+        rendered = (_render_witnesses(witnesses), _render_proposals(proposals))
+    cached_calls = _count_formatter_calls()
+
+    # ASSERT
+    logger.info(
+        f"Rendered witnesses and proposals tables ({ROWS_AMOUNT} rows each) {RENDERS_AMOUNT} times:"
+        f" without cache with {uncached_calls} formatter calls, with cache with {cached_calls} formatter calls"
+    )
+    assert rendered == expected
+    # relative time of the proposal end may move to the next day once while rendering
+    assert cached_calls <= single_render_calls + ROWS_AMOUNT, "Repeated renders should be served from cache."
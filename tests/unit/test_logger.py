@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Final, TextIO
+
+from loguru import logger as loguru_logger
+
+from clive.__private.logger import LogFilesGroup, LogFilesSink, Logger, get_log_category, logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    import pytest
+    from loguru import Message
+    from loguru._handler import Handler
+
+RECORDS_AMOUNT: Final[int] = 20_000
+WRITER_THREAD_NAME: Final[str] = "clive_log_writer"
+
+
+class RecordingTextualLogger:
+    def __init__(self, records: list[str]) -> None:
+        self._records = records
+
+    def __getattr__(self, item: str) -> Callable[..., None]:
+        def log(*args: object, **_: object) -> None:
+            self._records.append(f"{item}: {args}")
+
+        return log
+
+
+class ThreadRecordingFile:
+    """Wraps a log file, recording names of threads that write to it or flush it."""
+
+    def __init__(self, file: TextIO, threads: set[str]) -> None:
+        self._file = file
+        self._threads = threads
+
+    def write(self, text: str) -> int:
+        self._threads.add(threading.current_thread().name)
+        return self._file.write(text)
+
+    def flush(self) -> None:
+        self._threads.add(threading.current_thread().name)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _create_sink(tmp_path: Path) -> tuple[LogFilesSink, Path, Path]:
+    debug_path = tmp_path / "debug.log"
+    info_path = tmp_path / "info.log"
+    sink = LogFilesSink(
+        [
+            LogFilesGroup(
+                paths=(debug_path,), min_level_no_per_category={"clive": 10, "1st_party": 10, "3rd_party": 10}
+            ),
+            LogFilesGroup(
+                paths=(info_path,), min_level_no_per_category={"clive": 20, "1st_party": 20, "3rd_party": 20}
+            ),
+        ]
+    )
+    return sink, debug_path, info_path
+
+
+def _get_log_files_handlers() -> list[Handler]:
+    handlers: dict[int, Handler] = loguru_logger._core.handlers  # type: ignore[attr-defined]
+    return [
+        handler for handler in handlers.values() if isinstance(getattr(handler._sink, "_stream", None), LogFilesSink)
+    ]
+
+
+def test_setup_can_be_called_repeatedly() -> None:
+    # ACT
+    logger.setup(enable_textual=False)
+    logger.setup(enable_textual=False)
+
+    # ASSERT
+    assert len(_get_log_files_handlers()) == 1, "Log files handler should be replaced, not removed nor duplicated."
+    logger.info("Record logged after repeated setup.")
+
+
+def test_log_category_is_computed_once_per_name() -> None:
+    # ARRANGE
+    get_log_category.cache_clear()
+
+    # ACT
+    categories = [get_log_category(name) for name in ("clive.__private.ui.app", "beekeepy._remote", "httpx")]
+    get_log_category("clive.__private.ui.app")
+
+    # ASSERT
+    assert categories == ["clive", "1st_party", "3rd_party"]
+    assert get_log_category.cache_info().hits == 1
+
+
+def test_records_are_fanned_out_to_files_accepting_them(tmp_path: Path) -> None:
+    # ARRANGE
+    sink, debug_path, info_path = _create_sink(tmp_path)
+    handler_id = loguru_logger.add(sink, level=sink.min_level_no, filter=sink.accepts, format="{message}")
+
+    # ACT
+    loguru_logger.debug("debug record")
+    loguru_logger.info("info record")
+    loguru_logger.remove(handler_id)
+
+    # ASSERT
+    assert debug_path.read_text().splitlines() == ["debug record", "info record"]
+    assert info_path.read_text().splitlines() == ["info record"]
+
+
+def test_dropped_records_never_reach_sink_nor_textual_console(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # ARRANGE
+    sink, _, _ = _create_sink(tmp_path)
+    sink_writes: list[str] = []
+    original_write = sink.write
+
+    def write(message: Message) -> None:
+        sink_writes.append(str(message))
+        original_write(message)
+
+    sink.write = write  # type: ignore[method-assign]
+    handler_id = loguru_logger.add(sink, level=sink.min_level_no, filter=sink.accepts, format="{message}")
+    textual_records: list[str] = []
+    monkeypatch.setattr(
+        Logger, "_get_textual_logger_lazy", staticmethod(lambda: RecordingTextualLogger(textual_records))
+    )
+    tested_logger = Logger()
+    built_messages: list[int] = []
+
+    def build_message(index: int) -> str:
+        built_messages.append(index)
+        return f"Dropped record {index}"
+
+    # ACT
+    for index in range(RECORDS_AMOUNT):
+        tested_logger.trace(lambda index=index: build_message(index))  # below the minimal level of all handlers
+    loguru_logger.remove(handler_id)
+
+    # ASSERT
+    assert not built_messages, "Message of dropped record should not be built."
+    assert not sink_writes, "Dropped records should not reach the sink nor its queue."
+    assert not textual_records, "Dropped records should not reach the textual console."
+
+
+def test_written_records_are_saved_by_writer_thread_only(tmp_path: Path) -> None:
+    # ARRANGE
+    sink, _, info_path = _create_sink(tmp_path)
+    file_operations_threads: set[str] = set()
+    sink._files = [[ThreadRecordingFile(file, file_operations_threads) for file in files] for files in sink._files]
+    handler_id = loguru_logger.add(sink, level=sink.min_level_no, filter=sink.accepts, format="{message}")
+    value = {"key": "value"}
+
+    # ACT
+    for index in range(RECORDS_AMOUNT):
+        logger.info("Written record {}: {}", index, value)
+    loguru_logger.remove(handler_id)
+
+    # ASSERT
+    assert len(info_path.read_text().splitlines()) == RECORDS_AMOUNT
+    assert file_operations_threads == {WRITER_THREAD_NAME}, "Emitting thread should never do the file I/O."
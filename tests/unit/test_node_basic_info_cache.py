@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Final
+
+import msgspec
+import pytest
+
+from clive.__private.core.node import Node
+from clive.__private.core.node.async_hived.api.database_api import AsyncDatabaseApi
+from clive.__private.core.node.basic_info_cache import NodeBasicInfoCache
+from clive.__private.logger import logger
+from clive.__private.settings import safe_settings
+
+if TYPE_CHECKING:
+    import test_tools as tt
+
+    from clive.__private.core.world import World
+
+COMMAND_RUNS: Final[int] = 5
+COUNTED_METHODS: Final[tuple[str, ...]] = ("get_config", "get_version")
+
+
+@pytest.fixture
+def api_calls(init_node: tt.InitNode, monkeypatch: pytest.MonkeyPatch) -> Counter[str]:  # noqa: ARG001
+    """Count calls of node methods which return the basic info, starting with an empty cache."""
+    safe_settings.node.basic_info_cache_path.unlink(missing_ok=True)
+    calls: Counter[str] = Counter()
+
+    def count(method: str) -> None:
+        original = getattr(AsyncDatabaseApi, method)
+
+        async def counted(self: AsyncDatabaseApi, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            calls[method] += 1
+            return await original(self, *args, **kwargs)
+
+        monkeypatch.setattr(AsyncDatabaseApi, method, counted)
+
+    for method in COUNTED_METHODS:
+        count(method)
+    return calls
+
+
+async def _run_command(world: World) -> Node:
+    """Simulate a CLI command, which creates its own node in a new process."""
+    node = Node(world.profile)
+    try:
+        await node.cached.config
+        await node.cached.chain_id
+        await node.cached.network_type
+        await node.cached.wait_for_revalidation()
+    finally:
+        node.teardown()
+    return node
+
+
+async def test_basic_info_is_fetched_once_across_command_runs(world: World, api_calls: Counter[str]) -> None:
+    # ACT
+    for _ in range(COMMAND_RUNS):
+        await _run_command(world)
+
+    # ASSERT
+    logger.info(f"{COMMAND_RUNS} command runs called {dict(api_calls)}, without cache it would be {COMMAND_RUNS} each")
+    assert api_calls == {"get_version": COMMAND_RUNS, "get_config": 1}, "Only the version is checked on next runs."
+
+
+@pytest.mark.parametrize("saved_at", [0, None], ids=["stale", "fresh"])
+async def test_changed_version_is_detected_in_background(
+    world: World, api_calls: Counter[str], saved_at: float | None
+) -> None:
+    # ARRANGE
+    node = await _run_command(world)
+    address = node.http_endpoint_key
+    current = NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0).load(address)
+    assert current is not None
+    outdated_version = msgspec.structs.replace(current.version, hive_revision="0" * len(current.version.hive_revision))
+    outdated_cache = (
+        NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0)
+        if saved_at is None
+        else NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0, clock=lambda: saved_at)
+    )
+    outdated_cache.store(address, current.config, outdated_version)
+    api_calls.clear()
+
+    # ACT
+    await _run_command(world)
+
+    # ASSERT
+    refreshed = NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0).load(address)
+    assert refreshed is not None
+    assert refreshed.fingerprint == current.fingerprint
+    assert api_calls == {"get_version": 2, "get_config": 1}, "Version is checked, then basic info fetched again."
+
+
+async def test_up_to_date_version_is_confirmed_without_config(world: World, api_calls: Counter[str]) -> None:
+    # ARRANGE
+    node = await _run_command(world)
+    cache = NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0)
+    current = cache.load(node.http_endpoint_key)
+    assert current is not None
+    NodeBasicInfoCache(safe_settings.node.basic_info_cache_path, 0, clock=lambda: 0).store(
+        node.http_endpoint_key, current.config, current.version
+    )
+    api_calls.clear()
+
+    # ACT
+    await _run_command(world)
+
+    # ASSERT
+    confirmed = cache.load(node.http_endpoint_key)
+    assert confirmed is not None
+    assert confirmed.saved_at > 0
+    assert api_calls == {"get_version": 1}
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+import ssl
+import subprocess
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from beekeepy.communication import CommunicationSettings
+from beekeepy.interfaces import HttpUrl
+
+from clive.__private.core.node.connection_pool import (
+    ConnectionPoolSettings,
+    PersistentDnsResolver,
+    PooledAioHttpCommunicator,
+)
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+REQUESTS_AMOUNT: Final[int] = 5
+RUNS_AMOUNT: Final[int] = 2
+RESPONSE: Final[bytes] = json.dumps({"jsonrpc": "2.0", "result": {}, "id": 0}).encode()
+
+
+class TlsMockServer:
+    """HTTPS server answering every request with the same JSON, counting TLS handshakes (accepted connections)."""
+
+    def __init__(self, certificate: Path, key: Path) -> None:
+        self._context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._context.load_cert_chain(certificate, key)
+        self._server: asyncio.Server | None = None
+        self.handshakes = 0
+        self.requests = 0
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None, "server is not started"
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0, ssl=self._context)
+
+    async def stop(self) -> None:
+        assert self._server is not None, "server is not started"
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.handshakes += 1
+        try:
+            while headers := await reader.readuntil(b"\r\n\r\n"):
+                content_length = next(
+                    (
+                        int(line.split(b":", maxsplit=1)[1])
+                        for line in headers.lower().split(b"\r\n")
+                        if line.startswith(b"content-length:")
+                    ),
+                    0,
+                )
+                await reader.readexactly(content_length)
+                self.requests += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n"
+                    + f"Content-Length: {len(RESPONSE)}\r\n\r\n".encode()
+                    + RESPONSE
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def certificate(tmp_path: Path) -> tuple[Path, Path]:
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        pytest.skip("openssl is required to generate the certificate of the TLS mock server")
+    certificate, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(
+        [
+            openssl,
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost,IP:127.0.0.1",
+            "-keyout",
+            str(key),
+            "-out",
+            str(certificate),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certificate, key
+
+
+@pytest.fixture
+async def tls_server(certificate: tuple[Path, Path]) -> AsyncIterator[TlsMockServer]:
+    server = TlsMockServer(*certificate)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _create_communicator(certificate: tuple[Path, Path], dns_cache_path: Path) -> PooledAioHttpCommunicator:
+    return PooledAioHttpCommunicator(
+        settings=CommunicationSettings(),
+        pool_settings=ConnectionPoolSettings(
+            dns_cache_path=dns_cache_path, ssl_context=ssl.create_default_context(cafile=certificate[0])
+        ),
+    )
+
+
+async def test_connection_is_kept_alive_and_reused(
+    tmp_path: Path, certificate: tuple[Path, Path], tls_server: TlsMockServer
+) -> None:
+    # ARRANGE
+    communicator = _create_communicator(certificate, tmp_path / "dns_cache.json")
+    url = HttpUrl(f"https://localhost:{tls_server.port}")
+
+    # ACT
+    for _ in range(REQUESTS_AMOUNT):
+        await communicator.async_post(url, data='{"jsonrpc": "2.0", "method": "test", "id": 0}')
+    await communicator.close()
+
+    # ASSERT
+    metrics = communicator.metrics
+    logger.info(
+        f"{metrics.requests} requests, {tls_server.handshakes} TLS handshakes,"
+        f" average connect time {metrics.average_connect_secs:.4f}s"
+    )
+    assert tls_server.requests == REQUESTS_AMOUNT
+    assert tls_server.handshakes == 1
+    assert metrics.new_connections == 1
+    assert metrics.reused_connections == REQUESTS_AMOUNT - 1
+    assert metrics.connect_secs > 0
+
+
+async def test_resolved_address_is_persisted_between_runs(
+    tmp_path: Path, certificate: tuple[Path, Path], tls_server: TlsMockServer
+) -> None:
+    # ARRANGE
+    dns_cache_path = tmp_path / "dns_cache.json"
+    url = HttpUrl(f"https://localhost:{tls_server.port}")
+    first_run = _create_communicator(certificate, dns_cache_path)
+    second_run = _create_communicator(certificate, dns_cache_path)
+
+    # ACT
+    await first_run.async_post(url, data="{}")
+    await first_run.close()
+    await second_run.async_post(url, data="{}")
+    await second_run.close()
+
+    # ASSERT
+    assert first_run.metrics.dns_resolutions == 1
+    assert second_run.metrics.dns_resolutions == 0
+    assert second_run.metrics.dns_cache_hits == 1
+    assert tls_server.handshakes == RUNS_AMOUNT, "Each run connects on its own."
+
+
+async def test_resolver_is_closed_when_session_is_recreated(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, certificate: tuple[Path, Path], tls_server: TlsMockServer
+) -> None:
+    # ARRANGE
+    closed_resolvers: list[PersistentDnsResolver] = []
+    close = PersistentDnsResolver.close
+
+    async def _close(resolver: PersistentDnsResolver) -> None:
+        closed_resolvers.append(resolver)
+        await close(resolver)
+
+    monkeypatch.setattr(PersistentDnsResolver, "close", _close)
+    url = HttpUrl(f"https://localhost:{tls_server.port}")
+    communicator = _create_communicator(certificate, tmp_path / "dns_cache.json")
+
+    # ACT
+    for _ in range(RUNS_AMOUNT):
+        await communicator.async_post(url, data="{}")
+        await (await communicator.session).close()  # session is recreated on the next request
+    await communicator.async_post(url, data="{}")
+    await communicator.close()
+
+    # ASSERT
+    assert len(closed_resolvers) == RUNS_AMOUNT + 1
+    assert len(set(map(id, closed_resolvers))) == len(closed_resolvers), "Each session should have its own resolver."
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Final, Literal
+
+import beekeepy.exceptions as bke
+import pytest
+from beekeepy.communication import CommunicationSettings
+from beekeepy.interfaces import HttpUrl
+
+from clive.__private.core.node.connection_pool import PooledAioHttpCommunicator
+from clive.__private.core.node.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitStateChange,
+    ExponentialBackoff,
+    ResiliencePolicy,
+    ResilientOverseer,
+    RetryBudgets,
+)
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+Fault = Literal["none", "server_error", "disconnect", "hang", "unparsable", "error_response"]
+
+REQUEST: Final[str] = json.dumps({"jsonrpc": "2.0", "method": "database_api.get_config", "params": {}, "id": 0})
+OUTAGE_REQUESTS_AMOUNT: Final[int] = 20
+FAILURE_THRESHOLD: Final[int] = 5
+FIXED_RETRIES: Final[int] = 5
+"""Retries of every failed request done before, whatever the failure was."""
+BUDGETS: Final[RetryBudgets] = RetryBudgets(timeout=1, connection=2, server_error=3, json_rpc_error=4)
+TIMEOUT: Final[timedelta] = timedelta(seconds=0.2)
+REQUESTS_AFTER_RECOVERY: Final[int] = 2
+"""The probe and the request sent after the circuit closed."""
+
+
+class FaultInjectingServer:
+    """HTTP server answering JSON-RPC requests, or failing them in the way set by `fault`."""
+
+    def __init__(self) -> None:
+        self._server: asyncio.Server | None = None
+        self._released = asyncio.Event()
+        self.fault: Fault = "none"
+        self.requests = 0
+
+    @property
+    def url(self) -> HttpUrl:
+        assert self._server is not None, "server is not started"
+        return HttpUrl(f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}")
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self._server is not None, "server is not started"
+        self._released.set()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while headers := await reader.readuntil(b"\r\n\r\n"):
+                content_length = next(
+                    (
+                        int(line.split(b":", maxsplit=1)[1])
+                        for line in headers.lower().split(b"\r\n")
+                        if line.startswith(b"content-length:")
+                    ),
+                    0,
+                )
+                request_id = json.loads(await reader.readexactly(content_length))["id"]
+                self.requests += 1
+                if self.fault == "disconnect":
+                    return
+                if self.fault == "hang":
+                    await self._released.wait()
+                    return
+                writer.write(self._create_response(request_id))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _create_response(self, request_id: int) -> bytes:
+        status, body = "200 OK", json.dumps({"jsonrpc": "2.0", "result": {}, "id": request_id})
+        if self.fault == "server_error":
+            status, body = "503 Service Unavailable", "<html>node is restarting</html>"
+        elif self.fault == "unparsable":
+            body = "<html>not a json</html>"
+        elif self.fault == "error_response":
+            body = json.dumps({"jsonrpc": "2.0", "error": {"code": -32003, "message": "Assert"}, "id": request_id})
+        return f"HTTP/1.1 {status}\r\nConnection: keep-alive\r\nContent-Length: {len(body)}\r\n\r\n{body}".encode()
+
+
+class ManualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[FaultInjectingServer]:
+    server = FaultInjectingServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _create_overseer(breaker: CircuitBreaker) -> ResilientOverseer:
+    communicator = PooledAioHttpCommunicator(settings=CommunicationSettings(timeout=TIMEOUT, max_retries=FIXED_RETRIES))
+    policy = ResiliencePolicy(BUDGETS, ExponentialBackoff(base_secs=0.01, max_secs=0.05), breaker)
+    return ResilientOverseer(communicator=communicator, policy=policy)
+
+
+async def _close(overseer: ResilientOverseer) -> None:
+    communicator = overseer.communicator
+    assert isinstance(communicator, PooledAioHttpCommunicator)
+    await communicator.close()
+
+
+async def _send(overseer: ResilientOverseer, server: FaultInjectingServer) -> None:
+    await overseer.async_send(server.url, "POST", data=REQUEST)
+
+
+@pytest.mark.parametrize(
+    ("fault", "expected_attempts"),
+    [
+        ("server_error", 1 + BUDGETS.server_error),
+        ("disconnect", 1 + BUDGETS.connection),
+        ("hang", 1 + BUDGETS.timeout),
+        ("unparsable", 1 + BUDGETS.json_rpc_error),
+        ("error_response", 1),  # reported by the node, e.g. missing authority
+    ],
+)
+async def test_failure_is_retried_within_its_budget(
+    server: FaultInjectingServer, fault: Fault, expected_attempts: int
+) -> None:
+    # ARRANGE
+    breaker = CircuitBreaker(failure_threshold=0)
+    overseer = _create_overseer(breaker)
+    server.fault = fault
+
+    # ACT
+    with pytest.raises(bke.CommunicationError):
+        await _send(overseer, server)
+    await _close(overseer)
+
+    # ASSERT
+    assert server.requests == expected_attempts
+    assert breaker.state == "closed"
+
+
+async def test_outage_fails_fast_after_circuit_opens(server: FaultInjectingServer) -> None:
+    # ARRANGE
+    breaker = CircuitBreaker(failure_threshold=FAILURE_THRESHOLD, open_secs=60)
+    overseer = _create_overseer(breaker)
+    server.fault = "server_error"
+    fail_times: list[float] = []
+
+    # ACT
+    for _ in range(OUTAGE_REQUESTS_AMOUNT):
+        start = time.perf_counter()
+        with pytest.raises(bke.CommunicationError):
+            await _send(overseer, server)
+        fail_times.append(time.perf_counter() - start)
+    await _close(overseer)
+
+    # ASSERT
+    fast_fail_times = fail_times[-breaker.rejected_requests :]
+    logger.info(
+        f"{OUTAGE_REQUESTS_AMOUNT} requests during the outage sent {server.requests} HTTP requests"
+        f" (with fixed retries {OUTAGE_REQUESTS_AMOUNT * (1 + FIXED_RETRIES)}), first failed in {fail_times[0]:.4f}s,"
+        f" after opening the circuit in at most {max(fast_fail_times):.6f}s"
+    )
+    assert breaker.state == "open"
+    assert server.requests == FAILURE_THRESHOLD
+    assert breaker.rejected_requests == OUTAGE_REQUESTS_AMOUNT - 2, "The second request opens the circuit."
+    assert max(fast_fail_times) < fail_times[0]
+
+
+async def test_single_probe_closes_circuit_after_recovery(server: FaultInjectingServer) -> None:
+    # ARRANGE
+    clock = ManualClock()
+    breaker = CircuitBreaker(failure_threshold=1, open_secs=10, clock=clock)
+    transitions: list[CircuitStateChange] = []
+    breaker.subscribe(transitions.append)
+    overseer = _create_overseer(breaker)
+    server.fault = "disconnect"
+    with pytest.raises(bke.CommunicationError):
+        await _send(overseer, server)
+    server.fault = "none"
+    server.requests = 0
+
+    # ACT
+    with pytest.raises(CircuitOpenError):
+        await _send(overseer, server)
+    clock.now += 10
+    results = await asyncio.gather(*[_send(overseer, server) for _ in range(3)], return_exceptions=True)
+    await _send(overseer, server)
+    await _close(overseer)
+
+    # ASSERT
+    assert [isinstance(result, CircuitOpenError) for result in results] == [False, True, True]
+    assert server.requests == REQUESTS_AFTER_RECOVERY, "Only the probe is sent when half-open, then requests are sent."
+    assert [(change.previous, change.current) for change in transitions] == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotNeeds, SnapshotRound
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from clive.__private.core.node import Node
+
+ROUND_TRIP_SECS: Final[float] = 0.02
+PROVIDERS_AMOUNT: Final[int] = 4
+
+
+class FakeApiCall:
+    def __init__(self, node: FakeNode, api: str) -> None:
+        self._node = node
+        self._api = api
+
+    def __getattr__(self, method: str) -> Callable[..., Awaitable[str]]:
+        async def call(**params: Any) -> str:
+            self._node.requests.append(f"{self._api}.{method}")
+            return f"{self._api}.{method}({sorted(params.items())})"
+
+        return call
+
+
+class FakeApi:
+    def __init__(self, node: FakeNode) -> None:
+        self._node = node
+
+    def __getattr__(self, api: str) -> FakeApiCall:
+        return FakeApiCall(self._node, api)
+
+
+class FakeNode:
+    """Node answering every call with its description, counting round trips (batches) and requests in them."""
+
+    def __init__(self, round_trip_secs: float = 0.0) -> None:
+        self._round_trip_secs = round_trip_secs
+        self.api = FakeApi(self)
+        self.batches = 0
+        self.requests: list[str] = []
+
+    async def batch(self, *, delay_error_on_data_access: bool = False) -> Any:  # noqa: ANN401
+        assert delay_error_on_data_access, "Error of a single call should not fail all the retrievals."
+
+        @asynccontextmanager
+        async def impl() -> AsyncIterator[FakeNode]:
+            yield self
+            self.batches += 1
+            await asyncio.sleep(self._round_trip_secs)
+
+        return impl()
+
+
+def _declare_dashboard_needs(account_name: str) -> Callable[[SnapshotNeeds], None]:
+    def declare_needs(needs: SnapshotNeeds) -> None:
+        needs.add_gdpo()
+        needs.add_accounts(account_name)
+        needs.add_call("database_api", "find_savings_withdrawals", account=account_name)
+
+    return declare_needs
+
+
+async def _participate(snapshot_round: SnapshotRound, account_name: str) -> str:
+    snapshot = await snapshot_round.join(_declare_dashboard_needs(account_name))
+    return cast("str", snapshot.get_result("database_api", "find_savings_withdrawals", account=account_name))
+
+
+async def _fetch_alone(node: FakeNode, account_name: str) -> str:
+    needs = SnapshotNeeds()
+    _declare_dashboard_needs(account_name)(needs)
+    snapshot = await needs.fetch(cast("Node", node))
+    return cast("str", snapshot.get_result("database_api", "find_savings_withdrawals", account=account_name))
+
+
+async def test_needs_of_all_participants_are_fetched_in_single_batch() -> None:
+    # ARRANGE
+    node = FakeNode()
+    snapshot_round = SnapshotRound(cast("Node", node))
+
+    # ACT
+    results = await snapshot_round.run(
+        _participate(snapshot_round, "alice"),
+        _participate(snapshot_round, "alice"),
+        _participate(snapshot_round, "bob"),
+    )
+
+    # ASSERT
+    assert node.batches == 1
+    assert sorted(node.requests) == [
+        "database_api.find_accounts",
+        "database_api.find_savings_withdrawals",
+        "database_api.find_savings_withdrawals",
+        "database_api.get_dynamic_global_properties",
+    ], "Same calls of many participants should be sent once."
+    assert results[0] == results[1] != results[2]
+
+
+async def test_participant_failing_before_joining_does_not_block_round() -> None:
+    # ARRANGE
+    node = FakeNode()
+    snapshot_round = SnapshotRound(cast("Node", node))
+
+    async def fail() -> str:
+        raise ValueError("failed before harvesting")
+
+    # ACT
+    results = await asyncio.wait_for(snapshot_round.run(_participate(snapshot_round, "alice"), fail()), timeout=1)
+
+    # ASSERT
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], ValueError)
+    assert node.batches == 1
+
+
+async def test_nothing_is_fetched_when_no_participant_joined() -> None:
+    # ARRANGE
+    node = FakeNode()
+    snapshot_round = SnapshotRound(cast("Node", node))
+
+    async def skip() -> None:
+        return None
+
+    # ACT
+    await snapshot_round.run(skip())
+
+    # ASSERT
+    assert node.batches == 0
+
+
+async def test_dashboard_tick_benchmark() -> None:
+    # ARRANGE
+    account_names = [f"account-{number}" for number in range(PROVIDERS_AMOUNT)]
+    separate_node = FakeNode(ROUND_TRIP_SECS)
+    snapshot_node = FakeNode(ROUND_TRIP_SECS)
+
+    # ACT
+    start = time.perf_counter()
+    await asyncio.gather(*(_fetch_alone(separate_node, name) for name in account_names))
+    separate_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot_round = SnapshotRound(cast("Node", snapshot_node))
+    await snapshot_round.run(*(_participate(snapshot_round, name) for name in account_names))
+    snapshot_secs = time.perf_counter() - start
+
+    # ASSERT
+    logger.info(
+        f"Tick of {PROVIDERS_AMOUNT} providers: separately {separate_node.batches} round trips"
+        f" with {len(separate_node.requests)} requests in {separate_secs:.3f}s,"
+        f" in snapshot {snapshot_node.batches} round trip with {len(snapshot_node.requests)} requests"
+        f" in {snapshot_secs:.3f}s"
+    )
+    assert snapshot_node.batches == 1
+    assert separate_node.batches == PROVIDERS_AMOUNT
+    assert len(snapshot_node.requests) < len(separate_node.requests)
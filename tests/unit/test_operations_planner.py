@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Final, cast
+
+import pytest
+
+from clive.__private.core.commands.data_retrieval.account_votes_data import AccountVotesDataRetrieval
+from clive.__private.core.commands.data_retrieval.rc_data import RcDataRetrieval
+from clive.__private.core.commands.data_retrieval.snapshot import SnapshotNeeds
+from clive.__private.core.constants.node import (
+    HIVE_RC_MAX_ACCOUNTS_PER_DELEGATION_OP,
+    MAX_NUMBER_OF_PROPOSAL_IDS_IN_SINGLE_OPERATION,
+)
+from clive.__private.core.operations_planner import (
+    CurrentState,
+    InvalidTargetStateError,
+    TargetState,
+    plan_operations,
+)
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from clive.__private.core.node import Node
+
+ACCOUNT_NAME: Final[str] = "alice"
+CURRENT_RC: Final[int] = 1_000
+TARGET_RC: Final[int] = 5_000
+RC_DELEGATION_CHANGES: Final[int] = 155
+"""Delegatees removed and set by the target state."""
+PLANNED_ROUND_TRIPS: Final[int] = 2
+"""State fetched in a single batch and broadcasted in a single transaction."""
+
+
+class FakeApiCall:
+    def __init__(self, node: FakeNode, api: str) -> None:
+        self._node = node
+        self._api = api
+
+    def __getattr__(self, method: str) -> Callable[..., Awaitable[str]]:
+        async def call(**params: Any) -> str:
+            self._node.requests.append(f"{self._api}.{method}")
+            return f"{self._api}.{method}({sorted(params.items())})"
+
+        return call
+
+
+class FakeApi:
+    def __init__(self, node: FakeNode) -> None:
+        self._node = node
+
+    def __getattr__(self, api: str) -> FakeApiCall:
+        return FakeApiCall(self._node, api)
+
+
+class FakeNode:
+    """Node answering every call with its description, counting round trips (batches) and requests in them."""
+
+    def __init__(self) -> None:
+        self.api = FakeApi(self)
+        self.round_trips = 0
+        self.requests: list[str] = []
+
+    async def batch(self, *, delay_error_on_data_access: bool = False) -> Any:  # noqa: ANN401, ARG002
+        @asynccontextmanager
+        async def impl() -> AsyncIterator[FakeNode]:
+            yield self
+            self.round_trips += 1
+
+        return impl()
+
+    async def broadcast(self) -> None:
+        async with await self.batch() as batch_node:
+            await batch_node.api.network_broadcast_api.broadcast_transaction()
+
+
+def _create_current_state() -> CurrentState:
+    return CurrentState(
+        rc_delegations={f"delegatee-{number:03}": CURRENT_RC for number in range(25)},
+        witness_votes=frozenset(f"witness-{number:02}" for number in range(30)),
+        proposal_votes=frozenset(range(1, 13)),
+    )
+
+
+def _create_target_state() -> TargetState:
+    return TargetState(
+        rc_delegations={f"delegatee-{number:03}": Asset.Vests(amount=TARGET_RC) for number in range(5, 155)},
+        witness_votes=frozenset(f"witness-{number:02}" for number in range(10, 40)),
+        proposal_votes=frozenset(range(5, 31)),
+    )
+
+
+async def _fetch_alone(node: FakeNode, retrieval: RcDataRetrieval) -> None:
+    needs = SnapshotNeeds()
+    retrieval.declare_needs(needs)
+    await needs.fetch(cast("Node", node))
+
+
+def test_rc_delegations_with_same_amount_are_packed_together() -> None:
+    # ARRANGE
+    target = TargetState(rc_delegations=_create_target_state().rc_delegations)
+
+    # ACT
+    plan = plan_operations(account_name=ACCOUNT_NAME, target=target, current=_create_current_state())
+
+    # ASSERT
+    removals, *delegations = plan.rc_delegations
+    assert removals.max_rc == 0
+    assert removals.delegatees == tuple(f"delegatee-{number:03}" for number in range(5))
+    assert [len(change.delegatees) for change in delegations] == [50, HIVE_RC_MAX_ACCOUNTS_PER_DELEGATION_OP]
+    assert all(change.max_rc == TARGET_RC for change in delegations)
+    assert plan.changes_amount == RC_DELEGATION_CHANGES
+    assert plan.rc_delegations_delta == 150 * TARGET_RC - 25 * CURRENT_RC
+
+
+def test_votes_are_removed_before_added() -> None:
+    # ARRANGE
+    target = TargetState(
+        witness_votes=_create_target_state().witness_votes, proposal_votes=_create_target_state().proposal_votes
+    )
+
+    # ACT
+    plan = plan_operations(account_name=ACCOUNT_NAME, target=target, current=_create_current_state())
+
+    # ASSERT
+    assert [vote.approve for vote in plan.witness_votes] == [False] * 10 + [True] * 10
+    assert [vote.approve for vote in plan.proposal_votes] == [False] + [True] * 4
+    assert [vote.proposal_ids for vote in plan.proposal_votes[:2]] == [[1, 2, 3, 4], [13, 14, 15, 16, 17]]
+    assert all(len(vote.proposal_ids) <= MAX_NUMBER_OF_PROPOSAL_IDS_IN_SINGLE_OPERATION for vote in plan.proposal_votes)
+
+
+def test_nothing_is_planned_when_state_matches_target() -> None:
+    # ARRANGE
+    current = _create_current_state()
+    target = TargetState(
+        rc_delegations={delegatee: Asset.Vests(amount=amount) for delegatee, amount in current.rc_delegations.items()},
+        witness_votes=current.witness_votes,
+        proposal_votes=current.proposal_votes,
+    )
+
+    # ACT
+    plan = plan_operations(account_name=ACCOUNT_NAME, target=target, current=current)
+
+    # ASSERT
+    assert plan.is_empty
+
+
+def test_missing_sections_are_not_managed() -> None:
+    # ARRANGE
+    target = TargetState.from_dict({"proposal_votes": [1]})
+
+    # ACT
+    plan = plan_operations(account_name=ACCOUNT_NAME, target=target, current=_create_current_state())
+
+    # ASSERT
+    assert not plan.rc_delegations
+    assert not plan.witness_votes
+    assert [vote.proposal_ids for vote in plan.proposal_votes] == [[2, 3, 4, 5, 6], [7, 8, 9, 10, 11], [12]]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        [],
+        {"unknown": []},
+        {"witness_votes": "gtg"},
+        {"witness_votes": [f"witness-{number}" for number in range(31)]},
+        {"proposal_votes": [True]},
+        {"rc_delegations": {"bob": "1.000 HBD"}},
+        {"rc_delegations": {"bob": "not an amount"}},
+    ],
+)
+def test_invalid_target_state_is_rejected(content: object) -> None:
+    # ACT & ASSERT
+    with pytest.raises(InvalidTargetStateError):
+        TargetState.from_dict(content)
+
+
+async def test_operations_and_round_trips_saved_on_mock_node() -> None:
+    # ARRANGE
+    current = _create_current_state()
+    target = _create_target_state()
+    node = FakeNode()
+    rc_data_retrieval = RcDataRetrieval(node=cast("Node", node), account_name=ACCOUNT_NAME)
+    votes_retrieval = AccountVotesDataRetrieval(node=cast("Node", node), account_name=ACCOUNT_NAME)
+
+    # ACT
+    planned_needs = SnapshotNeeds()
+    rc_data_retrieval.declare_needs(planned_needs)
+    votes_retrieval.declare_needs(planned_needs)
+    await planned_needs.fetch(cast("Node", node))
+    plan = plan_operations(account_name=ACCOUNT_NAME, target=target, current=current)
+    await node.broadcast()
+    planned_round_trips = node.round_trips
+
+    node.round_trips = 0
+    for delegation in plan.rc_delegations:  # one by one, each RC delegation retrieves RC data on its own
+        for _ in delegation.delegatees:
+            await _fetch_alone(node, rc_data_retrieval)
+    for _ in range(plan.changes_amount):
+        await node.broadcast()
+    one_by_one_round_trips = node.round_trips
+
+    # ASSERT
+    logger.info(
+        f"Planned {plan.operations_amount} operations in {planned_round_trips} round trips, one by one it takes"
+        f" {plan.changes_amount} operations in {one_by_one_round_trips} round trips"
+    )
+    assert plan.operations_amount == 3 + 20 + 5
+    assert plan.changes_amount == RC_DELEGATION_CHANGES + 20 + 22
+    assert planned_round_trips == PLANNED_ROUND_TRIPS
+    assert one_by_one_round_trips == RC_DELEGATION_CHANGES + plan.changes_amount
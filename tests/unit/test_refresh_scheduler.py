@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Final
+
+from clive.__private.logger import logger
+from clive.__private.ui.refresh_scheduler import RefreshScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+NODE_DATA: Final[str] = "node_data"
+ALARMS: Final[str] = "alarms"
+INTERVAL_SECS: Final[float] = 0.05
+RUN_SECS: Final[float] = 0.5
+BASE_INTERVAL_SECS: Final[float] = 2
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _run_for(scheduler: RefreshScheduler, seconds: float) -> None:
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def _create_scheduler_with_node_and_alarms(events: list[str]) -> RefreshScheduler:
+    scheduler = RefreshScheduler()
+
+    def _job(name: str) -> Callable[[], Awaitable[None]]:
+        async def _refresh() -> None:
+            events.append(f"{name} started")
+            await asyncio.sleep(INTERVAL_SECS / 5)
+            events.append(f"{name} completed")
+            scheduler.notify_completed(name)
+
+        return _refresh
+
+    scheduler.add_job(NODE_DATA, _job(NODE_DATA), interval_secs=INTERVAL_SECS)
+    scheduler.add_job(ALARMS, _job(ALARMS), interval_secs=INTERVAL_SECS, after=NODE_DATA)
+    return scheduler
+
+
+async def test_dependent_job_runs_right_after_data_it_depends_on() -> None:
+    # ARRANGE
+    events: list[str] = []
+    scheduler = _create_scheduler_with_node_and_alarms(events)
+    scheduler.resume()
+
+    # ACT
+    await _run_for(scheduler, INTERVAL_SECS * 3.5)
+
+    # ASSERT
+    assert "alarms started" in events
+    for index, event in enumerate(events):
+        if event == "alarms started":
+            assert events[index - 1] == "node_data completed", f"Alarms should follow fresh node data: {events}"
+
+
+async def test_waiting_for_completion_is_signalled_without_polling() -> None:
+    # ARRANGE
+    events: list[str] = []
+    scheduler = _create_scheduler_with_node_and_alarms(events)
+    waiter = asyncio.create_task(scheduler.wait_for_completion(NODE_DATA))
+
+    # ACT
+    scheduler.trigger(NODE_DATA)  # works also when the job is paused
+    await asyncio.wait_for(waiter, timeout=1)
+
+    # ASSERT
+    assert events == ["node_data started", "node_data completed"]
+
+
+async def test_cancel_running_stops_ongoing_refreshes() -> None:
+    # ARRANGE
+    events: list[str] = []
+    scheduler = _create_scheduler_with_node_and_alarms(events)
+    scheduler.trigger(NODE_DATA)
+    await asyncio.sleep(0)
+
+    # ACT
+    scheduler.cancel_running()
+    await asyncio.sleep(INTERVAL_SECS)
+
+    # ASSERT
+    assert events == ["node_data started"], "Cancelled refresh should not complete."
+
+
+async def _do_nothing() -> None:
+    pass
+
+
+def test_intervals_adapt_to_activity() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    scheduler = RefreshScheduler(clock)
+    scheduler.add_job(NODE_DATA, _do_nothing, interval_secs=BASE_INTERVAL_SECS)
+    scheduler.add_job("lock_status", _do_nothing, interval_secs=1, is_adaptive=False)
+    idle_interval = BASE_INTERVAL_SECS * RefreshScheduler.IDLE_BACKOFF_FACTOR
+
+    # ACT & ASSERT
+    assert scheduler.get_interval(NODE_DATA) == BASE_INTERVAL_SECS
+
+    clock.now += RefreshScheduler.IDLE_AFTER_SECS
+    assert scheduler.get_interval(NODE_DATA) == idle_interval, "Should back off when idle."
+    assert scheduler.get_interval("lock_status") == 1, "Not adaptive job should keep its interval."
+
+    scheduler.notify_activity()
+    scheduler.notify_focus_changed(is_focused=False)
+    assert scheduler.get_interval(NODE_DATA) == idle_interval, "Should back off on blur."
+
+    scheduler.notify_broadcast()
+    assert scheduler.get_interval(NODE_DATA) == BASE_INTERVAL_SECS * RefreshScheduler.BROADCAST_BOOST_FACTOR
+    clock.now += RefreshScheduler.BROADCAST_BOOST_SECS
+    assert scheduler.get_interval(NODE_DATA) == idle_interval
+
+
+async def test_wakeups_per_minute_benchmark() -> None:
+    # ARRANGE
+    events: list[str] = []
+    scheduler = _create_scheduler_with_node_and_alarms(events)
+
+    # ACT
+    await _run_for(scheduler, RUN_SECS)
+    paused_wakeups = scheduler.wakeups_per_minute
+    scheduler.resume()
+    await _run_for(scheduler, RUN_SECS)
+    active_wakeups = scheduler.wakeups_per_minute
+
+    # ASSERT
+    expected_max_wakeups = RUN_SECS / INTERVAL_SECS + 2
+    logger.info(f"Scheduler wakeups: {paused_wakeups} while paused, {active_wakeups} in {RUN_SECS}s while active.")
+    assert paused_wakeups == 0, "Scheduler should not wake up when there is nothing to refresh."
+    assert 0 < active_wakeups <= expected_max_wakeups, "Scheduler should wake up only when a refresh is due."
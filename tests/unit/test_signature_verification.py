@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Final
+
+from clive.__private.core.signature_verification import (
+    AccountWeightedAuthorities,
+    AuthorityVerifier,
+    WeightedAuthority,
+)
+
+ALICE_KEY: Final[str] = "STM-alice"
+BOB_KEY: Final[str] = "STM-bob"
+CAROL_KEY: Final[str] = "STM-carol"
+DAVE_KEY: Final[str] = "STM-dave"
+
+
+def _single_key_account(key: str) -> AccountWeightedAuthorities:
+    authority = WeightedAuthority(weight_threshold=1, key_auths={key: 1})
+    return AccountWeightedAuthorities(owner=authority, active=authority, posting=authority)
+
+
+def _multisig_account() -> AccountWeightedAuthorities:
+    """2 of 3 multisig, where one of the approvals is given by the `carol` account."""
+    active = WeightedAuthority(weight_threshold=2, key_auths={ALICE_KEY: 1, BOB_KEY: 1}, account_auths={"carol": 1})
+    owner = WeightedAuthority(weight_threshold=1, key_auths={DAVE_KEY: 1})
+    return AccountWeightedAuthorities(owner=owner, active=active, posting=active)
+
+
+def _create_verifier(max_depth: int = 2) -> AuthorityVerifier:
+    return AuthorityVerifier(
+        {"multisig": _multisig_account(), "carol": _single_key_account(CAROL_KEY)},
+        max_depth=max_depth,
+    )
+
+
+def test_threshold_satisfied_with_keys_of_referenced_account() -> None:
+    # ARRANGE
+    verifier = _create_verifier()
+
+    # ACT
+    result = verifier.verify({"active": ["multisig"]}, {"sig-alice": ALICE_KEY, "sig-carol": CAROL_KEY})
+
+    # ASSERT
+    assert result.is_valid
+    assert [check.name for check in result.satisfied] == ["multisig@active"]
+
+
+def test_missing_keys_are_reported_for_unsatisfied_authority() -> None:
+    # ARRANGE
+    verifier = _create_verifier()
+
+    # ACT
+    result = verifier.verify({"active": ["multisig"]}, {"sig-alice": ALICE_KEY})
+
+    # ASSERT
+    assert not result.is_satisfied
+    assert result.unsatisfied[0].weight == 1
+    assert result.missing_keys == [BOB_KEY, CAROL_KEY]
+
+
+def test_account_authorities_are_not_followed_deeper_than_max_depth() -> None:
+    # ARRANGE
+    verifier = _create_verifier(max_depth=0)
+
+    # ACT
+    result = verifier.verify({"active": ["multisig"]}, {"sig-alice": ALICE_KEY, "sig-carol": CAROL_KEY})
+
+    # ASSERT
+    assert not result.is_satisfied
+    assert result.redundant_signatures == ("sig-carol",)
+
+
+def test_signatures_not_needed_to_reach_threshold_are_redundant() -> None:
+    # ARRANGE
+    verifier = _create_verifier()
+    signing_keys = {"sig-alice": ALICE_KEY, "sig-bob": BOB_KEY, "sig-carol": CAROL_KEY, "sig-dave": DAVE_KEY}
+
+    # ACT
+    result = verifier.verify({"active": ["multisig"]}, signing_keys)
+
+    # ASSERT
+    assert result.is_satisfied
+    assert not result.is_valid
+    assert result.redundant_signatures == ("sig-carol", "sig-dave"), (
+        "Owner key is not needed once active authority is satisfied."
+    )
+
+
+def test_other_authorities_and_unknown_accounts() -> None:
+    # ARRANGE
+    verifier = _create_verifier()
+    other = WeightedAuthority(weight_threshold=1, key_auths={DAVE_KEY: 1})
+
+    # ACT
+    result = verifier.verify({"posting": ["unknown"]}, {"sig-dave": DAVE_KEY}, other_authorities=[other])
+
+    # ASSERT
+    assert [(check.name, check.is_satisfied) for check in result.checks] == [
+        ("unknown@posting", False),
+        ("other authority", True),
+    ]
+    assert not result.redundant_signatures
+
+
+def test_owner_authority_satisfies_active() -> None:
+    # ARRANGE
+    verifier = _create_verifier()
+
+    # ACT
+    result = verifier.verify({"active": ["multisig"]}, {"sig-dave": DAVE_KEY})
+
+    # ASSERT
+    assert result.is_valid, "Owner signature should satisfy active authority."
+    assert [check.name for check in result.satisfied] == ["multisig@active"]
+
+
+def test_active_authority_satisfies_posting() -> None:
+    # ARRANGE
+    posting = WeightedAuthority(weight_threshold=1, key_auths={CAROL_KEY: 1})
+    active = WeightedAuthority(weight_threshold=1, key_auths={ALICE_KEY: 1})
+    owner = WeightedAuthority(weight_threshold=1, key_auths={DAVE_KEY: 1})
+    verifier = AuthorityVerifier({"alice": AccountWeightedAuthorities(owner=owner, active=active, posting=posting)})
+
+    # ACT
+    result = verifier.verify({"posting": ["alice"]}, {"sig-alice": ALICE_KEY})
+
+    # ASSERT
+    assert result.is_valid, "Active signature should satisfy posting authority."
+    assert [check.name for check in result.satisfied] == ["alice@posting"]
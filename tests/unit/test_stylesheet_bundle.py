@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from textual.app import App
+from textual.css.stylesheet import Stylesheet
+
+from clive.__private.logger import logger
+from clive.__private.ui.get_css import get_css_from_relative_path
+from clive.__private.ui.stylesheet_bundle import (
+    STYLESHEETS_ROOT,
+    BundledStylesheet,
+    StylesheetBundle,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path, PurePath
+
+GLOBAL_STYLESHEET: Final[Path] = STYLESHEETS_ROOT / "global.scss"
+SCREENS_DIRECTORIES: Final[dict[str, Path]] = {
+    "dashboard": STYLESHEETS_ROOT / "screens" / "dashboard",
+    "operations": STYLESHEETS_ROOT / "screens" / "operations",
+    "governance": STYLESHEETS_ROOT / "screens" / "operations" / "governance_operations",
+}
+
+
+@pytest.fixture
+def prepared_bundle(monkeypatch: pytest.MonkeyPatch) -> StylesheetBundle:
+    bundle = StylesheetBundle.build()  # done at the app start, mounting screens only takes stylesheets from it
+    monkeypatch.setattr(StylesheetBundle, "_prepared", bundle)
+    return bundle
+
+
+@pytest.fixture
+def files_read(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    files_read: list[str] = []
+    read = Stylesheet.read
+
+    def _read(self: Stylesheet, filename: str | PurePath) -> None:
+        files_read.append(str(filename))
+        read(self, filename)
+
+    monkeypatch.setattr(Stylesheet, "read", _read)
+    return files_read
+
+
+@pytest.fixture
+def stylesheets_root(tmp_path: Path) -> Path:
+    root = tmp_path / "ui"
+    (root / "screens").mkdir(parents=True)
+    (root / "global.scss").write_text("Screen { background: red; }")
+    (root / "screens" / "screen.scss").write_text("Label { color: blue; }")
+    return root
+
+
+def test_bundle_is_loaded_back(tmp_path: Path, stylesheets_root: Path) -> None:
+    # ARRANGE
+    bundle_path = tmp_path / "stylesheet_bundle.json"
+
+    # ACT
+    StylesheetBundle.build(root=stylesheets_root).save(bundle_path)
+    loaded = StylesheetBundle.load(bundle_path, root=stylesheets_root)
+
+    # ASSERT
+    assert loaded is not None
+    assert sorted(loaded.stylesheets) == ["global.scss", "screens/screen.scss"]
+    assert loaded.get(stylesheets_root / "screens" / "screen.scss") == "Label { color: blue; }"
+    assert not loaded.is_modified
+
+
+def test_bundle_of_other_version_is_not_loaded(tmp_path: Path, stylesheets_root: Path) -> None:
+    # ARRANGE
+    bundle_path = tmp_path / "stylesheet_bundle.json"
+    bundle = StylesheetBundle.build(root=stylesheets_root)
+    bundle.version = f"{bundle.version}.post1"
+    bundle.save(bundle_path)
+
+    # ACT
+    loaded = StylesheetBundle.load(bundle_path, root=stylesheets_root)
+
+    # ASSERT
+    assert loaded is None
+
+
+def test_changed_stylesheet_is_not_taken_from_bundle(stylesheets_root: Path) -> None:
+    # ARRANGE
+    bundle = StylesheetBundle.build(root=stylesheets_root)
+    changed = stylesheets_root / "global.scss"
+    touched = stylesheets_root / "screens" / "screen.scss"
+
+    added = stylesheets_root / "added.scss"
+
+    # ACT
+    changed.write_text("Screen { background: green; }")
+    os.utime(touched, ns=(0, 0))
+    added.write_text("Static { color: red; }")
+
+    # ASSERT
+    assert bundle.get(changed) is None
+    assert bundle.get(added) is None
+    assert bundle.get(touched) == "Label { color: blue; }", "Content is the same, only metadata changed."
+    assert bundle.is_modified
+
+
+def test_stylesheets_are_read_from_files_until_bundle_is_prepared(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    monkeypatch.setattr(StylesheetBundle, "_prepared", None)
+    stylesheet = BundledStylesheet()
+
+    # ACT
+    css = get_css_from_relative_path(GLOBAL_STYLESHEET)
+    stylesheet.read(GLOBAL_STYLESHEET)
+
+    # ASSERT
+    assert StylesheetBundle.get_prepared() is None
+    assert css == GLOBAL_STYLESHEET.read_text()
+    assert stylesheet.source
+
+
+def _load_screen_stylesheets(stylesheet: Stylesheet, screen_directory: Path) -> float:
+    start = time.perf_counter()
+    stylesheet.read_all([GLOBAL_STYLESHEET, *sorted(screen_directory.rglob("*.scss"))])
+    stylesheet.parse()
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("screen", SCREENS_DIRECTORIES)
+@pytest.mark.usefixtures("prepared_bundle")
+def test_first_mount_stylesheets_benchmark(screen: str, files_read: list[str]) -> None:
+    # ARRANGE
+    variables = App().get_css_variables()
+    from_files = Stylesheet(variables=variables)
+    from_bundle = BundledStylesheet(variables=variables)
+
+    # ACT
+    from_files_secs = _load_screen_stylesheets(from_files, SCREENS_DIRECTORIES[screen])
+    files_read_amount = len(files_read)
+    from_bundle_secs = _load_screen_stylesheets(from_bundle, SCREENS_DIRECTORIES[screen])
+
+    # ASSERT
+    logger.info(f"Stylesheets of {screen} screen: {from_files_secs:.4f}s from files, {from_bundle_secs:.4f}s bundled")
+    assert len(from_bundle.rules) == len(from_files.rules)
+    assert files_read_amount > 0
+    assert len(files_read) == files_read_amount, "Bundled stylesheets should not be read from files."
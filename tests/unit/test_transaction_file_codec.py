@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import tracemalloc
+from typing import TYPE_CHECKING, Final, Literal
+
+import pytest
+
+from clive.__private.core.transaction_file_codec import (
+    TransactionFileCodecError,
+    load_transaction_file,
+    save_transaction_file,
+)
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+from clive.__private.models.schemas import HiveDateTime, TransferOperation, convert_to_representation
+from clive.__private.models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+OPERATIONS_AMOUNT: Final[int] = 10_000
+SIGNATURE: Final[str] = "1f" + "00" * 64
+
+
+def _create_transaction(operations_amount: int) -> Transaction:
+    return Transaction(
+        operations=[
+            convert_to_representation(
+                TransferOperation(from_="alice", to=f"bob{index}", amount=Asset.hbd(1), memo=f"airdrop {index}")
+            )
+            for index in range(operations_amount)
+        ],
+        ref_block_num=1,
+        ref_block_prefix=2,
+        expiration=HiveDateTime("2021-01-01T00:00:00"),
+        extensions=[],
+        signatures=[],
+    )
+
+
+@pytest.mark.parametrize("file_format", ["json", "bin"])
+def test_saved_transaction_is_loaded_back(tmp_path: Path, file_format: Literal["json", "bin"]) -> None:
+    # ARRANGE
+    transaction = _create_transaction(600)  # more than a single chunk of operations
+    file_path = tmp_path / f"transaction.{file_format}"
+
+    # ACT
+    save_stats = save_transaction_file(transaction, file_path, file_format)
+    loaded, load_stats = load_transaction_file(file_path)
+
+    # ASSERT
+    assert loaded == transaction
+    assert load_stats.file_format == file_format
+    assert save_stats.sha256 == load_stats.sha256 == hashlib.sha256(file_path.read_bytes()).hexdigest()
+    assert save_stats.size_bytes == load_stats.size_bytes == file_path.stat().st_size
+
+
+@pytest.mark.parametrize("operations_amount", [0, 3])
+@pytest.mark.parametrize("signatures", [[], [SIGNATURE]])
+def test_json_layout_is_the_same_as_of_whole_transaction_encoding(
+    tmp_path: Path, operations_amount: int, signatures: list[str]
+) -> None:
+    # ARRANGE
+    transaction = _create_transaction(operations_amount)
+    transaction.signatures = signatures
+    file_path = tmp_path / "transaction.json"
+
+    # ACT
+    save_transaction_file(transaction, file_path, "json")
+
+    # ASSERT
+    assert file_path.read_text() == transaction.json(order="sorted", indent=4)
+
+
+@pytest.mark.parametrize("content", ["", "not a transaction", '{"operations": [{"type": "unknown"}]}'])
+def test_loading_invalid_file_fails(tmp_path: Path, content: str) -> None:
+    # ARRANGE
+    file_path = tmp_path / "transaction.json"
+    file_path.write_text(content)
+
+    # ACT & ASSERT
+    with pytest.raises(TransactionFileCodecError):
+        load_transaction_file(file_path)
+
+
+@pytest.mark.parametrize("file_format", ["json", "bin"])
+def test_large_transaction_file_benchmark(tmp_path: Path, file_format: Literal["json", "bin"]) -> None:
+    # ARRANGE
+    transaction = _create_transaction(OPERATIONS_AMOUNT)
+    file_path = tmp_path / f"transaction.{file_format}"
+
+    # ACT
+    save_stats = save_transaction_file(transaction, file_path, file_format, measure_memory=True)
+    loaded, load_stats = load_transaction_file(file_path, measure_memory=True)
+
+    tracemalloc.start()
+    whole_content = file_path.read_bytes()  # what the loading required before, the content itself was copied
+    whole_content_size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # ASSERT
+    logger.info(f"Saved {save_stats}")
+    logger.info(f"Loaded {load_stats}")
+    assert loaded == transaction
+    assert len(whole_content) == load_stats.size_bytes == save_stats.size_bytes
+    assert load_stats.sha256 == save_stats.sha256
+    assert load_stats.peak_memory_bytes is not None
+    assert save_stats.peak_memory_bytes is not None
+    if file_format == "json":
+        # operations are decoded and encoded in chunks, so there is no whole copy of the file content in memory
+        assert save_stats.peak_memory_bytes < whole_content_size
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Final, cast
+
+import pytest
+
+from clive.__private.core import iwax
+from clive.__private.core.transaction_sizing import (
+    OperationTooLargeError,
+    RcCostEstimator,
+    estimate_transaction_size,
+    split_operations,
+    split_transaction,
+    varint_size,
+)
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+from clive.__private.models.schemas import (
+    AccountWitnessVoteOperation,
+    CustomJsonOperation,
+    JsonString,
+    TransferOperation,
+    UpdateProposalVotesOperation,
+)
+from clive.__private.models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from clive.__private.models.schemas import GetResourceParams, GetResourcePool, OperationUnion
+
+MAX_SIZE: Final[int] = 1_000
+RANDOM_CASES: Final[int] = 200
+SERIALIZATIONS_OF_APPENDED_OPERATION: Final[int] = 2
+"""Transaction is serialized with and without the appended operation."""
+
+
+def _create_transfer(memo: str = "") -> TransferOperation:
+    return TransferOperation(from_="alice", to="bob", amount=Asset.hive(1), memo=memo)
+
+
+def _serialized_size(operations: Sequence[OperationUnion]) -> int:
+    transaction = Transaction(operations=Transaction.convert_operations(operations))
+    return len(iwax.serialize_transaction(transaction)) // 2
+
+
+def _min_transactions_amount(sizes: Sequence[int], max_size: int) -> int:
+    """Brute-force the fewest order-preserving transactions by checking every possible cut."""
+    best = [0] + [len(sizes) + 1] * len(sizes)
+    for stop in range(1, len(sizes) + 1):
+        for start in range(stop):
+            if estimate_transaction_size(sizes[start:stop]) <= max_size:
+                best[stop] = min(best[stop], best[start] + 1)
+    return best[-1]
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [_create_transfer()],
+        [_create_transfer("x" * 200)],
+        [AccountWitnessVoteOperation(account="alice", witness="gtg", approve=True)],
+        [UpdateProposalVotesOperation(voter="alice", proposal_ids=[1, 2, 3], approve=False, extensions=[])],
+        [_create_transfer(f"memo {number}") for number in range(130)],
+    ],
+)
+def test_size_matches_wax_serialization(operations: list[OperationUnion]) -> None:
+    # ACT
+    sizes = [iwax.calculate_operation_size(operation) for operation in operations]
+
+    # ASSERT
+    operations_count_growth = varint_size(len(operations)) - varint_size(0)
+    assert _serialized_size(operations) - _serialized_size([]) == sum(sizes) + operations_count_growth
+
+
+def test_custom_json_size_is_packed_locally() -> None:
+    # ARRANGE
+    json = '["delegate_rc",{"from":"alice","delegatees":["bob"],"max_rc":1000}]'
+    operation = CustomJsonOperation(
+        id_="rc", json_=JsonString(json), required_auths=[], required_posting_auths=["alice"]
+    )
+    tag, required_auths, required_posting_auths, custom_id = 1, 1, 1 + 1 + len("alice"), 1 + len("rc")
+
+    # ACT
+    size = iwax.calculate_operation_size(operation)
+
+    # ASSERT
+    assert size == tag + required_auths + required_posting_auths + custom_id + 1 + len(json)
+
+
+def test_split_is_optimal_and_preserves_order() -> None:
+    # ARRANGE
+    generator = random.Random(48)  # noqa: S311
+
+    for _ in range(RANDOM_CASES):
+        sizes = [generator.randint(1, 400) for _ in range(generator.randint(0, 40))]
+
+        # ACT
+        parts = split_operations(sizes, max_size=MAX_SIZE)
+
+        # ASSERT
+        assert [index for part in parts for index in part] == list(range(len(sizes)))
+        assert all(estimate_transaction_size(sizes[part.start : part.stop]) <= MAX_SIZE for part in parts)
+        assert len(parts) == _min_transactions_amount(sizes, MAX_SIZE)
+
+
+def test_split_accounts_for_growing_operations_count() -> None:
+    # ARRANGE
+    max_size = estimate_transaction_size([1] * 127)
+
+    # ACT
+    parts = split_operations([1] * 128, max_size=max_size + 1)
+
+    # ASSERT
+    assert [len(part) for part in parts] == [127, 1], "128 operations need 2 bytes for their count."
+
+
+def test_operation_larger_than_transaction_is_rejected() -> None:
+    # ACT & ASSERT
+    with pytest.raises(OperationTooLargeError) as error:
+        split_operations([10, MAX_SIZE, 10], max_size=MAX_SIZE)
+    assert error.value.index == 1
+
+
+def test_only_new_operations_are_serialized_when_sizing_again() -> None:
+    # ARRANGE
+    operations: list[OperationUnion] = [_create_transfer(f"sizing {number}" * 8) for number in range(500)]
+    split_transaction(operations, max_size=MAX_SIZE * 10)
+    iwax.reset_call_histograms()
+
+    # ACT
+    operations.append(_create_transfer("the new one"))
+    split = split_transaction(operations, max_size=MAX_SIZE * 10)
+
+    # ASSERT
+    serializations = iwax.get_call_histograms()["serialize_transaction"].calls
+    logger.info(f"Sized {len(operations)} operations into {len(split.parts)} transactions with {serializations} calls")
+    assert split.is_split
+    assert serializations == SERIALIZATIONS_OF_APPENDED_OPERATION, "Only the new operation should be serialized."
+
+
+def test_rc_cost_follows_size_and_signatures() -> None:
+    # ARRANGE
+    resource = SimpleNamespace(
+        price_curve_params=SimpleNamespace(coeff_a=1, coeff_b=1_000, shift=0),
+        resource_dynamics_params=SimpleNamespace(resource_unit=10),
+    )
+    pool = SimpleNamespace(pool=9_000)
+    estimator = RcCostEstimator(
+        resource_params=cast(
+            "GetResourceParams",
+            SimpleNamespace(
+                resource_params=SimpleNamespace(
+                    resource_history_bytes=resource, resource_execution_time=resource, resource_state_bytes=resource
+                ),
+                size_info=SimpleNamespace(
+                    resource_execution_time=SimpleNamespace(transaction_time=10, verify_authority_time=20),
+                    resource_state_bytes=SimpleNamespace(transaction_base_size=0),
+                ),
+            ),
+        ),
+        resource_pool=cast(
+            "GetResourcePool",
+            SimpleNamespace(
+                resource_pool=SimpleNamespace(
+                    resource_history_bytes=pool, resource_execution_time=pool, resource_state_bytes=pool
+                )
+            ),
+        ),
+        total_vesting_shares=144_000 * 999,  # regeneration of 999 per block
+    )
+
+    # ACT
+    cost = estimator.estimate(100, ["unknown"])
+
+    # ASSERT
+    history_cost = (999 + 1) * 100 * 10 // 10_000 + 1
+    execution_cost = (999 + 1) * (10 + 20) * 10 // 10_000 + 1
+    assert cost == history_cost + execution_cost
+    assert estimator.estimate(200, ["unknown"]) > cost
+    assert estimator.estimate(100, ["unknown"], signatures_amount=2) > cost
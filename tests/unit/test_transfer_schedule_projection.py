@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+import pytest
+
+from clive.__private.core.commands.data_retrieval.find_scheduled_transfers import (
+    AccountScheduledTransferData,
+    ScheduledTransfer,
+)
+from clive.__private.core.transfer_schedule_projection import TransferScheduleProjection
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+
+START_DATE: Final[datetime] = datetime(2025, 1, 1, tzinfo=UTC)
+DEFINITIONS_AMOUNT: Final[int] = 500
+EXECUTIONS_PER_DEFINITION: Final[int] = 10_000
+PAGE_SIZE: Final[int] = 10
+WEEK_DAYS: Final[int] = 7
+
+
+@pytest.fixture(autouse=True)
+def clear_projections_cache() -> None:
+    TransferScheduleProjection.clear_cache()
+
+
+def _create_scheduled_transfer(
+    pair_id: int, *, amount: Asset.LiquidT, recurrence: int, remaining_executions: int, delay_hours: int = 0
+) -> ScheduledTransfer:
+    return ScheduledTransfer(
+        amount=amount,
+        consecutive_failures=0,
+        from_="alice",
+        memo="",
+        pair_id=pair_id,
+        recurrence=recurrence,
+        remaining_executions=remaining_executions,
+        to="bob",
+        trigger_date=START_DATE + timedelta(hours=delay_hours),
+    )
+
+
+def _create_data(
+    scheduled_transfers: list[ScheduledTransfer], *, hive_balance: int = 100, hbd_balance: int = 100
+) -> AccountScheduledTransferData:
+    return AccountScheduledTransferData(
+        scheduled_transfers=scheduled_transfers,
+        account_hive_balance=Asset.hive(hive_balance),
+        account_hbd_balance=Asset.hbd(hbd_balance),
+    )
+
+
+def _expand_naively(data: AccountScheduledTransferData) -> list[tuple[datetime, int]]:
+    executions = [
+        (st.trigger_date + timedelta(hours=index * st.recurrence), st.pair_id)
+        for st in data.scheduled_transfers
+        for index in range(st.remaining_executions)
+    ]
+    return sorted(executions, key=lambda execution: execution[0])
+
+
+def test_projection_matches_naive_expansion() -> None:
+    # ARRANGE
+    data = _create_data(
+        [
+            _create_scheduled_transfer(0, amount=Asset.hive(1), recurrence=24, remaining_executions=30),
+            _create_scheduled_transfer(1, amount=Asset.hbd(2), recurrence=36, remaining_executions=20, delay_hours=5),
+            _create_scheduled_transfer(2, amount=Asset.hive(3), recurrence=24, remaining_executions=2),
+        ]
+    )
+
+    # ACT
+    projected = data.get_projection().get_upcoming(1000).future_scheduled_transfers
+
+    # ASSERT
+    actual = [(execution.trigger_date, execution.pair_id) for execution in projected]
+    assert actual == _expand_naively(data), "Projection should produce the same timeline as a full expansion."
+
+
+def test_projection_pages_and_horizon() -> None:
+    # ARRANGE
+    data = _create_data([_create_scheduled_transfer(0, amount=Asset.hive(1), recurrence=24, remaining_executions=50)])
+    projection = data.get_projection()
+
+    # ACT
+    second_page = projection.get_upcoming(PAGE_SIZE, offset=PAGE_SIZE).future_scheduled_transfers
+    until_week = projection.get_upcoming(until=START_DATE + timedelta(days=WEEK_DAYS)).future_scheduled_transfers
+
+    # ASSERT
+    assert [execution.trigger_date for execution in second_page] == [
+        START_DATE + timedelta(days=day) for day in range(PAGE_SIZE, 2 * PAGE_SIZE)
+    ]
+    assert len(until_week) == WEEK_DAYS + 1, "Executions from day 0 to day 7 (inclusive) should be returned."
+
+
+def test_first_lack_of_funds_is_flagged_beyond_first_page() -> None:
+    # ARRANGE
+    data = _create_data(
+        [_create_scheduled_transfer(0, amount=Asset.hive(7), recurrence=24, remaining_executions=100)],
+        hive_balance=100,
+    )
+
+    # ACT
+    first_lack_of_funds = data.get_projection().find_first_lack_of_funds()
+
+    # ASSERT
+    assert first_lack_of_funds is not None, "Balance is not enough for all executions."
+    assert first_lack_of_funds.trigger_date == START_DATE + timedelta(days=14), "15th transfer should fail."
+    assert first_lack_of_funds.is_lack_of_funds()
+
+
+def test_projection_is_cached_until_definitions_or_balance_change() -> None:
+    # ARRANGE
+    scheduled_transfers = [_create_scheduled_transfer(0, amount=Asset.hive(1), recurrence=24, remaining_executions=5)]
+    projection = _create_data(scheduled_transfers).get_projection()
+
+    # ACT & ASSERT
+    assert _create_data(list(scheduled_transfers)).get_projection() is projection, "Projection should be reused."
+    assert _create_data(scheduled_transfers, hive_balance=1).get_projection() is not projection
+    scheduled_transfers[0].remaining_executions = 4
+    assert _create_data(scheduled_transfers).get_projection() is not projection
+
+
+def test_upcoming_projection_of_long_horizons_benchmark() -> None:
+    # ARRANGE
+    data = _create_data(
+        [
+            _create_scheduled_transfer(
+                pair_id,
+                amount=Asset.hive(1),
+                recurrence=24 + pair_id % 48,
+                remaining_executions=EXECUTIONS_PER_DEFINITION,
+                delay_hours=pair_id,
+            )
+            for pair_id in range(DEFINITIONS_AMOUNT)
+        ],
+        hive_balance=1_000_000,
+    )
+
+    projection = data.get_projection()
+
+    # ACT
+    upcoming = data.get_next_upcoming_future_scheduled_transfers(PAGE_SIZE)
+    projected_after_first_display = projection.projected_executions_amount
+    data.get_next_upcoming_future_scheduled_transfers(PAGE_SIZE)
+
+    # ASSERT
+    logger.info(
+        f"Projected {projection.projected_executions_amount} of {projection.total_executions_amount} executions."
+    )
+    assert len(upcoming.future_scheduled_transfers) == PAGE_SIZE
+    assert projected_after_first_display == PAGE_SIZE, "Only the displayed executions should be expanded."
+    assert data.get_projection() is projection, "Cached projection should be reused."
+    assert projection.projected_executions_amount == PAGE_SIZE, "Next display should not expand any execution."
+
+
+def test_future_transfers_keep_execution_index_as_remaining_executions() -> None:
+    # ARRANGE
+    data = _create_data([_create_scheduled_transfer(0, amount=Asset.hive(1), recurrence=24, remaining_executions=3)])
+
+    # ACT
+    projected = data.get_projection().get_upcoming(PAGE_SIZE).future_scheduled_transfers
+
+    # ASSERT
+    assert [execution.remaining_executions for execution in projected] == [0, 1, 2], (
+        "Remaining executions of future transfers should count up by execution index, as before the projection."
+    )
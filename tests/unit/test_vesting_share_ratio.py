@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Final
+
+import pytest
+
+import wax
+from clive.__private.core import iwax
+from clive.__private.core.vesting_share_ratio import SHARE_TYPE_MAX, AssetAmountOutOfRangeError, VestingShareRatio
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+
+SEED: Final[int] = 43
+SAMPLES_AMOUNT: Final[int] = 2_000
+BENCHMARK_CALLS: Final[int] = 5_000
+
+
+@dataclass
+class FakeGlobalProperties:
+    total_vesting_fund_hive: Asset.Hive
+    total_vesting_shares: Asset.Vests
+
+
+def _create_global_properties(rng: random.Random) -> FakeGlobalProperties:
+    total_vesting_fund_hive = rng.randint(1, 10**12)
+    total_vesting_shares = total_vesting_fund_hive * rng.randint(1, 2_000_000) + rng.randint(0, 10**6)
+    return FakeGlobalProperties(Asset.Hive(amount=total_vesting_fund_hive), Asset.Vests(amount=total_vesting_shares))
+
+
+def _vests_to_hp_by_wax(vests: int, data: FakeGlobalProperties) -> int:
+    result = wax.calculate_vests_to_hp(
+        vests=wax.vests(vests),
+        total_vesting_fund_hive=iwax.to_python_json_asset(data.total_vesting_fund_hive),
+        total_vesting_shares=iwax.to_python_json_asset(data.total_vesting_shares),
+    )
+    return int(result.amount)
+
+
+def _hp_to_vests_by_wax(hive: int, data: FakeGlobalProperties) -> int:
+    result = wax.calculate_hp_to_vests(
+        hive=wax.hive(hive),
+        total_vesting_fund_hive=iwax.to_python_json_asset(data.total_vesting_fund_hive),
+        total_vesting_shares=iwax.to_python_json_asset(data.total_vesting_shares),
+    )
+    return int(result.amount)
+
+
+def test_conversions_are_same_as_wax_ones() -> None:
+    # ARRANGE
+    rng = random.Random(SEED)  # noqa: S311
+    samples = [
+        (_create_global_properties(rng), rng.choice([0, 1, rng.randint(1, 10**6), rng.randint(1, 10**12)]))
+        for _ in range(SAMPLES_AMOUNT)
+    ]
+
+    # ACT & ASSERT
+    for data, amount in samples:
+        ratio = VestingShareRatio.from_data(data)
+        assert ratio.vests_to_hp(amount) == _vests_to_hp_by_wax(amount, data), f"vests={amount}, {ratio}"
+        assert ratio.hp_to_vests(amount) == _hp_to_vests_by_wax(amount, data), f"hive={amount}, {ratio}"
+
+
+def test_result_out_of_range() -> None:
+    # ARRANGE
+    ratio = VestingShareRatio(total_vesting_fund_hive=1, total_vesting_shares=10**6)
+
+    # ACT & ASSERT
+    with pytest.raises(AssetAmountOutOfRangeError):
+        ratio.hp_to_vests(SHARE_TYPE_MAX)
+
+
+@pytest.mark.parametrize(
+    ("ratio", "amount"),
+    [
+        (VestingShareRatio(total_vesting_fund_hive=0, total_vesting_shares=10**6), 1),
+        (VestingShareRatio(total_vesting_fund_hive=1, total_vesting_shares=10**6), -1),
+        (VestingShareRatio(total_vesting_fund_hive=1, total_vesting_shares=10**6), SHARE_TYPE_MAX + 1),
+    ],
+)
+def test_amounts_left_for_wax(ratio: VestingShareRatio, amount: int) -> None:
+    # ACT & ASSERT
+    assert not ratio.can_convert(amount)
+
+
+def test_vests_to_hp_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    data = _create_global_properties(random.Random(SEED))  # noqa: S311
+    vests = [Asset.Vests(amount=amount) for amount in range(1, BENCHMARK_CALLS + 1)]
+    by_wax = [_vests_to_hp_by_wax(int(amount.amount), data) for amount in vests]
+    wax_calls: list[object] = []
+    original_calculate_vests_to_hp = wax.calculate_vests_to_hp
+
+    def calculate_vests_to_hp(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        wax_calls.append(kwargs.get("vests"))
+        return original_calculate_vests_to_hp(*args, **kwargs)
+
+    monkeypatch.setattr(wax, "calculate_vests_to_hp", calculate_vests_to_hp)
+
+    # ACT
+    by_iwax = iwax.calculate_vests_to_hp_many(vests, data)
+
+    # ASSERT
+    logger.info(f"Converted {BENCHMARK_CALLS} VESTS amounts to HP with {len(wax_calls)} wax calls.")
+    assert [int(hive.amount) for hive in by_iwax] == by_wax
+    assert not wax_calls, "Amounts in range should be converted by the integer ratio, without calling wax."
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from clive.__private.core.beekeeper_manager import WalletStateWatcher
+from clive.__private.core.commands.sync_state_with_beekeeper import SyncStateWithBeekeeper
+from clive.__private.core.encryption import EncryptionService
+from clive.__private.logger import logger
+
+if TYPE_CHECKING:
+    from clive.__private.core.app_state import AppState, LockSource
+    from clive.__private.core.wallet_container import WalletContainer
+
+PROFILE_NAME: Final[str] = "alice"
+REFRESH_INTERVAL_SECS: Final[float] = 0.5
+UNLOCK_TIMEOUT_SECS: Final[float] = 30.0
+SIMULATED_SECS: Final[float] = 60.0
+MAX_BEEKEEPER_CALLS_PER_MINUTE: Final[int] = 10
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class FakeWallet:
+    name: str
+
+
+@dataclass
+class FakeInfo:
+    now: datetime
+    timeout_time: datetime
+
+
+class FakeSession:
+    """Session with wallets unlocked until the timeout, counting beekeeper API calls."""
+
+    START: Final[datetime] = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def __init__(self, clock: FakeClock, *, timeout_secs: float) -> None:
+        self._clock = clock
+        self._timeout_at = clock() + timeout_secs
+        self.calls = 0
+
+    @property
+    async def wallets_unlocked(self) -> list[FakeWallet]:
+        self.calls += 1
+        if self._clock() >= self._timeout_at:
+            return []
+        return [FakeWallet(PROFILE_NAME), FakeWallet(EncryptionService.get_encryption_wallet_name(PROFILE_NAME))]
+
+    async def get_info(self) -> FakeInfo:
+        self.calls += 1
+        return FakeInfo(
+            now=self.START + timedelta(seconds=self._clock()),
+            timeout_time=self.START + timedelta(seconds=self._timeout_at),
+        )
+
+
+class FakeAppState:
+    def __init__(self, clock: FakeClock) -> None:
+        self._clock = clock
+        self.is_unlocked = True
+        self.events: list[tuple[str, float]] = []
+
+    async def unlock(self, wallets: WalletContainer | None = None) -> None:  # noqa: ARG002
+        self.events.append(("unlock", self._clock()))
+        self.is_unlocked = True
+
+    async def lock(self, source: LockSource = "unknown") -> None:  # noqa: ARG002
+        self.events.append(("lock", self._clock()))
+        self.is_unlocked = False
+
+
+async def _simulate_refreshes(*, use_watcher: bool) -> tuple[FakeSession, FakeAppState]:
+    clock = FakeClock()
+    session = FakeSession(clock, timeout_secs=UNLOCK_TIMEOUT_SECS)
+    app_state = FakeAppState(clock)
+    watcher = WalletStateWatcher(clock) if use_watcher else None
+
+    while clock.now <= SIMULATED_SECS:
+        await SyncStateWithBeekeeper(
+            session=cast("Any", session),
+            app_state=cast("AppState", app_state),
+            wallet_state_watcher=watcher,
+        ).execute()
+        clock.now += REFRESH_INTERVAL_SECS
+    return session, app_state
+
+
+async def test_watcher_polls_only_near_the_predicted_lock() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    session = FakeSession(clock, timeout_secs=UNLOCK_TIMEOUT_SECS)
+    watcher = WalletStateWatcher(clock)
+
+    # ACT
+    assert watcher.is_poll_due, "Should poll when state is not known yet."
+    await watcher.observe(cast("Any", session), is_unlocked=True)
+
+    # ASSERT
+    assert watcher.lock_deadline == UNLOCK_TIMEOUT_SECS
+    assert not watcher.is_poll_due
+    clock.now = UNLOCK_TIMEOUT_SECS - WalletStateWatcher.DEADLINE_MARGIN_SECS
+    assert watcher.is_poll_due, "Should poll near the deadline."
+
+
+async def test_watcher_polls_after_user_action() -> None:
+    # ARRANGE
+    clock = FakeClock()
+    watcher = WalletStateWatcher(clock)
+    await watcher.observe(cast("Any", FakeSession(clock, timeout_secs=0)), is_unlocked=False)
+    assert not watcher.is_poll_due, "Locked wallets can't be locked by the timeout."
+
+    # ACT
+    watcher.request_poll()
+
+    # ASSERT
+    assert watcher.is_poll_due
+
+
+async def test_beekeeper_calls_and_lock_detection_latency_benchmark() -> None:
+    # ACT
+    naive_session, naive_app_state = await _simulate_refreshes(use_watcher=False)
+    watched_session, watched_app_state = await _simulate_refreshes(use_watcher=True)
+
+    # ASSERT
+    logger.info(
+        f"Beekeeper calls in {SIMULATED_SECS}s: {naive_session.calls} when polling every refresh,"
+        f" {watched_session.calls} with watcher. Lock detected: {naive_app_state.events}"
+        f" vs {watched_app_state.events}."
+    )
+    assert naive_app_state.events == [("lock", UNLOCK_TIMEOUT_SECS)]
+    assert watched_app_state.events == naive_app_state.events, "Lock should be detected with the same latency."
+    assert watched_session.calls <= MAX_BEEKEEPER_CALLS_PER_MINUTE < naive_session.calls
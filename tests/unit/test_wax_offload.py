@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from clive.__private.core import iwax
+from clive.__private.core._thread import calculate_cpu_thread_pool_size
+from clive.__private.core.constants.setting_identifiers import WAX_OFFLOAD_SIZE_THRESHOLD
+from clive.__private.core.keys import PrivateKey
+from clive.__private.logger import logger
+from clive.__private.models.asset import Asset
+from clive.__private.models.schemas import TransferOperation
+from clive.__private.models.transaction import Transaction
+from clive.__private.settings import get_settings, safe_settings
+from clive_local_tools.data.constants import TESTNET_CHAIN_ID
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from clive.__private.core.profile import Profile
+    from clive.__private.core.world import World
+
+OPERATIONS_AMOUNT: Final[int] = 200
+TICK_INTERVAL_SECS: Final[float] = 0.005
+EVENT_LOOP_LAG_BUDGET_SECS: Final[float] = 0.05
+
+
+@pytest.fixture
+def offload_every_wax_call() -> Iterator[None]:
+    threshold_before = safe_settings.wax.offload_size_threshold
+    settings = get_settings()
+    settings.set(WAX_OFFLOAD_SIZE_THRESHOLD, 0)
+    iwax.reset_call_histograms()
+    yield
+    settings.set(WAX_OFFLOAD_SIZE_THRESHOLD, threshold_before)
+
+
+async def _measure_max_event_loop_lag(stop: asyncio.Event) -> float:
+    max_lag = 0.0
+    while not stop.is_set():
+        expected_wakeup = time.perf_counter() + TICK_INTERVAL_SECS
+        await asyncio.sleep(TICK_INTERVAL_SECS)
+        max_lag = max(max_lag, time.perf_counter() - expected_wakeup)
+    return max_lag
+
+
+def _create_transaction() -> Transaction:
+    return Transaction(
+        operations=Transaction.convert_operations(
+            TransferOperation(from_="alice", to="bob", amount=Asset.hive(index + 1), memo=f"transfer {index}")
+            for index in range(OPERATIONS_AMOUNT)
+        ),
+        ref_block_num=1,
+        ref_block_prefix=1,
+    )
+
+
+@pytest.mark.parametrize(
+    ("configured_workers", "cpu_count", "expected"), [(0, 8, 7), (0, 1, 1), (0, None, 1), (3, 8, 3)]
+)
+def test_cpu_thread_pool_size(
+    monkeypatch: pytest.MonkeyPatch, configured_workers: int, cpu_count: int | None, expected: int
+) -> None:
+    # ARRANGE
+    monkeypatch.setattr("os.cpu_count", lambda: cpu_count)
+
+    # ACT
+    size = calculate_cpu_thread_pool_size(configured_workers)
+
+    # ASSERT
+    assert size == expected
+
+
+async def test_small_wax_calls_are_kept_inline() -> None:
+    # ARRANGE
+    iwax.reset_call_histograms()
+    transaction = Transaction(ref_block_num=1, ref_block_prefix=1)
+
+    # ACT
+    await iwax.calculate_sig_digest_async(transaction, TESTNET_CHAIN_ID)
+
+    # ASSERT
+    histogram = iwax.get_call_histograms()["calculate_sig_digest"]
+    assert histogram.calls == 1
+    assert histogram.offloaded_calls == 0, "Small call should be made inline."
+
+
+async def test_event_loop_stays_responsive_while_building_and_signing(
+    world: World,
+    prepare_profile_with_wallet: Profile,  # noqa: ARG001
+    offload_every_wax_call: None,  # noqa: ARG001
+) -> None:
+    # ARRANGE
+    private_key = PrivateKey.generate(with_alias="signing_key")
+    imported_key = (await world.commands.import_key(key_to_import=private_key)).result_or_raise
+    stop = asyncio.Event()
+    lag_measurement = asyncio.create_task(_measure_max_event_loop_lag(stop))
+
+    # ACT
+    try:
+        transaction = (await world.commands.build_transaction(content=_create_transaction())).result_or_raise
+        signed = (
+            await world.commands.sign(transaction=transaction, sign_with=imported_key, chain_id=TESTNET_CHAIN_ID)
+        ).result_or_raise
+    finally:
+        stop.set()
+    max_lag = await lag_measurement
+
+    # ASSERT
+    histograms = iwax.get_call_histograms()
+    logger.info(
+        f"Max event loop lag while building and signing {OPERATIONS_AMOUNT}-operation transaction: {max_lag:.4f}s. "
+        + ", ".join(f"{name}: {histogram.mean_secs:.6f}s mean" for name, histogram in histograms.items())
+    )
+    assert signed.is_signed, "Transaction should be signed."
+    assert histograms["calculate_sig_digest"].offloaded_calls == 1, "Sig digest should be calculated in thread pool."
+    assert histograms["validate_transaction"].offloaded_calls == 1, "Validation should be made in thread pool."
+    assert max_lag < EVENT_LOOP_LAG_BUDGET_SECS, f"Event loop was blocked for {max_lag:.4f}s."